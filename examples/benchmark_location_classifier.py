@@ -0,0 +1,101 @@
+"""
+Location Classifier Benchmark
+Compares the gazetteer automaton with per-category keyword scans as the
+gazetteers grow
+
+The bundled term lists are padded with generated place names to each size;
+location names come from the stub server's synthetic routes. Both classifiers
+are checked to agree before timing.
+
+Usage:
+    python examples/benchmark_location_classifier.py --sizes 22 1000 10000 --routes 200
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.google_maps.instructions import parse_instruction
+from src.models import LocationType
+from src.modules.location_classifier import (
+    CLASSIFICATION_PRIORITY,
+    INTERSECTION_MARKERS,
+    LocationClassifier,
+    load_gazetteers,
+)
+from src.stub_server import synthetic_directions
+
+
+def padded_gazetteers(size: int):
+    gazetteers = load_gazetteers()
+    total = sum(len(terms) for terms in gazetteers.values())
+    for i in range(max(0, size - total)):
+        location_type = (LocationType.LANDMARK, LocationType.NEIGHBORHOOD)[i % 2]
+        gazetteers[location_type].append(f"gazetteer place {i}")
+    return gazetteers
+
+
+def scan_classifier(gazetteers):
+    """Previous approach: any(term in name) over each category's list"""
+    lists = {location_type: [term.lower() for term in terms] for location_type, terms in gazetteers.items()}
+    lists[LocationType.INTERSECTION] = list(INTERSECTION_MARKERS)
+
+    def classify(location_name):
+        name_lower = location_name.lower()
+        for location_type in CLASSIFICATION_PRIORITY:
+            if any(term in name_lower for term in lists[location_type]):
+                return location_type
+        return LocationType.INTERSECTION
+    return classify
+
+
+def build_names(route_count: int):
+    names = []
+    for i in range(route_count):
+        route = synthetic_directions(f"Origin {i}", f"Destination {i}", step_count=20, step_meters=800)
+        for step in route["routes"][0]["legs"][0]["steps"]:
+            _, name = parse_instruction(step["html_instructions"])
+            names.append(name or "40.7128, -74.0060")
+    return names
+
+
+def timed(classify, names, repeat):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for name in names:
+            classify(name)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[22, 1000, 10000])
+    parser.add_argument("--routes", type=int, default=200)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    names = build_names(args.routes)
+    print(f"{len(names)} location names\n")
+    print(f"{'terms':>7} {'keyword scans':>15} {'automaton':>12} {'speedup':>8}")
+
+    for size in args.sizes:
+        gazetteers = padded_gazetteers(size)
+        scan = scan_classifier(gazetteers)
+        classifier = LocationClassifier(gazetteers)
+        automaton = lambda name: classifier.classify(name).location_type
+        if any(scan(name) != automaton(name) for name in names):
+            sys.exit(f"Classifiers disagree at {size} terms")
+
+        scan_seconds = timed(scan, names, args.repeat)
+        automaton_seconds = timed(automaton, names, args.repeat)
+        print(f"{size:>7} {scan_seconds * 1000:>12.1f} ms {automaton_seconds * 1000:>9.1f} ms "
+              f"{scan_seconds / automaton_seconds:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Route Retrieval Load Test
+Drives the real (non-mock) route retrieval path against the local stub server
+
+Starts src.stub_server in-process, points GOOGLE_MAPS_BASE_URL at it and
+retrieves routes from many threads, reporting latency percentiles, errors
+and what the stub observed (rate limiting, injected errors, connections).
+Caching is disabled so every request reaches the stub.
+
+Usage:
+    python examples/load_test_stub.py --requests 500 --threads 16 \
+        --route-steps 200 --latency lognormal --latency-ms 80 --latency-spread-ms 40 \
+        --error-rate 0.01 --rate 100
+"""
+
+import argparse
+import statistics
+import sys
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from src.config import SystemConfig, set_config
+from src.models import TransactionContext
+from src.modules.route_retrieval import RouteRetrievalError, retrieve_route
+from src.stub_server import LATENCY_DISTRIBUTIONS, LatencyModel, StubServer, StubServerConfig
+
+
+def retrieve_once(index: int):
+    context = TransactionContext(
+        transaction_id=str(uuid.uuid4()),
+        origin=f"Origin {index % 50}",
+        destination=f"Destination {index % 37}"
+    )
+    start = time.perf_counter()
+    try:
+        route = retrieve_route(context)
+        return time.perf_counter() - start, route.waypoint_count(), None
+    except RouteRetrievalError as e:
+        return time.perf_counter() - start, 0, e.status or "network"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--route-steps", type=int, default=50)
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="lognormal")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--latency-spread-ms", type=float, default=25.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--rate", type=float, default=0.0, help="Stub-side requests per second (0 = unlimited)")
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    stub = StubServer(StubServerConfig(
+        route_steps=args.route_steps,
+        latency=LatencyModel(args.latency, args.latency_ms, args.latency_spread_ms),
+        error_rate=args.error_rate,
+        rate_per_second=args.rate,
+        seed=args.seed
+    )).start()
+    set_config(SystemConfig(
+        google_maps_api_key="stub",
+        google_maps_base_url=stub.url,
+        mock_mode=False,
+        enable_caching=False,
+        reverse_geocode_waypoints=False,
+        log_level="WARNING",
+        log_file_path="./logs/load_test.log"
+    ))
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        results = list(executor.map(retrieve_once, range(args.requests)))
+    elapsed = time.perf_counter() - start
+    stub.stop()
+
+    latencies = sorted(seconds * 1000 for seconds, _, error in results if error is None)
+    errors = [error for _, _, error in results if error is not None]
+    print(f"{args.requests} route retrievals on {args.threads} threads in {elapsed:.2f} s "
+          f"({args.requests / elapsed:.1f} routes/s)")
+    if latencies:
+        quantiles = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        print(f"  latency p50 {quantiles[49]:.1f} ms  p95 {quantiles[94]:.1f} ms  "
+              f"p99 {quantiles[98]:.1f} ms  max {latencies[-1]:.1f} ms")
+        print(f"  waypoints per route: {statistics.mean(w for _, w, e in results if e is None):.0f}")
+    print(f"  failed: {len(errors)} {dict((e, errors.count(e)) for e in set(errors))}")
+    print(f"  stub: {stub.stats()}")
+
+
+if __name__ == "__main__":
+    main()
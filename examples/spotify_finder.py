@@ -13,6 +13,11 @@ import requests
 from typing import Dict, Any, Optional, List
 
 
+# Overridable to point at a local stub server (python -m src.stub_server)
+SPOTIFY_ACCOUNTS_URL = os.getenv('SPOTIFY_ACCOUNTS_URL', 'https://accounts.spotify.com')
+SPOTIFY_API_URL = os.getenv('SPOTIFY_API_URL', 'https://api.spotify.com')
+
+
 def authenticate_spotify() -> Optional[str]:
     """
     Authenticate with Spotify Web API using client credentials flow
@@ -33,7 +38,7 @@ def authenticate_spotify() -> Optional[str]:
     auth_base64 = base64.b64encode(auth_bytes).decode('utf-8')
 
     # Request access token
-    url = "https://accounts.spotify.com/api/token"
+    url = f"{SPOTIFY_ACCOUNTS_URL}/api/token"
     headers = {
         "Authorization": f"Basic {auth_base64}",
         "Content-Type": "application/x-www-form-urlencoded"
@@ -61,7 +66,7 @@ def search_spotify(token: str, query: str, limit: int = 20) -> List[Dict[str, An
     Returns:
         List of track objects
     """
-    url = "https://api.spotify.com/v1/search"
+    url = f"{SPOTIFY_API_URL}/v1/search"
     headers = {"Authorization": f"Bearer {token}"}
     params = {
         "q": query,
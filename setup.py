@@ -48,6 +48,7 @@ setup(
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
             "pytest-asyncio>=0.21.0",
+            "numpy>=1.24",
             "black>=23.0.0",
             "flake8>=6.0.0",
             "mypy>=1.0.0",
@@ -60,11 +61,12 @@ setup(
     entry_points={
         "console_scripts": [
             "tour-guide=main:main",
+            "tour-guide-warmup=src.cache.warmup:main",
         ],
     },
     include_package_data=True,
     package_data={
-        "src": ["*.json", "*.yaml"],
+        "src": ["*.json", "*.yaml", "modules/gazetteers/*.txt"],
     },
     project_urls={
         "Bug Reports": "https://github.com/yourusername/multi-agent-tour-guide/issues",
@@ -33,6 +33,7 @@ from src.models import (
     create_fallback_content,
     create_timeout_result,
     create_error_result,
+    create_no_results_result,
 )
 
 from src.config import (
@@ -76,6 +77,7 @@ __all__ = [
     "create_fallback_content",
     "create_timeout_result",
     "create_error_result",
+    "create_no_results_result",
 
     # Configuration
     "SystemConfig",
@@ -6,7 +6,14 @@ Wrapper for youtube-location-video-finder agent
 import time
 from typing import Dict, Any
 
-from src.models import AgentResult, ContentItem, ContentType, AgentStatus, Waypoint
+from src.models import (
+    AgentResult,
+    ContentItem,
+    ContentType,
+    AgentStatus,
+    Waypoint,
+    create_no_results_result
+)
 from src.logging_config import get_logger
 
 
@@ -49,7 +56,8 @@ def parse_youtube_agent_response(
     response: Dict[str, Any],
     transaction_id: str,
     waypoint_id: int,
-    execution_time_ms: int
+    execution_time_ms: int,
+    query: str = ""
 ) -> AgentResult:
     """
     Parse response from YouTube agent into AgentResult format
@@ -59,12 +67,19 @@ def parse_youtube_agent_response(
         transaction_id: Transaction ID
         waypoint_id: Waypoint ID
         execution_time_ms: Execution time
+        query: Search query the agent ran (for no-results reporting)
 
     Returns:
         Parsed AgentResult
     """
     logger = get_logger()
 
+    # Agent found no videos for this query
+    if not response:
+        result = create_no_results_result("youtube", transaction_id, waypoint_id, query)
+        result.execution_time_ms = execution_time_ms
+        return result
+
     try:
         # Extract content from agent response
         content = ContentItem(
@@ -0,0 +1,66 @@
+"""
+Caching Package
+In-process caches for route lookups, agent results, waypoint preprocessing,
+formatted responses and reverse geocoding, with an optional shared backend
+"""
+
+from src.cache.ttl_cache import TTLCache, CacheEntry, CacheStats
+from src.cache.sizing import estimate_size
+from src.cache.backends import (
+    CacheBackend,
+    CacheBackendError,
+    InMemoryBackend,
+    RedisBackend,
+)
+from src.cache.serialization import serialize, deserialize, PayloadSignatureError, SCHEMA_VERSION
+from src.cache.stats_reporter import CacheStatsReporter
+from src.cache.registry import (
+    ROUTE_CACHE,
+    AGENT_RESULT_CACHE,
+    PREPROCESSING_CACHE,
+    RESPONSE_CACHE,
+    GEOCODE_CACHE,
+    get_cache,
+    get_cache_stats,
+    reset_caches,
+    make_route_key,
+    make_agent_key,
+)
+from src.cache.response_cache import (
+    IdempotencyKeyReusedError,
+    execute_idempotent,
+    make_idempotency_key,
+    make_request_key,
+    make_request_fingerprint,
+)
+
+__all__ = [
+    "TTLCache",
+    "CacheEntry",
+    "CacheStats",
+    "CacheStatsReporter",
+    "estimate_size",
+    "CacheBackend",
+    "CacheBackendError",
+    "InMemoryBackend",
+    "RedisBackend",
+    "serialize",
+    "deserialize",
+    "PayloadSignatureError",
+    "SCHEMA_VERSION",
+    "ROUTE_CACHE",
+    "AGENT_RESULT_CACHE",
+    "PREPROCESSING_CACHE",
+    "RESPONSE_CACHE",
+    "GEOCODE_CACHE",
+    "get_cache",
+    "get_cache_stats",
+    "reset_caches",
+    "make_route_key",
+    "make_agent_key",
+    "IdempotencyKeyReusedError",
+    "execute_idempotent",
+    "make_idempotency_key",
+    "make_request_key",
+    "make_request_fingerprint",
+]
@@ -0,0 +1,266 @@
+"""
+Cache Backends
+Shared storage tier behind the in-process caches
+
+A TTLCache configured with a backend writes entries through to it and falls
+back to it on local misses, so several pipeline workers share one cache.
+Backends store opaque payloads (see src.cache.serialization) with a TTL.
+"""
+
+import math
+import socket
+import threading
+import time
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from urllib.parse import unquote, urlparse
+
+
+# (payload, remaining TTL in seconds; math.inf if the key never expires)
+StoredPayload = Tuple[bytes, float]
+
+
+class CacheBackendError(Exception):
+    """Raised when a cache backend cannot be reached or rejects a command"""
+    pass
+
+
+class CacheBackend(ABC):
+    """Key/value store for serialized cache entries"""
+
+    @abstractmethod
+    def get_many(self, keys: Sequence[str]) -> Dict[str, StoredPayload]:
+        """
+        Fetch several keys in one round trip
+
+        Args:
+            keys: Backend keys
+
+        Returns:
+            Mapping of found keys to (payload, remaining TTL seconds);
+            missing and expired keys are omitted
+        """
+
+    @abstractmethod
+    def set(self, key: str, payload: bytes, ttl_seconds: float) -> None:
+        """Store a payload (math.inf TTL = no expiry)"""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove a key if present"""
+
+    def close(self) -> None:
+        """Release connections (no-op by default)"""
+
+
+class InMemoryBackend(CacheBackend):
+    """
+    Process-local backend
+    Shares entries between caches in one process; also the reference
+    implementation used in tests and by the fake Redis server
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._data: Dict[str, Tuple[bytes, float]] = {}
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, StoredPayload]:
+        now = self._clock()
+        found = {}
+        with self._lock:
+            for key in keys:
+                item = self._data.get(key)
+                if item is None:
+                    continue
+                payload, expires_at = item
+                if now >= expires_at:
+                    del self._data[key]
+                    continue
+                found[key] = (payload, expires_at - now)
+        return found
+
+    def set(self, key: str, payload: bytes, ttl_seconds: float) -> None:
+        with self._lock:
+            self._data[key] = (payload, self._clock() + ttl_seconds)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+
+class RedisBackend(CacheBackend):
+    """
+    Minimal Redis-protocol (RESP2) client over one persistent connection
+
+    Batched lookups are pipelined: all GET/PTTL commands are written at once
+    and the replies read back in order. Reconnects lazily after errors.
+    """
+
+    def __init__(self, url: str, timeout_seconds: float = 0.2):
+        """
+        Args:
+            url: redis://[:password@]host[:port][/db]
+            timeout_seconds: Connect and per-reply socket timeout
+        """
+        parsed = urlparse(url)
+        if parsed.scheme != "redis":
+            raise ValueError(f"Unsupported cache backend URL: {url}")
+
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.timeout_seconds = timeout_seconds
+        self._sock: Optional[socket.socket] = None
+        self._reader = None
+        self._lock = threading.Lock()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, StoredPayload]:
+        if not keys:
+            return {}
+
+        commands = []
+        for key in keys:
+            commands.append(("GET", key))
+            commands.append(("PTTL", key))
+        replies = self.pipeline(commands)
+
+        found = {}
+        for index, key in enumerate(keys):
+            payload, pttl = replies[2 * index], replies[2 * index + 1]
+            if payload is None or pttl == -2:
+                continue
+            found[key] = (payload, math.inf if pttl == -1 else pttl / 1000)
+        return found
+
+    def set(self, key: str, payload: bytes, ttl_seconds: float) -> None:
+        if math.isinf(ttl_seconds):
+            self.pipeline([("SET", key, payload)])
+        else:
+            ttl_ms = max(1, int(ttl_seconds * 1000))
+            self.pipeline([("SET", key, payload, "PX", str(ttl_ms))])
+
+    def delete(self, key: str) -> None:
+        self.pipeline([("DEL", key)])
+
+    def pipeline(self, commands: List[Tuple[Any, ...]]) -> List[Any]:
+        """
+        Send several commands in one write and read all replies
+
+        Args:
+            commands: Commands as tuples of str/bytes arguments
+
+        Returns:
+            Decoded replies in command order
+
+        Raises:
+            CacheBackendError: On connection failure or any error reply
+        """
+        with self._lock:
+            try:
+                if self._sock is None:
+                    self._connect()
+                self._sock.sendall(b"".join(_encode_command(c) for c in commands))
+                replies = [self._read_reply() for _ in commands]
+            except (OSError, ValueError) as e:
+                self._disconnect()
+                raise CacheBackendError(
+                    f"Cache backend {self.host}:{self.port} unavailable: {str(e)}"
+                ) from e
+
+        for reply in replies:
+            if isinstance(reply, _ErrorReply):
+                raise CacheBackendError(f"Cache backend error: {reply}")
+        return replies
+
+    def close(self) -> None:
+        with self._lock:
+            self._disconnect()
+
+    def _connect(self) -> None:
+        # Caller holds self._lock
+        self._sock = socket.create_connection((self.host, self.port), timeout=self.timeout_seconds)
+        self._sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self._reader = self._sock.makefile("rb")
+
+        setup = []
+        if self.password:
+            setup.append(("AUTH", self.password))
+        if self.db:
+            setup.append(("SELECT", str(self.db)))
+        if setup:
+            self._sock.sendall(b"".join(_encode_command(c) for c in setup))
+            for _ in setup:
+                reply = self._read_reply()
+                if isinstance(reply, _ErrorReply):
+                    raise ValueError(str(reply))
+
+    def _disconnect(self) -> None:
+        # Caller holds self._lock
+        if self._reader is not None:
+            self._reader.close()
+        if self._sock is not None:
+            self._sock.close()
+        self._sock = None
+        self._reader = None
+
+    def _read_reply(self) -> Any:
+        return read_reply(self._reader)
+
+
+class _ErrorReply(str):
+    """RESP error reply ("-ERR ...")"""
+
+
+def _encode_command(args: Tuple[Any, ...]) -> bytes:
+    parts = [f"*{len(args)}\r\n".encode()]
+    for arg in args:
+        data = arg if isinstance(arg, bytes) else str(arg).encode("utf-8")
+        parts.append(f"${len(data)}\r\n".encode())
+        parts.append(data)
+        parts.append(b"\r\n")
+    return b"".join(parts)
+
+
+def read_reply(reader) -> Any:
+    """
+    Read one RESP2 value from a binary file-like object
+
+    Returns:
+        str for simple strings, _ErrorReply for errors, int, bytes or None
+        for bulk strings, list for arrays
+
+    Raises:
+        ValueError: On a closed connection or malformed data
+    """
+    line = reader.readline()
+    if not line.endswith(b"\r\n"):
+        raise ValueError("Connection closed by cache backend")
+
+    prefix, body = line[:1], line[1:-2]
+    if prefix == b"+":
+        return body.decode("utf-8")
+    if prefix == b"-":
+        return _ErrorReply(body.decode("utf-8"))
+    if prefix == b":":
+        return int(body)
+    if prefix == b"$":
+        length = int(body)
+        if length < 0:
+            return None
+        data = reader.read(length + 2)
+        if len(data) != length + 2:
+            raise ValueError("Connection closed by cache backend")
+        return data[:-2]
+    if prefix == b"*":
+        count = int(body)
+        if count < 0:
+            return None
+        return [read_reply(reader) for _ in range(count)]
+
+    raise ValueError(f"Malformed cache backend reply: {line!r}")
@@ -0,0 +1,147 @@
+"""
+Fake Redis Server
+In-process Redis-protocol server for offline tests and local development
+
+Implements the subset of commands used by RedisBackend (GET, SET with PX/EX,
+PTTL, DEL, PING, SELECT, AUTH, FLUSHDB) on top of an InMemoryBackend.
+
+Usage:
+    server = FakeRedisServer().start()
+    backend = RedisBackend(server.url)
+    ...
+    server.stop()
+"""
+
+import math
+import socketserver
+import threading
+from typing import Any, Callable, List, Optional
+
+from src.cache.backends import InMemoryBackend, read_reply
+
+
+class FakeRedisServer:
+    """Threaded RESP2 server listening on localhost"""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0):
+        """
+        Args:
+            host: Interface to bind
+            port: Port to bind (0 = pick a free port)
+        """
+        self.store = InMemoryBackend()
+        self.command_count = 0
+        self._count_lock = threading.Lock()
+        self._server = _ThreadingServer((host, port), _make_handler(self))
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"redis://{host}:{port}/0"
+
+    def start(self) -> "FakeRedisServer":
+        """Serve in a daemon thread; returns self for chaining"""
+        self._thread = threading.Thread(
+            target=self._server.serve_forever,
+            name="fake-redis",
+            daemon=True
+        )
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket"""
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+
+    def execute(self, args: List[bytes]) -> Any:
+        """
+        Execute one command
+
+        Returns:
+            Reply value (see _encode_reply for the RESP mapping)
+        """
+        with self._count_lock:
+            self.command_count += 1
+
+        name = args[0].decode("utf-8").upper()
+        keys = [arg.decode("utf-8") for arg in args[1:2]]
+
+        if name == "PING":
+            return _Status("PONG")
+        if name in ("SELECT", "AUTH"):
+            return _Status("OK")
+        if name == "FLUSHDB":
+            self.store.clear()
+            return _Status("OK")
+        if name == "GET" and len(args) == 2:
+            found = self.store.get_many(keys)
+            return found[keys[0]][0] if found else None
+        if name == "PTTL" and len(args) == 2:
+            found = self.store.get_many(keys)
+            if not found:
+                return -2
+            remaining = found[keys[0]][1]
+            return -1 if math.isinf(remaining) else int(remaining * 1000)
+        if name == "DEL" and len(args) >= 2:
+            deleted = 0
+            for key in (arg.decode("utf-8") for arg in args[1:]):
+                if self.store.get_many([key]):
+                    self.store.delete(key)
+                    deleted += 1
+            return deleted
+        if name == "SET" and len(args) in (3, 5):
+            ttl_seconds = math.inf
+            if len(args) == 5:
+                unit = args[3].decode("utf-8").upper()
+                if unit not in ("PX", "EX"):
+                    return _Error("ERR syntax error")
+                ttl_seconds = int(args[4]) / (1000 if unit == "PX" else 1)
+            self.store.set(keys[0], args[2], ttl_seconds)
+            return _Status("OK")
+
+        return _Error(f"ERR unknown command or wrong number of arguments for '{name}'")
+
+
+class _ThreadingServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+
+class _Status(str):
+    """Simple string reply ("+OK")"""
+
+
+class _Error(str):
+    """Error reply ("-ERR ...")"""
+
+
+def _make_handler(server: FakeRedisServer) -> Callable[..., socketserver.BaseRequestHandler]:
+    class _Handler(socketserver.StreamRequestHandler):
+        def handle(self) -> None:
+            while True:
+                try:
+                    command = read_reply(self.rfile)
+                except (OSError, ValueError):
+                    return
+                if not isinstance(command, list) or not command:
+                    self.wfile.write(_encode_reply(_Error("ERR protocol error")))
+                    return
+                self.wfile.write(_encode_reply(server.execute(command)))
+
+    return _Handler
+
+
+def _encode_reply(value: Any) -> bytes:
+    if isinstance(value, _Status):
+        return f"+{value}\r\n".encode("utf-8")
+    if isinstance(value, _Error):
+        return f"-{value}\r\n".encode("utf-8")
+    if isinstance(value, int):
+        return f":{value}\r\n".encode("utf-8")
+    if value is None:
+        return b"$-1\r\n"
+    return f"${len(value)}\r\n".encode("utf-8") + value + b"\r\n"
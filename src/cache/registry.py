@@ -0,0 +1,192 @@
+"""
+Cache Registry
+Process-wide cache instances, one per namespace
+"""
+
+import threading
+from typing import Dict, Optional
+
+from src.cache.backends import CacheBackend, RedisBackend
+from src.cache.stats_reporter import CacheStatsReporter
+from src.cache.ttl_cache import CacheStats, TTLCache
+from src.config import SystemConfig, get_config
+from src.logging_config import get_logger
+
+
+# Cache namespaces
+ROUTE_CACHE = "routes"
+AGENT_RESULT_CACHE = "agent_results"
+PREPROCESSING_CACHE = "preprocessing"
+RESPONSE_CACHE = "responses"
+GEOCODE_CACHE = "geocoding"
+
+_caches: Dict[str, TTLCache] = {}
+_registry_lock = threading.Lock()
+_stats_reporter: Optional[CacheStatsReporter] = None
+_backend: Optional[CacheBackend] = None
+
+
+def get_cache(namespace: str) -> TTLCache:
+    """
+    Get the cache for a namespace
+    Creates it from the global configuration on first call, and starts
+    periodic statistics logging (and connects the shared backend, if
+    configured with a signing secret) when the first cache is created
+
+    Args:
+        namespace: Cache namespace (e.g. ROUTE_CACHE)
+
+    Returns:
+        Shared TTLCache instance
+    """
+    global _stats_reporter, _backend
+
+    with _registry_lock:
+        cache = _caches.get(namespace)
+        if cache is None:
+            config = get_config()
+            if _backend is None and config.cache_backend == "redis":
+                if config.cache_backend_secret:
+                    _backend = RedisBackend(
+                        config.cache_backend_url,
+                        timeout_seconds=config.cache_backend_timeout_ms / 1000
+                    )
+                elif not _caches:
+                    # validate() rejects this outside mock mode
+                    get_logger().warning(
+                        "CACHE_BACKEND_SECRET is not set; shared cache backend disabled"
+                    )
+            cache = _build_cache(namespace, config, _backend)
+            _caches[namespace] = cache
+
+            if _stats_reporter is None and config.cache_stats_interval_seconds > 0:
+                _stats_reporter = CacheStatsReporter(
+                    config.cache_stats_interval_seconds,
+                    get_cache_stats
+                )
+                _stats_reporter.start()
+        return cache
+
+
+def get_cache_stats() -> Dict[str, CacheStats]:
+    """
+    Snapshot statistics for every cache created so far
+
+    Returns:
+        Mapping of namespace to CacheStats (e.g. for dashboards)
+    """
+    with _registry_lock:
+        caches = list(_caches.values())
+    return {cache.namespace: cache.stats() for cache in caches}
+
+
+def reset_caches() -> None:
+    """
+    Drop all cache instances
+    Next get_cache() call rebuilds them from the current configuration
+    """
+    global _stats_reporter, _backend
+
+    with _registry_lock:
+        for cache in _caches.values():
+            cache.close()
+        _caches.clear()
+        reporter, _stats_reporter = _stats_reporter, None
+        backend, _backend = _backend, None
+
+    if reporter is not None:
+        reporter.stop()
+    if backend is not None:
+        backend.close()
+
+
+def make_route_key(origin: str, destination: str, mode: str = "driving") -> str:
+    """
+    Build a normalized cache key for a route lookup
+
+    Args:
+        origin: Starting location
+        destination: Ending location
+        mode: Travel mode
+
+    Returns:
+        Case- and whitespace-insensitive key
+    """
+    def _normalize(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    return f"{_normalize(origin)}|{_normalize(destination)}|{mode}"
+
+
+def make_agent_key(agent_name: str, query: str) -> str:
+    """
+    Build a cache key for an agent search query
+
+    Args:
+        agent_name: Agent name ("youtube", "spotify", "history")
+        query: Agent search query from AgentContext
+
+    Returns:
+        Cache key
+    """
+    return f"{agent_name}|{' '.join(query.lower().split())}"
+
+
+def _build_cache(
+    namespace: str,
+    config: SystemConfig,
+    backend: Optional[CacheBackend] = None
+) -> TTLCache:
+    """Create a cache with the settings appropriate for its namespace"""
+    if namespace == PREPROCESSING_CACHE:
+        # Pure function of (location_name, instruction): never expires, only evicts.
+        # Recomputing is cheaper than a backend round trip, so it stays local
+        return TTLCache(
+            namespace=namespace,
+            ttl_seconds=float("inf"),
+            negative_ttl_seconds=0,
+            max_entries=config.preprocessing_cache_max_entries,
+            max_bytes=_megabytes(config.cache_max_size_mb)
+        )
+
+    if namespace == RESPONSE_CACHE:
+        # Entries are stored with the idempotency or deduplication window as TTL
+        return TTLCache(
+            namespace=namespace,
+            ttl_seconds=config.idempotency_window_seconds,
+            negative_ttl_seconds=0,
+            max_entries=config.cache_max_entries,
+            max_bytes=_megabytes(config.cache_max_size_mb),
+            backend=backend,
+            secret=config.cache_backend_secret.encode()
+        )
+
+    if namespace == GEOCODE_CACHE:
+        # Bulk resolution has no background refresh, so expired addresses are misses
+        return TTLCache(
+            namespace=namespace,
+            ttl_seconds=config.cache_ttl_seconds,
+            negative_ttl_seconds=config.negative_cache_ttl_seconds,
+            max_entries=config.cache_max_entries,
+            stale_grace_seconds=0,
+            max_bytes=_megabytes(config.cache_max_size_mb),
+            backend=backend,
+            secret=config.cache_backend_secret.encode()
+        )
+
+    size_mb = config.route_cache_max_size_mb if namespace == ROUTE_CACHE else config.cache_max_size_mb
+
+    return TTLCache(
+        namespace=namespace,
+        ttl_seconds=config.cache_ttl_seconds,
+        negative_ttl_seconds=config.negative_cache_ttl_seconds,
+        max_entries=config.cache_max_entries,
+        stale_grace_seconds=config.cache_stale_grace_seconds,
+        max_bytes=_megabytes(size_mb),
+        backend=backend,
+        secret=config.cache_backend_secret.encode()
+    )
+
+
+def _megabytes(size_mb: int) -> int:
+    return size_mb * 1024 * 1024
@@ -0,0 +1,185 @@
+"""
+Response Cache
+Replays formatted pipeline responses for repeated requests
+
+Used for client idempotency keys and, optionally, for deduplicating identical
+(origin, destination, preferences) requests. Concurrent duplicates wait for
+the first execution instead of running the pipeline again.
+
+Idempotency keys are client-chosen, so each stored response carries a
+fingerprint of the request that produced it; reusing a key for a different
+request raises IdempotencyKeyReusedError instead of replaying.
+"""
+
+import copy
+import hashlib
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Optional
+
+from src.cache.registry import RESPONSE_CACHE, get_cache
+from src.logging_config import get_logger
+
+
+class IdempotencyKeyReusedError(Exception):
+    """Raised when an idempotency key is reused for a different request"""
+    pass
+
+
+@dataclass
+class _InFlightCall:
+    """Pipeline execution shared by concurrent duplicate requests"""
+    fingerprint: Optional[str] = None
+    done: threading.Event = field(default_factory=threading.Event)
+    response: Optional[Dict[str, Any]] = None
+    error: Optional[BaseException] = None
+
+
+# Guards only the in-flight map; cache (and backend) lookups happen outside it
+_in_flight: Dict[str, _InFlightCall] = {}
+_in_flight_lock = threading.Lock()
+
+
+def execute_idempotent(
+    key: str,
+    window_seconds: float,
+    execute: Callable[[], Dict[str, Any]],
+    fingerprint: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Run execute() at most once per key within the window
+
+    Successful responses are stored for window_seconds and replayed to
+    repeated requests. Error responses are shared with concurrent duplicates
+    but never stored, so a later retry runs the pipeline again.
+
+    Args:
+        key: Idempotency or deduplication key
+        window_seconds: How long a successful response is replayed
+        execute: Callable producing the formatted response
+        fingerprint: Identifies the request behind key (see
+            make_request_fingerprint); None if the key already does
+
+    Returns:
+        Formatted response (a private copy for every caller)
+
+    Raises:
+        IdempotencyKeyReusedError: If key was used for a request with a
+            different fingerprint
+    """
+    cache = get_cache(RESPONSE_CACHE)
+
+    replay = _replay_cached(cache, key, fingerprint)
+    if replay is not None:
+        return replay
+
+    with _in_flight_lock:
+        call = _in_flight.get(key)
+        is_leader = call is None
+        if is_leader:
+            call = _InFlightCall(fingerprint=fingerprint)
+            _in_flight[key] = call
+
+    if not is_leader:
+        _check_fingerprint(key, call.fingerprint, fingerprint)
+        call.done.wait()
+        if call.error is not None:
+            raise call.error
+        return copy.deepcopy(call.response)
+
+    try:
+        # A previous leader may have stored its response after our first lookup
+        replay = _replay_cached(cache, key, fingerprint)
+        if replay is not None:
+            call.response = copy.deepcopy(replay)
+            return replay
+
+        response = execute()
+        call.response = copy.deepcopy(response)
+        if "error" not in response:
+            cache.set(
+                key,
+                {"fingerprint": fingerprint, "response": call.response},
+                ttl_seconds=window_seconds
+            )
+        return response
+
+    except BaseException as e:
+        call.error = e
+        raise
+
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+        call.done.set()
+
+
+def _replay_cached(cache, key: str, fingerprint: Optional[str]) -> Optional[Dict[str, Any]]:
+    """Return a copy of the stored response for key, or None if there is none"""
+    entry = cache.get(key)
+    if entry is None:
+        return None
+
+    _check_fingerprint(key, entry.value["fingerprint"], fingerprint)
+    response = entry.value["response"]
+    get_logger().info(
+        "Replaying cached response",
+        transaction_id=response.get("transaction_id"),
+        response_key=key
+    )
+    return copy.deepcopy(response)
+
+
+def _check_fingerprint(key: str, stored: Optional[str], fingerprint: Optional[str]) -> None:
+    if stored != fingerprint:
+        raise IdempotencyKeyReusedError(
+            f"Key {key.split('|', 1)[-1]!r} was already used for a different request"
+        )
+
+
+def make_idempotency_key(idempotency_key: str) -> str:
+    """Namespace a client-supplied idempotency key"""
+    return f"idempotency|{idempotency_key}"
+
+
+def make_request_key(
+    origin: Any,
+    destination: Any,
+    preferences: Optional[Dict[str, Any]]
+) -> str:
+    """
+    Build a deduplication key for an (origin, destination, preferences) tuple
+
+    Args:
+        origin: Starting location as supplied by the client
+        destination: Ending location as supplied by the client
+        preferences: User preferences (order-insensitive)
+
+    Returns:
+        Case- and whitespace-insensitive key
+    """
+    def _normalize(text: Any) -> str:
+        return " ".join(str(text or "").lower().split())
+
+    preferences_json = json.dumps(preferences or {}, sort_keys=True, default=str)
+    return f"request|{_normalize(origin)}|{_normalize(destination)}|{preferences_json}"
+
+
+def make_request_fingerprint(
+    origin: Any,
+    destination: Any,
+    preferences: Optional[Dict[str, Any]]
+) -> str:
+    """
+    Fingerprint an (origin, destination, preferences) tuple
+
+    Args:
+        origin: Starting location as supplied by the client
+        destination: Ending location as supplied by the client
+        preferences: User preferences
+
+    Returns:
+        Hex digest equal for requests make_request_key treats as identical
+    """
+    return hashlib.sha256(make_request_key(origin, destination, preferences).encode("utf-8")).hexdigest()
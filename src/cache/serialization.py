@@ -0,0 +1,88 @@
+"""
+Cache Value Serialization
+Compact, signed binary encoding for values stored in a shared cache backend
+
+Values are pickled (RouteData, AgentResult and response dicts round-trip
+unchanged) and zlib-compressed above a size threshold. The first byte of
+every payload records the encoding, followed by an HMAC-SHA256 tag over the
+backend key and the rest of the payload.
+
+Unpickling can execute arbitrary code, so deserialize() verifies the tag
+with the configured secret (CACHE_BACKEND_SECRET) before decompressing or
+unpickling anything: only processes holding the secret can produce payloads
+that are loaded, and a payload only verifies under the key it was written
+to, so entries cannot be copied between keys. Anyone with the secret is
+trusted as much as the process.
+"""
+
+import hashlib
+import hmac
+import pickle
+import zlib
+from typing import Any
+
+
+# Bump when cached value types change incompatibly; it is part of every
+# backend key, so entries written by older deploys are never read
+SCHEMA_VERSION = 3
+
+COMPRESSION_THRESHOLD_BYTES = 512
+
+_RAW = b"\x00"
+_ZLIB = b"\x01"
+_TAG_BYTES = hashlib.sha256().digest_size
+
+
+class PayloadSignatureError(ValueError):
+    """Raised when a payload's signature does not match the secret"""
+
+
+def serialize(value: Any, secret: bytes, key: str) -> bytes:
+    """
+    Encode and sign a value for storage in a cache backend
+
+    Args:
+        value: Picklable value
+        secret: Signing key shared by every process using the backend
+        key: Backend key the payload is stored under
+
+    Returns:
+        Payload bytes (header byte + HMAC tag + pickle, compressed if large)
+    """
+    data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    header = _RAW
+    if len(data) > COMPRESSION_THRESHOLD_BYTES:
+        compressed = zlib.compress(data)
+        if len(compressed) < len(data):
+            header, data = _ZLIB, compressed
+    return header + _sign(secret, key, header, data) + data
+
+
+def deserialize(payload: bytes, secret: bytes, key: str) -> Any:
+    """
+    Verify and decode a payload produced by serialize()
+
+    Args:
+        payload: Bytes read from the backend
+        secret: Signing key the payload must have been signed with
+        key: Backend key the payload was read from
+
+    Raises:
+        PayloadSignatureError: If the signature is missing or does not match
+        ValueError: If the payload header is unknown
+    """
+    header, tag, data = payload[:1], payload[1:1 + _TAG_BYTES], payload[1 + _TAG_BYTES:]
+    if header not in (_RAW, _ZLIB):
+        raise ValueError(f"Unknown cache payload encoding: {header!r}")
+    if not hmac.compare_digest(tag, _sign(secret, key, header, data)):
+        raise PayloadSignatureError("Cache payload signature mismatch")
+    if header == _ZLIB:
+        data = zlib.decompress(data)
+    return pickle.loads(data)
+
+
+def _sign(secret: bytes, key: str, header: bytes, data: bytes) -> bytes:
+    # Length-prefix the key so no (key, payload) pair can be re-split into another
+    encoded_key = key.encode("utf-8")
+    message = len(encoded_key).to_bytes(4, "big") + encoded_key + header + data
+    return hmac.new(secret, message, hashlib.sha256).digest()
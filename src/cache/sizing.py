@@ -0,0 +1,55 @@
+"""
+Cache Entry Sizing
+Estimates the memory held by cached objects
+"""
+
+import sys
+from enum import Enum
+from typing import Any, Set
+
+
+def estimate_size(obj: Any) -> int:
+    """
+    Estimate the deep in-memory size of an object in bytes
+
+    Follows containers, dataclasses and plain objects, counting shared
+    objects once. Enum members, classes and other process-wide singletons
+    are not counted since caching does not keep them alive.
+
+    Args:
+        obj: Object to measure (e.g. RouteData, AgentResult, response dict)
+
+    Returns:
+        Approximate size in bytes
+    """
+    return _deep_size(obj, set())
+
+
+def _deep_size(obj: Any, seen: Set[int]) -> int:
+    if obj is None or isinstance(obj, (bool, Enum, type)):
+        return 0
+
+    obj_id = id(obj)
+    if obj_id in seen:
+        return 0
+    seen.add(obj_id)
+
+    size = sys.getsizeof(obj)
+
+    if isinstance(obj, (str, bytes, bytearray, int, float)):
+        return size
+
+    if isinstance(obj, dict):
+        for key, value in obj.items():
+            size += _deep_size(key, seen) + _deep_size(value, seen)
+        return size
+
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        for item in obj:
+            size += _deep_size(item, seen)
+        return size
+
+    if hasattr(obj, "__dict__"):
+        size += _deep_size(vars(obj), seen)
+
+    return size
@@ -0,0 +1,55 @@
+"""
+Cache Statistics Reporter
+Periodically exports per-namespace cache statistics to the structured log
+"""
+
+import threading
+from typing import Callable, Dict, Optional
+
+from src.cache.ttl_cache import CacheStats
+from src.logging_config import get_logger
+
+
+class CacheStatsReporter:
+    """
+    Background thread that logs cache statistics at a fixed interval
+    One "Cache statistics" record is written per namespace per interval
+    """
+
+    def __init__(
+        self,
+        interval_seconds: float,
+        collect: Callable[[], Dict[str, CacheStats]]
+    ):
+        self.interval_seconds = interval_seconds
+        self._collect = collect
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start reporting (no-op if already running)"""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="cache-stats-reporter",
+            daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        """Stop reporting and wait for the thread to exit"""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.interval_seconds)
+            self._thread = None
+
+    def report_once(self) -> None:
+        """Write the current statistics of every namespace to the log"""
+        logger = get_logger()
+        for stats in self._collect().values():
+            logger.info("Cache statistics", **stats.to_dict())
+
+    def _run(self) -> None:
+        while not self._stop_event.wait(self.interval_seconds):
+            self.report_once()
@@ -0,0 +1,431 @@
+"""
+TTL Cache
+Thread-safe in-process cache with per-entry expiry, negative entries,
+stale-while-revalidate serving and a byte budget, optionally backed by
+a shared cache backend
+"""
+
+import pickle
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+from src.cache.backends import CacheBackend, CacheBackendError
+from src.cache.serialization import SCHEMA_VERSION, deserialize, serialize
+from src.cache.sizing import estimate_size
+from src.logging_config import get_logger
+
+
+@dataclass
+class CacheEntry:
+    """
+    Single cached value with its expiry information
+
+    Negative entries record a deterministic failure (e.g. an unroutable
+    origin/destination pair) so repeats can fail fast without an upstream call.
+    """
+    value: Any
+    created_at: float
+    expires_at: float
+    negative: bool = False
+    size_bytes: int = 0
+
+    def is_expired(self, now: float) -> bool:
+        return now >= self.expires_at
+
+
+@dataclass
+class CacheStats:
+    """
+    Point-in-time statistics for one cache namespace
+    Counters are cumulative since the cache was created
+    """
+    namespace: str
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    entry_count: int
+    bytes_held: int
+    average_entry_age_seconds: float
+    max_bytes: int = 0
+    rejections: int = 0
+    remote_hits: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "namespace": self.namespace,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entry_count": self.entry_count,
+            "bytes_held": self.bytes_held,
+            "max_bytes": self.max_bytes,
+            "rejections": self.rejections,
+            "remote_hits": self.remote_hits,
+            "average_entry_age_seconds": self.average_entry_age_seconds
+        }
+
+
+class TTLCache:
+    """
+    LRU-ordered cache with time-based expiry
+    Positive and negative entries share one key space but use separate TTLs
+
+    Positive entries remain servable for stale_grace_seconds after expiry.
+    Callers serve such stale entries immediately and schedule a single
+    background refresh per key via refresh_async().
+
+    Entries are evicted least recently used first once either max_entries or
+    max_bytes (estimated deep size of the stored values, 0 = unbounded) is
+    exceeded. A single value larger than max_bytes is not stored at all.
+
+    With a backend, entries are written through to it and local misses fall
+    back to it, so processes sharing the backend share cached results.
+    Payloads are signed with secret and unsigned or foreign payloads are
+    ignored. Backend failures are logged and otherwise ignored.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        ttl_seconds: float,
+        negative_ttl_seconds: float,
+        max_entries: int = 1000,
+        stale_grace_seconds: float = 0,
+        max_bytes: int = 0,
+        backend: Optional[CacheBackend] = None,
+        secret: bytes = b"",
+        refresh_workers: int = 2,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        if backend is not None and not secret:
+            raise ValueError("A cache backend requires a payload signing secret")
+        self.namespace = namespace
+        self.ttl_seconds = ttl_seconds
+        self.negative_ttl_seconds = negative_ttl_seconds
+        self.max_entries = max_entries
+        self.stale_grace_seconds = stale_grace_seconds
+        self.max_bytes = max_bytes
+        self.backend = backend
+        self._secret = secret
+        self.refresh_workers = refresh_workers
+        self._clock = clock
+        self._entries: "OrderedDict[Hashable, CacheEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._refreshing: Set[Hashable] = set()
+        self._refresh_pool: Optional[ThreadPoolExecutor] = None
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.rejections = 0
+        self.remote_hits = 0
+        self._bytes_held = 0
+
+    def get(self, key: Hashable) -> Optional[CacheEntry]:
+        """
+        Look up a servable entry
+
+        Args:
+            key: Cache key
+
+        Returns:
+            CacheEntry if fresh, or positive and within the stale grace window;
+            None otherwise. Use is_stale() to decide whether to refresh.
+        """
+        now = self._clock()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                if entry.is_expired(now) and not self._within_grace(entry, now):
+                    self._remove(key)
+                    self.expirations += 1
+                else:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+            if self.backend is None:
+                self.misses += 1
+                return None
+
+        entry = self._load_remote([key]).get(key)
+        with self._lock:
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self.remote_hits += 1
+        return entry
+
+    def prefetch(self, keys: Iterable[Hashable]) -> int:
+        """
+        Load entries missing locally from the backend in one round trip
+        Used before a batch of get() calls (e.g. every agent query of a route)
+
+        Args:
+            keys: Keys about to be looked up
+
+        Returns:
+            Number of entries loaded from the backend
+        """
+        if self.backend is None:
+            return 0
+
+        now = self._clock()
+        with self._lock:
+            missing = [
+                key for key in dict.fromkeys(keys)
+                if key not in self._entries
+                or (self._entries[key].is_expired(now)
+                    and not self._within_grace(self._entries[key], now))
+            ]
+        if not missing:
+            return 0
+        return len(self._load_remote(missing))
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of get() calls that returned an entry (0.0 if never queried)"""
+        return self.stats().hit_rate
+
+    def stats(self) -> CacheStats:
+        """Snapshot of counters, size and entry age for this namespace"""
+        now = self._clock()
+        with self._lock:
+            entry_count = len(self._entries)
+            total_age = sum(now - entry.created_at for entry in self._entries.values())
+            return CacheStats(
+                namespace=self.namespace,
+                hits=self.hits,
+                misses=self.misses,
+                evictions=self.evictions,
+                expirations=self.expirations,
+                entry_count=entry_count,
+                bytes_held=self._bytes_held,
+                average_entry_age_seconds=total_age / entry_count if entry_count else 0.0,
+                max_bytes=self.max_bytes,
+                rejections=self.rejections,
+                remote_hits=self.remote_hits
+            )
+
+    def entry_sizes(self, limit: Optional[int] = None) -> List[Tuple[Hashable, int]]:
+        """
+        Estimated size of each entry, largest first
+
+        Args:
+            limit: Return only the largest N entries (None = all)
+
+        Returns:
+            List of (key, size_bytes) pairs
+        """
+        with self._lock:
+            sizes = [(key, entry.size_bytes) for key, entry in self._entries.items()]
+        sizes.sort(key=lambda item: item[1], reverse=True)
+        return sizes if limit is None else sizes[:limit]
+
+    def is_stale(self, entry: CacheEntry) -> bool:
+        """Whether an entry returned by get() is past its TTL (served from grace)"""
+        return entry.is_expired(self._clock())
+
+    def refresh_async(self, key: Hashable, refresh: Callable[[], None]) -> bool:
+        """
+        Run a refresh for key in the background, at most one in flight per key
+
+        The refresh callable is responsible for storing the new value.
+        If it raises, the stale entry keeps being served until its grace expires.
+
+        Args:
+            key: Cache key being refreshed
+            refresh: Callable that fetches and stores a fresh value
+
+        Returns:
+            True if a refresh was scheduled, False if one is already running
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            if self._refresh_pool is None:
+                self._refresh_pool = ThreadPoolExecutor(
+                    max_workers=self.refresh_workers,
+                    thread_name_prefix=f"cache-refresh-{self.namespace}"
+                )
+            pool = self._refresh_pool
+
+        pool.submit(self._run_refresh, key, refresh)
+        return True
+
+    def close(self, wait: bool = False) -> None:
+        """
+        Stop the background refresh pool
+        In-flight refreshes always finish; wait=True blocks until they have
+        """
+        with self._lock:
+            pool, self._refresh_pool = self._refresh_pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait)
+
+    def set(self, key: Hashable, value: Any, ttl_seconds: Optional[float] = None) -> None:
+        """Store a successful result under the regular TTL (or an explicit override)"""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        self._store(key, value, ttl, negative=False)
+
+    def set_negative(self, key: Hashable, value: Any) -> None:
+        """
+        Store a deterministic failure under the (shorter) negative TTL
+        A non-positive negative TTL disables negative caching
+        """
+        if self.negative_ttl_seconds <= 0:
+            return
+        self._store(key, value, self.negative_ttl_seconds, negative=True)
+
+    def invalidate(self, key: Hashable) -> None:
+        """Remove a single entry if present (locally and in the backend)"""
+        with self._lock:
+            self._remove(key)
+        if self.backend is not None:
+            try:
+                self.backend.delete(self._backend_key(key))
+            except CacheBackendError as e:
+                self._log_backend_failure("delete", key, e)
+
+    def clear(self) -> None:
+        """Remove all local entries (the shared backend is left untouched)"""
+        with self._lock:
+            self._entries.clear()
+            self._bytes_held = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _store(self, key: Hashable, value: Any, ttl: float, negative: bool) -> None:
+        now = self._clock()
+        entry = CacheEntry(
+            value=value,
+            created_at=now,
+            expires_at=now + ttl,
+            negative=negative,
+            size_bytes=estimate_size(value)
+        )
+        if not self._install(key, entry):
+            return
+
+        if self.backend is not None:
+            # Kept remotely through the grace window so other workers can serve it stale
+            remote_ttl = ttl if negative else ttl + self.stale_grace_seconds
+            try:
+                backend_key = self._backend_key(key)
+                payload = serialize((negative, value), self._secret, backend_key)
+                self.backend.set(backend_key, payload, remote_ttl)
+            except (CacheBackendError, pickle.PicklingError, TypeError, AttributeError) as e:
+                self._log_backend_failure("set", key, e)
+
+    def _install(self, key: Hashable, entry: CacheEntry) -> bool:
+        """Place an entry in the local store, evicting as needed; False if rejected"""
+        with self._lock:
+            self._remove(key)
+            if self.max_bytes and entry.size_bytes > self.max_bytes:
+                # Storing it would flush the whole namespace and still not fit
+                self.rejections += 1
+                rejected = True
+            else:
+                rejected = False
+                self._entries[key] = entry
+                self._bytes_held += entry.size_bytes
+                while len(self._entries) > self.max_entries or self._over_byte_budget():
+                    _, evicted = self._entries.popitem(last=False)
+                    self._bytes_held -= evicted.size_bytes
+                    self.evictions += 1
+
+        if rejected:
+            get_logger().warning(
+                "Cache entry exceeds namespace byte budget, not stored",
+                namespace=self.namespace,
+                key=str(key),
+                size_bytes=entry.size_bytes,
+                max_bytes=self.max_bytes
+            )
+        return not rejected
+
+    def _load_remote(self, keys: List[Hashable]) -> Dict[Hashable, CacheEntry]:
+        """Fetch keys from the backend and install servable entries locally"""
+        backend_keys = {self._backend_key(key): key for key in keys}
+        try:
+            found = self.backend.get_many(list(backend_keys))
+        except CacheBackendError as e:
+            self._log_backend_failure("get", keys[0] if len(keys) == 1 else f"{len(keys)} keys", e)
+            return {}
+
+        now = self._clock()
+        loaded = {}
+        for backend_key, (payload, remaining_seconds) in found.items():
+            key = backend_keys[backend_key]
+            try:
+                negative, value = deserialize(payload, self._secret, backend_key)
+            except Exception as e:
+                self._log_backend_failure("decode", key, e)
+                continue
+
+            grace = 0 if negative else self.stale_grace_seconds
+            entry = CacheEntry(
+                value=value,
+                created_at=now,
+                expires_at=now + remaining_seconds - grace,
+                negative=negative,
+                size_bytes=estimate_size(value)
+            )
+            if self._install(key, entry):
+                loaded[key] = entry
+        return loaded
+
+    def _backend_key(self, key: Hashable) -> str:
+        return f"tour-guide:v{SCHEMA_VERSION}:{self.namespace}:{key if isinstance(key, str) else repr(key)}"
+
+    def _log_backend_failure(self, operation: str, key: Any, error: Exception) -> None:
+        get_logger().warning(
+            "Cache backend operation failed",
+            namespace=self.namespace,
+            operation=operation,
+            key=str(key),
+            error=str(error)
+        )
+
+    def _remove(self, key: Hashable) -> None:
+        # Caller holds self._lock
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes_held -= entry.size_bytes
+
+    def _over_byte_budget(self) -> bool:
+        # Caller holds self._lock
+        return bool(self.max_bytes) and self._bytes_held > self.max_bytes
+
+    def _run_refresh(self, key: Hashable, refresh: Callable[[], None]) -> None:
+        try:
+            refresh()
+        except Exception as e:
+            get_logger().warning(
+                "Background cache refresh failed",
+                namespace=self.namespace,
+                key=str(key),
+                error=str(e)
+            )
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def _within_grace(self, entry: CacheEntry, now: float) -> bool:
+        # Negative entries are never served stale
+        return not entry.negative and now < entry.expires_at + self.stale_grace_seconds
@@ -0,0 +1,254 @@
+"""
+Cache Warm-up
+Pre-fills route and agent caches for popular origin/destination pairs
+
+Runs pipeline stages 1-4 (validation, route retrieval, then the pipeline's
+own simplification, preprocessing, clustering and orchestration) for each
+pair with bounded concurrency and a rate limit.
+
+The CLI only fills caches other processes can read, so it requires the
+shared cache backend (CACHE_BACKEND=redis); in-process caches would be
+discarded when it exits.
+
+Usage:
+    python -m src.cache.warmup pairs.jsonl --concurrency 4 --rate 2 --mock
+
+Input formats:
+    JSONL: {"origin": "...", "destination": "...", "preferences": {...}}
+    CSV:   origin,destination[,preferences]   (preferences as a JSON object)
+"""
+
+import argparse
+import csv
+import dataclasses
+import json
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.cache.registry import ROUTE_CACHE, AGENT_RESULT_CACHE, get_cache
+from src.config import SystemConfig, set_config
+from src.logging_config import get_logger
+from src.rate_limiter import RateLimiter
+
+
+@dataclass
+class WarmupPair:
+    """Single origin/destination pair to warm"""
+    origin: str
+    destination: str
+    preferences: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class WarmupReport:
+    """Outcome of a warm-up run"""
+    total: int
+    warmed: int
+    failed: int
+    elapsed_ms: int
+    failures: List[Dict[str, str]] = field(default_factory=list)
+    route_cache_entries: int = 0
+    agent_cache_entries: int = 0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "total": self.total,
+            "warmed": self.warmed,
+            "failed": self.failed,
+            "elapsed_ms": self.elapsed_ms,
+            "failures": self.failures,
+            "route_cache_entries": self.route_cache_entries,
+            "agent_cache_entries": self.agent_cache_entries
+        }
+
+
+def load_pairs(path: str) -> List[WarmupPair]:
+    """
+    Load origin/destination pairs from a JSONL or CSV file
+
+    Args:
+        path: Path to a .jsonl/.json or .csv file
+
+    Returns:
+        List of pairs in file order
+
+    Raises:
+        ValueError: If the file format is unsupported or a record is malformed
+    """
+    file_path = Path(path)
+    suffix = file_path.suffix.lower()
+
+    with file_path.open(encoding="utf-8") as f:
+        if suffix in (".jsonl", ".json"):
+            records = [
+                (line_number, json.loads(line))
+                for line_number, line in enumerate(f, start=1)
+                if line.strip()
+            ]
+        elif suffix == ".csv":
+            records = [
+                (line_number, row)
+                for line_number, row in enumerate(csv.DictReader(f), start=2)
+            ]
+        else:
+            raise ValueError(f"Unsupported pairs file format: {suffix or path}")
+
+    return [_parse_record(record, line_number) for line_number, record in records]
+
+
+def warm_caches(
+    pairs: List[WarmupPair],
+    concurrency: int = 4,
+    rate_per_second: float = 2.0
+) -> WarmupReport:
+    """
+    Run pipeline stages up to orchestration for each pair to fill the caches
+
+    Args:
+        pairs: Pairs to warm
+        concurrency: Maximum pairs processed at once
+        rate_per_second: Maximum pair starts per second (0 = unlimited)
+
+    Returns:
+        WarmupReport with counts, failures and elapsed time
+    """
+    logger = get_logger()
+    limiter = RateLimiter(rate_per_second)
+    start_time = time.time()
+
+    logger.info(
+        "Cache warm-up started",
+        pair_count=len(pairs),
+        concurrency=concurrency,
+        rate_per_second=rate_per_second
+    )
+
+    def run(pair: WarmupPair) -> Optional[str]:
+        limiter.acquire()
+        try:
+            _warm_pair(pair)
+            return None
+        except Exception as e:
+            return str(e)
+
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="cache-warmup") as pool:
+        errors = list(pool.map(run, pairs))
+
+    failures = [
+        {"origin": pair.origin, "destination": pair.destination, "error": error}
+        for pair, error in zip(pairs, errors)
+        if error is not None
+    ]
+
+    report = WarmupReport(
+        total=len(pairs),
+        warmed=len(pairs) - len(failures),
+        failed=len(failures),
+        elapsed_ms=int((time.time() - start_time) * 1000),
+        failures=failures,
+        route_cache_entries=len(get_cache(ROUTE_CACHE)),
+        agent_cache_entries=len(get_cache(AGENT_RESULT_CACHE))
+    )
+
+    logger.info("Cache warm-up completed", **{k: v for k, v in report.to_dict().items() if k != "failures"})
+
+    return report
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Command-line entry point
+
+    Returns:
+        Exit code: 0 if all pairs warmed, 1 if any failed, 2 on usage or
+        configuration errors (including a non-shared cache backend)
+    """
+    parser = argparse.ArgumentParser(
+        description="Warm route and agent caches for popular origin/destination pairs"
+    )
+    parser.add_argument("pairs_file", help="JSONL or CSV file of origin/destination pairs")
+    parser.add_argument("--concurrency", type=int, default=4, help="Pairs processed at once")
+    parser.add_argument("--rate", type=float, default=2.0, help="Max pair starts per second (0 = unlimited)")
+    parser.add_argument("--mock", action="store_true", help="Use mock route data and agents")
+    args = parser.parse_args(argv)
+
+    # --mock is applied before validation, so offline runs need no API keys
+    config = SystemConfig.from_env()
+    if args.mock:
+        config = dataclasses.replace(config, mock_mode=True)
+    errors = config.validate()
+    if errors and not config.mock_mode:
+        print(f"Configuration errors: {', '.join(errors)}", file=sys.stderr)
+        return 2
+    config.ensure_log_directory()
+    set_config(config)
+
+    if not config.enable_caching:
+        print("Caching is disabled (ENABLE_CACHING=false); nothing to warm", file=sys.stderr)
+        return 2
+    if config.cache_backend != "redis":
+        print(
+            "Warm-up needs the shared cache backend (CACHE_BACKEND=redis); "
+            "in-process caches are discarded when the warm-up exits",
+            file=sys.stderr
+        )
+        return 2
+    if not config.cache_backend_secret:
+        print("CACHE_BACKEND_SECRET is required to write to the shared cache backend", file=sys.stderr)
+        return 2
+    if args.concurrency <= 0:
+        print("--concurrency must be positive", file=sys.stderr)
+        return 2
+
+    try:
+        pairs = load_pairs(args.pairs_file)
+    except (OSError, ValueError) as e:
+        print(f"Failed to load pairs: {e}", file=sys.stderr)
+        return 2
+
+    report = warm_caches(pairs, concurrency=args.concurrency, rate_per_second=args.rate)
+    print(json.dumps(report.to_dict(), indent=2))
+
+    return 0 if report.failed == 0 else 1
+
+
+def _parse_record(record: Dict[str, Any], line_number: int) -> WarmupPair:
+    """Convert a raw JSONL/CSV record into a WarmupPair"""
+    if not isinstance(record, dict) or not record.get("origin") or not record.get("destination"):
+        raise ValueError(f"Line {line_number}: origin and destination are required")
+
+    preferences = record.get("preferences") or {}
+    if isinstance(preferences, str):
+        preferences = json.loads(preferences)
+    if not isinstance(preferences, dict):
+        raise ValueError(f"Line {line_number}: preferences must be an object")
+
+    return WarmupPair(
+        origin=record["origin"],
+        destination=record["destination"],
+        preferences=preferences
+    )
+
+
+def _warm_pair(pair: WarmupPair) -> None:
+    """Run stages 1-4 for one pair; results land in the caches as a side effect"""
+    # Imported here: src.modules and src.pipeline depend on src.cache
+    from src.modules import validate_request, retrieve_route, Orchestrator
+    from src.pipeline import run_enrichment_stages
+
+    context = validate_request(pair.origin, pair.destination, pair.preferences)
+    route_data = retrieve_route(context)
+
+    orchestrator = Orchestrator()
+    try:
+        run_enrichment_stages(context, route_data, orchestrator)
+    finally:
+        orchestrator.shutdown()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -26,14 +26,32 @@ class SystemConfig:
     spotify_client_id: str = ""
     spotify_client_secret: str = ""
 
+    # Upstream endpoints (point at a local stub server for load tests)
+    google_maps_base_url: str = "https://maps.googleapis.com"
+
     # Timeouts (milliseconds)
     agent_timeout_ms: int = 5000
     judge_timeout_ms: int = 3000
     route_retrieval_timeout_ms: int = 10000
 
+    # HTTP connections (Google Maps APIs)
+    http_pool_size: int = 10  # Idle keep-alive connections kept per host
+    http_idle_timeout_seconds: int = 60  # Idle connections older than this are not reused
+    http_transport: str = "live"  # "live", "record" or "replay" (offline, from the cassette)
+    http_cassette_path: str = "./data/http_cassette.json"
+    http_replay_latency_scale: float = 1.0  # Replayed latency multiplier (0 = instant)
+
+    # Google Maps quota
+    directions_rate_per_second: float = 50.0  # Token bucket refill rate (0 disables)
+    directions_burst: int = 10
+    quota_retry_max_attempts: int = 4  # Retries after OVER_QUERY_LIMIT
+    quota_backoff_base_ms: int = 250  # First backoff cap; doubles per retry, jittered
+    quota_backoff_max_ms: int = 4000
+
     # Concurrency
     max_concurrent_waypoints: int = 5
     max_agent_threads: int = 50
+    stage_queue_size: int = 8  # Preprocessed waypoints buffered ahead of orchestration (0 = run stages in sequence)
 
     # Logging
     log_level: str = "INFO"
@@ -44,6 +62,45 @@ class SystemConfig:
     # Performance
     enable_caching: bool = True
     cache_ttl_seconds: int = 3600
+    negative_cache_ttl_seconds: int = 300  # Deterministic failures (0 disables)
+    cache_max_entries: int = 1000
+    cache_max_size_mb: int = 64  # Byte budget per namespace (0 = unbounded)
+    route_cache_max_size_mb: int = 256  # Routes with raw steps are much larger
+    raw_steps_retention: str = "auto"  # RouteData.steps: "none", "compact", "full"; "auto" = compact if DEBUG
+    cache_stale_grace_seconds: int = 300  # Serve expired entries while refreshing
+    cache_backend: str = "memory"  # "memory" (per process) or "redis" (shared)
+    cache_backend_url: str = "redis://localhost:6379/0"
+    cache_backend_timeout_ms: int = 200
+    cache_backend_secret: str = ""  # HMAC key signing backend payloads (required for "redis")
+    preprocessing_cache_max_entries: int = 10000  # Memoized per-location preprocessing
+    gazetteer_dir: str = ""  # Location classifier term lists (<type>.txt); "" = bundled only
+    preprocessing_parallel_threshold: int = 1000  # Longer retrieved routes are preprocessed in a process pool, before simplification (0 disables)
+    preprocessing_workers: int = 0  # Process pool size (0 = CPU count; fewer than 2 stays serial)
+    preprocessing_chunk_size: int = 250  # Waypoints per process pool task
+    cache_stats_interval_seconds: int = 60  # Log cache statistics (0 disables)
+    idempotency_window_seconds: int = 600  # Replay window for repeated idempotency keys
+    response_dedup_window_seconds: int = 0  # Replay identical requests (0 disables)
+
+    # Reverse geocoding
+    reverse_geocode_waypoints: bool = False  # Name coordinate-only waypoints via Geocoding API
+    geocode_precision: int = 4  # Decimal places for coordinate quantization (~11 m)
+    geocode_max_concurrency: int = 8
+    geocode_rate_per_second: float = 10.0
+    geocode_burst: int = 10
+
+    # Route densification
+    densify_interval_meters: int = 2000  # Extra waypoints along long steps (0 disables)
+    densify_interval_seconds: int = 0  # Same, by travel time; the shorter spacing wins
+
+    # Waypoint simplification (bounds agent calls per route)
+    waypoint_simplification: str = "merge"  # "off", "merge" or "douglas_peucker"
+    simplify_min_distance_meters: int = 200  # merge: closer waypoints are merged
+    simplify_min_seconds: int = 0  # merge: same, by travel time (0 disables)
+    simplify_tolerance_meters: int = 50  # douglas_peucker: max deviation of dropped points
+    max_waypoints_per_route: int = 40  # Budget after simplification (0 = unlimited)
+
+    # Waypoint clustering (nearby waypoints share one set of agent results)
+    cluster_radius_meters: int = 0  # Max distance from the cluster representative (0 disables; opt-in)
 
     # Development
     mock_mode: bool = True  # Use mock agents/APIs during development
@@ -60,15 +117,31 @@ class SystemConfig:
             youtube_api_key=os.getenv("YOUTUBE_API_KEY", ""),
             spotify_client_id=os.getenv("SPOTIFY_CLIENT_ID", ""),
             spotify_client_secret=os.getenv("SPOTIFY_CLIENT_SECRET", ""),
+            google_maps_base_url=os.getenv("GOOGLE_MAPS_BASE_URL", "https://maps.googleapis.com"),
 
             # Timeouts
             agent_timeout_ms=int(os.getenv("AGENT_TIMEOUT_MS", "5000")),
             judge_timeout_ms=int(os.getenv("JUDGE_TIMEOUT_MS", "3000")),
             route_retrieval_timeout_ms=int(os.getenv("ROUTE_RETRIEVAL_TIMEOUT_MS", "10000")),
 
+            # HTTP connections
+            http_pool_size=int(os.getenv("HTTP_POOL_SIZE", "10")),
+            http_idle_timeout_seconds=int(os.getenv("HTTP_IDLE_TIMEOUT_SECONDS", "60")),
+            http_transport=os.getenv("HTTP_TRANSPORT", "live"),
+            http_cassette_path=os.getenv("HTTP_CASSETTE_PATH", "./data/http_cassette.json"),
+            http_replay_latency_scale=float(os.getenv("HTTP_REPLAY_LATENCY_SCALE", "1.0")),
+
+            # Google Maps quota
+            directions_rate_per_second=float(os.getenv("DIRECTIONS_RATE_PER_SECOND", "50")),
+            directions_burst=int(os.getenv("DIRECTIONS_BURST", "10")),
+            quota_retry_max_attempts=int(os.getenv("QUOTA_RETRY_MAX_ATTEMPTS", "4")),
+            quota_backoff_base_ms=int(os.getenv("QUOTA_BACKOFF_BASE_MS", "250")),
+            quota_backoff_max_ms=int(os.getenv("QUOTA_BACKOFF_MAX_MS", "4000")),
+
             # Concurrency
             max_concurrent_waypoints=int(os.getenv("MAX_CONCURRENT_WAYPOINTS", "5")),
             max_agent_threads=int(os.getenv("MAX_AGENT_THREADS", "50")),
+            stage_queue_size=int(os.getenv("STAGE_QUEUE_SIZE", "8")),
 
             # Logging
             log_level=os.getenv("LOG_LEVEL", "INFO"),
@@ -79,6 +152,45 @@ class SystemConfig:
             # Performance
             enable_caching=os.getenv("ENABLE_CACHING", "true").lower() == "true",
             cache_ttl_seconds=int(os.getenv("CACHE_TTL_SECONDS", "3600")),
+            negative_cache_ttl_seconds=int(os.getenv("NEGATIVE_CACHE_TTL_SECONDS", "300")),
+            cache_max_entries=int(os.getenv("CACHE_MAX_ENTRIES", "1000")),
+            cache_max_size_mb=int(os.getenv("CACHE_MAX_SIZE_MB", "64")),
+            route_cache_max_size_mb=int(os.getenv("ROUTE_CACHE_MAX_SIZE_MB", "256")),
+            raw_steps_retention=os.getenv("RAW_STEPS_RETENTION", "auto").lower(),
+            cache_stale_grace_seconds=int(os.getenv("CACHE_STALE_GRACE_SECONDS", "300")),
+            cache_backend=os.getenv("CACHE_BACKEND", "memory").lower(),
+            cache_backend_url=os.getenv("CACHE_BACKEND_URL", "redis://localhost:6379/0"),
+            cache_backend_timeout_ms=int(os.getenv("CACHE_BACKEND_TIMEOUT_MS", "200")),
+            cache_backend_secret=os.getenv("CACHE_BACKEND_SECRET", ""),
+            preprocessing_cache_max_entries=int(os.getenv("PREPROCESSING_CACHE_MAX_ENTRIES", "10000")),
+            gazetteer_dir=os.getenv("GAZETTEER_DIR", ""),
+            preprocessing_parallel_threshold=int(os.getenv("PREPROCESSING_PARALLEL_THRESHOLD", "1000")),
+            preprocessing_workers=int(os.getenv("PREPROCESSING_WORKERS", "0")),
+            preprocessing_chunk_size=int(os.getenv("PREPROCESSING_CHUNK_SIZE", "250")),
+            cache_stats_interval_seconds=int(os.getenv("CACHE_STATS_INTERVAL_SECONDS", "60")),
+            idempotency_window_seconds=int(os.getenv("IDEMPOTENCY_WINDOW_SECONDS", "600")),
+            response_dedup_window_seconds=int(os.getenv("RESPONSE_DEDUP_WINDOW_SECONDS", "0")),
+
+            # Reverse geocoding
+            reverse_geocode_waypoints=os.getenv("REVERSE_GEOCODE_WAYPOINTS", "false").lower() == "true",
+            geocode_precision=int(os.getenv("GEOCODE_PRECISION", "4")),
+            geocode_max_concurrency=int(os.getenv("GEOCODE_MAX_CONCURRENCY", "8")),
+            geocode_rate_per_second=float(os.getenv("GEOCODE_RATE_PER_SECOND", "10")),
+            geocode_burst=int(os.getenv("GEOCODE_BURST", "10")),
+
+            # Route densification
+            densify_interval_meters=int(os.getenv("DENSIFY_INTERVAL_METERS", "2000")),
+            densify_interval_seconds=int(os.getenv("DENSIFY_INTERVAL_SECONDS", "0")),
+
+            # Waypoint simplification
+            waypoint_simplification=os.getenv("WAYPOINT_SIMPLIFICATION", "merge").lower(),
+            simplify_min_distance_meters=int(os.getenv("SIMPLIFY_MIN_DISTANCE_METERS", "200")),
+            simplify_min_seconds=int(os.getenv("SIMPLIFY_MIN_SECONDS", "0")),
+            simplify_tolerance_meters=int(os.getenv("SIMPLIFY_TOLERANCE_METERS", "50")),
+            max_waypoints_per_route=int(os.getenv("MAX_WAYPOINTS_PER_ROUTE", "40")),
+
+            # Waypoint clustering
+            cluster_radius_meters=int(os.getenv("CLUSTER_RADIUS_METERS", "0")),
 
             # Development
             mock_mode=os.getenv("MOCK_MODE", "true").lower() == "true"
@@ -110,11 +222,101 @@ class SystemConfig:
         if self.judge_timeout_ms <= 0:
             errors.append("judge_timeout_ms must be positive")
 
+        # Check HTTP connection values
+        if self.http_pool_size <= 0:
+            errors.append("http_pool_size must be positive")
+        if self.http_idle_timeout_seconds < 0:
+            errors.append("http_idle_timeout_seconds must be non-negative")
+        if self.http_transport not in ("live", "record", "replay"):
+            errors.append("http_transport must be one of: live, record, replay")
+        if self.http_replay_latency_scale < 0:
+            errors.append("http_replay_latency_scale must be non-negative")
+
+        # Check Google Maps quota values
+        if self.directions_burst <= 0:
+            errors.append("directions_burst must be positive")
+        if self.quota_retry_max_attempts < 0:
+            errors.append("quota_retry_max_attempts must be non-negative")
+        if self.quota_backoff_base_ms <= 0 or self.quota_backoff_max_ms < self.quota_backoff_base_ms:
+            errors.append("quota backoff requires 0 < quota_backoff_base_ms <= quota_backoff_max_ms")
+
         # Check concurrency values
         if self.max_concurrent_waypoints <= 0:
             errors.append("max_concurrent_waypoints must be positive")
         if self.max_agent_threads <= 0:
             errors.append("max_agent_threads must be positive")
+        if self.stage_queue_size < 0:
+            errors.append("stage_queue_size must be non-negative")
+
+        # Check cache values
+        if self.cache_ttl_seconds <= 0:
+            errors.append("cache_ttl_seconds must be positive")
+        if self.negative_cache_ttl_seconds < 0:
+            errors.append("negative_cache_ttl_seconds must be non-negative")
+        if self.cache_max_entries <= 0:
+            errors.append("cache_max_entries must be positive")
+        if self.cache_max_size_mb < 0:
+            errors.append("cache_max_size_mb must be non-negative")
+        if self.route_cache_max_size_mb < 0:
+            errors.append("route_cache_max_size_mb must be non-negative")
+        if self.cache_stale_grace_seconds < 0:
+            errors.append("cache_stale_grace_seconds must be non-negative")
+        if self.cache_backend not in ("memory", "redis"):
+            errors.append("cache_backend must be 'memory' or 'redis'")
+        if self.cache_backend_timeout_ms <= 0:
+            errors.append("cache_backend_timeout_ms must be positive")
+        if self.cache_backend == "redis" and len(self.cache_backend_secret) < 32:
+            errors.append("cache_backend_secret must be at least 32 characters when cache_backend is 'redis'")
+        if self.preprocessing_cache_max_entries <= 0:
+            errors.append("preprocessing_cache_max_entries must be positive")
+        if self.gazetteer_dir and not Path(self.gazetteer_dir).is_dir():
+            errors.append("gazetteer_dir must be an existing directory")
+        if self.preprocessing_parallel_threshold < 0:
+            errors.append("preprocessing_parallel_threshold must be non-negative")
+        if self.preprocessing_workers < 0:
+            errors.append("preprocessing_workers must be non-negative")
+        if self.preprocessing_chunk_size <= 0:
+            errors.append("preprocessing_chunk_size must be positive")
+        if self.cache_stats_interval_seconds < 0:
+            errors.append("cache_stats_interval_seconds must be non-negative")
+        if self.idempotency_window_seconds < 0:
+            errors.append("idempotency_window_seconds must be non-negative")
+        if self.response_dedup_window_seconds < 0:
+            errors.append("response_dedup_window_seconds must be non-negative")
+
+        # Check reverse geocoding values
+        if self.geocode_precision < 0:
+            errors.append("geocode_precision must be non-negative")
+        if self.geocode_max_concurrency <= 0:
+            errors.append("geocode_max_concurrency must be positive")
+        if self.geocode_burst <= 0:
+            errors.append("geocode_burst must be positive")
+
+        # Check route densification values
+        if self.densify_interval_meters < 0:
+            errors.append("densify_interval_meters must be non-negative")
+        if self.densify_interval_seconds < 0:
+            errors.append("densify_interval_seconds must be non-negative")
+
+        # Check raw steps retention
+        if self.raw_steps_retention not in ("auto", "none", "compact", "full"):
+            errors.append("raw_steps_retention must be 'auto', 'none', 'compact' or 'full'")
+
+        # Check waypoint simplification values
+        if self.waypoint_simplification not in ("off", "merge", "douglas_peucker"):
+            errors.append("waypoint_simplification must be 'off', 'merge' or 'douglas_peucker'")
+        if self.simplify_min_distance_meters < 0:
+            errors.append("simplify_min_distance_meters must be non-negative")
+        if self.simplify_min_seconds < 0:
+            errors.append("simplify_min_seconds must be non-negative")
+        if self.simplify_tolerance_meters < 0:
+            errors.append("simplify_tolerance_meters must be non-negative")
+        if self.max_waypoints_per_route < 0:
+            errors.append("max_waypoints_per_route must be non-negative")
+
+        # Check waypoint clustering values
+        if self.cluster_radius_meters < 0:
+            errors.append("cluster_radius_meters must be non-negative")
 
         # Check log level
         valid_levels = ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
@@ -0,0 +1,70 @@
+"""
+Geographic Helpers
+Distances and local projections on a spherical Earth
+
+Shared by polyline densification, waypoint simplification and clustering
+so that all of them measure metres the same way.
+"""
+
+import math
+from typing import Tuple
+
+
+EARTH_RADIUS_METERS = 6371008.8  # Mean Earth radius
+METERS_PER_DEGREE = EARTH_RADIUS_METERS * math.pi / 180  # Along a meridian (~111195 m)
+
+LatLng = Tuple[float, float]
+
+
+def haversine_meters(a: LatLng, b: LatLng) -> float:
+    """
+    Great-circle distance between two (lat, lng) points
+
+    Args:
+        a: First point in degrees
+        b: Second point in degrees
+
+    Returns:
+        Distance in metres
+    """
+    lat1, lng1 = math.radians(a[0]), math.radians(a[1])
+    lat2, lng2 = math.radians(b[0]), math.radians(b[1])
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_METERS * math.asin(math.sqrt(min(1.0, h)))
+
+
+def equirectangular_meters(a: LatLng, b: LatLng) -> float:
+    """
+    Fast approximate distance between two nearby (lat, lng) points
+    Accurate to well under 1% over a few kilometres
+
+    Args:
+        a: First point in degrees
+        b: Second point in degrees
+
+    Returns:
+        Distance in metres
+    """
+    x1, y1 = project_meters(a, (a[0] + b[0]) / 2)
+    x2, y2 = project_meters(b, (a[0] + b[0]) / 2)
+    return math.hypot(x2 - x1, y2 - y1)
+
+
+def project_meters(point: LatLng, reference_lat: float) -> Tuple[float, float]:
+    """
+    Equirectangular projection around a reference latitude
+
+    Args:
+        point: (lat, lng) in degrees
+        reference_lat: Latitude (degrees) where east-west scale is exact
+
+    Returns:
+        (x, y) in metres; only differences between projected points are meaningful
+    """
+    return (
+        point[1] * METERS_PER_DEGREE * math.cos(math.radians(reference_lat)),
+        point[0] * METERS_PER_DEGREE
+    )
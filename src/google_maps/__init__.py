@@ -1,11 +1,63 @@
 """
 Google Maps Integration Package
-Handles all interactions with Google Maps Directions API
+Handles all interactions with Google Maps Directions and Geocoding APIs
 """
 
-from src.google_maps.client import GoogleMapsClient, GoogleMapsError
+from src.google_maps.client import (
+    GoogleMapsClient,
+    GoogleMapsError,
+    DETERMINISTIC_FAILURE_STATUSES,
+    get_maps_client,
+    reset_maps_client,
+)
+from src.google_maps.errors import OVER_QUERY_LIMIT
+from src.google_maps.directions import DirectionsResult, RouteSummary
+from src.google_maps.async_http import AsyncHTTPConnectionPool
+from src.google_maps.throttling import (
+    BackoffPolicy,
+    call_with_quota_backoff,
+    call_with_quota_backoff_async,
+)
+from src.google_maps.http_pool import (
+    HTTPConnectionPool,
+    PooledResponse,
+    get_http_pool,
+    reset_http_pool,
+)
+from src.google_maps.geocoding import ReverseGeocoder
+from src.google_maps.replay import (
+    AsyncRecordingTransport,
+    AsyncReplayTransport,
+    Cassette,
+    RecordingTransport,
+    ReplayMissError,
+    ReplayTransport,
+    reset_cassettes,
+)
 
 __all__ = [
     "GoogleMapsClient",
     "GoogleMapsError",
+    "DETERMINISTIC_FAILURE_STATUSES",
+    "OVER_QUERY_LIMIT",
+    "BackoffPolicy",
+    "call_with_quota_backoff",
+    "call_with_quota_backoff_async",
+    "DirectionsResult",
+    "RouteSummary",
+    "get_maps_client",
+    "reset_maps_client",
+    "HTTPConnectionPool",
+    "AsyncHTTPConnectionPool",
+    "PooledResponse",
+    "get_http_pool",
+    "reset_http_pool",
+    "ReverseGeocoder",
+    "Cassette",
+    "RecordingTransport",
+    "ReplayTransport",
+    "AsyncRecordingTransport",
+    "AsyncReplayTransport",
+    "ReplayMissError",
+    "reset_cassettes",
 ]
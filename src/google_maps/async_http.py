@@ -0,0 +1,260 @@
+"""
+Async HTTP Connection Pool
+Minimal asyncio HTTP/1.1 client with keep-alive reuse for Google Maps calls
+
+Uses asyncio streams only (no third-party HTTP library). Supports GET with
+Content-Length or chunked bodies and gzip decoding, which is all the Maps
+web services need. Connections belong to the event loop that opened them.
+"""
+
+import asyncio
+import gzip
+import ssl
+import time
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.google_maps.http_pool import PooledResponse
+
+
+Origin = Tuple[str, str, int]
+
+
+class AsyncHTTPError(OSError):
+    """Raised for malformed responses or connections closed mid-response"""
+    pass
+
+
+@dataclass
+class _AsyncConnection:
+    reader: asyncio.StreamReader
+    writer: asyncio.StreamWriter
+    idle_since: float = 0.0
+
+    def close(self) -> None:
+        self.writer.close()
+
+
+class AsyncHTTPConnectionPool:
+    """
+    Keep-alive connection pool for one event loop
+
+    Mirrors HTTPConnectionPool: idle connections are kept per origin up to
+    max_idle_per_host and reused until idle_timeout_seconds, and a request
+    on a reused connection the server has closed is retried once on a fresh
+    connection. If the pool is
+    used from a different event loop, idle connections from the old loop are
+    dropped.
+    """
+
+    def __init__(
+        self,
+        max_idle_per_host: int = 10,
+        idle_timeout_seconds: float = 60,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._clock = clock
+        self._idle: Dict[Origin, List[_AsyncConnection]] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._ssl_context: Optional[ssl.SSLContext] = None
+        self.connections_created = 0
+        self.requests_sent = 0
+
+    async def request(
+        self,
+        url: str,
+        timeout_seconds: float,
+        headers: Optional[Dict[str, str]] = None
+    ) -> PooledResponse:
+        """
+        Send a GET request over a pooled connection
+
+        Args:
+            url: Absolute http(s) URL including query string
+            timeout_seconds: Deadline for connecting and reading the full response
+            headers: Extra request headers
+
+        Returns:
+            PooledResponse with the (gunzipped) body
+
+        Raises:
+            asyncio.TimeoutError: If the deadline passes (not an OSError
+                before Python 3.11)
+            OSError: On connection failures or malformed responses
+        """
+        return await asyncio.wait_for(self._request(url, headers or {}), timeout_seconds)
+
+    def idle_count(self) -> int:
+        """Number of idle connections currently pooled (all origins)"""
+        return sum(len(idle) for idle in self._idle.values())
+
+    async def close(self) -> None:
+        """Close all idle connections"""
+        idle = [conn for conns in self._idle.values() for conn in conns]
+        self._idle.clear()
+        for conn in idle:
+            conn.close()
+        for conn in idle:
+            try:
+                await conn.writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _request(self, url: str, headers: Dict[str, str]) -> PooledResponse:
+        parts = urlsplit(url)
+        origin = (parts.scheme, parts.hostname or "", parts.port or (443 if parts.scheme == "https" else 80))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        request_headers = {
+            "Host": parts.netloc,
+            "Accept-Encoding": "gzip",
+            "Connection": "keep-alive",
+            **headers
+        }
+        head = f"GET {path} HTTP/1.1\r\n" + "".join(
+            f"{name}: {value}\r\n" for name, value in request_headers.items()
+        ) + "\r\n"
+
+        conn, reused = await self._acquire(origin)
+        while True:
+            try:
+                conn.writer.write(head.encode("latin-1"))
+                await conn.writer.drain()
+                status, response_headers, body = await _read_response(conn.reader)
+                break
+            except (ConnectionError, asyncio.IncompleteReadError, AsyncHTTPError):
+                conn.close()
+                if not reused:
+                    raise
+                # The server closed the idle connection: retry once, on a fresh one
+                conn, reused = await self._connect(origin), False
+            except BaseException:
+                conn.close()
+                raise
+
+        self.requests_sent += 1
+        if response_headers.get("connection", "").lower() == "close":
+            conn.close()
+        else:
+            self._release(origin, conn)
+
+        if response_headers.get("content-encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+
+        return PooledResponse(status=status, body=body, headers=response_headers)
+
+    async def _acquire(self, origin: Origin) -> Tuple[_AsyncConnection, bool]:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            # Connections cannot move between event loops
+            for conns in self._idle.values():
+                for conn in conns:
+                    try:
+                        conn.close()
+                    except RuntimeError:
+                        pass
+            self._idle.clear()
+            self._loop = loop
+
+        now = self._clock()
+        idle = self._idle.get(origin, [])
+        while idle:
+            conn = idle.pop()
+            if now - conn.idle_since < self.idle_timeout_seconds and not conn.reader.at_eof():
+                return conn, True
+            conn.close()
+
+        return await self._connect(origin), False
+
+    async def _connect(self, origin: Origin) -> _AsyncConnection:
+        scheme, host, port = origin
+        ssl_context = None
+        if scheme == "https":
+            if self._ssl_context is None:
+                self._ssl_context = ssl.create_default_context()
+            ssl_context = self._ssl_context
+
+        self.connections_created += 1
+        reader, writer = await asyncio.open_connection(host, port, ssl=ssl_context)
+        return _AsyncConnection(reader, writer)
+
+    def _release(self, origin: Origin, conn: _AsyncConnection) -> None:
+        idle = self._idle.setdefault(origin, [])
+        if len(idle) < self.max_idle_per_host:
+            conn.idle_since = self._clock()
+            idle.append(conn)
+        else:
+            conn.close()
+
+
+async def _read_response(reader: asyncio.StreamReader) -> Tuple[int, Dict[str, str], bytes]:
+    """Read one HTTP/1.1 response: status, lower-cased headers, raw body"""
+    status_line = await reader.readline()
+    if not status_line:
+        raise AsyncHTTPError("Connection closed before response")
+    try:
+        _, status_text, _ = (status_line.decode("latin-1").rstrip("\r\n") + " ").split(" ", 2)
+        status = int(status_text)
+    except ValueError:
+        raise AsyncHTTPError(f"Malformed status line: {status_line!r}")
+
+    headers: Dict[str, str] = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n"):
+            break
+        if not line:
+            raise AsyncHTTPError("Connection closed while reading headers")
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip()
+
+    try:
+        if headers.get("transfer-encoding", "").lower() == "chunked":
+            chunks = []
+            while True:
+                size = await _read_chunk_size(reader)
+                if size == 0:
+                    await reader.readline()  # Trailing CRLF (trailers unsupported)
+                    break
+                chunks.append(await reader.readexactly(size))
+                await reader.readexactly(2)
+            body = b"".join(chunks)
+        elif "content-length" in headers:
+            body = await reader.readexactly(_parse_content_length(headers["content-length"]))
+        else:
+            # Body delimited by connection close; cannot be reused
+            body = await reader.read()
+            headers["connection"] = "close"
+    except asyncio.IncompleteReadError as e:
+        raise AsyncHTTPError("Connection closed while reading body") from e
+
+    return status, headers, body
+
+
+async def _read_chunk_size(reader: asyncio.StreamReader) -> int:
+    """Read a chunk-size line; EOF is an error, only an explicit 0 ends the body"""
+    line = await reader.readline()
+    if not line.endswith(b"\n"):
+        raise AsyncHTTPError("Connection closed while reading chunked body")
+    try:
+        size = int(line.split(b";")[0].strip(), 16)
+    except ValueError:
+        size = -1
+    if size < 0:
+        raise AsyncHTTPError(f"Malformed chunk size line: {line!r}")
+    return size
+
+
+def _parse_content_length(value: str) -> int:
+    try:
+        length = int(value)
+    except ValueError:
+        length = -1
+    if length < 0:
+        raise AsyncHTTPError(f"Malformed Content-Length: {value!r}")
+    return length
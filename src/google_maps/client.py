@@ -3,34 +3,73 @@ Google Maps Directions API Client
 Handles route retrieval and waypoint extraction
 """
 
+import asyncio
 import time
+import threading
+import http.client
 from typing import List, Dict, Any, Optional
 import urllib.parse
-import urllib.request
 import json
 
 from src.models import RouteData, Waypoint, Coordinates
+from src.google_maps.errors import GoogleMapsError, DETERMINISTIC_FAILURE_STATUSES
+from src.google_maps.http_pool import HTTPConnectionPool, PooledResponse, get_http_pool
+from src.google_maps.async_http import AsyncHTTPConnectionPool
+from src.google_maps.directions import DirectionsResult, RouteSummary
+from src.google_maps.instructions import clean_instruction, format_coordinates, parse_instruction
+from src.google_maps.polyline import decode_polyline, densify
+from src.google_maps.replay import configure_transport
+from src.google_maps.throttling import (
+    BackoffPolicy,
+    call_with_quota_backoff,
+    call_with_quota_backoff_async,
+)
+from src.rate_limiter import DIRECTIONS_LIMITER, TokenBucket, get_rate_limiter
 from src.logging_config import get_logger
 from src.config import get_config
 
 
-class GoogleMapsError(Exception):
-    """Raised when Google Maps API returns an error"""
-    pass
+# Appended to config.google_maps_base_url
+DIRECTIONS_PATH = "/maps/api/directions/json"
+GEOCODE_PATH = "/maps/api/geocode/json"
 
 
 class GoogleMapsClient:
     """
     Client for Google Maps Directions API
     Retrieves routes and extracts waypoints from directions
-    """
 
-    BASE_URL = "https://maps.googleapis.com/maps/api/directions/json"
+    Requests go through a keep-alive connection pool; use get_maps_client()
+    for the long-lived shared instance instead of constructing per request.
+    get_directions_async() is the non-blocking variant for asyncio callers.
+    get_directions_result() exposes every leg and alternative route, parsing
+    waypoints only for the route that is picked.
+
+    Calls take a token from the shared Directions rate limiter, and
+    OVER_QUERY_LIMIT responses are retried with jittered backoff until the
+    request deadline (route_retrieval_timeout_ms unless given).
+    """
 
-    def __init__(self):
+    def __init__(
+        self,
+        http_pool: Optional[HTTPConnectionPool] = None,
+        async_http_pool: Optional[AsyncHTTPConnectionPool] = None,
+        rate_limiter: Optional[TokenBucket] = None
+    ):
         self.config = get_config()
         self.logger = get_logger()
         self.api_key = self.config.google_maps_api_key
+        self.directions_url = self.config.google_maps_base_url.rstrip("/") + DIRECTIONS_PATH
+        self.http_pool = http_pool or get_http_pool()
+        self.async_http_pool = async_http_pool or configure_transport(
+            AsyncHTTPConnectionPool(
+                max_idle_per_host=self.config.http_pool_size,
+                idle_timeout_seconds=self.config.http_idle_timeout_seconds
+            ),
+            asynchronous=True
+        )
+        self.rate_limiter = rate_limiter or get_rate_limiter(DIRECTIONS_LIMITER)
+        self.backoff_policy = BackoffPolicy.from_config(self.config)
 
         if not self.api_key and not self.config.mock_mode:
             raise GoogleMapsError(
@@ -42,7 +81,9 @@ class GoogleMapsClient:
         self,
         origin: str,
         destination: str,
-        mode: str = "driving"
+        mode: str = "driving",
+        deadline: Optional[float] = None,
+        stops: Optional[List[str]] = None
     ) -> RouteData:
         """
         Get directions from Google Maps API
@@ -51,22 +92,153 @@ class GoogleMapsClient:
             origin: Starting address or place name
             destination: Ending address or place name
             mode: Travel mode (driving, walking, bicycling, transit)
+            deadline: time.monotonic() by which the call must finish
+                (default: now + route_retrieval_timeout_ms)
+            stops: Intermediate stops, visited in order (one leg each)
 
         Returns:
-            RouteData with extracted waypoints
+            RouteData with extracted waypoints for all legs
 
         Raises:
             GoogleMapsError: If API call fails or no route found
         """
-        # Build API request URL
+        return self.get_directions_result(origin, destination, mode, deadline, stops).route(0)
+
+    def get_directions_result(
+        self,
+        origin: str,
+        destination: str,
+        mode: str = "driving",
+        deadline: Optional[float] = None,
+        stops: Optional[List[str]] = None,
+        alternatives: bool = False
+    ) -> DirectionsResult:
+        """
+        Get directions, including alternative routes, without extracting waypoints
+
+        Args:
+            origin: Starting address or place name
+            destination: Ending address or place name
+            mode: Travel mode (driving, walking, bicycling, transit)
+            deadline: time.monotonic() by which the call must finish
+                (default: now + route_retrieval_timeout_ms)
+            stops: Intermediate stops, visited in order (one leg each)
+            alternatives: Ask the API for alternative routes
+
+        Returns:
+            DirectionsResult with a summary per route; route(i) extracts waypoints
+
+        Raises:
+            GoogleMapsError: If API call fails or no route found
+        """
+        url = self._build_directions_url(origin, destination, mode, stops, alternatives)
+        deadline = self._resolve_deadline(deadline)
+
+        def attempt() -> DirectionsResult:
+            start_time = time.time()
+            try:
+                # Make API request over a pooled keep-alive connection
+                response = self.http_pool.request(url, timeout_seconds=self._remaining(deadline))
+                return self._handle_directions_response(response, start_time)
+
+            except GoogleMapsError:
+                raise
+
+            except Exception as e:
+                raise self._to_maps_error(e)
+
+        return call_with_quota_backoff(attempt, self.rate_limiter, deadline, self.backoff_policy)
+
+    async def get_directions_async(
+        self,
+        origin: str,
+        destination: str,
+        mode: str = "driving",
+        deadline: Optional[float] = None,
+        stops: Optional[List[str]] = None
+    ) -> RouteData:
+        """
+        Get directions without blocking the event loop
+        Same request, parsing and errors as get_directions(); connections are
+        kept alive per event loop so concurrent lookups share them
+
+        Args:
+            origin: Starting address or place name
+            destination: Ending address or place name
+            mode: Travel mode (driving, walking, bicycling, transit)
+            deadline: time.monotonic() by which the call must finish
+                (default: now + route_retrieval_timeout_ms)
+            stops: Intermediate stops, visited in order (one leg each)
+
+        Returns:
+            RouteData with extracted waypoints for all legs
+
+        Raises:
+            GoogleMapsError: If API call fails, times out or no route found
+        """
+        result = await self.get_directions_result_async(origin, destination, mode, deadline, stops)
+        return result.route(0)
+
+    async def get_directions_result_async(
+        self,
+        origin: str,
+        destination: str,
+        mode: str = "driving",
+        deadline: Optional[float] = None,
+        stops: Optional[List[str]] = None,
+        alternatives: bool = False
+    ) -> DirectionsResult:
+        """Async variant of get_directions_result()"""
+        url = self._build_directions_url(origin, destination, mode, stops, alternatives)
+        deadline = self._resolve_deadline(deadline)
+
+        async def attempt() -> DirectionsResult:
+            start_time = time.time()
+            try:
+                response = await self.async_http_pool.request(url, timeout_seconds=self._remaining(deadline))
+                return self._handle_directions_response(response, start_time)
+
+            except GoogleMapsError:
+                raise
+
+            except Exception as e:
+                raise self._to_maps_error(e)
+
+        return await call_with_quota_backoff_async(attempt, self.rate_limiter, deadline, self.backoff_policy)
+
+    async def aclose(self) -> None:
+        """Close idle connections of the async pool"""
+        await self.async_http_pool.close()
+
+    def _resolve_deadline(self, deadline: Optional[float]) -> float:
+        if deadline is not None:
+            return deadline
+        return time.monotonic() + self.config.route_retrieval_timeout_ms / 1000
+
+    @staticmethod
+    def _remaining(deadline: float) -> float:
+        """Seconds left before the deadline, as a usable socket timeout"""
+        return max(0.001, deadline - time.monotonic())
+
+    def _build_directions_url(
+        self,
+        origin: str,
+        destination: str,
+        mode: str,
+        stops: Optional[List[str]] = None,
+        alternatives: bool = False
+    ) -> str:
+        """Build the Directions API request URL"""
         params = {
             "origin": origin,
             "destination": destination,
             "mode": mode,
             "key": self.api_key
         }
-
-        url = f"{self.BASE_URL}?{urllib.parse.urlencode(params)}"
+        if stops:
+            params["waypoints"] = "|".join(stops)
+        if alternatives:
+            params["alternatives"] = "true"
 
         self.logger.debug(
             "Calling Google Maps API",
@@ -75,91 +247,126 @@ class GoogleMapsClient:
             mode=mode
         )
 
-        start_time = time.time()
+        return f"{self.directions_url}?{urllib.parse.urlencode(params)}"
 
-        try:
-            # Make API request
-            with urllib.request.urlopen(url, timeout=self.config.route_retrieval_timeout_ms / 1000) as response:
-                data = json.loads(response.read().decode())
-
-            response_time_ms = int((time.time() - start_time) * 1000)
+    def _handle_directions_response(self, response: PooledResponse, start_time: float) -> DirectionsResult:
+        """
+        Check HTTP and API status of a Directions response and parse it
 
-            # Check API status
-            status = data.get("status")
+        Raises:
+            GoogleMapsError: On HTTP errors or a non-OK API status
+            json.JSONDecodeError: If the body is not JSON
+        """
+        if response.status >= 400:
+            raise GoogleMapsError(f"Network error: HTTP {response.status}")
+        data = json.loads(response.body.decode())
 
-            if status != "OK":
-                error_message = self._get_error_message(status, data)
-                self.logger.error(
-                    f"Google Maps API error: {status}",
-                    status=status,
-                    error_message=error_message
-                )
-                raise GoogleMapsError(error_message)
+        response_time_ms = int((time.time() - start_time) * 1000)
 
-            # Parse response and extract route data
-            route_data = self._parse_directions_response(data)
+        # Check API status
+        status = data.get("status")
 
-            self.logger.info(
-                "Google Maps API call successful",
-                waypoint_count=len(route_data.waypoints),
-                total_distance=route_data.distance,
-                response_time_ms=response_time_ms
+        if status != "OK":
+            error_message = self._get_error_message(status, data)
+            self.logger.error(
+                f"Google Maps API error: {status}",
+                status=status,
+                error_message=error_message
             )
+            raise GoogleMapsError(error_message, status=status)
 
-            return route_data
+        # Parse route summaries; waypoints are extracted on demand
+        result = self._parse_directions_response(data)
 
-        except urllib.error.URLError as e:
+        self.logger.info(
+            "Google Maps API call successful",
+            route_count=len(result),
+            leg_count=result.alternatives[0].leg_count,
+            total_distance=result.alternatives[0].distance,
+            response_time_ms=response_time_ms
+        )
+
+        return result
+
+    def _to_maps_error(self, error: Exception) -> GoogleMapsError:
+        """Log a request failure and wrap it in a GoogleMapsError"""
+        # asyncio.TimeoutError only became TimeoutError (an OSError) in Python 3.11
+        timed_out = isinstance(error, (TimeoutError, asyncio.TimeoutError))
+        if timed_out or isinstance(error, (OSError, http.client.HTTPException)):
+            detail = str(error) or ("request timed out" if timed_out else type(error).__name__)
             self.logger.error(
                 "Network error calling Google Maps API",
-                error=str(e),
+                error=detail,
                 exc_info=True
             )
-            raise GoogleMapsError(f"Network error: {str(e)}")
+            return GoogleMapsError(f"Network error: {detail}")
 
-        except json.JSONDecodeError as e:
+        if isinstance(error, json.JSONDecodeError):
             self.logger.error(
                 "Failed to parse Google Maps API response",
-                error=str(e),
+                error=str(error),
                 exc_info=True
             )
-            raise GoogleMapsError(f"Invalid API response: {str(e)}")
+            return GoogleMapsError(f"Invalid API response: {str(error)}")
+
+        self.logger.error(
+            "Unexpected error calling Google Maps API",
+            error=str(error),
+            exc_info=True
+        )
+        return GoogleMapsError(f"Unexpected error: {str(error)}")
+
+    def _parse_directions_response(self, data: Dict[str, Any]) -> DirectionsResult:
+        """
+        Parse Google Maps directions response into route summaries
+
+        Args:
+            data: Raw API response
 
-        except Exception as e:
+        Returns:
+            DirectionsResult; waypoints are extracted per route on first access
+        """
+        try:
+            routes = data["routes"]
+            if not routes:
+                raise IndexError("no routes in response")
+            return DirectionsResult(routes, self._build_route_data)
+
+        except (KeyError, IndexError, TypeError) as e:
             self.logger.error(
-                "Unexpected error calling Google Maps API",
+                "Failed to parse route from response",
                 error=str(e),
                 exc_info=True
             )
-            raise GoogleMapsError(f"Unexpected error: {str(e)}")
+            raise GoogleMapsError(f"Invalid route structure in API response: {str(e)}")
 
-    def _parse_directions_response(self, data: Dict[str, Any]) -> RouteData:
+    def _build_route_data(self, route: Dict[str, Any], summary: RouteSummary) -> RouteData:
         """
-        Parse Google Maps directions response and extract waypoints
+        Extract waypoints for one route across all of its legs
+
+        Steps of all legs are numbered as one sequence, so waypoint ids,
+        step_index and distance_from_start continue across stopovers.
 
         Args:
-            data: Raw API response
+            route: One raw route from the response
+            summary: The route's summary, already computed by DirectionsResult
 
         Returns:
             RouteData with waypoints extracted from steps
         """
         try:
-            # Get the first route (Google Maps can return alternatives)
-            route = data["routes"][0]
-            leg = route["legs"][0]  # Assuming single leg (no intermediate stops)
-
-            # Extract overall route information
-            distance = leg["distance"]["text"]
-            duration = leg["duration"]["text"]
-            steps = leg["steps"]
+            legs = route["legs"]
+            steps = [step for leg in legs for step in leg["steps"]]
 
             # Extract waypoints from steps
             waypoints = self._extract_waypoints_from_steps(steps)
 
             return RouteData(
-                distance=distance,
-                duration=duration,
+                distance=summary.distance,
+                duration=summary.duration,
                 waypoints=waypoints,
-                steps=steps
+                steps=self._retained_steps(steps),
+                overview_polyline=route.get("overview_polyline", {}).get("points", "")
             )
 
         except (KeyError, IndexError) as e:
@@ -175,7 +382,8 @@ class GoogleMapsClient:
         Extract waypoints from navigation steps
 
         Each step in Google Maps directions represents a maneuver.
-        We create a waypoint for each significant step.
+        We create a waypoint for each significant step, plus evenly spaced
+        waypoints along the polyline of long steps (see _densify_step).
 
         Args:
             steps: List of navigation steps from API
@@ -185,6 +393,7 @@ class GoogleMapsClient:
         """
         waypoints = []
         cumulative_distance = 0.0
+        cumulative_seconds: Optional[float] = 0.0  # None once a step lacks a duration
 
         for idx, step in enumerate(steps):
             try:
@@ -192,32 +401,51 @@ class GoogleMapsClient:
                 start_location = step["start_location"]
                 end_location = step["end_location"]
 
-                # Get instruction (remove HTML tags)
-                instruction = self._clean_html_instruction(step["html_instructions"])
+                # Plain-text instruction and the street it names, if any
+                instruction, location_name = parse_instruction(step["html_instructions"])
 
-                # Calculate distance
+                # Distance covered before this step starts
                 distance_meters = step["distance"]["value"]
+                step_start_distance = cumulative_distance
                 cumulative_distance += distance_meters
 
-                # Create location name from instruction or address
-                location_name = self._extract_location_name(instruction, start_location)
+                # Travel time before this step starts
+                step_start_seconds = cumulative_seconds
+                step_seconds = step.get("duration", {}).get("value")
+                cumulative_seconds = (
+                    cumulative_seconds + step_seconds
+                    if cumulative_seconds is not None and step_seconds is not None
+                    else None
+                )
+
+                if location_name is None:
+                    location_name = format_coordinates(start_location["lat"], start_location["lng"])
 
                 # Create waypoint
                 waypoint = Waypoint(
-                    id=idx + 1,
+                    id=len(waypoints) + 1,
                     location_name=location_name,
                     coordinates=Coordinates(
                         lat=start_location["lat"],
                         lng=start_location["lng"]
                     ),
                     instruction=instruction,
-                    distance_from_start=cumulative_distance,
-                    step_index=idx
+                    distance_from_start=step_start_distance,
+                    step_index=idx,
+                    duration_from_start=step_start_seconds
                 )
 
                 waypoints.append(waypoint)
-
-            except (KeyError, ValueError) as e:
+                waypoints.extend(self._densify_step(
+                    step,
+                    idx,
+                    instruction,
+                    step_start_distance,
+                    step_start_seconds,
+                    len(waypoints) + 1
+                ))
+
+            except (KeyError, ValueError, TypeError) as e:
                 self.logger.warning(
                     f"Failed to parse step {idx}",
                     error=str(e)
@@ -226,60 +454,93 @@ class GoogleMapsClient:
 
         return waypoints
 
-    def _clean_html_instruction(self, html_instruction: str) -> str:
+    def _retained_steps(self, steps: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
-        Remove HTML tags from instruction text
+        Raw steps to keep on RouteData per raw_steps_retention
 
-        Args:
-            html_instruction: Instruction with HTML tags
-
-        Returns:
-            Clean text instruction
+        Nothing downstream of parsing reads raw steps, so by default none are
+        kept; "compact" keeps what is useful for debugging without HTML or
+        polylines, "full" keeps the API payload as is.
         """
-        # Simple HTML tag removal (more robust parsing could use html.parser)
-        import re
-        clean = re.sub('<[^<]+?>', '', html_instruction)
-        return clean.strip()
+        retention = self.config.raw_steps_retention
+        if retention == "auto":
+            retention = "compact" if self.config.log_level.upper() == "DEBUG" else "none"
+
+        if retention == "full":
+            return steps
+        if retention != "compact":
+            return []
+        return [
+            {
+                "instruction": clean_instruction(step.get("html_instructions", "")),
+                "distance": step.get("distance", {}).get("value"),
+                "duration": step.get("duration", {}).get("value"),
+                "start_location": step.get("start_location"),
+                "end_location": step.get("end_location"),
+                "travel_mode": step.get("travel_mode")
+            }
+            for step in steps
+        ]
 
-    def _extract_location_name(
+    def _densify_step(
         self,
+        step: Dict[str, Any],
+        step_index: int,
         instruction: str,
-        location: Dict[str, float]
-    ) -> str:
+        step_start_distance: float,
+        step_start_seconds: Optional[float],
+        first_id: int
+    ) -> List[Waypoint]:
         """
-        Extract a meaningful location name from instruction or coordinates
+        Emit waypoints along a long step's polyline
+
+        Spacing is densify_interval_meters, or the distance covered in
+        densify_interval_seconds at the step's average speed if shorter.
+        Polyline distances are scaled to the step's reported distance so
+        distance_from_start stays consistent with the maneuver waypoints.
 
         Args:
-            instruction: Navigation instruction
-            location: Lat/lng dictionary
+            step: Raw navigation step
+            step_index: Index of the step in the leg
+            instruction: Cleaned instruction of the step
+            step_start_distance: Route distance at the start of the step
+            step_start_seconds: Travel time at the start of the step (None if unknown)
+            first_id: Waypoint id for the first emitted waypoint
 
         Returns:
-            Location name suitable for display
+            Waypoints between the step's start and end (empty for short steps
+            or steps without a polyline)
         """
-        # Try to extract street names from instruction
-        # e.g., "Turn right onto Main St" -> "Main St"
-        import re
-
-        # Pattern: "onto X" or "on X" or "toward X"
-        patterns = [
-            r'onto\s+([^,\.]+)',
-            r'on\s+([^,\.]+)',
-            r'toward\s+([^,\.]+)',
-            r'at\s+([^,\.]+)',
+        step_meters = step["distance"]["value"]
+        intervals = []
+        if self.config.densify_interval_meters > 0:
+            intervals.append(self.config.densify_interval_meters)
+        step_seconds = step.get("duration", {}).get("value", 0)
+        if self.config.densify_interval_seconds > 0 and step_seconds > 0:
+            intervals.append(self.config.densify_interval_seconds * step_meters / step_seconds)
+        if not intervals or step_meters < 1.5 * min(intervals):
+            return []
+
+        points = decode_polyline(step.get("polyline", {}).get("points", ""))
+        samples = densify(points, min(intervals), length_meters=step_meters)
+
+        return [
+            Waypoint(
+                id=first_id + offset,
+                location_name=format_coordinates(lat, lng),
+                coordinates=Coordinates(lat=lat, lng=lng),
+                instruction=instruction,
+                distance_from_start=step_start_distance + meters,
+                step_index=step_index,
+                duration_from_start=(
+                    step_start_seconds + step_seconds * meters / step_meters
+                    if step_start_seconds is not None and step_seconds > 0
+                    else None
+                )
+            )
+            for offset, (lat, lng, meters) in enumerate(samples)
         ]
 
-        for pattern in patterns:
-            match = re.search(pattern, instruction, re.IGNORECASE)
-            if match:
-                location_name = match.group(1).strip()
-                # Clean up common suffixes
-                location_name = re.sub(r'\s*\(.*?\)', '', location_name)
-                if len(location_name) > 3:
-                    return location_name
-
-        # Fallback: use coordinates
-        return f"{location['lat']:.4f}, {location['lng']:.4f}"
-
     def _get_error_message(self, status: str, data: Dict[str, Any]) -> str:
         """
         Get user-friendly error message based on API status
@@ -310,6 +571,32 @@ class GoogleMapsClient:
         return base_message
 
 
+_shared_client: Optional[GoogleMapsClient] = None
+_shared_client_lock = threading.Lock()
+
+
+def get_maps_client() -> GoogleMapsClient:
+    """
+    Get the long-lived shared client
+    Created on first call; reuses pooled connections across requests
+
+    Raises:
+        GoogleMapsError: If the API key is missing outside mock mode
+    """
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = GoogleMapsClient()
+        return _shared_client
+
+
+def reset_maps_client() -> None:
+    """Drop the shared client (next get_maps_client() rebuilds it from config)"""
+    global _shared_client
+    with _shared_client_lock:
+        _shared_client = None
+
+
 def reverse_geocode(lat: float, lng: float, api_key: str) -> Optional[str]:
     """
     Reverse geocode coordinates to get address
@@ -323,21 +610,55 @@ def reverse_geocode(lat: float, lng: float, api_key: str) -> Optional[str]:
     Returns:
         Address string or None if failed
     """
-    url = "https://maps.googleapis.com/maps/api/geocode/json"
+    try:
+        return fetch_reverse_geocode(lat, lng, api_key)
+    except (GoogleMapsError, KeyError, IndexError, TypeError, AttributeError):
+        # Malformed payloads (e.g. a result without formatted_address) also yield None
+        return None
+
+
+def fetch_reverse_geocode(
+    lat: float,
+    lng: float,
+    api_key: str,
+    timeout_seconds: float = 5
+) -> Optional[str]:
+    """
+    Reverse geocode coordinates, distinguishing "no address" from failures
+
+    Args:
+        lat: Latitude
+        lng: Longitude
+        api_key: Google Maps API key
+        timeout_seconds: Request timeout
+
+    Returns:
+        Formatted address, or None if the API has no address for the point
+
+    Raises:
+        GoogleMapsError: On network errors, invalid responses or API errors
+    """
     params = {
         "latlng": f"{lat},{lng}",
         "key": api_key
     }
+    base_url = get_config().google_maps_base_url.rstrip("/")
+    full_url = f"{base_url}{GEOCODE_PATH}?{urllib.parse.urlencode(params)}"
 
     try:
-        full_url = f"{url}?{urllib.parse.urlencode(params)}"
-        with urllib.request.urlopen(full_url, timeout=5) as response:
-            data = json.loads(response.read().decode())
-
-        if data["status"] == "OK" and data["results"]:
-            return data["results"][0]["formatted_address"]
-
-    except Exception:
-        pass
-
-    return None
+        response = get_http_pool().request(full_url, timeout_seconds=timeout_seconds)
+        if response.status >= 400:
+            raise GoogleMapsError(f"Network error: HTTP {response.status}")
+        data = json.loads(response.body.decode())
+    except (OSError, http.client.HTTPException) as e:
+        raise GoogleMapsError(f"Network error: {str(e)}")
+    except json.JSONDecodeError as e:
+        raise GoogleMapsError(f"Invalid API response: {str(e)}")
+
+    status = data.get("status")
+    if status == "ZERO_RESULTS":
+        return None
+    if status != "OK" or not data.get("results"):
+        raise GoogleMapsError(f"Geocoding API error: {status}", status=status)
+
+    return data["results"][0]["formatted_address"]
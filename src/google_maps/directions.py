@@ -0,0 +1,145 @@
+"""
+Directions Results
+Lazy view over a Directions API response with alternatives and multi-leg routes
+
+Route summaries (distance and duration per alternative) are computed when
+the response is parsed; waypoints are extracted only for the routes a
+caller actually asks for.
+"""
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List
+
+from src.models import RouteData
+
+
+@dataclass
+class RouteSummary:
+    """
+    Cheap overview of one route alternative
+    Totals are summed over all legs (one leg per stopover + 1)
+    """
+    index: int
+    summary: str  # e.g. "I-95 N"
+    distance: str
+    duration: str
+    distance_meters: int
+    duration_seconds: int
+    leg_count: int
+    warnings: List[str] = field(default_factory=list)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "index": self.index,
+            "summary": self.summary,
+            "distance": self.distance,
+            "duration": self.duration,
+            "distance_meters": self.distance_meters,
+            "duration_seconds": self.duration_seconds,
+            "leg_count": self.leg_count,
+            "warnings": self.warnings
+        }
+
+
+class DirectionsResult:
+    """
+    Parsed Directions response
+
+    alternatives holds a RouteSummary per route. route(index) extracts the
+    waypoints of one route on first access and returns the same RouteData
+    on later calls.
+    """
+
+    def __init__(
+        self,
+        routes: List[Dict[str, Any]],
+        build_route: Callable[[Dict[str, Any], RouteSummary], RouteData]
+    ):
+        """
+        Args:
+            routes: Raw "routes" array of the response (at least one route)
+            build_route: Turns one raw route and its summary into RouteData
+        """
+        self._routes = routes
+        self._build_route = build_route
+        self._parsed: Dict[int, RouteData] = {}
+        self._lock = threading.Lock()
+        self.alternatives = [summarize_route(index, route) for index, route in enumerate(routes)]
+
+    def __len__(self) -> int:
+        return len(self._routes)
+
+    def route(self, index: int = 0) -> RouteData:
+        """
+        Get the full route for one alternative
+
+        Args:
+            index: Position in alternatives (0 = Google's recommended route)
+
+        Returns:
+            RouteData with waypoints for every leg
+
+        Raises:
+            IndexError: If there is no such alternative
+        """
+        if not 0 <= index < len(self._routes):
+            raise IndexError(f"Route alternative {index} out of range ({len(self._routes)} available)")
+        with self._lock:
+            if index not in self._parsed:
+                self._parsed[index] = self._build_route(self._routes[index], self.alternatives[index])
+            return self._parsed[index]
+
+    def parsed_count(self) -> int:
+        """Number of alternatives whose waypoints have been extracted"""
+        with self._lock:
+            return len(self._parsed)
+
+
+def summarize_route(index: int, route: Dict[str, Any]) -> RouteSummary:
+    """
+    Summarize one raw route without touching its steps
+
+    Raises:
+        KeyError, IndexError: If the route has no legs or leg totals
+    """
+    legs = route["legs"]
+    if not legs:
+        raise IndexError("route has no legs")
+    distance_meters = sum(leg["distance"].get("value", 0) for leg in legs)
+    duration_seconds = sum(leg["duration"].get("value", 0) for leg in legs)
+
+    if len(legs) == 1:
+        distance, duration = legs[0]["distance"]["text"], legs[0]["duration"]["text"]
+    else:
+        distance, duration = format_distance(distance_meters), format_duration(duration_seconds)
+
+    return RouteSummary(
+        index=index,
+        summary=route.get("summary", ""),
+        distance=distance,
+        duration=duration,
+        distance_meters=distance_meters,
+        duration_seconds=duration_seconds,
+        leg_count=len(legs),
+        warnings=list(route.get("warnings", []))
+    )
+
+
+def format_distance(meters: float) -> str:
+    """Format metres like the Directions API ("850 m", "45.2 km")"""
+    if meters < 1000:
+        return f"{int(round(meters))} m"
+    return f"{meters / 1000:.1f} km"
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds like the Directions API ("12 mins", "1 hour 5 mins")"""
+    minutes = max(1, int(round(seconds / 60)))
+    hours, minutes = divmod(minutes, 60)
+    parts = []
+    if hours:
+        parts.append(f"{hours} hour{'s' if hours != 1 else ''}")
+    if minutes or not hours:
+        parts.append(f"{minutes} min{'s' if minutes != 1 else ''}")
+    return " ".join(parts)
@@ -0,0 +1,26 @@
+"""
+Google Maps Errors
+Exception type and API status classification shared by the Maps clients
+"""
+
+from typing import Optional
+
+
+OVER_QUERY_LIMIT = "OVER_QUERY_LIMIT"
+
+# API statuses that will repeat for the same request and are safe to negatively cache.
+# Transient statuses (OVER_QUERY_LIMIT, UNKNOWN_ERROR) and network errors are excluded.
+DETERMINISTIC_FAILURE_STATUSES = frozenset({"ZERO_RESULTS", "NOT_FOUND"})
+
+
+class GoogleMapsError(Exception):
+    """Raised when Google Maps API returns an error"""
+
+    def __init__(self, message: str, status: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
+
+    @property
+    def is_deterministic(self) -> bool:
+        """Whether retrying the same request would fail the same way"""
+        return self.status in DETERMINISTIC_FAILURE_STATUSES
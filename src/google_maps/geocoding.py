@@ -0,0 +1,173 @@
+"""
+Reverse Geocoding Service
+Resolves coordinates to addresses with quantized caching and bulk lookups
+
+Coordinates are rounded to a configurable number of decimal places so that
+nearby points share one lookup and one cache entry. Bulk resolution
+deduplicates quantized points and fetches the remainder concurrently under
+a rate limit, so a whole route resolves in roughly one round trip.
+"""
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from src.cache import GEOCODE_CACHE, get_cache
+from src.config import get_config
+from src.google_maps.client import GoogleMapsError, fetch_reverse_geocode
+from src.google_maps.instructions import format_coordinates
+from src.google_maps.throttling import BackoffPolicy, call_with_quota_backoff
+from src.logging_config import get_logger
+from src.models import Coordinates, Waypoint
+from src.rate_limiter import GEOCODING_LIMITER, TokenBucket, get_rate_limiter
+
+
+QuantizedPoint = Tuple[float, float]
+
+
+class ReverseGeocoder:
+    """
+    Cached, rate-limited reverse geocoding
+    Successful lookups and "no address" results are cached; failures are not
+
+    Lookups share the process-wide geocoding token bucket unless an explicit
+    rate_per_second is given, and OVER_QUERY_LIMIT responses are retried
+    with jittered backoff.
+    """
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        precision: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        rate_per_second: Optional[float] = None,
+        fetch: Optional[Callable[[float, float], Optional[str]]] = None
+    ):
+        self.config = get_config()
+        self.logger = get_logger()
+        self.api_key = api_key if api_key is not None else self.config.google_maps_api_key
+        self.precision = precision if precision is not None else self.config.geocode_precision
+        self.max_concurrency = max_concurrency or self.config.geocode_max_concurrency
+        if rate_per_second is None:
+            self.limiter = get_rate_limiter(GEOCODING_LIMITER)
+        else:
+            self.limiter = TokenBucket(rate_per_second, self.config.geocode_burst, name=GEOCODING_LIMITER)
+        self.backoff_policy = BackoffPolicy.from_config(self.config)
+        self._fetch = fetch or self._fetch_from_api
+
+    def quantize(self, lat: float, lng: float) -> QuantizedPoint:
+        """Round coordinates to the configured precision"""
+        return (round(lat, self.precision), round(lng, self.precision))
+
+    def resolve(self, lat: float, lng: float) -> Optional[str]:
+        """
+        Resolve a single coordinate to an address
+
+        Returns:
+            Address, or None if unknown or the lookup failed
+        """
+        return self.resolve_many([Coordinates(lat=lat, lng=lng)])[0]
+
+    def resolve_many(self, coordinates: Iterable[Coordinates]) -> List[Optional[str]]:
+        """
+        Resolve many coordinates, one lookup per distinct quantized point
+
+        Args:
+            coordinates: Points to resolve (e.g. all waypoints of a route)
+
+        Returns:
+            Addresses in input order (None where unknown or failed)
+        """
+        start_time = time.time()
+        points = [self.quantize(c.lat, c.lng) for c in coordinates]
+        cache = get_cache(GEOCODE_CACHE) if self.config.enable_caching else None
+
+        resolved: Dict[QuantizedPoint, Optional[str]] = {}
+        pending: List[QuantizedPoint] = []
+
+        for point in dict.fromkeys(points):
+            entry = cache.get(point) if cache is not None else None
+            if entry is not None:
+                resolved[point] = entry.value
+            else:
+                pending.append(point)
+
+        if pending:
+            workers = min(self.max_concurrency, len(pending))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="reverse-geocode") as pool:
+                for point, address in zip(pending, pool.map(self._lookup, pending)):
+                    resolved[point] = address
+
+        self.logger.debug(
+            "Reverse geocoding completed",
+            point_count=len(points),
+            unique_points=len(resolved),
+            fetched=len(pending),
+            duration_ms=int((time.time() - start_time) * 1000)
+        )
+
+        return [resolved[point] for point in points]
+
+    def resolve_waypoint_names(self, waypoints: List[Waypoint]) -> int:
+        """
+        Replace coordinate-fallback waypoint names with addresses
+
+        Args:
+            waypoints: Waypoints whose names may be "lat, lng" fallbacks
+
+        Returns:
+            Number of waypoints renamed
+        """
+        unnamed = [wp for wp in waypoints if _is_coordinate_name(wp)]
+        if not unnamed:
+            return 0
+
+        addresses = self.resolve_many(wp.coordinates for wp in unnamed)
+        renamed = 0
+        for waypoint, address in zip(unnamed, addresses):
+            if address:
+                waypoint.location_name = address
+                renamed += 1
+
+        return renamed
+
+    def _lookup(self, point: QuantizedPoint) -> Optional[str]:
+        """Fetch one quantized point under the rate limit and cache the outcome"""
+        deadline = time.monotonic() + self.config.route_retrieval_timeout_ms / 1000
+        try:
+            address = call_with_quota_backoff(
+                lambda: self._fetch(*point),
+                self.limiter,
+                deadline,
+                self.backoff_policy
+            )
+        except GoogleMapsError as e:
+            self.logger.warning(
+                "Reverse geocoding failed",
+                lat=point[0],
+                lng=point[1],
+                error=str(e)
+            )
+            return None
+
+        if self.config.enable_caching:
+            cache = get_cache(GEOCODE_CACHE)
+            if address is None:
+                cache.set_negative(point, None)
+            else:
+                cache.set(point, address)
+
+        return address
+
+    def _fetch_from_api(self, lat: float, lng: float) -> Optional[str]:
+        return fetch_reverse_geocode(
+            lat,
+            lng,
+            self.api_key,
+            timeout_seconds=self.config.route_retrieval_timeout_ms / 1000
+        )
+
+
+def _is_coordinate_name(waypoint: Waypoint) -> bool:
+    """Whether the waypoint name is the "lat, lng" fallback from step parsing"""
+    return waypoint.location_name == format_coordinates(waypoint.coordinates.lat, waypoint.coordinates.lng)
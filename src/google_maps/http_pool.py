@@ -0,0 +1,230 @@
+"""
+HTTP Connection Pool
+Thread-safe keep-alive connection reuse for Google Maps API calls
+
+Each call through urllib.request.urlopen pays a new TCP and TLS handshake.
+The pool keeps idle HTTP/1.1 connections per (scheme, host, port) and hands
+them to the next request, so steady traffic only pays the round trip.
+"""
+
+import gzip
+import http.client
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from src.config import get_config
+
+
+Origin = Tuple[str, str, int]
+
+# Errors that mean a reused keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    ConnectionAbortedError,
+    BrokenPipeError,
+)
+
+
+@dataclass
+class PooledResponse:
+    """Fully read HTTP response (body already decompressed)"""
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class _IdleConnection:
+    connection: http.client.HTTPConnection
+    idle_since: float
+
+
+class HTTPConnectionPool:
+    """
+    Keep-alive connection pool shared by all threads
+
+    Connections are checked out for the duration of one request. At most
+    max_idle_per_host idle connections are kept per origin; extra ones are
+    closed on release. Connections idle longer than idle_timeout_seconds are
+    discarded rather than reused. A request on a reused connection that the
+    server has already closed is retried once on a fresh connection.
+    """
+
+    def __init__(
+        self,
+        max_idle_per_host: int = 10,
+        idle_timeout_seconds: float = 60,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        self.max_idle_per_host = max_idle_per_host
+        self.idle_timeout_seconds = idle_timeout_seconds
+        self._clock = clock
+        self._idle: Dict[Origin, List[_IdleConnection]] = {}
+        self._lock = threading.Lock()
+        self.connections_created = 0
+        self.requests_sent = 0
+
+    def request(
+        self,
+        url: str,
+        timeout_seconds: float,
+        headers: Optional[Dict[str, str]] = None
+    ) -> PooledResponse:
+        """
+        Send a GET request over a pooled connection
+
+        Args:
+            url: Absolute http(s) URL including query string
+            timeout_seconds: Connect and read timeout; a retry after a stale
+                reused connection only gets what is left of it
+            headers: Extra request headers
+
+        Returns:
+            PooledResponse with the (gunzipped) body
+
+        Raises:
+            OSError: On connection failures and timeouts
+            http.client.HTTPException: On protocol errors
+        """
+        parts = urlsplit(url)
+        origin = (parts.scheme, parts.hostname or "", parts.port or _default_port(parts.scheme))
+        path = parts.path or "/"
+        if parts.query:
+            path = f"{path}?{parts.query}"
+
+        request_headers = {"Accept-Encoding": "gzip", "Connection": "keep-alive"}
+        request_headers.update(headers or {})
+
+        deadline = time.monotonic() + timeout_seconds
+        connection, reused = self._acquire(origin, timeout_seconds)
+        while True:
+            try:
+                connection.request("GET", path, headers=request_headers)
+                response = connection.getresponse()
+                body = response.read()
+                break
+            except _STALE_CONNECTION_ERRORS:
+                connection.close()
+                remaining = deadline - time.monotonic()
+                if not reused or remaining <= 0:
+                    raise
+                # The server closed the idle connection: retry once, fresh, within the deadline
+                connection, reused = self._connect(origin, remaining), False
+            except BaseException:
+                connection.close()
+                raise
+
+        with self._lock:
+            self.requests_sent += 1
+
+        if response.will_close:
+            connection.close()
+        else:
+            self._release(origin, connection)
+
+        if (response.getheader("Content-Encoding") or "").lower() == "gzip":
+            body = gzip.decompress(body)
+
+        return PooledResponse(
+            status=response.status,
+            body=body,
+            headers={name.lower(): value for name, value in response.getheaders()}
+        )
+
+    def idle_count(self) -> int:
+        """Number of idle connections currently pooled (all origins)"""
+        with self._lock:
+            return sum(len(idle) for idle in self._idle.values())
+
+    def close(self) -> None:
+        """Close all idle connections"""
+        with self._lock:
+            idle = [item for items in self._idle.values() for item in items]
+            self._idle.clear()
+        for item in idle:
+            item.connection.close()
+
+    def _acquire(self, origin: Origin, timeout_seconds: float) -> Tuple[http.client.HTTPConnection, bool]:
+        """Check out an idle connection (most recently used first) or open a new one"""
+        now = self._clock()
+        expired = []
+        connection = None
+
+        with self._lock:
+            idle = self._idle.get(origin, [])
+            while idle:
+                item = idle.pop()
+                if now - item.idle_since < self.idle_timeout_seconds:
+                    connection = item.connection
+                    break
+                expired.append(item.connection)
+
+        for stale in expired:
+            stale.close()
+
+        if connection is None:
+            return self._connect(origin, timeout_seconds), False
+
+        connection.timeout = timeout_seconds
+        if connection.sock is not None:
+            connection.sock.settimeout(timeout_seconds)
+        return connection, True
+
+    def _connect(self, origin: Origin, timeout_seconds: float) -> http.client.HTTPConnection:
+        """Open a new connection (connects lazily on the first request)"""
+        with self._lock:
+            self.connections_created += 1
+
+        scheme, host, port = origin
+        connection_class = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return connection_class(host, port, timeout=timeout_seconds)
+
+    def _release(self, origin: Origin, connection: http.client.HTTPConnection) -> None:
+        with self._lock:
+            idle = self._idle.setdefault(origin, [])
+            if len(idle) < self.max_idle_per_host:
+                idle.append(_IdleConnection(connection, self._clock()))
+                return
+        connection.close()
+
+
+_http_pool: Optional[HTTPConnectionPool] = None
+_http_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HTTPConnectionPool:
+    """
+    Get the process-wide connection pool
+    Created from the global configuration on first call; with HTTP_TRANSPORT
+    set to record or replay this is a recording or replaying transport
+    """
+    # Imported here: replay builds on PooledResponse from this module
+    from src.google_maps.replay import configure_transport
+
+    global _http_pool
+    with _http_pool_lock:
+        if _http_pool is None:
+            config = get_config()
+            _http_pool = configure_transport(HTTPConnectionPool(
+                max_idle_per_host=config.http_pool_size,
+                idle_timeout_seconds=config.http_idle_timeout_seconds
+            ))
+        return _http_pool
+
+
+def reset_http_pool() -> None:
+    """Close and drop the process-wide pool (next use rebuilds it from config)"""
+    global _http_pool
+    with _http_pool_lock:
+        pool, _http_pool = _http_pool, None
+    if pool is not None:
+        pool.close()
+
+
+def _default_port(scheme: str) -> int:
+    return 443 if scheme == "https" else 80
@@ -0,0 +1,93 @@
+"""
+Step Instruction Parsing
+Turns a Directions step's html_instructions into plain text and a street name
+
+Runs once per step (plus once per retained compact step), so every pattern
+is compiled at import. Keywords are searched one compiled pattern at a
+time: each starts with a literal, which lets the regex engine skip ahead
+to candidate positions. A single alternation (or a lookahead scan for all
+keywords at once) loses that and measured slower on real-shaped
+instructions (see examples/benchmark_instruction_parser.py).
+"""
+
+import html
+import re
+from typing import Optional, Tuple
+
+
+# Any HTML tag (Directions only uses <b>, <div> and <wbr/>)
+TAG_PATTERN = re.compile(r"<[^<]+?>")
+
+# Street name patterns, highest priority first. The name runs to the next
+# comma or period, e.g. "Turn right onto Main St" -> "Main St".
+LOCATION_PATTERNS = tuple(
+    re.compile(keyword + r"\s+([^,\.]+)", re.IGNORECASE)
+    for keyword in ("onto", "on", "toward", "at")
+)
+
+# Parenthesized remarks dropped from names, e.g. "(toll road)"
+PARENTHESIZED_PATTERN = re.compile(r"\s*\(.*?\)")
+
+# Names this short are abbreviations or fragments ("I", "Rd")
+MIN_LOCATION_NAME_LENGTH = 4
+
+
+def clean_instruction(html_instruction: str) -> str:
+    """
+    Strip HTML tags and decode entities ("&amp;" -> "&")
+
+    Args:
+        html_instruction: Step html_instructions
+
+    Returns:
+        Plain-text instruction
+    """
+    text = TAG_PATTERN.sub("", html_instruction)
+    if "&" in text:
+        text = html.unescape(text)
+    return text.strip()
+
+
+def extract_location_name(instruction: str) -> Optional[str]:
+    """
+    Find the street or place a plain-text instruction refers to
+
+    Patterns are tried in LOCATION_PATTERNS order; for each, only its first
+    match counts. The first candidate that is still at least
+    MIN_LOCATION_NAME_LENGTH characters once parenthesized remarks are
+    removed wins.
+
+    Args:
+        instruction: Plain-text instruction (see clean_instruction)
+
+    Returns:
+        Location name, or None if the instruction names no place
+    """
+    for pattern in LOCATION_PATTERNS:
+        match = pattern.search(instruction)
+        if match:
+            name = match.group(1).strip()
+            if "(" in name:
+                name = PARENTHESIZED_PATTERN.sub("", name)
+            if len(name) >= MIN_LOCATION_NAME_LENGTH:
+                return name
+    return None
+
+
+def parse_instruction(html_instruction: str) -> Tuple[str, Optional[str]]:
+    """
+    Clean a step instruction and extract its location name
+
+    Args:
+        html_instruction: Step html_instructions
+
+    Returns:
+        (plain-text instruction, location name or None)
+    """
+    instruction = clean_instruction(html_instruction)
+    return instruction, extract_location_name(instruction)
+
+
+def format_coordinates(lat: float, lng: float) -> str:
+    """Fallback location name for waypoints without a named place"""
+    return f"{lat:.4f}, {lng:.4f}"
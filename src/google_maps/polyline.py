@@ -0,0 +1,223 @@
+"""
+Encoded Polylines
+Decoding, length and densification of Google Maps encoded polylines
+
+Uses NumPy when it is installed: decoding, haversine distances and
+interpolation are then vectorized, which keeps routes with tens of thousands
+of polyline points fast. Without NumPy the same results are computed in
+pure Python.
+"""
+
+from bisect import bisect_right
+from itertools import accumulate
+from typing import List, Optional, Sequence, Tuple
+
+from src.geo import EARTH_RADIUS_METERS, LatLng, haversine_meters
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+DEFAULT_PRECISION = 5  # Google polylines store 1e-5 degrees
+
+
+def decode_polyline(encoded: str, precision: int = DEFAULT_PRECISION) -> List[LatLng]:
+    """
+    Decode an encoded polyline string
+
+    A truncated string decodes up to its last complete point.
+
+    Args:
+        encoded: Polyline as returned in overview_polyline.points / step polyline.points
+        precision: Decimal places encoded (5 for Google Maps)
+
+    Returns:
+        List of (lat, lng) tuples
+    """
+    if not encoded:
+        return []
+    if np is not None:
+        return [tuple(point) for point in _decode_numpy(encoded, precision).tolist()]
+    return _decode_python(encoded, precision)
+
+
+def encode_polyline(points: Sequence[LatLng], precision: int = DEFAULT_PRECISION) -> str:
+    """
+    Encode (lat, lng) points as a polyline string
+
+    Args:
+        points: Coordinates to encode
+        precision: Decimal places to keep
+
+    Returns:
+        Encoded polyline
+    """
+    factor = 10 ** precision
+    chunks = []
+    prev_lat = prev_lng = 0
+    for lat, lng in points:
+        lat_e5 = int(round(lat * factor))
+        lng_e5 = int(round(lng * factor))
+        for delta in (lat_e5 - prev_lat, lng_e5 - prev_lng):
+            value = ~(delta << 1) if delta < 0 else delta << 1
+            while value >= 0x20:
+                chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+                value >>= 5
+            chunks.append(chr(value + 63))
+        prev_lat, prev_lng = lat_e5, lng_e5
+    return "".join(chunks)
+
+
+def cumulative_distances(points: Sequence[LatLng]) -> List[float]:
+    """
+    Haversine distance from the first point to each point along the line
+
+    Args:
+        points: (lat, lng) coordinates
+
+    Returns:
+        Metres travelled at each point (first is 0.0)
+    """
+    if len(points) == 0:
+        return []
+    if np is not None:
+        return _cumulative_numpy(np.asarray(points, dtype=np.float64)).tolist()
+    return list(accumulate(
+        (haversine_meters(a, b) for a, b in zip(points, points[1:])),
+        initial=0.0
+    ))
+
+
+def densify(
+    points: Sequence[LatLng],
+    interval_meters: float,
+    length_meters: Optional[float] = None
+) -> List[Tuple[float, float, float]]:
+    """
+    Interpolate points every interval_meters along a line
+
+    Positions start one interval in and stop short of the end by at least
+    half an interval, so they never duplicate the line's endpoints.
+
+    Args:
+        points: (lat, lng) coordinates of the line
+        interval_meters: Spacing between emitted points
+        length_meters: Known length of the line (e.g. a step's reported
+            distance); haversine distances are scaled to match it
+
+    Returns:
+        (lat, lng, metres from the line start) for each emitted point
+    """
+    if interval_meters <= 0 or len(points) < 2:
+        return []
+    if np is not None:
+        array = np.asarray(points, dtype=np.float64)
+        cumulative = _cumulative_numpy(array)
+        if length_meters is not None and cumulative[-1] > 0:
+            cumulative *= length_meters / cumulative[-1]
+        return _densify_numpy(array, cumulative, interval_meters)
+
+    cumulative = cumulative_distances(points)
+    if length_meters is not None and cumulative[-1] > 0:
+        scale = length_meters / cumulative[-1]
+        cumulative = [meters * scale for meters in cumulative]
+    return _densify_python(points, cumulative, interval_meters)
+
+
+def _decode_numpy(encoded: str, precision: int) -> "np.ndarray":
+    data = np.frombuffer(encoded.encode("ascii"), dtype=np.uint8).astype(np.int64) - 63
+    ends = np.flatnonzero((data & 0x20) == 0)
+    if len(ends) < 2:
+        return np.empty((0, 2))
+    data = data[:ends[-1] + 1]  # Drop a trailing incomplete value
+
+    # Each value is a run of 5-bit chunks, least significant first
+    starts = np.concatenate(([0], ends[:-1] + 1))
+    position = np.arange(len(data)) - np.repeat(starts, ends - starts + 1)
+    values = np.bitwise_or.reduceat((data & 0x1F) << (5 * position), starts)
+
+    deltas = np.where(values & 1, ~(values >> 1), values >> 1)
+    deltas = deltas[:len(deltas) // 2 * 2].reshape(-1, 2)
+    return np.cumsum(deltas, axis=0) / float(10 ** precision)
+
+
+def _decode_python(encoded: str, precision: int) -> List[LatLng]:
+    factor = float(10 ** precision)
+    points = []
+    coords = [0, 0]
+    index = 0
+    length = len(encoded)
+    while index < length:
+        deltas = []
+        for _ in range(2):
+            shift = result = 0
+            while index < length:
+                byte = ord(encoded[index]) - 63
+                index += 1
+                result |= (byte & 0x1F) << shift
+                shift += 5
+                if byte < 0x20:
+                    deltas.append(~(result >> 1) if result & 1 else result >> 1)
+                    break
+        if len(deltas) < 2:
+            break
+        coords[0] += deltas[0]
+        coords[1] += deltas[1]
+        points.append((coords[0] / factor, coords[1] / factor))
+    return points
+
+
+def _cumulative_numpy(points: "np.ndarray") -> "np.ndarray":
+    lat = np.radians(points[:, 0])
+    lng = np.radians(points[:, 1])
+    a = (
+        np.sin(np.diff(lat) / 2) ** 2
+        + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lng) / 2) ** 2
+    )
+    segments = 2 * EARTH_RADIUS_METERS * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+    return np.concatenate(([0.0], np.cumsum(segments)))
+
+
+def _densify_numpy(
+    points: "np.ndarray",
+    cumulative: "np.ndarray",
+    interval_meters: float
+) -> List[Tuple[float, float, float]]:
+    targets = np.arange(interval_meters, cumulative[-1] - interval_meters / 2, interval_meters)
+    if len(targets) == 0:
+        return []
+
+    index = np.searchsorted(cumulative, targets, side="right") - 1
+    segment = cumulative[index + 1] - cumulative[index]
+    fraction = np.divide(
+        targets - cumulative[index],
+        segment,
+        out=np.zeros_like(targets),
+        where=segment > 0
+    )[:, None]
+    interpolated = points[index] + (points[index + 1] - points[index]) * fraction
+    return [
+        (lat, lng, offset)
+        for (lat, lng), offset in zip(interpolated.tolist(), targets.tolist())
+    ]
+
+
+def _densify_python(
+    points: Sequence[LatLng],
+    cumulative: List[float],
+    interval_meters: float
+) -> List[Tuple[float, float, float]]:
+    result = []
+    count = 1
+    target = interval_meters
+    while target < cumulative[-1] - interval_meters / 2:
+        index = bisect_right(cumulative, target) - 1
+        segment = cumulative[index + 1] - cumulative[index]
+        fraction = (target - cumulative[index]) / segment if segment > 0 else 0.0
+        (lat1, lng1), (lat2, lng2) = points[index], points[index + 1]
+        result.append((lat1 + (lat2 - lat1) * fraction, lng1 + (lng2 - lng1) * fraction, target))
+        count += 1
+        target = interval_meters * count
+    return result
@@ -0,0 +1,366 @@
+"""
+HTTP Record/Replay
+Deterministic stand-ins for the connection pools, for offline benchmarks and tests
+
+In record mode every request goes through the real pool and the response,
+with its latency, is added to a cassette (a JSON fixture file). In replay
+mode responses are served from the cassette without touching the network,
+after the recorded latency multiplied by a scale factor (1 = as recorded,
+0 = instant). Credentials in query strings and headers are never written
+to the cassette.
+
+Transports have the same request()/close() interface as HTTPConnectionPool
+and AsyncHTTPConnectionPool, so any client that accepts a pool can use them.
+HTTP_TRANSPORT=record|replay switches the shared pools over globally.
+"""
+
+import asyncio
+import atexit
+import base64
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from src.config import get_config
+from src.google_maps.http_pool import PooledResponse
+from src.logging_config import get_logger
+
+
+# Transport modes (config.http_transport)
+TRANSPORT_LIVE = "live"
+TRANSPORT_RECORD = "record"
+TRANSPORT_REPLAY = "replay"
+
+CASSETTE_VERSION = 1
+
+# Never persisted: replaced by "REDACTED" in recorded URLs
+REDACTED_PARAMS = frozenset({"key", "client_secret", "access_token", "token"})
+REDACTED_HEADERS = frozenset({"authorization", "set-cookie", "cookie"})
+
+
+class ReplayMissError(OSError):
+    """Raised when a replayed request has no recorded response"""
+    pass
+
+
+def normalize_url(url: str) -> str:
+    """
+    Canonical form of a URL used to match requests against recordings
+    Query parameters are sorted and credentials redacted
+    """
+    parts = urlsplit(url)
+    query = sorted(
+        (name, "REDACTED" if name in REDACTED_PARAMS else value)
+        for name, value in parse_qsl(parts.query, keep_blank_values=True)
+    )
+    return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+
+@dataclass
+class RecordedExchange:
+    """One request/response pair with the latency observed when recording"""
+    method: str
+    url: str  # Normalized (see normalize_url)
+    status: int
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+    latency_seconds: float = 0.0
+
+    def to_response(self) -> PooledResponse:
+        return PooledResponse(status=self.status, body=self.body, headers=dict(self.headers))
+
+    def to_dict(self) -> Dict[str, Any]:
+        entry: Dict[str, Any] = {
+            "method": self.method,
+            "url": self.url,
+            "status": self.status,
+            "headers": self.headers,
+            "latency_ms": round(self.latency_seconds * 1000, 3)
+        }
+        try:
+            entry["body"] = self.body.decode("utf-8")
+        except UnicodeDecodeError:
+            entry["body_base64"] = base64.b64encode(self.body).decode("ascii")
+        return entry
+
+    @classmethod
+    def from_dict(cls, entry: Dict[str, Any]) -> "RecordedExchange":
+        if "body_base64" in entry:
+            body = base64.b64decode(entry["body_base64"])
+        else:
+            body = entry.get("body", "").encode("utf-8")
+        return cls(
+            method=entry.get("method", "GET"),
+            url=entry["url"],
+            status=entry["status"],
+            body=body,
+            headers=entry.get("headers", {}),
+            latency_seconds=entry.get("latency_ms", 0) / 1000
+        )
+
+
+class Cassette:
+    """
+    Ordered recordings for one fixture file
+
+    Repeated requests for the same URL are answered with the recordings in
+    the order they were made; once those run out, the last one is reused.
+    """
+
+    def __init__(self, path: Optional[str] = None, exchanges: Optional[List[RecordedExchange]] = None):
+        self.path = Path(path) if path else None
+        self.exchanges: List[RecordedExchange] = list(exchanges or [])
+        self._lock = threading.Lock()
+        self._served: Dict[str, int] = {}
+        self._save_at_exit = False
+
+    @classmethod
+    def load(cls, path: str) -> "Cassette":
+        """
+        Read a cassette file
+
+        Raises:
+            OSError: If the file cannot be read
+            ValueError: If it is not a cassette
+        """
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if data.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"Unsupported cassette version in {path}: {data.get('version')}")
+        return cls(path, [RecordedExchange.from_dict(entry) for entry in data.get("exchanges", [])])
+
+    def add(self, exchange: RecordedExchange) -> None:
+        with self._lock:
+            self.exchanges.append(exchange)
+
+    def save(self) -> None:
+        """Write all recordings to the cassette file"""
+        if self.path is None:
+            return
+        with self._lock:
+            data = {
+                "version": CASSETTE_VERSION,
+                "exchanges": [exchange.to_dict() for exchange in self.exchanges]
+            }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(json.dumps(data, indent=1), encoding="utf-8")
+        tmp_path.replace(self.path)
+
+    def save_at_exit(self) -> None:
+        """Write the cassette when the process exits (once per cassette)"""
+        with self._lock:
+            if self._save_at_exit:
+                return
+            self._save_at_exit = True
+        atexit.register(self.save)
+
+    def next_exchange(self, method: str, url: str) -> RecordedExchange:
+        """
+        Find the recording that answers a request
+
+        Raises:
+            ReplayMissError: If nothing was recorded for the request
+        """
+        key = normalize_url(url)
+        with self._lock:
+            matches = [e for e in self.exchanges if e.method == method and e.url == key]
+            if not matches:
+                raise ReplayMissError(f"No recorded response for {method} {key}")
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+            return matches[min(served, len(matches) - 1)]
+
+
+class _RecordingBase:
+    def __init__(self, inner, cassette: Cassette, clock: Callable[[], float] = time.monotonic):
+        self.inner = inner
+        self.cassette = cassette
+        self._clock = clock
+
+    def _record(self, url: str, response: PooledResponse, latency: float) -> None:
+        self.cassette.add(RecordedExchange(
+            method="GET",
+            url=normalize_url(url),
+            status=response.status,
+            body=response.body,
+            headers={
+                name: value for name, value in response.headers.items()
+                if name.lower() not in REDACTED_HEADERS
+            },
+            latency_seconds=latency
+        ))
+
+    def idle_count(self) -> int:
+        return self.inner.idle_count()
+
+
+class RecordingTransport(_RecordingBase):
+    """Sends requests through a real pool and records every response"""
+
+    def request(
+        self,
+        url: str,
+        timeout_seconds: float,
+        headers: Optional[Dict[str, str]] = None
+    ) -> PooledResponse:
+        start = self._clock()
+        response = self.inner.request(url, timeout_seconds=timeout_seconds, headers=headers)
+        self._record(url, response, self._clock() - start)
+        return response
+
+    def close(self) -> None:
+        """Close the real pool and write the cassette"""
+        self.inner.close()
+        self.cassette.save()
+
+
+class AsyncRecordingTransport(_RecordingBase):
+    """Async variant of RecordingTransport"""
+
+    async def request(
+        self,
+        url: str,
+        timeout_seconds: float,
+        headers: Optional[Dict[str, str]] = None
+    ) -> PooledResponse:
+        start = self._clock()
+        response = await self.inner.request(url, timeout_seconds=timeout_seconds, headers=headers)
+        self._record(url, response, self._clock() - start)
+        return response
+
+    async def close(self) -> None:
+        """Close the real pool and write the cassette"""
+        await self.inner.close()
+        self.cassette.save()
+
+
+class _ReplayBase:
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0):
+        self.cassette = cassette
+        self.latency_scale = latency_scale
+        self.requests_served = 0
+
+    def _lookup(self, url: str, timeout_seconds: float):
+        """Return (exchange, delay, timed_out) for a request"""
+        exchange = self.cassette.next_exchange("GET", url)
+        delay = max(0.0, exchange.latency_seconds * self.latency_scale)
+        if delay > timeout_seconds:
+            return exchange, timeout_seconds, True
+        return exchange, delay, False
+
+    def idle_count(self) -> int:
+        return 0
+
+
+class ReplayTransport(_ReplayBase):
+    """Serves recorded responses without network access"""
+
+    def __init__(self, cassette: Cassette, latency_scale: float = 1.0, sleep: Callable[[float], None] = time.sleep):
+        super().__init__(cassette, latency_scale)
+        self._sleep = sleep
+
+    def request(
+        self,
+        url: str,
+        timeout_seconds: float,
+        headers: Optional[Dict[str, str]] = None
+    ) -> PooledResponse:
+        """
+        Serve the recorded response after the (scaled) recorded latency
+
+        Raises:
+            ReplayMissError: If nothing was recorded for the URL
+            TimeoutError: If the scaled latency exceeds timeout_seconds
+        """
+        exchange, delay, timed_out = self._lookup(url, timeout_seconds)
+        if delay > 0:
+            self._sleep(delay)
+        if timed_out:
+            raise TimeoutError("timed out")
+        self.requests_served += 1
+        return exchange.to_response()
+
+    def close(self) -> None:
+        pass
+
+
+class AsyncReplayTransport(_ReplayBase):
+    """Async variant of ReplayTransport"""
+
+    async def request(
+        self,
+        url: str,
+        timeout_seconds: float,
+        headers: Optional[Dict[str, str]] = None
+    ) -> PooledResponse:
+        exchange, delay, timed_out = self._lookup(url, timeout_seconds)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        if timed_out:
+            raise TimeoutError("timed out")
+        self.requests_served += 1
+        return exchange.to_response()
+
+    async def close(self) -> None:
+        pass
+
+
+_cassettes: Dict[str, Cassette] = {}
+_cassettes_lock = threading.Lock()
+
+
+def get_cassette(path: str) -> Cassette:
+    """
+    Get the shared cassette for a fixture file
+    Loaded from disk if it exists, otherwise starts empty (for recording)
+    """
+    with _cassettes_lock:
+        cassette = _cassettes.get(path)
+        if cassette is None:
+            cassette = Cassette.load(path) if Path(path).exists() else Cassette(path)
+            _cassettes[path] = cassette
+        return cassette
+
+
+def reset_cassettes() -> None:
+    """Drop shared cassettes (unsaved recordings are discarded)"""
+    with _cassettes_lock:
+        _cassettes.clear()
+
+
+def configure_transport(pool, asynchronous: bool = False):
+    """
+    Apply the configured HTTP transport mode to a connection pool
+
+    Args:
+        pool: HTTPConnectionPool, or AsyncHTTPConnectionPool if asynchronous
+        asynchronous: Whether the pool is the asyncio variant
+
+    Returns:
+        The pool itself (live), a recording wrapper around it (record), or a
+        replay transport that never uses it (replay)
+    """
+    config = get_config()
+    mode = config.http_transport
+    if mode == TRANSPORT_LIVE:
+        return pool
+
+    cassette = get_cassette(config.http_cassette_path)
+    get_logger().info(
+        "HTTP transport in non-live mode",
+        mode=mode,
+        cassette=config.http_cassette_path,
+        recorded_exchanges=len(cassette.exchanges)
+    )
+
+    if mode == TRANSPORT_RECORD:
+        cassette.save_at_exit()
+        return AsyncRecordingTransport(pool, cassette) if asynchronous else RecordingTransport(pool, cassette)
+
+    scale = config.http_replay_latency_scale
+    return AsyncReplayTransport(cassette, scale) if asynchronous else ReplayTransport(cassette, scale)
@@ -0,0 +1,161 @@
+"""
+Quota Throttling
+Client-side rate limiting and OVER_QUERY_LIMIT backoff for Google Maps calls
+
+Every attempt takes a token from a shared TokenBucket first. Responses with
+status OVER_QUERY_LIMIT are retried after a "full jitter" exponential backoff
+(a random delay up to base * 2^attempt, capped), as long as the next attempt
+can still start before the caller's deadline.
+"""
+
+import asyncio
+import random
+import time
+from dataclasses import dataclass
+from typing import Awaitable, Callable, Optional, TypeVar
+
+from src.config import SystemConfig
+from src.google_maps.errors import GoogleMapsError, OVER_QUERY_LIMIT
+from src.logging_config import get_logger
+from src.rate_limiter import TokenBucket
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class BackoffPolicy:
+    """Retry limits for OVER_QUERY_LIMIT responses"""
+    max_retries: int = 4
+    base_delay_seconds: float = 0.25
+    max_delay_seconds: float = 4.0
+
+    @classmethod
+    def from_config(cls, config: SystemConfig) -> "BackoffPolicy":
+        return cls(
+            max_retries=config.quota_retry_max_attempts,
+            base_delay_seconds=config.quota_backoff_base_ms / 1000,
+            max_delay_seconds=config.quota_backoff_max_ms / 1000
+        )
+
+    def delay(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        """Full-jitter backoff before retry number attempt + 1"""
+        cap = min(self.max_delay_seconds, self.base_delay_seconds * (2 ** attempt))
+        return cap * rand()
+
+
+def call_with_quota_backoff(
+    call: Callable[[], T],
+    limiter: TokenBucket,
+    deadline: float,
+    policy: BackoffPolicy,
+    sleep: Callable[[float], None] = time.sleep,
+    clock: Callable[[], float] = time.monotonic,
+    rand: Callable[[], float] = random.random
+) -> T:
+    """
+    Run a Google Maps call under the rate limiter, retrying quota rejections
+
+    Args:
+        call: Performs one request; raises GoogleMapsError on failure
+        limiter: Shared token bucket for the API
+        deadline: time.monotonic() value after which no attempt may start
+        policy: Retry limits
+
+    Returns:
+        The call's result
+
+    Raises:
+        GoogleMapsError: The call's error, or OVER_QUERY_LIMIT if the rate
+            limit or backoff would run past the deadline
+    """
+    attempt = 0
+    while True:
+        wait = _reserve(limiter, deadline, clock)
+        if wait > 0:
+            sleep(wait)
+
+        try:
+            return call()
+        except GoogleMapsError as e:
+            delay = _retry_delay(e, limiter, attempt, deadline, policy, clock, rand)
+            if delay is None:
+                raise
+        sleep(delay)
+        attempt += 1
+
+
+async def call_with_quota_backoff_async(
+    call: Callable[[], Awaitable[T]],
+    limiter: TokenBucket,
+    deadline: float,
+    policy: BackoffPolicy,
+    clock: Callable[[], float] = time.monotonic,
+    rand: Callable[[], float] = random.random
+) -> T:
+    """Async variant of call_with_quota_backoff(); waits without blocking the loop"""
+    attempt = 0
+    while True:
+        wait = _reserve(limiter, deadline, clock)
+        if wait > 0:
+            await asyncio.sleep(wait)
+
+        try:
+            return await call()
+        except GoogleMapsError as e:
+            delay = _retry_delay(e, limiter, attempt, deadline, policy, clock, rand)
+            if delay is None:
+                raise
+        await asyncio.sleep(delay)
+        attempt += 1
+
+
+def _reserve(limiter: TokenBucket, deadline: float, clock: Callable[[], float]) -> float:
+    """Reserve a token, failing fast if it would only arrive after the deadline"""
+    wait = limiter.reserve(max_wait=max(0.0, deadline - clock()))
+    if wait is None:
+        get_logger().warning(
+            "Google Maps rate limit wait exceeds deadline",
+            limiter=limiter.name
+        )
+        raise GoogleMapsError(
+            "Client-side rate limit reached; no capacity before the request deadline",
+            status=OVER_QUERY_LIMIT
+        )
+    if wait > 0:
+        get_logger().debug(
+            "Waiting for Google Maps rate limit",
+            limiter=limiter.name,
+            wait_ms=int(wait * 1000)
+        )
+    return wait
+
+
+def _retry_delay(
+    error: GoogleMapsError,
+    limiter: TokenBucket,
+    attempt: int,
+    deadline: float,
+    policy: BackoffPolicy,
+    clock: Callable[[], float],
+    rand: Callable[[], float]
+) -> Optional[float]:
+    """Backoff before the next attempt, or None if the error must be raised"""
+    if error.status != OVER_QUERY_LIMIT:
+        return None
+
+    limiter.record_over_query_limit()
+    if attempt >= policy.max_retries:
+        return None
+
+    delay = policy.delay(attempt, rand)
+    if clock() + delay >= deadline:
+        return None
+
+    get_logger().warning(
+        "Google Maps quota exceeded, backing off",
+        limiter=limiter.name,
+        attempt=attempt + 1,
+        delay_ms=int(delay * 1000)
+    )
+    return delay
@@ -11,7 +11,7 @@ This module defines all data models used throughout the pipeline:
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 from enum import Enum
 import uuid
 import threading
@@ -30,6 +30,7 @@ class AgentStatus(Enum):
     SUCCESS = "success"
     TIMEOUT = "timeout"
     ERROR = "error"
+    NO_RESULTS = "no_results"  # Search completed but matched nothing
     PENDING = "pending"
 
 
@@ -164,9 +165,15 @@ class WaypointEnrichment:
     all_agent_results: Dict[str, AgentResult]
     judge_decision: JudgeDecision
     processing_time_ms: int
+    shared_from: Optional[int] = None  # Cluster representative's waypoint id, for shared copies
+    shared_with: Tuple[int, ...] = ()  # Waypoint ids sharing this enrichment (empty if not shared)
+
+    def is_shared(self) -> bool:
+        """Check if this enrichment is shared by a cluster of waypoints"""
+        return bool(self.shared_with)
 
     def to_dict(self) -> Dict[str, Any]:
-        return {
+        data = {
             "selected_content": self.selected_content.to_dict(),
             "all_agent_results": {
                 name: result.to_dict()
@@ -175,6 +182,10 @@ class WaypointEnrichment:
             "judge_decision": self.judge_decision.to_dict(),
             "processing_time_ms": self.processing_time_ms
         }
+        if self.shared_with:
+            data["shared_from"] = self.shared_from
+            data["shared_with"] = list(self.shared_with)
+        return data
 
 
 @dataclass
@@ -207,6 +218,7 @@ class Waypoint:
     instruction: str
     distance_from_start: float = 0.0  # Meters
     step_index: int = 0
+    duration_from_start: Optional[float] = None  # Seconds of travel, when known
     metadata: Optional[WaypointMetadata] = None
     agent_context: Optional[AgentContext] = None
     enrichment: Optional[WaypointEnrichment] = None
@@ -246,7 +258,8 @@ class RouteData:
     distance: str  # e.g., "45.2 km"
     duration: str  # e.g., "52 mins"
     waypoints: List[Waypoint]
-    steps: List[Dict[str, Any]] = field(default_factory=list)  # Raw navigation steps
+    steps: List[Dict[str, Any]] = field(default_factory=list)  # Raw steps, if retained (RAW_STEPS_RETENTION)
+    overview_polyline: str = ""  # Encoded; see src.google_maps.polyline.decode_polyline
 
     def waypoint_count(self) -> int:
         return len(self.waypoints)
@@ -284,6 +297,24 @@ class TransactionContext:
         with self._lock:
             self.current_stage = stage_name
 
+    def sub_stage_context(self) -> "TransactionContext":
+        """
+        Context for a stage running concurrently with this one's current stage
+        Shares the request, metadata and lock; stage transitions stay local,
+        so the concurrent stage never overwrites current_stage
+        """
+        child = TransactionContext(
+            transaction_id=self.transaction_id,
+            origin=self.origin,
+            destination=self.destination,
+            created_at=self.created_at,
+            user_preferences=self.user_preferences,
+            current_stage=self.current_stage,
+            metadata=self.metadata
+        )
+        child._lock = self._lock
+        return child
+
     def add_metadata(self, key: str, value: Any) -> None:
         """
         Add metadata in a thread-safe manner
@@ -411,3 +442,19 @@ def create_error_result(agent_name: str, transaction_id: str, waypoint_id: int,
         error_message=str(error),
         execution_time_ms=0
     )
+
+
+def create_no_results_result(agent_name: str, transaction_id: str, waypoint_id: int, query: str) -> AgentResult:
+    """
+    Create AgentResult for a search that completed but matched nothing
+    Unlike timeouts and errors, this outcome is deterministic for the query
+    """
+    return AgentResult(
+        agent_name=agent_name,
+        transaction_id=transaction_id,
+        waypoint_id=waypoint_id,
+        status=AgentStatus.NO_RESULTS,
+        content=None,
+        error_message=f"No results found for query: {query}",
+        execution_time_ms=0
+    )
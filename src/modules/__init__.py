@@ -4,7 +4,7 @@ Contains all 6 pipeline modules with their interfaces
 
 This package implements the complete processing pipeline:
 - Module 1: Request Validation
-- Module 2: Route Retrieval
+- Module 2: Route Retrieval (and waypoint simplification)
 - Module 3: Waypoint Preprocessing
 - Module 4: Orchestration (Agent Coordination)
 - Module 5: Result Aggregation
@@ -16,9 +16,18 @@ from src.modules.request_validator import validate_request, ValidationError
 
 # Module 2: Route Retrieval
 from src.modules.route_retrieval import retrieve_route, RouteRetrievalError
+from src.modules.bulk_route_retrieval import retrieve_routes_bulk, BulkRouteResult
+from src.modules.waypoint_simplifier import simplify_waypoints
 
 # Module 3: Waypoint Preprocessor
-from src.modules.waypoint_preprocessor import preprocess_waypoints
+from src.modules.waypoint_preprocessor import (
+    preprocess_waypoints,
+    iter_preprocessed_waypoints,
+    preprocesses_in_parallel,
+)
+
+# Module 3b: Waypoint Clustering
+from src.modules.waypoint_clustering import WaypointClusterer, share_cluster_enrichment
 
 # Module 4: Orchestrator
 from src.modules.orchestrator import Orchestrator
@@ -43,7 +52,14 @@ __all__ = [
     "ValidationError",
     "retrieve_route",
     "RouteRetrievalError",
+    "retrieve_routes_bulk",
+    "BulkRouteResult",
+    "simplify_waypoints",
     "preprocess_waypoints",
+    "iter_preprocessed_waypoints",
+    "preprocesses_in_parallel",
+    "WaypointClusterer",
+    "share_cluster_enrichment",
     "Orchestrator",
     "aggregate_results",
     "format_response",
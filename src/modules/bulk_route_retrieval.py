@@ -0,0 +1,262 @@
+"""
+Bulk Route Retrieval
+Retrieves routes for many origin/destination pairs concurrently
+
+Built for offline jobs that precompute tours: pairs are read lazily from any
+iterable, looked up through retrieve_route() (so results land in the route
+cache) under a global rate limit, and streamed back as they complete.
+Identical pairs are looked up once; only the outcome of finished pairs is
+kept, and later repeats of a successful pair re-read the route cache. A
+checkpoint file records finished pairs so an interrupted job can resume
+where it stopped.
+"""
+
+import copy
+import json
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from src.cache import ROUTE_CACHE, get_cache, make_route_key
+from src.config import get_config
+from src.logging_config import get_logger
+from src.models import RouteData
+from src.modules.request_validator import validate_request, ValidationError
+from src.modules.route_retrieval import retrieve_route, RouteRetrievalError
+from src.rate_limiter import RateLimiter
+
+
+@dataclass
+class BulkRouteResult:
+    """
+    Outcome for one input pair
+    Exactly one of route_data and error is set
+    """
+    origin: str
+    destination: str
+    route_data: Optional[RouteData] = None
+    error: Optional[str] = None
+    status: Optional[str] = None  # Google Maps status for failures, if known
+    duplicate: bool = False  # Served from an earlier identical pair
+
+    @property
+    def succeeded(self) -> bool:
+        return self.route_data is not None
+
+
+def retrieve_routes_bulk(
+    pairs: Iterable[Tuple[str, str]],
+    concurrency: int = 8,
+    rate_per_second: float = 10.0,
+    checkpoint_path: Optional[str] = None
+) -> Iterator[BulkRouteResult]:
+    """
+    Retrieve routes for many pairs, yielding results as they complete
+
+    Results arrive in completion order, not input order. Duplicates of a pair
+    are marked duplicate=True. Those read while its lookup is in flight are
+    yielded with it, sharing the same RouteData; later ones re-read the route
+    cache (falling back to a rate-limited lookup on a miss), since only the
+    error and status of finished pairs are kept. At most 2 x concurrency pairs
+    are read ahead of the results, so the input may be a large or lazy
+    iterable.
+
+    Successes and deterministic failures (e.g. ZERO_RESULTS) are appended to
+    the checkpoint file; pairs already recorded there are skipped entirely.
+    Transient failures are not recorded and are retried on resume.
+
+    Args:
+        pairs: (origin, destination) tuples
+        concurrency: Maximum lookups in flight
+        rate_per_second: Maximum lookup starts per second (0 = unlimited)
+        checkpoint_path: JSONL file to resume from and append to (optional)
+
+    Yields:
+        BulkRouteResult per input pair (except checkpointed pairs)
+    """
+    logger = get_logger()
+    limiter = RateLimiter(rate_per_second)
+    checkpoint = _Checkpoint(checkpoint_path) if checkpoint_path else None
+    start_time = time.time()
+
+    # Outcome of every finished pair as (error, status); error is None on success
+    finished: Dict[str, Tuple[Optional[str], Optional[str]]] = {}
+    in_flight: Dict[Future, str] = {}
+    rereads: Set[Future] = set()
+    waiting: Dict[str, List[Tuple[str, str]]] = {}
+    pair_iter = iter(pairs)
+    exhausted = False
+    counts = {"yielded": 0, "lookups": 0, "rereads": 0, "skipped": 0, "failed": 0}
+
+    def lookup(origin: str, destination: str) -> BulkRouteResult:
+        limiter.acquire()
+        return _retrieve_one(origin, destination)
+
+    def reread(origin: str, destination: str) -> BulkRouteResult:
+        route_data = _cached_route(origin, destination)
+        if route_data is None:
+            result = lookup(origin, destination)
+        else:
+            result = BulkRouteResult(origin=origin, destination=destination, route_data=route_data)
+        result.duplicate = True
+        return result
+
+    logger.info(
+        "Bulk route retrieval started",
+        concurrency=concurrency,
+        rate_per_second=rate_per_second,
+        checkpoint=checkpoint_path,
+        resumed_pairs=len(checkpoint.done) if checkpoint else 0
+    )
+
+    try:
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="bulk-route") as pool:
+            while True:
+                # Read ahead until the window is full; emit duplicates of finished pairs directly
+                ready: List[BulkRouteResult] = []
+                while not exhausted and len(in_flight) < 2 * concurrency and not ready:
+                    try:
+                        origin, destination = next(pair_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+
+                    key = make_route_key(origin, destination)
+                    if key in finished:
+                        error, status = finished[key]
+                        if error is None:
+                            future = pool.submit(reread, origin, destination)
+                            in_flight[future] = key
+                            rereads.add(future)
+                            counts["rereads"] += 1
+                        else:
+                            ready.append(BulkRouteResult(
+                                origin=origin, destination=destination,
+                                error=error, status=status, duplicate=True
+                            ))
+                    elif checkpoint is not None and key in checkpoint.done:
+                        counts["skipped"] += 1
+                    elif key in waiting:
+                        waiting[key].append((origin, destination))
+                    else:
+                        waiting[key] = [(origin, destination)]
+                        in_flight[pool.submit(lookup, origin, destination)] = key
+                        counts["lookups"] += 1
+
+                if not ready:
+                    if not in_flight:
+                        break
+                    done, _ = wait(list(in_flight), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        key = in_flight.pop(future)
+                        result = future.result()
+                        if future in rereads:
+                            rereads.discard(future)
+                            ready.append(result)
+                            continue
+
+                        finished[key] = (result.error, result.status)
+                        if checkpoint is not None:
+                            checkpoint.record(key, result)
+
+                        duplicates = waiting.pop(key)[1:]
+                        ready.append(result)
+                        ready.extend(_as_duplicate(result, *pair) for pair in duplicates)
+
+                for result in ready:
+                    counts["yielded"] += 1
+                    if not result.succeeded:
+                        counts["failed"] += 1
+                    yield result
+    finally:
+        if checkpoint is not None:
+            checkpoint.close()
+
+    logger.info(
+        "Bulk route retrieval completed",
+        duration_ms=int((time.time() - start_time) * 1000),
+        **counts
+    )
+
+
+def _retrieve_one(origin: str, destination: str) -> BulkRouteResult:
+    """Validate and retrieve one pair, converting failures into a result"""
+    try:
+        context = validate_request(origin, destination)
+        route_data = retrieve_route(context)
+        return BulkRouteResult(origin=origin, destination=destination, route_data=route_data)
+    except RouteRetrievalError as e:
+        return BulkRouteResult(origin=origin, destination=destination, error=str(e), status=e.status)
+    except ValidationError as e:
+        return BulkRouteResult(origin=origin, destination=destination, error=str(e), status="INVALID_REQUEST")
+    except Exception as e:
+        return BulkRouteResult(origin=origin, destination=destination, error=f"Unexpected error: {str(e)}")
+
+
+def _cached_route(origin: str, destination: str) -> Optional[RouteData]:
+    """Route for a pair from the route cache, or None when absent or disabled"""
+    if not get_config().enable_caching:
+        return None
+    entry = get_cache(ROUTE_CACHE).get(make_route_key(origin, destination))
+    if entry is None or entry.negative:
+        return None
+    return copy.deepcopy(entry.value)
+
+
+def _as_duplicate(result: BulkRouteResult, origin: str, destination: str) -> BulkRouteResult:
+    return BulkRouteResult(
+        origin=origin,
+        destination=destination,
+        route_data=result.route_data,
+        error=result.error,
+        status=result.status,
+        duplicate=True
+    )
+
+
+class _Checkpoint:
+    """Append-only JSONL record of finished pairs"""
+
+    # Failures that will not change on retry; everything else is retried on resume
+    FINAL_FAILURE_STATUSES = frozenset({"ZERO_RESULTS", "NOT_FOUND", "INVALID_REQUEST"})
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        self.done: Set[str] = set()
+        if self.path.exists():
+            with self.path.open(encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if not line:
+                        continue
+                    try:
+                        self.done.add(json.loads(line)["key"])
+                    except (ValueError, KeyError):
+                        continue  # Partial last line from an interrupted write
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        torn = False
+        if self.path.exists() and self.path.stat().st_size:
+            with self.path.open("rb") as f:
+                f.seek(-1, 2)
+                torn = f.read(1) != b"\n"
+        self._file = self.path.open("a", encoding="utf-8")
+        if torn:
+            self._file.write("\n")  # Terminate a torn final line before appending
+
+    def record(self, key: str, result: BulkRouteResult) -> None:
+        if not result.succeeded and result.status not in self.FINAL_FAILURE_STATUSES:
+            return
+        entry = {
+            "key": key,
+            "origin": result.origin,
+            "destination": result.destination,
+            "ok": result.succeeded,
+            "status": result.status
+        }
+        self._file.write(json.dumps(entry) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
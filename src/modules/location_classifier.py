@@ -0,0 +1,266 @@
+"""
+Location Classifier
+Classifies waypoint location names against keyword gazetteers
+
+Gazetteers are plain-text term lists, one file per location type. All terms
+are compiled once into an Aho-Corasick automaton, so classifying a name
+takes one pass over its characters however many terms are loaded.
+"""
+
+import threading
+from collections import deque
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from src.config import get_config
+from src.models import LocationType
+
+
+# Bundled gazetteers; GAZETTEER_DIR files with the same names replace them
+BUNDLED_GAZETTEER_DIR = Path(__file__).parent / "gazetteers"
+
+# Gazetteer file stem -> location type, in classification priority order
+GAZETTEER_TYPES = (
+    ("landmark", LocationType.LANDMARK),
+    ("highway", LocationType.HIGHWAY),
+    ("neighborhood", LocationType.NEIGHBORHOOD),
+)
+
+# Cross-street markers ("Main St & 5th Ave", "Elm St at Oak St")
+INTERSECTION_MARKERS = ("&", " and ", " at ")
+
+# Highest priority first; names matching nothing are intersections
+CLASSIFICATION_PRIORITY = (
+    LocationType.LANDMARK,
+    LocationType.HIGHWAY,
+    LocationType.INTERSECTION,
+    LocationType.NEIGHBORHOOD,
+)
+
+
+class KeywordAutomaton:
+    """
+    Aho-Corasick multi-pattern matcher
+    Finds every occurrence of every keyword in a single left-to-right scan
+    """
+
+    def __init__(self, keywords: Iterable[Tuple[str, object]]):
+        """
+        Build the automaton
+
+        Args:
+            keywords: (keyword, value) pairs; a keyword listed twice keeps both values
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._outputs: List[Tuple[Tuple[int, object], ...]] = [()]
+        self.size = 0
+
+        for keyword, value in keywords:
+            if keyword:
+                self._insert(keyword, value)
+                self.size += 1
+
+        self._fail = [0] * len(self._goto)
+        self._link_failures()
+
+    def _insert(self, keyword: str, value: object) -> None:
+        state = 0
+        for char in keyword:
+            next_state = self._goto[state].get(char)
+            if next_state is None:
+                next_state = len(self._goto)
+                self._goto.append({})
+                self._outputs.append(())
+                self._goto[state][char] = next_state
+            state = next_state
+        self._outputs[state] += ((len(keyword), value),)
+
+    def _link_failures(self) -> None:
+        # Breadth-first, so every shorter state's failure link is final before use
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self._goto[state].items():
+                queue.append(next_state)
+                fallback = self._fail[state]
+                while fallback and char not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                if state:
+                    self._fail[next_state] = self._goto[fallback].get(char, 0)
+                # Suffix keywords ("park" inside "ballpark") are reported too
+                self._outputs[next_state] += self._outputs[self._fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, object]]:
+        """
+        Yield every keyword occurrence in text
+
+        Args:
+            text: Text to scan (keywords are matched exactly; normalize case first)
+
+        Yields:
+            (start, end, value) per occurrence, ordered by end position
+        """
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        root = goto[0]
+        state = 0
+        for index, char in enumerate(text):
+            if state == 0:
+                state = root.get(char, 0)
+            else:
+                while state and char not in goto[state]:
+                    state = fail[state]
+                state = goto[state].get(char, 0)
+            if outputs[state]:
+                end = index + 1
+                for length, value in outputs[state]:
+                    yield end - length, end, value
+
+
+@dataclass(frozen=True)
+class LocationClassification:
+    """Location type of a name and the landmark terms found in it"""
+    location_type: LocationType
+    landmarks: Tuple[str, ...]
+
+
+class LocationClassifier:
+    """
+    Gazetteer-backed location type classifier
+    Thread-safe after construction (the automaton is read-only)
+    """
+
+    def __init__(self, gazetteers: Dict[LocationType, Iterable[str]]):
+        """
+        Initialize classifier
+
+        Args:
+            gazetteers: Terms per location type (matched case-insensitively
+                anywhere in the name); intersection markers are always added
+        """
+        keywords = [(marker, LocationType.INTERSECTION) for marker in INTERSECTION_MARKERS]
+        for location_type, terms in gazetteers.items():
+            keywords.extend((term.lower(), location_type) for term in terms)
+        self.automaton = KeywordAutomaton(keywords)
+
+    def classify(self, location_name: str) -> LocationClassification:
+        """
+        Classify a location name
+
+        Args:
+            location_name: Waypoint location name
+
+        Returns:
+            LocationClassification with the highest-priority matched type and
+            the landmark terms as written in the name (longest first on overlap)
+        """
+        lowered, offsets = _lower_with_offsets(location_name)
+        matched_types = set()
+        landmark_spans = []
+        for start, end, location_type in self.automaton.iter_matches(lowered):
+            matched_types.add(location_type)
+            if location_type is LocationType.LANDMARK:
+                if offsets is not None:
+                    start, end = offsets[start], offsets[end - 1] + 1
+                landmark_spans.append((start, end))
+
+        location_type = next(
+            (candidate for candidate in CLASSIFICATION_PRIORITY if candidate in matched_types),
+            LocationType.INTERSECTION
+        )
+        return LocationClassification(
+            location_type=location_type,
+            landmarks=_select_landmarks(location_name, landmark_spans)
+        )
+
+
+def _lower_with_offsets(text: str) -> Tuple[str, Optional[List[int]]]:
+    """
+    Lowercase text for matching, keeping a way back to the original
+    str.lower() can change length ("İ" becomes two characters), so then the
+    original index of every lowered character is returned too (else None)
+    """
+    lowered = text.lower()
+    if len(lowered) == len(text):
+        return lowered, None
+
+    offsets = []
+    for index, char in enumerate(text):
+        offsets.extend([index] * len(char.lower()))
+    return lowered, offsets
+
+
+def _select_landmarks(location_name: str, spans: List[Tuple[int, int]]) -> Tuple[str, ...]:
+    """Leftmost-longest non-overlapping spans, as text, without repeats"""
+    landmarks = []
+    covered_until = 0
+    for start, end in sorted(spans, key=lambda span: (span[0], -span[1])):
+        if start >= covered_until:
+            landmark = location_name[start:end]
+            if landmark not in landmarks:
+                landmarks.append(landmark)
+            covered_until = end
+    return tuple(landmarks)
+
+
+def load_gazetteer(path: Path) -> List[str]:
+    """
+    Read a gazetteer file
+
+    Args:
+        path: Text file with one term per line; blank lines and "#" comments are skipped
+
+    Returns:
+        Terms in file order
+    """
+    terms = []
+    with open(path, encoding="utf-8") as gazetteer:
+        for line in gazetteer:
+            term = line.strip()
+            if term and not term.startswith("#"):
+                terms.append(term)
+    return terms
+
+
+def load_gazetteers(gazetteer_dir: Optional[str] = None) -> Dict[LocationType, List[str]]:
+    """
+    Load every gazetteer, preferring files in gazetteer_dir over bundled ones
+
+    Args:
+        gazetteer_dir: Directory of <type>.txt files (None or "" = bundled only)
+
+    Returns:
+        Terms per location type
+    """
+    gazetteers = {}
+    for stem, location_type in GAZETTEER_TYPES:
+        path = BUNDLED_GAZETTEER_DIR / f"{stem}.txt"
+        if gazetteer_dir:
+            override = Path(gazetteer_dir) / f"{stem}.txt"
+            if override.is_file():
+                path = override
+        gazetteers[location_type] = load_gazetteer(path)
+    return gazetteers
+
+
+_classifier: Optional[LocationClassifier] = None
+_classifier_lock = threading.Lock()
+
+
+def get_location_classifier() -> LocationClassifier:
+    """
+    Get the shared classifier
+    Built from the configured gazetteers on first call
+    """
+    global _classifier
+    with _classifier_lock:
+        if _classifier is None:
+            _classifier = LocationClassifier(load_gazetteers(get_config().gazetteer_dir))
+        return _classifier
+
+
+def reset_location_classifier() -> None:
+    """Drop the shared classifier (next get_location_classifier() reloads the gazetteers)"""
+    global _classifier
+    with _classifier_lock:
+        _classifier = None
@@ -15,11 +15,43 @@ from src.models import (
     AgentStatus,
     JudgeDecision,
     TransactionContext,
-    create_fallback_content
+    create_fallback_content,
+    create_no_results_result
 )
 from src.logging_config import get_logger
 
 
+def _has_place_name(waypoint: Waypoint) -> bool:
+    """
+    Check whether a waypoint has a searchable place name
+    Unnamed waypoints (e.g. densified samples) are named by their coordinates,
+    which no content search matches
+    """
+    return any(char.isalpha() for char in waypoint.location_name)
+
+
+def _mock_no_results(
+    agent_name: str,
+    transaction_id: str,
+    waypoint: Waypoint,
+    query: str,
+    start_time: float
+) -> AgentResult:
+    """Build and log the "no results" outcome of a mock search"""
+    result = create_no_results_result(agent_name, transaction_id, waypoint.id, query)
+    result.execution_time_ms = int((time.time() - start_time) * 1000)
+
+    get_logger().log_agent_completion(
+        agent_name,
+        transaction_id,
+        waypoint.id,
+        result.status.value,
+        result.execution_time_ms
+    )
+
+    return result
+
+
 def run_mock_youtube_agent(
     transaction_id: str,
     waypoint: Waypoint
@@ -35,21 +67,25 @@ def run_mock_youtube_agent(
         waypoint: Waypoint location to find content for
 
     Returns:
-        AgentResult with mock video content
+        AgentResult with mock video content (NO_RESULTS for unnamed waypoints)
     """
     logger = get_logger()
     start_time = time.time()
 
+    query = waypoint.agent_context.youtube_query if waypoint.agent_context else ""
     logger.log_agent_start(
         "youtube",
         transaction_id,
         waypoint.id,
-        search_query=waypoint.agent_context.youtube_query if waypoint.agent_context else ""
+        search_query=query
     )
 
     # Simulate API call delay
     time.sleep(0.5)
 
+    if not _has_place_name(waypoint):
+        return _mock_no_results("youtube", transaction_id, waypoint, query, start_time)
+
     # Create mock video content
     content = ContentItem(
         content_type=ContentType.VIDEO,
@@ -98,21 +134,25 @@ def run_mock_spotify_agent(
         waypoint: Waypoint location to find content for
 
     Returns:
-        AgentResult with mock music content
+        AgentResult with mock music content (NO_RESULTS for unnamed waypoints)
     """
     logger = get_logger()
     start_time = time.time()
 
+    query = waypoint.agent_context.spotify_query if waypoint.agent_context else ""
     logger.log_agent_start(
         "spotify",
         transaction_id,
         waypoint.id,
-        search_query=waypoint.agent_context.spotify_query if waypoint.agent_context else ""
+        search_query=query
     )
 
     # Simulate API call delay
     time.sleep(0.4)
 
+    if not _has_place_name(waypoint):
+        return _mock_no_results("spotify", transaction_id, waypoint, query, start_time)
+
     # Create mock music content
     content = ContentItem(
         content_type=ContentType.SONG,
@@ -161,21 +201,25 @@ def run_mock_history_agent(
         waypoint: Waypoint location to find content for
 
     Returns:
-        AgentResult with mock historical content
+        AgentResult with mock historical content (NO_RESULTS for unnamed waypoints)
     """
     logger = get_logger()
     start_time = time.time()
 
+    query = waypoint.agent_context.history_query if waypoint.agent_context else ""
     logger.log_agent_start(
         "history",
         transaction_id,
         waypoint.id,
-        search_query=waypoint.agent_context.history_query if waypoint.agent_context else ""
+        search_query=query
     )
 
     # Simulate API call delay
     time.sleep(0.3)
 
+    if not _has_place_name(waypoint):
+        return _mock_no_results("history", transaction_id, waypoint, query, start_time)
+
     # Create mock historical content
     content = ContentItem(
         content_type=ContentType.HISTORY,
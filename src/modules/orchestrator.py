@@ -4,15 +4,20 @@ Coordinates parallel agent execution for each waypoint
 This is the central nervous system of the multi-agent platform
 """
 
+import copy
 import time
+import dataclasses
+from collections import deque
+from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, Future
-from typing import List, Dict
+from typing import Deque, Dict, Iterable, List, Tuple
 import threading
 
 from src.models import (
     TransactionContext,
     Waypoint,
     AgentResult,
+    AgentStatus,
     WaypointEnrichment,
     create_fallback_content,
     create_timeout_result,
@@ -24,6 +29,7 @@ from src.modules.mock_agents import (
     run_mock_history_agent,
     run_mock_judge
 )
+from src.cache import AGENT_RESULT_CACHE, get_cache, make_agent_key
 from src.logging_config import get_logger
 from src.config import get_config
 
@@ -46,7 +52,7 @@ class Orchestrator:
     def enrich_route(
         self,
         context: TransactionContext,
-        waypoints: List[Waypoint]
+        waypoints: Iterable[Waypoint]
     ) -> List[Waypoint]:
         """
         Main orchestration method
@@ -54,18 +60,22 @@ class Orchestrator:
 
         Input Contract:
             - TransactionContext
-            - List of preprocessed Waypoints
+            - List of preprocessed Waypoints, or an iterator still producing them
 
         Output Contract:
             - List of enriched Waypoints
 
         Args:
             context: Transaction context
-            waypoints: List of waypoints to enrich
+            waypoints: Waypoints to enrich; a list is processed in batches,
+                any other iterable is consumed as waypoints arrive
 
         Returns:
             List of enriched waypoints
         """
+        if not isinstance(waypoints, list):
+            return self._enrich_stream(context, waypoints)
+
         context.log_stage_entry("orchestration")
         self.logger.log_stage_entry(
             "orchestration",
@@ -76,6 +86,8 @@ class Orchestrator:
         start_time = time.time()
         enriched_waypoints = []
 
+        self._prefetch_agent_results(waypoints)
+
         # Process waypoints in batches for controlled concurrency
         batches = self._create_batches(waypoints)
 
@@ -127,32 +139,99 @@ class Orchestrator:
             futures.append((waypoint, future))
 
         # Collect results with timeout
-        results = []
-        timeout_seconds = (self.config.agent_timeout_ms + self.config.judge_timeout_ms + 1000) / 1000
+        return [self._collect_waypoint(context, waypoint, future) for waypoint, future in futures]
 
-        for waypoint, future in futures:
-            try:
-                enriched = future.result(timeout=timeout_seconds)
-                results.append(enriched)
-            except TimeoutError:
-                self.logger.error(
-                    f"Waypoint {waypoint.id} processing timeout",
-                    transaction_id=context.transaction_id,
-                    waypoint_id=waypoint.id
-                )
-                # Return waypoint without enrichment
-                results.append(waypoint)
-            except Exception as e:
-                self.logger.error(
-                    f"Waypoint {waypoint.id} processing error",
-                    transaction_id=context.transaction_id,
-                    waypoint_id=waypoint.id,
-                    error=str(e),
-                    exc_info=True
-                )
-                results.append(waypoint)
+    def _enrich_stream(
+        self,
+        context: TransactionContext,
+        waypoints: Iterable[Waypoint]
+    ) -> List[Waypoint]:
+        """
+        Enrich waypoints as an upstream stage produces them
+
+        Each waypoint is submitted as soon as it arrives and one of the
+        max_concurrent_waypoints slots is free, instead of waiting for the
+        whole route and then for each full batch.
+
+        Args:
+            context: Transaction context
+            waypoints: Preprocessed waypoints, possibly still being produced
 
-        return results
+        Returns:
+            List of enriched waypoints, in arrival order
+        """
+        context.log_stage_entry("orchestration")
+        self.logger.log_stage_entry(
+            "orchestration",
+            context.transaction_id,
+            streamed=True
+        )
+
+        start_time = time.time()
+        enriched_waypoints = []
+        in_flight: Deque[Tuple[Waypoint, Future]] = deque()
+
+        for waypoint in waypoints:
+            if len(in_flight) >= self.config.max_concurrent_waypoints:
+                enriched_waypoints.append(self._collect_waypoint(context, *in_flight.popleft()))
+
+            # Without the whole route up front, prefetch per waypoint
+            self._prefetch_agent_results([waypoint])
+            future = self.thread_pool.submit(self._enrich_single_waypoint, context, waypoint)
+            in_flight.append((waypoint, future))
+
+        while in_flight:
+            enriched_waypoints.append(self._collect_waypoint(context, *in_flight.popleft()))
+
+        duration_ms = int((time.time() - start_time) * 1000)
+
+        self.logger.log_stage_exit(
+            "orchestration",
+            context.transaction_id,
+            duration_ms=duration_ms,
+            enriched_count=sum(1 for wp in enriched_waypoints if wp.is_enriched())
+        )
+
+        return enriched_waypoints
+
+    def _collect_waypoint(
+        self,
+        context: TransactionContext,
+        waypoint: Waypoint,
+        future: Future
+    ) -> Waypoint:
+        """
+        Wait for a submitted waypoint enrichment
+
+        Args:
+            context: Transaction context
+            waypoint: Waypoint that was submitted
+            future: Its _enrich_single_waypoint future
+
+        Returns:
+            Enriched waypoint, or the waypoint without enrichment on timeout/error
+        """
+        timeout_seconds = (self.config.agent_timeout_ms + self.config.judge_timeout_ms + 1000) / 1000
+
+        try:
+            return future.result(timeout=timeout_seconds)
+        except TimeoutError:
+            self.logger.error(
+                f"Waypoint {waypoint.id} processing timeout",
+                transaction_id=context.transaction_id,
+                waypoint_id=waypoint.id
+            )
+            # Return waypoint without enrichment
+            return waypoint
+        except Exception as e:
+            self.logger.error(
+                f"Waypoint {waypoint.id} processing error",
+                transaction_id=context.transaction_id,
+                waypoint_id=waypoint.id,
+                error=str(e),
+                exc_info=True
+            )
+            return waypoint
 
     def _enrich_single_waypoint(
         self,
@@ -186,21 +265,13 @@ class Orchestrator:
 
         # Launch 3 agents in parallel
         agent_futures = {
-            'youtube': self.thread_pool.submit(
-                run_mock_youtube_agent,
-                context.transaction_id,
-                waypoint
-            ),
-            'spotify': self.thread_pool.submit(
-                run_mock_spotify_agent,
-                context.transaction_id,
-                waypoint
-            ),
-            'history': self.thread_pool.submit(
-                run_mock_history_agent,
+            agent_name: self.thread_pool.submit(
+                self._run_agent,
+                agent_name,
                 context.transaction_id,
                 waypoint
             )
+            for agent_name in ('youtube', 'spotify', 'history')
         }
 
         # Collect agent results with timeout
@@ -266,6 +337,116 @@ class Orchestrator:
 
         return waypoint
 
+    def _run_agent(
+        self,
+        agent_name: str,
+        transaction_id: str,
+        waypoint: Waypoint
+    ) -> AgentResult:
+        """
+        Run a single content agent, serving repeated queries from cache
+
+        Successful results are cached under the regular TTL and "no results"
+        outcomes under the negative TTL. Timeouts and errors are never cached.
+        Expired results within the stale grace window are returned immediately
+        while a single background refresh re-runs the agent.
+
+        Args:
+            agent_name: "youtube" | "spotify" | "history"
+            transaction_id: Transaction ID
+            waypoint: Waypoint to find content for
+
+        Returns:
+            AgentResult for this waypoint
+        """
+        agent_functions = {
+            'youtube': run_mock_youtube_agent,
+            'spotify': run_mock_spotify_agent,
+            'history': run_mock_history_agent
+        }
+        agent_function = agent_functions[agent_name]
+
+        query = self._get_agent_query(agent_name, waypoint)
+        cache = get_cache(AGENT_RESULT_CACHE) if self.config.enable_caching and query else None
+
+        if cache is None:
+            return agent_function(transaction_id, waypoint)
+
+        cache_key = make_agent_key(agent_name, query)
+        entry = cache.get(cache_key)
+
+        if entry is not None:
+            stale = cache.is_stale(entry)
+            if stale:
+                # Serve the expired result now, refresh once in the background
+                cache.refresh_async(
+                    cache_key,
+                    lambda: self._store_agent_result(
+                        cache, cache_key, agent_function(transaction_id, waypoint)
+                    )
+                )
+
+            self.logger.debug(
+                f"{agent_name} agent cache hit",
+                transaction_id=transaction_id,
+                waypoint_id=waypoint.id,
+                negative=entry.negative,
+                stale=stale
+            )
+            # Callers (and cluster sharing) mutate results, so never hand out the cached instance
+            return dataclasses.replace(
+                copy.deepcopy(entry.value),
+                transaction_id=transaction_id,
+                waypoint_id=waypoint.id,
+                execution_time_ms=0,
+                timestamp=datetime.utcnow()
+            )
+
+        result = agent_function(transaction_id, waypoint)
+        self._store_agent_result(cache, cache_key, result)
+        return result
+
+    def _prefetch_agent_results(self, waypoints: List[Waypoint]) -> None:
+        """
+        Load cached agent results for the whole route in one backend round trip
+        No-op unless caching uses a shared backend
+        """
+        if not self.config.enable_caching:
+            return
+
+        cache = get_cache(AGENT_RESULT_CACHE)
+        if cache.backend is None:
+            return
+
+        keys = []
+        for waypoint in waypoints:
+            for agent_name in ('youtube', 'spotify', 'history'):
+                query = self._get_agent_query(agent_name, waypoint)
+                if query:
+                    keys.append(make_agent_key(agent_name, query))
+        loaded = cache.prefetch(keys)
+
+        self.logger.debug(
+            "Prefetched agent results from cache backend",
+            key_count=len(keys),
+            loaded=loaded
+        )
+
+    @staticmethod
+    def _store_agent_result(cache, cache_key: str, result: AgentResult) -> None:
+        """Cache copies of successes and "no results"; timeouts and errors are never cached"""
+        if result.is_successful():
+            cache.set(cache_key, copy.deepcopy(result))
+        elif result.status == AgentStatus.NO_RESULTS:
+            cache.set_negative(cache_key, copy.deepcopy(result))
+
+    @staticmethod
+    def _get_agent_query(agent_name: str, waypoint: Waypoint) -> str:
+        """Get the agent's search query from the waypoint context ("" if absent)"""
+        if not waypoint.agent_context:
+            return ""
+        return getattr(waypoint.agent_context, f"{agent_name}_query", "")
+
     def _create_batches(self, waypoints: List[Waypoint]) -> List[List[Waypoint]]:
         """
         Split waypoints into batches for controlled concurrent processing
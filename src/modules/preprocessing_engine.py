@@ -0,0 +1,150 @@
+"""
+Preprocessing Text Engine
+Extracts landmarks, neighborhood and search keywords from a waypoint's text
+
+All patterns are compiled once at import and each waypoint is analyzed in
+one call: the instruction and location name are joined and case-folded
+once, keyword patterns only run when their keyword occurs in the text, and
+duplicates are dropped with sets instead of list scans.
+"""
+
+import re
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+
+# Landmark patterns in priority order, each guarded by its literal keyword
+# (patterns are case-insensitive; the guard is checked on case-folded text)
+LANDMARK_PATTERNS = tuple(
+    (keyword + " ", re.compile(keyword + r" ([\w\s]+)", re.IGNORECASE))
+    for keyword in ("near", "past", "toward", "at")
+)
+MAX_LANDMARKS = 3
+
+# Neighborhood patterns in priority order; the last comma-separated part of
+# the location name is the fallback ("5th Ave, Manhattan" -> "Manhattan")
+NEIGHBORHOOD_PATTERNS = (
+    re.compile(r"(\w+\s+(?:District|Quarter|Heights|Village|Town))", re.IGNORECASE),
+    re.compile(r"((?:Upper|Lower|East|West|North|South)\s+\w+)", re.IGNORECASE),
+)
+
+# Location names are split into keywords at "&", "," and "-"
+KEYWORD_SEPARATOR_PATTERN = re.compile(r"[&,\-]")
+MAX_SEARCH_KEYWORDS = 5
+
+
+@dataclass(frozen=True)
+class LocationFeatures:
+    """Text features of one (instruction, location_name) pair"""
+    landmarks: Tuple[str, ...]
+    neighborhood: Optional[str]
+    search_keywords: Tuple[str, ...]
+
+
+def extract_location_features(instruction: str, location_name: str) -> LocationFeatures:
+    """
+    Extract landmarks, neighborhood and search keywords for a waypoint
+
+    Args:
+        instruction: Plain-text navigation instruction
+        location_name: Waypoint location name
+
+    Returns:
+        LocationFeatures
+    """
+    landmarks = extract_landmarks(instruction, location_name)
+    neighborhood = extract_neighborhood(location_name)
+    return LocationFeatures(
+        landmarks=tuple(landmarks),
+        neighborhood=neighborhood,
+        search_keywords=tuple(build_search_keywords(location_name, landmarks, neighborhood))
+    )
+
+
+def extract_landmarks(instruction: str, location_name: str) -> List[str]:
+    """
+    Extract landmark names ("near X", "past X", "toward X", "at X")
+
+    Matches are taken pattern by pattern in LANDMARK_PATTERNS order, then
+    by position; names of 3 characters or fewer and repeats are skipped.
+
+    Args:
+        instruction: Navigation instruction
+        location_name: Name of the location (searched after the instruction)
+
+    Returns:
+        Up to MAX_LANDMARKS landmark names
+    """
+    text = f"{instruction} {location_name}"
+    folded = text.casefold()
+
+    landmarks = []
+    seen = set()
+    for keyword, pattern in LANDMARK_PATTERNS:
+        if keyword not in folded:
+            continue
+        for match in pattern.findall(text):
+            landmark = match.strip()
+            if len(landmark) > 3 and landmark not in seen:
+                seen.add(landmark)
+                landmarks.append(landmark)
+                if len(landmarks) == MAX_LANDMARKS:
+                    return landmarks
+    return landmarks
+
+
+def extract_neighborhood(location_name: str) -> Optional[str]:
+    """
+    Extract a neighborhood name from a location name
+
+    Args:
+        location_name: Location name
+
+    Returns:
+        Neighborhood name or None
+    """
+    for pattern in NEIGHBORHOOD_PATTERNS:
+        match = pattern.search(location_name)
+        if match:
+            return match.group(1).strip()
+
+    if "," in location_name:
+        potential_neighborhood = location_name.rsplit(",", 1)[1].strip()
+        if len(potential_neighborhood) > 2:
+            return potential_neighborhood
+
+    return None
+
+
+def build_search_keywords(
+    location_name: str,
+    landmarks: List[str],
+    neighborhood: Optional[str]
+) -> List[str]:
+    """
+    Build search keywords: location name parts, then landmarks, then neighborhood
+
+    Args:
+        location_name: Name of location
+        landmarks: Nearby landmarks
+        neighborhood: Neighborhood name
+
+    Returns:
+        Up to MAX_SEARCH_KEYWORDS keywords, case-insensitively unique
+    """
+    candidates = [part.strip() for part in KEYWORD_SEPARATOR_PATTERN.split(location_name)]
+    candidates = [part for part in candidates if len(part) > 2]
+    candidates.extend(landmarks)
+    if neighborhood:
+        candidates.append(neighborhood)
+
+    keywords = []
+    seen = set()
+    for keyword in candidates:
+        keyword_lower = keyword.lower()
+        if keyword_lower not in seen:
+            seen.add(keyword_lower)
+            keywords.append(keyword)
+            if len(keywords) == MAX_SEARCH_KEYWORDS:
+                break
+    return keywords
@@ -123,6 +123,13 @@ def _format_waypoints(waypoints) -> list[Dict[str, Any]]:
                 if "album" in content.metadata:
                     wp_data["content"]["album"] = content.metadata["album"]
 
+            # Mark waypoints whose content comes from a shared cluster enrichment
+            if waypoint.enrichment.is_shared():
+                wp_data["shared_enrichment"] = {
+                    "representative_step": waypoint.enrichment.shared_from or waypoint.id,
+                    "steps": list(waypoint.enrichment.shared_with)
+                }
+
             # Add decision info (optional, for debugging)
             wp_data["decision"] = {
                 "winner": waypoint.enrichment.judge_decision.winner,
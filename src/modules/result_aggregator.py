@@ -55,11 +55,11 @@ def aggregate_results(
     enriched_count = sum(1 for wp in enriched_waypoints if wp.is_enriched())
     failed_count = len(enriched_waypoints) - enriched_count
 
-    # Calculate total and average processing time
+    # Calculate total and average processing time (shared cluster copies ran no agents)
     processing_times = [
         wp.enrichment.processing_time_ms
         for wp in enriched_waypoints
-        if wp.enrichment
+        if wp.enrichment and wp.enrichment.shared_from is None
     ]
 
     total_processing_time = sum(processing_times)
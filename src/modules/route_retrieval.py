@@ -3,17 +3,22 @@ Module 2: Route Retrieval
 Fetches route data from Google Maps Directions API
 """
 
+import copy
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 from src.models import TransactionContext, RouteData, Waypoint, Coordinates
+from src.cache import ROUTE_CACHE, get_cache, make_route_key
 from src.logging_config import get_logger
 from src.config import get_config
 
 
 class RouteRetrievalError(Exception):
     """Raised when route retrieval fails"""
-    pass
+
+    def __init__(self, message: str, status: Optional[str] = None):
+        super().__init__(message)
+        self.status = status
 
 
 def retrieve_route(context: TransactionContext) -> RouteData:
@@ -50,13 +55,38 @@ def retrieve_route(context: TransactionContext) -> RouteData:
 
     start_time = time.time()
 
+    # Serve repeats from cache (including known-unroutable pairs)
+    cache = get_cache(ROUTE_CACHE) if config.enable_caching else None
+    cache_key = make_route_key(context.origin, context.destination)
+
+    if cache is not None:
+        entry = cache.get(cache_key)
+        if entry is not None:
+            # Expired but within grace: serve now, refresh once in the background
+            stale = cache.is_stale(entry)
+            if stale:
+                cache.refresh_async(
+                    cache_key,
+                    lambda: _refresh_cached_route(context, cache, cache_key)
+                )
+
+            duration_ms = int((time.time() - start_time) * 1000)
+            logger.log_stage_exit(
+                "route_retrieval",
+                context.transaction_id,
+                duration_ms=duration_ms,
+                cache_hit=True,
+                negative=entry.negative,
+                stale=stale
+            )
+            if entry.negative:
+                message, status = entry.value
+                raise RouteRetrievalError(message, status=status)
+            # Downstream stages mutate waypoints, so never hand out the cached instance
+            return copy.deepcopy(entry.value)
+
     try:
-        if config.mock_mode:
-            # Use mock data during development
-            route_data = _retrieve_route_mock(context)
-        else:
-            # Real Google Maps API call (to be implemented in Phase 4)
-            route_data = _retrieve_route_real(context)
+        route_data = _fetch_route(context)
 
         # Calculate processing time
         duration_ms = int((time.time() - start_time) * 1000)
@@ -77,6 +107,9 @@ def retrieve_route(context: TransactionContext) -> RouteData:
             waypoint_count=len(route_data.waypoints)
         )
 
+        if cache is not None:
+            cache.set(cache_key, copy.deepcopy(route_data))
+
         return route_data
 
     except Exception as e:
@@ -86,7 +119,68 @@ def retrieve_route(context: TransactionContext) -> RouteData:
             error=str(e),
             exc_info=True
         )
-        raise RouteRetrievalError(f"Failed to retrieve route: {str(e)}")
+        error = RouteRetrievalError(
+            f"Failed to retrieve route: {str(e)}",
+            status=getattr(e, "status", None)
+        )
+        if cache is not None and _is_deterministic_failure(error):
+            cache.set_negative(cache_key, (str(error), error.status))
+        raise error
+
+
+def _fetch_route(context: TransactionContext) -> RouteData:
+    """
+    Fetch a route from the configured source, bypassing the cache
+
+    Args:
+        context: Transaction context
+
+    Returns:
+        RouteData from mock data or Google Maps
+    """
+    if get_config().mock_mode:
+        # Use mock data during development
+        return _retrieve_route_mock(context)
+
+    # Real Google Maps API call
+    return _retrieve_route_real(context)
+
+
+def _refresh_cached_route(context: TransactionContext, cache, cache_key: str) -> None:
+    """
+    Background stale-while-revalidate refresh for a cached route
+    Failures keep the stale entry unless they are deterministic
+
+    Args:
+        context: Transaction context of the request that found the stale entry
+        cache: Route cache
+        cache_key: Key to refresh
+    """
+    try:
+        route_data = _fetch_route(context)
+    except RouteRetrievalError as e:
+        if _is_deterministic_failure(e):
+            cache.set_negative(cache_key, (f"Failed to retrieve route: {str(e)}", e.status))
+            return
+        raise
+
+    cache.set(cache_key, copy.deepcopy(route_data))
+
+
+def _is_deterministic_failure(error: RouteRetrievalError) -> bool:
+    """
+    Check whether a failure will repeat for the same origin/destination
+    Only these are negatively cached; timeouts, quota and network errors are not
+
+    Args:
+        error: Route retrieval error
+
+    Returns:
+        True if the failure is safe to negatively cache
+    """
+    from src.google_maps import DETERMINISTIC_FAILURE_STATUSES
+
+    return error.status in DETERMINISTIC_FAILURE_STATUSES
 
 
 def _retrieve_route_mock(context: TransactionContext) -> RouteData:
@@ -190,13 +284,14 @@ def _retrieve_route_real(context: TransactionContext) -> RouteData:
     Raises:
         RouteRetrievalError: If route cannot be retrieved
     """
-    from src.google_maps import GoogleMapsClient, GoogleMapsError
+    from src.google_maps import GoogleMapsError, ReverseGeocoder, get_maps_client
 
     logger = get_logger()
+    config = get_config()
 
     try:
-        # Create Google Maps client
-        client = GoogleMapsClient()
+        # Shared client keeps connections alive between requests
+        client = get_maps_client()
 
         # Get directions
         route_data = client.get_directions(
@@ -205,6 +300,10 @@ def _retrieve_route_real(context: TransactionContext) -> RouteData:
             mode="driving"
         )
 
+        # Steps without a street name fall back to "lat, lng"; resolve them in bulk
+        if config.reverse_geocode_waypoints:
+            ReverseGeocoder().resolve_waypoint_names(route_data.waypoints)
+
         logger.info(
             "Successfully retrieved route from Google Maps",
             transaction_id=context.transaction_id,
@@ -220,7 +319,10 @@ def _retrieve_route_real(context: TransactionContext) -> RouteData:
             transaction_id=context.transaction_id,
             error=str(e)
         )
-        raise RouteRetrievalError(f"Failed to get route from Google Maps: {str(e)}")
+        raise RouteRetrievalError(
+            f"Failed to get route from Google Maps: {str(e)}",
+            status=e.status
+        )
 
     except Exception as e:
         logger.error(
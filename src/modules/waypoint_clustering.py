@@ -0,0 +1,266 @@
+"""
+Module 3b: Waypoint Clustering
+Shares one set of agent results between nearby waypoints
+
+Consecutive waypoints a few hundred metres apart along the same avenue get
+near-identical agent results. Preprocessed waypoints are grouped into
+clusters of consecutive waypoints within a radius of the cluster's first
+waypoint (its representative) and of the same location type; agents run for
+the representative only and every other member receives a copy of its
+enrichment, adapted by the member enrichment hook. Landmarks always get
+their own agent calls.
+"""
+
+import dataclasses
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, Iterator, List, Optional
+
+from src.geo import equirectangular_meters
+from src.models import TransactionContext, Waypoint, WaypointEnrichment, LocationType
+from src.logging_config import get_logger
+
+
+# Location types whose waypoints may share enrichment (with the same type only)
+CLUSTERABLE_LOCATION_TYPES = frozenset({
+    LocationType.INTERSECTION,
+    LocationType.HIGHWAY,
+    LocationType.NEIGHBORHOOD,
+})
+
+# Agent calls per waypoint: YouTube, Spotify and History (the judge is local)
+AGENT_CALLS_PER_WAYPOINT = 3
+
+# (representative, member, representative's enrichment) -> member's enrichment
+MemberEnrichmentHook = Callable[[Waypoint, Waypoint, WaypointEnrichment], WaypointEnrichment]
+
+
+@dataclass
+class WaypointCluster:
+    """Consecutive waypoints sharing the representative's enrichment"""
+    representative: Waypoint
+    members: List[Waypoint] = field(default_factory=list)  # Representative first
+
+    @property
+    def waypoint_ids(self) -> List[int]:
+        return [waypoint.id for waypoint in self.members]
+
+
+class WaypointClusterer:
+    """
+    Groups preprocessed waypoints into clusters as they arrive
+    Works on a stream, so representatives can be enriched while later
+    waypoints are still being preprocessed
+    """
+
+    def __init__(self, radius_meters: float):
+        """
+        Initialize clusterer
+
+        Args:
+            radius_meters: Maximum distance of a member from its representative (0 disables)
+        """
+        self.radius_meters = radius_meters
+        self.clusters: List[WaypointCluster] = []
+
+    def add(self, waypoint: Waypoint) -> bool:
+        """
+        Add the next waypoint in route order
+
+        Args:
+            waypoint: Preprocessed waypoint
+
+        Returns:
+            True if the waypoint starts a new cluster (and needs agent calls)
+        """
+        if self.clusters and self._joins(self.clusters[-1].representative, waypoint):
+            self.clusters[-1].members.append(waypoint)
+            return False
+
+        self.clusters.append(WaypointCluster(representative=waypoint, members=[waypoint]))
+        return True
+
+    def representatives(self, waypoints: Iterable[Waypoint]) -> Iterator[Waypoint]:
+        """
+        Cluster a stream of waypoints, yielding each representative immediately
+
+        Args:
+            waypoints: Preprocessed waypoints in route order
+
+        Yields:
+            The waypoints that need agent calls
+        """
+        for waypoint in waypoints:
+            if self.add(waypoint):
+                yield waypoint
+
+    def _joins(self, representative: Waypoint, waypoint: Waypoint) -> bool:
+        if self.radius_meters <= 0 or not representative.metadata or not waypoint.metadata:
+            return False
+        location_type = representative.metadata.location_type
+        return (
+            location_type in CLUSTERABLE_LOCATION_TYPES
+            and waypoint.metadata.location_type == location_type
+            and _distance_meters(representative, waypoint) <= self.radius_meters
+        )
+
+
+def cluster_waypoints(waypoints: Iterable[Waypoint], radius_meters: float) -> List[WaypointCluster]:
+    """
+    Group preprocessed waypoints into clusters
+
+    Args:
+        waypoints: Preprocessed waypoints in route order
+        radius_meters: Maximum distance of a member from its representative (0 disables)
+
+    Returns:
+        Clusters in route order
+    """
+    clusterer = WaypointClusterer(radius_meters)
+    for waypoint in waypoints:
+        clusterer.add(waypoint)
+    return clusterer.clusters
+
+
+def share_cluster_enrichment(
+    context: TransactionContext,
+    representatives: List[Waypoint],
+    clusters: List[WaypointCluster],
+    hook: Optional[MemberEnrichmentHook] = None
+) -> List[Waypoint]:
+    """
+    Give every cluster member its representative's enrichment
+
+    Input Contract:
+        - TransactionContext
+        - Representatives as returned by orchestration
+        - Clusters from the WaypointClusterer that produced them
+
+    Output Contract:
+        - All waypoints, each member placed after its representative;
+          shared enrichments list the cluster's waypoint ids
+
+    Args:
+        context: Transaction context
+        representatives: Enriched representative waypoints
+        clusters: Clusters the representatives belong to
+        hook: Builds each member's enrichment (default: get_member_enrichment_hook())
+
+    Returns:
+        Representatives and their members, in order
+    """
+    hook = hook or get_member_enrichment_hook()
+    clusters_by_representative: Dict[int, WaypointCluster] = {
+        id(cluster.representative): cluster for cluster in clusters
+    }
+
+    waypoints = []
+    shared_count = 0
+    for representative in representatives:
+        cluster = clusters_by_representative.get(id(representative))
+        if cluster is None or len(cluster.members) == 1:
+            waypoints.append(representative)
+            continue
+
+        waypoint_ids = tuple(cluster.waypoint_ids)
+        enrichment = representative.enrichment
+        if enrichment is not None:
+            representative.enrichment = dataclasses.replace(enrichment, shared_with=waypoint_ids)
+        waypoints.append(representative)
+
+        for member in cluster.members[1:]:
+            if enrichment is not None:
+                member.enrichment = dataclasses.replace(
+                    hook(representative, member, enrichment),
+                    shared_from=representative.id,
+                    shared_with=waypoint_ids
+                )
+                shared_count += 1
+            waypoints.append(member)
+
+    context.add_metadata("waypoint_clustering", {
+        "waypoints": len(waypoints),
+        "clusters": len(representatives),
+        "shared_enrichments": shared_count
+    })
+
+    get_logger().info(
+        "Cluster enrichment shared",
+        transaction_id=context.transaction_id,
+        waypoint_count=len(waypoints),
+        cluster_count=len(representatives),
+        shared_count=shared_count,
+        agent_calls_saved=(len(waypoints) - len(representatives)) * AGENT_CALLS_PER_WAYPOINT
+    )
+
+    return waypoints
+
+
+def default_member_enrichment(
+    representative: Waypoint,
+    member: Waypoint,
+    enrichment: WaypointEnrichment
+) -> WaypointEnrichment:
+    """
+    Default member enrichment: the representative's, with no processing time of its own
+
+    Location-bound text is rewritten for the member: the representative's
+    location name in the title and description is replaced with the
+    member's, and the content's metadata records the step it was shared
+    from (shared_from_step).
+
+    Args:
+        representative: Cluster representative
+        member: Member receiving the enrichment
+        enrichment: Representative's enrichment
+
+    Returns:
+        The member's copy (content and agent results are copied, not shared)
+    """
+    content = enrichment.selected_content
+    metadata = dict(content.metadata)
+    metadata["shared_from_step"] = representative.id
+    return dataclasses.replace(
+        enrichment,
+        selected_content=dataclasses.replace(
+            content,
+            title=_for_member(content.title, representative, member),
+            description=_for_member(content.description, representative, member),
+            metadata=metadata
+        ),
+        all_agent_results=dict(enrichment.all_agent_results),
+        processing_time_ms=0
+    )
+
+
+def _for_member(text: str, representative: Waypoint, member: Waypoint) -> str:
+    """Replace the representative's location name in text with the member's"""
+    if not text or not representative.location_name:
+        return text
+    return text.replace(representative.location_name, member.location_name)
+
+
+_member_enrichment_hook: MemberEnrichmentHook = default_member_enrichment
+
+
+def get_member_enrichment_hook() -> MemberEnrichmentHook:
+    """Get the hook building cluster members' enrichment"""
+    return _member_enrichment_hook
+
+
+def set_member_enrichment_hook(hook: Optional[MemberEnrichmentHook]) -> None:
+    """
+    Set the hook building cluster members' enrichment
+
+    Args:
+        hook: Called as hook(representative, member, enrichment) for every
+            member; None restores default_member_enrichment
+    """
+    global _member_enrichment_hook
+    _member_enrichment_hook = hook or default_member_enrichment
+
+
+def _distance_meters(a: Waypoint, b: Waypoint) -> float:
+    return equirectangular_meters(
+        (a.coordinates.lat, a.coordinates.lng),
+        (b.coordinates.lat, b.coordinates.lng)
+    )
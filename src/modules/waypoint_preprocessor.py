@@ -3,19 +3,62 @@ Module 3: Waypoint Preprocessor
 Enriches waypoint data with metadata for agent processing
 """
 
+import logging
+import multiprocessing
+import os
+import threading
 import time
-import re
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from typing import Iterator, List, Optional, Tuple
 
 from src.models import (
     TransactionContext,
     RouteData,
     Waypoint,
+    Coordinates,
     WaypointMetadata,
     AgentContext,
     LocationType
 )
+from src.modules.location_classifier import get_location_classifier
+from src.modules.preprocessing_engine import extract_location_features
+from src.cache import PREPROCESSING_CACHE, get_cache
 from src.logging_config import get_logger
+from src.config import get_config, set_config
+
+
+@dataclass(frozen=True)
+class _LocationAnalysis:
+    """
+    Immutable preprocessing result for one (location_name, instruction)
+    Shared across requests via the preprocessing cache; every waypoint
+    receives its own fresh WaypointMetadata and AgentContext built from it
+    """
+    location_type: LocationType
+    gazetteer_landmarks: Tuple[str, ...]
+    nearby_landmarks: Tuple[str, ...]
+    neighborhood: Optional[str]
+    search_keywords: Tuple[str, ...]
+    youtube_query: str
+    spotify_query: str
+    history_query: str
+
+    def build_metadata(self) -> WaypointMetadata:
+        return WaypointMetadata(
+            location_type=self.location_type,
+            nearby_landmarks=list(self.nearby_landmarks),
+            neighborhood=self.neighborhood,
+            search_keywords=list(self.search_keywords)
+        )
+
+    def build_agent_context(self) -> AgentContext:
+        return AgentContext(
+            youtube_query=self.youtube_query,
+            spotify_query=self.spotify_query,
+            history_query=self.history_query
+        )
 
 
 def preprocess_waypoints(context: TransactionContext, route: RouteData) -> List[Waypoint]:
@@ -36,7 +79,24 @@ def preprocess_waypoints(context: TransactionContext, route: RouteData) -> List[
     Returns:
         List of processed waypoints with metadata
     """
+    return list(iter_preprocessed_waypoints(context, route))
+
+
+def iter_preprocessed_waypoints(context: TransactionContext, route: RouteData) -> Iterator[Waypoint]:
+    """
+    Preprocess waypoints, yielding each one as soon as it is ready
+    Lets orchestration start on the first waypoints while the rest of the
+    route is still being preprocessed (see preprocess_waypoints)
+
+    Args:
+        context: Transaction context
+        route: Route data with waypoints
+
+    Yields:
+        Processed waypoints, in route order
+    """
     logger = get_logger()
+    config = get_config()
 
     context.log_stage_entry("waypoint_preprocessing")
     logger.log_stage_entry(
@@ -46,50 +106,45 @@ def preprocess_waypoints(context: TransactionContext, route: RouteData) -> List[
     )
 
     start_time = time.time()
-    processed_waypoints = []
+    suspended_seconds = 0.0
 
-    for waypoint in route.waypoints:
-        # Classify location type
-        location_type = _classify_location_type(waypoint)
+    # Preprocessing is a pure function of (location_name, instruction)
+    cache = get_cache(PREPROCESSING_CACHE) if config.enable_caching else None
 
-        # Extract nearby landmarks from instruction
-        landmarks = _extract_landmarks(waypoint.instruction, waypoint.location_name)
+    workers = _parallel_workers(len(route.waypoints), config)
+    if workers:
+        results = _iter_parallel_analyses(route.waypoints, cache, workers, config.preprocessing_chunk_size)
+    else:
+        results = (_get_location_analysis(waypoint, cache) for waypoint in route.waypoints)
 
-        # Extract neighborhood if possible
-        neighborhood = _extract_neighborhood(waypoint.location_name)
+    processed_count = 0
+    cache_hits = 0
+    log_waypoints = logger.logger.isEnabledFor(logging.DEBUG)
 
-        # Generate search keywords
-        keywords = _generate_search_keywords(
-            waypoint.location_name,
-            landmarks,
-            neighborhood
-        )
+    for waypoint, (analysis, cache_hit) in zip(route.waypoints, results):
+        cache_hits += cache_hit
 
-        # Create metadata
-        waypoint.metadata = WaypointMetadata(
-            location_type=location_type,
-            nearby_landmarks=landmarks,
-            neighborhood=neighborhood,
-            search_keywords=keywords
-        )
+        waypoint.metadata = analysis.build_metadata()
+        waypoint.agent_context = analysis.build_agent_context()
 
-        # Build agent-specific queries
-        waypoint.agent_context = AgentContext(
-            youtube_query=_build_youtube_query(waypoint),
-            spotify_query=_build_spotify_query(waypoint),
-            history_query=_build_history_query(waypoint)
-        )
+        processed_count += 1
 
-        processed_waypoints.append(waypoint)
+        # Log preprocessing for each waypoint (skipped entirely unless DEBUG)
+        if log_waypoints:
+            logger.debug(
+                "Waypoint preprocessed",
+                transaction_id=context.transaction_id,
+                waypoint_id=waypoint.id,
+                location_type=analysis.location_type.value,
+                gazetteer_landmarks=analysis.gazetteer_landmarks,
+                search_keywords=waypoint.metadata.search_keywords,
+                cache_hit=cache_hit
+            )
 
-        # Log preprocessing for each waypoint
-        logger.debug(
-            "Waypoint preprocessed",
-            transaction_id=context.transaction_id,
-            waypoint_id=waypoint.id,
-            location_type=location_type.value,
-            search_keywords=keywords
-        )
+        # Time spent waiting on the consumer is not preprocessing time
+        suspended_at = time.time()
+        yield waypoint
+        suspended_seconds += time.time() - suspended_at
 
     duration_ms = int((time.time() - start_time) * 1000)
 
@@ -97,163 +152,254 @@ def preprocess_waypoints(context: TransactionContext, route: RouteData) -> List[
         "waypoint_preprocessing",
         context.transaction_id,
         duration_ms=duration_ms,
-        processed_count=len(processed_waypoints)
+        active_ms=int((time.time() - start_time - suspended_seconds) * 1000),
+        processed_count=processed_count,
+        cache_hits=cache_hits,
+        parallel_workers=workers
     )
 
-    return processed_waypoints
 
-
-def _classify_location_type(waypoint: Waypoint) -> LocationType:
+def _get_location_analysis(waypoint: Waypoint, cache) -> Tuple[_LocationAnalysis, bool]:
     """
-    Classify the type of location based on name and instruction
+    Look up or compute the preprocessing result for a waypoint's location
 
     Args:
-        waypoint: Waypoint to classify
+        waypoint: Waypoint to analyze
+        cache: Preprocessing cache, or None when caching is disabled
 
     Returns:
-        LocationType classification
+        Tuple of (analysis, whether it came from the cache)
     """
-    name_lower = waypoint.location_name.lower()
-    instruction_lower = waypoint.instruction.lower()
+    if cache is None:
+        return _analyze_location(waypoint), False
 
-    # Check for landmarks
-    landmark_keywords = [
-        "park", "building", "tower", "statue", "museum", "library",
-        "cathedral", "church", "bridge", "square", "plaza", "center"
-    ]
-    if any(keyword in name_lower for keyword in landmark_keywords):
-        return LocationType.LANDMARK
+    key = (waypoint.location_name, waypoint.instruction)
+    entry = cache.get(key)
+    if entry is not None:
+        return entry.value, True
 
-    # Check for highway/interstate
-    if any(term in name_lower for term in ["highway", "interstate", "i-", "route"]):
-        return LocationType.HIGHWAY
+    analysis = _analyze_location(waypoint)
+    cache.set(key, analysis)
+    return analysis, False
 
-    # Check for intersection (contains &, "and", or "at")
-    if "&" in name_lower or " and " in name_lower or " at " in name_lower:
-        return LocationType.INTERSECTION
 
-    # Check for neighborhood names
-    neighborhood_keywords = [
-        "district", "quarter", "neighborhood", "heights", "village", "town"
-    ]
-    if any(keyword in name_lower for keyword in neighborhood_keywords):
-        return LocationType.NEIGHBORHOOD
+def preprocesses_in_parallel(waypoint_count: int) -> bool:
+    """
+    Whether a route of this many waypoints is preprocessed in the process pool
+    The pipeline checks this on the route as retrieved, before simplification
+    caps it, and preprocesses such routes ahead of simplification
+
+    Args:
+        waypoint_count: Waypoints in the route
 
-    # Default to intersection
-    return LocationType.INTERSECTION
+    Returns:
+        True when the route is over the threshold and two or more workers are usable
+    """
+    return _parallel_workers(waypoint_count, get_config()) > 0
 
 
-def _extract_landmarks(instruction: str, location_name: str) -> List[str]:
+def _parallel_workers(waypoint_count: int, config) -> int:
     """
-    Extract landmark names from instruction text
+    Number of pool processes to preprocess a route with (0 = serial)
 
     Args:
-        instruction: Navigation instruction
-        location_name: Name of the location
+        waypoint_count: Waypoints in the route
+        config: System configuration
 
     Returns:
-        List of landmark names
+        Worker count, or 0 when the route is under the threshold or only one CPU is usable
     """
-    landmarks = []
-
-    # Common landmark patterns in instructions
-    landmark_patterns = [
-        r"near ([\w\s]+)",
-        r"past ([\w\s]+)",
-        r"toward ([\w\s]+)",
-        r"at ([\w\s]+)",
-    ]
-
-    combined_text = f"{instruction} {location_name}"
+    threshold = config.preprocessing_parallel_threshold
+    if not threshold or waypoint_count <= threshold:
+        return 0
+    workers = config.preprocessing_workers or os.cpu_count() or 1
+    return workers if workers > 1 else 0
+
+
+def _iter_parallel_analyses(
+    waypoints: List[Waypoint],
+    cache,
+    workers: int,
+    chunk_size: int
+) -> Iterator[Tuple[_LocationAnalysis, bool]]:
+    """
+    Preprocess a long route in the process pool
 
-    for pattern in landmark_patterns:
-        matches = re.findall(pattern, combined_text, re.IGNORECASE)
-        landmarks.extend(matches)
+    Cached locations are resolved here; each remaining unique
+    (location_name, instruction) is analyzed once, in chunks, and the
+    results are mapped back onto the waypoints in route order as each
+    chunk completes.
 
-    # Clean and deduplicate
-    cleaned_landmarks = []
-    for landmark in landmarks:
-        cleaned = landmark.strip()
-        if cleaned and len(cleaned) > 3 and cleaned not in cleaned_landmarks:
-            cleaned_landmarks.append(cleaned)
+    Args:
+        waypoints: Route waypoints
+        cache: Preprocessing cache, or None when caching is disabled
+        workers: Pool size
+        chunk_size: Unique locations per pool task
 
-    return cleaned_landmarks[:3]  # Limit to top 3
+    Yields:
+        (analysis, cache_hit) per waypoint, in waypoint order
+    """
+    analyses = {}
+    cached_keys = set()
+    pending = []
+    for waypoint in waypoints:
+        key = (waypoint.location_name, waypoint.instruction)
+        if key in analyses:
+            continue
+        entry = cache.get(key) if cache is not None else None
+        if entry is not None:
+            analyses[key] = entry.value
+            cached_keys.add(key)
+        else:
+            analyses[key] = None
+            pending.append(key)
+
+    chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+    chunk_results = _map_chunks(chunks, workers)
+
+    for waypoint in waypoints:
+        key = (waypoint.location_name, waypoint.instruction)
+        # Chunks complete in first-seen order, so this never skips ahead
+        while analyses[key] is None:
+            chunk, results = next(chunk_results)
+            for chunk_key, analysis in zip(chunk, results):
+                analyses[chunk_key] = analysis
+                if cache is not None:
+                    cache.set(chunk_key, analysis)
+        yield analyses[key], key in cached_keys
+
+
+def _map_chunks(
+    chunks: List[List[Tuple[str, str]]],
+    workers: int
+) -> Iterator[Tuple[List[Tuple[str, str]], List[_LocationAnalysis]]]:
+    """
+    Analyze chunks in the process pool, serially if the pool breaks
 
+    Args:
+        chunks: Lists of (location_name, instruction)
+        workers: Pool size
 
-def _extract_neighborhood(location_name: str) -> str:
+    Yields:
+        (chunk, analyses) in chunk order
     """
-    Extract neighborhood name from location
+    done = 0
+    try:
+        for results in _get_preprocessing_pool(workers).map(_analyze_chunk, chunks):
+            yield chunks[done], results
+            done += 1
+    except (OSError, BrokenProcessPool) as e:
+        get_logger().warning("Parallel preprocessing failed, continuing serially", error=str(e))
+        reset_preprocessing_pool()
+        for chunk in chunks[done:]:
+            yield chunk, _analyze_chunk(chunk)
+
+
+def _analyze_chunk(keys: List[Tuple[str, str]]) -> List[_LocationAnalysis]:
+    """
+    Analyze (location_name, instruction) pairs (runs in pool processes)
 
     Args:
-        location_name: Location name
+        keys: Locations to analyze
 
     Returns:
-        Neighborhood name or None
+        One analysis per key, in order
     """
-    # Common neighborhood indicators
-    neighborhood_patterns = [
-        r"(\w+\s+(?:District|Quarter|Heights|Village|Town))",
-        r"((?:Upper|Lower|East|West|North|South)\s+\w+)",
+    return [
+        _analyze_location(Waypoint(
+            id=0,
+            location_name=location_name,
+            coordinates=Coordinates(lat=0.0, lng=0.0),
+            instruction=instruction
+        ))
+        for location_name, instruction in keys
     ]
 
-    for pattern in neighborhood_patterns:
-        match = re.search(pattern, location_name, re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
-
-    # Default: extract area from location (e.g., "Manhattan" from "5th Ave, Manhattan")
-    if "," in location_name:
-        parts = location_name.split(",")
-        if len(parts) > 1:
-            potential_neighborhood = parts[-1].strip()
-            if potential_neighborhood and len(potential_neighborhood) > 2:
-                return potential_neighborhood
 
-    return None
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_workers = 0
+_pool_lock = threading.Lock()
 
 
-def _generate_search_keywords(
-    location_name: str,
-    landmarks: List[str],
-    neighborhood: str
-) -> List[str]:
+def _get_preprocessing_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Get the shared preprocessing pool, started on first use
+    Workers are spawned (not forked, so no lock held by another thread is
+    inherited) and receive this process's configuration; scripts that can
+    reach the pool need an `if __name__ == "__main__":` entry point
     """
-    Generate search keywords for the location
+    global _pool, _pool_workers
+    with _pool_lock:
+        if _pool is None or _pool_workers != workers:
+            if _pool is not None:
+                _pool.shutdown(wait=False)
+            _pool_workers = workers
+            _pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=set_config,
+                initargs=(get_config(),)
+            )
+        return _pool
+
+
+def reset_preprocessing_pool() -> None:
+    """Shut down the shared preprocessing pool (the next long route starts a new one)"""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _analyze_location(waypoint: Waypoint) -> _LocationAnalysis:
+    """
+    Run classification, extraction and query building for a waypoint
 
     Args:
-        location_name: Name of location
-        landmarks: Nearby landmarks
-        neighborhood: Neighborhood name
+        waypoint: Waypoint to analyze (its metadata is set as a side effect)
 
     Returns:
-        List of search keywords
+        Immutable analysis result
+    """
+    # Classify location type against the gazetteers
+    classification = get_location_classifier().classify(waypoint.location_name)
+    location_type = classification.location_type
+
+    # Landmarks, neighborhood and search keywords in one pass over the text
+    features = extract_location_features(waypoint.instruction, waypoint.location_name)
+
+    # Query builders read the waypoint's metadata
+    waypoint.metadata = WaypointMetadata(
+        location_type=location_type,
+        nearby_landmarks=list(features.landmarks),
+        neighborhood=features.neighborhood,
+        search_keywords=list(features.search_keywords)
+    )
+
+    # Build agent-specific queries
+    return _LocationAnalysis(
+        location_type=location_type,
+        gazetteer_landmarks=classification.landmarks,
+        nearby_landmarks=features.landmarks,
+        neighborhood=features.neighborhood,
+        search_keywords=features.search_keywords,
+        youtube_query=_build_youtube_query(waypoint),
+        spotify_query=_build_spotify_query(waypoint),
+        history_query=_build_history_query(waypoint)
+    )
+
+
+def is_landmark(waypoint: Waypoint) -> bool:
+    """
+    Check whether a waypoint names a landmark
+    Used by waypoint simplification to decide what must never be dropped;
+    reuses the preprocessed location type when the waypoint already has one
     """
-    keywords = []
-
-    # Add location name components
-    name_parts = re.split(r'[&,\-]', location_name)
-    for part in name_parts:
-        cleaned = part.strip()
-        if cleaned and len(cleaned) > 2:
-            keywords.append(cleaned)
-
-    # Add landmarks
-    keywords.extend(landmarks)
-
-    # Add neighborhood
-    if neighborhood:
-        keywords.append(neighborhood)
-
-    # Deduplicate while preserving order
-    seen = set()
-    unique_keywords = []
-    for keyword in keywords:
-        keyword_lower = keyword.lower()
-        if keyword_lower not in seen:
-            seen.add(keyword_lower)
-            unique_keywords.append(keyword)
-
-    return unique_keywords[:5]  # Limit to top 5
+    if waypoint.metadata is not None:
+        return waypoint.metadata.location_type == LocationType.LANDMARK
+    classification = get_location_classifier().classify(waypoint.location_name)
+    return classification.location_type == LocationType.LANDMARK
 
 
 def _build_youtube_query(waypoint: Waypoint) -> str:
@@ -0,0 +1,251 @@
+"""
+Module 2b: Waypoint Simplifier
+Reduces a route's waypoints before preprocessing to bound agent fan-out
+
+Every waypoint costs three agent calls plus a judge, so dense routes (e.g.
+stop-and-go city driving with 150+ steps) are thinned out first: waypoints
+that are too close to the previous kept one are merged, or the route is
+simplified with Douglas-Peucker, and the result is capped at a per-route
+budget. The start, the destination and landmarks are always preferred.
+"""
+
+import math
+import time
+from typing import List, Optional, Sequence
+
+from src.geo import project_meters
+from src.models import TransactionContext, RouteData, Waypoint
+from src.modules.waypoint_preprocessor import is_landmark
+from src.logging_config import get_logger
+from src.config import get_config
+
+
+# Simplification modes (config.waypoint_simplification)
+SIMPLIFY_OFF = "off"
+SIMPLIFY_MERGE = "merge"
+SIMPLIFY_DOUGLAS_PEUCKER = "douglas_peucker"
+
+
+def simplify_waypoints(context: TransactionContext, route: RouteData) -> RouteData:
+    """
+    Drop redundant waypoints and cap the route at the waypoint budget
+
+    Input Contract:
+        - TransactionContext
+        - RouteData with waypoints in route order
+
+    Output Contract:
+        - RouteData with a subset of the waypoints, renumbered 1..n
+
+    Args:
+        context: Transaction context
+        route: Route data from route retrieval
+
+    Returns:
+        Route data with the kept waypoints (renumbered in place)
+    """
+    logger = get_logger()
+    config = get_config()
+
+    context.log_stage_entry("waypoint_simplification")
+    logger.log_stage_entry(
+        "waypoint_simplification",
+        context.transaction_id,
+        waypoint_count=len(route.waypoints),
+        mode=config.waypoint_simplification
+    )
+
+    start_time = time.time()
+    waypoints = list(route.waypoints)
+    input_count = len(waypoints)
+
+    if config.waypoint_simplification == SIMPLIFY_MERGE:
+        waypoints = merge_close_waypoints(
+            waypoints,
+            min_distance_meters=config.simplify_min_distance_meters,
+            min_seconds=config.simplify_min_seconds,
+            seconds_at=_waypoint_times(waypoints)
+        )
+    elif config.waypoint_simplification == SIMPLIFY_DOUGLAS_PEUCKER:
+        waypoints = douglas_peucker(waypoints, config.simplify_tolerance_meters)
+    simplified_count = len(waypoints)
+
+    if config.max_waypoints_per_route > 0:
+        waypoints = apply_waypoint_budget(waypoints, config.max_waypoints_per_route)
+
+    for new_id, waypoint in enumerate(waypoints, start=1):
+        waypoint.id = new_id
+
+    context.add_metadata("waypoint_simplification", {
+        "input_waypoints": input_count,
+        "after_simplification": simplified_count,
+        "output_waypoints": len(waypoints)
+    })
+
+    logger.log_stage_exit(
+        "waypoint_simplification",
+        context.transaction_id,
+        duration_ms=int((time.time() - start_time) * 1000),
+        input_count=input_count,
+        output_count=len(waypoints),
+        dropped=input_count - len(waypoints)
+    )
+
+    return RouteData(
+        distance=route.distance,
+        duration=route.duration,
+        waypoints=waypoints,
+        steps=route.steps,
+        overview_polyline=route.overview_polyline
+    )
+
+
+def merge_close_waypoints(
+    waypoints: Sequence[Waypoint],
+    min_distance_meters: float,
+    min_seconds: float = 0,
+    seconds_at: Optional[List[float]] = None
+) -> List[Waypoint]:
+    """
+    Merge each waypoint into the previous kept one if it is too close
+
+    A waypoint is merged when it lies within min_distance_meters of route
+    distance, or within min_seconds of travel time, of the last kept
+    waypoint. The first and last waypoints and landmarks are never merged.
+
+    Args:
+        waypoints: Waypoints in route order
+        min_distance_meters: Distance below which waypoints merge (0 disables)
+        min_seconds: Travel time below which waypoints merge (0 disables)
+        seconds_at: Estimated travel time at each waypoint (None disables
+            the time criterion)
+
+    Returns:
+        Kept waypoints in route order
+    """
+    if len(waypoints) <= 2:
+        return list(waypoints)
+
+    use_time = min_seconds > 0 and seconds_at is not None
+    kept = [waypoints[0]]
+    kept_index = 0
+    last = len(waypoints) - 1
+
+    for index in range(1, len(waypoints)):
+        waypoint = waypoints[index]
+        if index < last and not is_landmark(waypoint):
+            gap_meters = waypoint.distance_from_start - waypoints[kept_index].distance_from_start
+            if min_distance_meters > 0 and gap_meters < min_distance_meters:
+                continue
+            if use_time and seconds_at[index] - seconds_at[kept_index] < min_seconds:
+                continue
+        kept.append(waypoint)
+        kept_index = index
+
+    return kept
+
+
+def douglas_peucker(waypoints: Sequence[Waypoint], tolerance_meters: float) -> List[Waypoint]:
+    """
+    Keep the waypoints needed to trace the route's shape within a tolerance
+
+    Waypoints deviating less than tolerance_meters from the line between
+    their kept neighbours are dropped. Landmarks are always kept and split
+    the route into independently simplified sections.
+
+    Args:
+        waypoints: Waypoints in route order
+        tolerance_meters: Maximum perpendicular deviation of dropped waypoints
+
+    Returns:
+        Kept waypoints in route order
+    """
+    if len(waypoints) <= 2 or tolerance_meters <= 0:
+        return list(waypoints)
+
+    # Local equirectangular projection (metres) around the route's mean latitude
+    mean_lat = sum(wp.coordinates.lat for wp in waypoints) / len(waypoints)
+    points = [project_meters((wp.coordinates.lat, wp.coordinates.lng), mean_lat) for wp in waypoints]
+
+    keep = [False] * len(waypoints)
+    anchors = [0] + [i for i in range(1, len(waypoints) - 1) if is_landmark(waypoints[i])] + [len(waypoints) - 1]
+    for index in anchors:
+        keep[index] = True
+
+    stack = list(zip(anchors, anchors[1:]))
+    while stack:
+        first, last = stack.pop()
+        farthest, max_distance = None, tolerance_meters
+        for index in range(first + 1, last):
+            distance = _segment_distance(points[index], points[first], points[last])
+            if distance > max_distance:
+                farthest, max_distance = index, distance
+        if farthest is not None:
+            keep[farthest] = True
+            stack.append((first, farthest))
+            stack.append((farthest, last))
+
+    return [wp for wp, kept in zip(waypoints, keep) if kept]
+
+
+def apply_waypoint_budget(waypoints: Sequence[Waypoint], budget: int) -> List[Waypoint]:
+    """
+    Cap the number of waypoints, spreading the kept ones along the route
+
+    The first and last waypoints and landmarks are kept first; remaining
+    slots go to the other waypoints at evenly spaced positions. If there are
+    more landmarks than slots, landmarks are spread out instead.
+
+    Args:
+        waypoints: Waypoints in route order
+        budget: Maximum number of waypoints (at least 1)
+
+    Returns:
+        At most budget waypoints in route order
+    """
+    if len(waypoints) <= budget:
+        return list(waypoints)
+    if budget <= 2:
+        return [waypoints[0], waypoints[-1]][:budget]
+
+    last = len(waypoints) - 1
+    landmarks = [i for i in range(1, last) if is_landmark(waypoints[i])]
+    slots = budget - 2
+
+    if len(landmarks) >= slots:
+        chosen = _spread(landmarks, slots)
+    else:
+        others = [i for i in range(1, last) if not is_landmark(waypoints[i])]
+        chosen = landmarks + _spread(others, slots - len(landmarks))
+
+    return [waypoints[i] for i in sorted({0, last, *chosen})]
+
+
+def _spread(indices: List[int], count: int) -> List[int]:
+    """Pick count evenly spaced items from indices"""
+    if count <= 0:
+        return []
+    if count >= len(indices):
+        return list(indices)
+    step = len(indices) / count
+    return [indices[int(step * (n + 0.5))] for n in range(count)]
+
+
+def _segment_distance(point, start, end) -> float:
+    """Distance from point to the segment start-end (projected metres)"""
+    dx, dy = end[0] - start[0], end[1] - start[1]
+    length_squared = dx * dx + dy * dy
+    if length_squared == 0:
+        return math.hypot(point[0] - start[0], point[1] - start[1])
+    t = max(0.0, min(1.0, ((point[0] - start[0]) * dx + (point[1] - start[1]) * dy) / length_squared))
+    return math.hypot(point[0] - (start[0] + t * dx), point[1] - (start[1] + t * dy))
+
+
+def _waypoint_times(waypoints: Sequence[Waypoint]) -> Optional[List[float]]:
+    """
+    Travel time at each waypoint, or None if any is unknown (e.g. mock routes)
+    """
+    times = [waypoint.duration_from_start for waypoint in waypoints]
+    if any(seconds is None for seconds in times):
+        return None
+    return times
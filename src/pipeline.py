@@ -3,19 +3,34 @@ Main Pipeline
 Orchestrates the complete flow through all 6 modules
 """
 
-from typing import Dict, Any
+import queue
+import threading
+import time
+from typing import Dict, Any, List, Optional
 
-from src.models import TransactionContext
+from src.models import TransactionContext, RouteData, Waypoint
 from src.modules import (
     validate_request,
     ValidationError,
     retrieve_route,
     RouteRetrievalError,
+    simplify_waypoints,
     preprocess_waypoints,
+    iter_preprocessed_waypoints,
+    preprocesses_in_parallel,
+    WaypointClusterer,
+    share_cluster_enrichment,
     Orchestrator,
     aggregate_results,
     format_response
 )
+from src.cache import (
+    IdempotencyKeyReusedError,
+    execute_idempotent,
+    make_idempotency_key,
+    make_request_key,
+    make_request_fingerprint,
+)
 from src.logging_config import get_logger
 from src.config import get_config
 
@@ -35,7 +50,7 @@ def execute_pipeline(
 
     This is the main entry point that orchestrates all 6 modules:
     1. Request Validation
-    2. Route Retrieval
+    2. Route Retrieval (then waypoint simplification)
     3. Waypoint Preprocessing
     4. Orchestration (multi-agent enrichment)
     5. Result Aggregation
@@ -86,15 +101,8 @@ def execute_pipeline(
             "duration": route_data.duration
         }
 
-        # ============================================================
-        # MODULE 3: WAYPOINT PREPROCESSING
-        # ============================================================
-        processed_waypoints = preprocess_waypoints(context, route_data)
-
-        # ============================================================
-        # MODULE 4: ORCHESTRATION (Multi-Agent Enrichment)
-        # ============================================================
-        enriched_waypoints = orchestrator.enrich_route(context, processed_waypoints)
+        # Modules 3-4 (with simplification and clustering)
+        enriched_waypoints = run_enrichment_stages(context, route_data, orchestrator)
 
         # ============================================================
         # MODULE 5: RESULT AGGREGATION
@@ -147,6 +155,171 @@ def execute_pipeline(
         orchestrator.shutdown()
 
 
+def run_enrichment_stages(
+    context: TransactionContext,
+    route_data: RouteData,
+    orchestrator: Orchestrator
+) -> List[Waypoint]:
+    """
+    Run the stages between route retrieval and aggregation
+    Simplification, preprocessing, clustering and orchestration, exactly as
+    execute_pipeline runs them (also used by the cache warm-up)
+
+    Args:
+        context: Transaction context
+        route_data: Retrieved route
+        orchestrator: Orchestrator running the agents
+
+    Returns:
+        Enriched waypoints in route order, cluster members included
+    """
+    config = get_config()
+
+    # Agents run once per cluster of nearby, similar waypoints
+    clusterer = WaypointClusterer(config.cluster_radius_meters)
+
+    if preprocesses_in_parallel(len(route_data.waypoints)):
+        # Very long (e.g. densified) route: preprocess all of it in the process
+        # pool first; simplification then reads landmark types from the metadata
+        # instead of classifying every waypoint serially
+        preprocess_waypoints(context, route_data)
+        route_data = simplify_waypoints(context, route_data)
+        representatives = orchestrator.enrich_route(
+            context, list(clusterer.representatives(route_data.waypoints))
+        )
+        return share_cluster_enrichment(context, representatives, clusterer.clusters)
+
+    # Bound agent fan-out: drop redundant waypoints, cap at the budget
+    route_data = simplify_waypoints(context, route_data)
+
+    # ============================================================
+    # MODULE 3: WAYPOINT PREPROCESSING (then clustering)
+    # MODULE 4: ORCHESTRATION (Multi-Agent Enrichment)
+    # ============================================================
+    if config.stage_queue_size > 0:
+        # Agents start on each waypoint as soon as it is preprocessed
+        representatives = _run_overlapped_stages(
+            context, route_data, orchestrator, config.stage_queue_size, clusterer
+        )
+    else:
+        processed_waypoints = preprocess_waypoints(context, route_data)
+        representatives = orchestrator.enrich_route(
+            context, list(clusterer.representatives(processed_waypoints))
+        )
+
+    return share_cluster_enrichment(context, representatives, clusterer.clusters)
+
+
+# Marks the end of the preprocessed waypoint stream
+_STAGE_DONE = object()
+
+
+def _run_overlapped_stages(
+    context: TransactionContext,
+    route_data: RouteData,
+    orchestrator: Orchestrator,
+    queue_size: int,
+    clusterer: WaypointClusterer
+) -> List[Waypoint]:
+    """
+    Run preprocessing and orchestration concurrently
+
+    Preprocessing runs in its own thread, on a sub-stage context, and hands
+    each waypoint to the orchestrator through a bounded queue, so the first
+    agent call does not wait for the whole route. Both stages still log their
+    own entry and exit; the overlap between them is logged once both finish.
+
+    Args:
+        context: Transaction context
+        route_data: Simplified route
+        orchestrator: Orchestrator running the agents
+        queue_size: Waypoints preprocessing may run ahead of orchestration
+        clusterer: Clusters the preprocessed waypoints; only representatives
+            are enriched
+
+    Returns:
+        Enriched cluster representatives, in route order
+
+    Raises:
+        Any exception raised by preprocessing, re-raised in the caller's thread
+        PipelineError: If preprocessing stopped without ending its stream
+    """
+    logger = get_logger()
+    handoff: queue.Queue = queue.Queue(maxsize=queue_size)
+    stopped = threading.Event()
+    timings: Dict[str, float] = {}
+    stage_context = context.sub_stage_context()
+
+    def put(item) -> bool:
+        # Gives up once orchestration has stopped consuming
+        while not stopped.is_set():
+            try:
+                handoff.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def preprocess() -> None:
+        timings["preprocessing_start"] = time.monotonic()
+        outcome = _STAGE_DONE
+        try:
+            for waypoint in iter_preprocessed_waypoints(stage_context, route_data):
+                if not put(waypoint):
+                    return
+        except BaseException as e:  # Includes KeyboardInterrupt/SystemExit; re-raised by the consumer
+            outcome = e
+        finally:
+            timings["preprocessing_end"] = time.monotonic()
+            # Always end the stream, or the consumer would wait forever
+            put(outcome)
+
+    def preprocessed_waypoints():
+        while True:
+            try:
+                item = handoff.get(timeout=0.1)
+            except queue.Empty:
+                if producer.is_alive() or not handoff.empty():
+                    continue
+                raise PipelineError("Waypoint preprocessing stopped without finishing")
+            if item is _STAGE_DONE:
+                return
+            if isinstance(item, BaseException):
+                raise item
+            timings.setdefault("first_handoff", time.monotonic())
+            yield item
+
+    producer = threading.Thread(target=preprocess, name="waypoint-preprocessing", daemon=True)
+    orchestration_start = time.monotonic()
+    producer.start()
+    try:
+        representatives = orchestrator.enrich_route(
+            context, clusterer.representatives(preprocessed_waypoints())
+        )
+    finally:
+        stopped.set()
+        producer.join()
+    orchestration_end = time.monotonic()
+
+    preprocessing_start = timings["preprocessing_start"]
+    preprocessing_end = timings["preprocessing_end"]
+    overlap = min(preprocessing_end, orchestration_end) - max(preprocessing_start, orchestration_start)
+    first_handoff = timings.get("first_handoff", orchestration_end)
+
+    logger.info(
+        "Stages overlapped",
+        transaction_id=context.transaction_id,
+        stages="waypoint_preprocessing,orchestration",
+        preprocessing_ms=int((preprocessing_end - preprocessing_start) * 1000),
+        orchestration_ms=int((orchestration_end - orchestration_start) * 1000),
+        overlap_ms=int(max(overlap, 0.0) * 1000),
+        first_waypoint_ms=int((first_handoff - preprocessing_start) * 1000),
+        queue_size=queue_size
+    )
+
+    return representatives
+
+
 class ErrorResponse:
     """Structure for error responses"""
 
@@ -170,12 +343,68 @@ class ErrorResponse:
 def execute_pipeline_safe(
     origin: str,
     destination: str,
-    preferences: Dict[str, Any] = None
+    preferences: Dict[str, Any] = None,
+    idempotency_key: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Safe pipeline execution with comprehensive error handling
     Returns error response instead of raising exceptions
 
+    Retries carrying the same idempotency key within the configured window
+    receive the stored response, and concurrent duplicates wait for the first
+    execution. A key reused for a different request gets an
+    IDEMPOTENCY_KEY_REUSED error response. With a deduplication window
+    configured, identical (origin, destination, preferences) requests are
+    replayed the same way.
+
+    Args:
+        origin: Starting location
+        destination: Ending location
+        preferences: Optional user preferences
+        idempotency_key: Optional client-supplied key identifying retries
+
+    Returns:
+        Success response or error response dictionary
+    """
+    config = get_config()
+
+    def execute() -> Dict[str, Any]:
+        return _execute_pipeline_safe(origin, destination, preferences)
+
+    if idempotency_key and config.idempotency_window_seconds > 0:
+        try:
+            return execute_idempotent(
+                make_idempotency_key(idempotency_key),
+                config.idempotency_window_seconds,
+                execute,
+                fingerprint=make_request_fingerprint(origin, destination, preferences)
+            )
+        except IdempotencyKeyReusedError as e:
+            from src.models import create_transaction_id
+            return ErrorResponse(
+                transaction_id=create_transaction_id(),
+                error_code="IDEMPOTENCY_KEY_REUSED",
+                message=str(e)
+            ).to_dict()
+
+    if config.response_dedup_window_seconds > 0:
+        return execute_idempotent(
+            make_request_key(origin, destination, preferences),
+            config.response_dedup_window_seconds,
+            execute
+        )
+
+    return execute()
+
+
+def _execute_pipeline_safe(
+    origin: str,
+    destination: str,
+    preferences: Dict[str, Any] = None
+) -> Dict[str, Any]:
+    """
+    Run the pipeline, converting exceptions into error response dictionaries
+
     Args:
         origin: Starting location
         destination: Ending location
@@ -0,0 +1,213 @@
+"""
+Rate Limiting
+Thread-safe token buckets for calls to external services
+
+Shared, named limiters (one per upstream API) are created from the global
+configuration by get_rate_limiter(); their statistics show when callers are
+being throttled locally or by the upstream quota.
+"""
+
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+from src.config import get_config
+
+
+# Shared limiter names
+DIRECTIONS_LIMITER = "directions"
+GEOCODING_LIMITER = "geocoding"
+
+
+@dataclass
+class RateLimiterStats:
+    """
+    Point-in-time state of one limiter
+    Counters are cumulative since the limiter was created
+    """
+    name: str
+    rate_per_second: float
+    burst: int
+    tokens_available: float
+    acquired: int  # Calls let through
+    throttled: int  # Calls that had to wait for a token
+    rejected: int  # Calls that gave up because the wait exceeded their deadline
+    total_wait_seconds: float
+    over_query_limit: int  # OVER_QUERY_LIMIT responses reported by callers
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "name": self.name,
+            "rate_per_second": self.rate_per_second,
+            "burst": self.burst,
+            "tokens_available": self.tokens_available,
+            "acquired": self.acquired,
+            "throttled": self.throttled,
+            "rejected": self.rejected,
+            "total_wait_seconds": self.total_wait_seconds,
+            "over_query_limit": self.over_query_limit
+        }
+
+
+class TokenBucket:
+    """
+    Token bucket: sustained rate_per_second with bursts of up to burst calls
+    A non-positive rate disables limiting
+
+    Waiting callers reserve their token up front, so concurrent callers are
+    served in arrival order without oversubscribing the rate.
+    """
+
+    def __init__(
+        self,
+        rate_per_second: float,
+        burst: int = 1,
+        name: str = "",
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep
+    ):
+        self.name = name
+        self.rate_per_second = rate_per_second
+        self.burst = max(1, burst)
+        self._clock = clock
+        self._sleep = sleep
+        self._tokens = float(self.burst)
+        self._updated = clock()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.throttled = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.over_query_limit = 0
+
+    def reserve(self, max_wait: Optional[float] = None) -> Optional[float]:
+        """
+        Take a token, returning how long the caller must wait before using it
+
+        Args:
+            max_wait: Give up (taking no token) if the wait would be longer
+
+        Returns:
+            Seconds to wait (0.0 if a token is available now), or None if
+            the wait would exceed max_wait
+        """
+        with self._lock:
+            if self.rate_per_second <= 0:
+                self.acquired += 1
+                return 0.0
+
+            self._refill()
+            wait = 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate_per_second
+            if max_wait is not None and wait > max_wait:
+                self.rejected += 1
+                return None
+
+            self._tokens -= 1
+            self.acquired += 1
+            if wait > 0:
+                self.throttled += 1
+                self.total_wait_seconds += wait
+            return wait
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a token is available
+
+        Args:
+            timeout: Maximum seconds to wait (None = no limit)
+
+        Returns:
+            True once a token was taken, False if it would take longer than timeout
+        """
+        wait = self.reserve(max_wait=timeout)
+        if wait is None:
+            return False
+        if wait > 0:
+            self._sleep(wait)
+        return True
+
+    def record_over_query_limit(self) -> None:
+        """Count an upstream quota rejection (for observability)"""
+        with self._lock:
+            self.over_query_limit += 1
+
+    def stats(self) -> RateLimiterStats:
+        """Snapshot of rate, available tokens and counters"""
+        with self._lock:
+            if self.rate_per_second > 0:
+                self._refill()
+            return RateLimiterStats(
+                name=self.name,
+                rate_per_second=self.rate_per_second,
+                burst=self.burst,
+                tokens_available=self._tokens,
+                acquired=self.acquired,
+                throttled=self.throttled,
+                rejected=self.rejected,
+                total_wait_seconds=self.total_wait_seconds,
+                over_query_limit=self.over_query_limit
+            )
+
+    def _refill(self) -> None:
+        # Caller holds self._lock
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate_per_second)
+        self._updated = now
+
+
+class RateLimiter(TokenBucket):
+    """
+    Spaces call starts at least 1/rate seconds apart across threads
+    A non-positive rate disables limiting
+    """
+
+    def __init__(self, rate_per_second: float):
+        super().__init__(rate_per_second, burst=1)
+
+
+_limiters: Dict[str, TokenBucket] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(name: str) -> TokenBucket:
+    """
+    Get the shared limiter for an upstream API
+    Created from the global configuration on first call
+
+    Args:
+        name: Limiter name (DIRECTIONS_LIMITER or GEOCODING_LIMITER)
+
+    Returns:
+        Shared TokenBucket
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(name)
+        if limiter is None:
+            config = get_config()
+            if name == GEOCODING_LIMITER:
+                limiter = TokenBucket(config.geocode_rate_per_second, config.geocode_burst, name=name)
+            elif name == DIRECTIONS_LIMITER:
+                limiter = TokenBucket(config.directions_rate_per_second, config.directions_burst, name=name)
+            else:
+                raise ValueError(f"Unknown rate limiter: {name}")
+            _limiters[name] = limiter
+        return limiter
+
+
+def get_rate_limiter_stats() -> Dict[str, RateLimiterStats]:
+    """
+    Snapshot statistics for every shared limiter created so far
+
+    Returns:
+        Mapping of limiter name to RateLimiterStats
+    """
+    with _limiters_lock:
+        limiters = list(_limiters.values())
+    return {limiter.name: limiter.stats() for limiter in limiters}
+
+
+def reset_rate_limiters() -> None:
+    """Drop shared limiters (next get_rate_limiter() rebuilds them from config)"""
+    with _limiters_lock:
+        _limiters.clear()
@@ -0,0 +1,32 @@
+"""
+Stub Upstream Server Package
+Local stand-ins for the Google Maps, YouTube and Spotify APIs for load tests
+
+Start with `python -m src.stub_server` (see --help), then point the clients
+at it: GOOGLE_MAPS_BASE_URL, SPOTIFY_ACCOUNTS_URL and SPOTIFY_API_URL all
+take the server's base URL.
+"""
+
+from src.stub_server.server import (
+    LATENCY_DISTRIBUTIONS,
+    LatencyModel,
+    StubServer,
+    StubServerConfig,
+)
+from src.stub_server.synthetic import (
+    synthetic_directions,
+    synthetic_geocode,
+    synthetic_spotify_search,
+    synthetic_youtube_search,
+)
+
+__all__ = [
+    "LATENCY_DISTRIBUTIONS",
+    "LatencyModel",
+    "StubServer",
+    "StubServerConfig",
+    "synthetic_directions",
+    "synthetic_geocode",
+    "synthetic_spotify_search",
+    "synthetic_youtube_search",
+]
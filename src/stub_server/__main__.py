@@ -0,0 +1,70 @@
+"""
+Run the stub upstream server
+
+Usage:
+    python -m src.stub_server --port 8765 --route-steps 200 \
+        --latency lognormal --latency-ms 120 --latency-spread-ms 60 \
+        --error-rate 0.01 --rate 50
+
+Then, in another shell:
+    GOOGLE_MAPS_BASE_URL=http://127.0.0.1:8765 MOCK_MODE=false GOOGLE_MAPS_API_KEY=stub ...
+"""
+
+import argparse
+import json
+import time
+
+from src.stub_server.server import (
+    LATENCY_DISTRIBUTIONS,
+    LatencyModel,
+    StubServer,
+    StubServerConfig,
+)
+
+
+def parse_args(argv=None) -> StubServerConfig:
+    parser = argparse.ArgumentParser(description="Stub Google Maps / YouTube / Spotify server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--route-steps", type=int, default=20, help="Steps per synthetic route")
+    parser.add_argument("--step-meters", type=int, default=500, help="Mean step length")
+    parser.add_argument("--latency", choices=LATENCY_DISTRIBUTIONS, default="fixed")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Mean response latency")
+    parser.add_argument("--latency-spread-ms", type=float, default=0.0,
+                        help="Half-width (uniform) or standard deviation (normal, lognormal)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of requests answered with 503")
+    parser.add_argument("--rate", type=float, default=0.0, help="Requests per second per service (0 = unlimited)")
+    parser.add_argument("--burst", type=int, default=10)
+    parser.add_argument("--handshake-ms", type=float, default=0.0, help="Delay per new connection")
+    parser.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    return StubServerConfig(
+        host=args.host,
+        port=args.port,
+        route_steps=args.route_steps,
+        step_meters=args.step_meters,
+        latency=LatencyModel(args.latency, args.latency_ms, args.latency_spread_ms),
+        error_rate=args.error_rate,
+        rate_per_second=args.rate,
+        burst=args.burst,
+        handshake_ms=args.handshake_ms,
+        seed=args.seed
+    )
+
+
+def main(argv=None) -> None:
+    stub = StubServer(parse_args(argv)).start()
+    print(f"Stub server listening on {stub.url} (Ctrl+C to stop)")
+    try:
+        while True:
+            time.sleep(1)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stub.stop()
+        print(json.dumps(stub.stats(), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+"""
+Stub Upstream Server
+Local HTTP stand-in for the Google Maps, YouTube and Spotify endpoints
+
+Implements:
+    GET  /maps/api/directions/json   (Directions: origin, destination, waypoints, alternatives)
+    GET  /maps/api/geocode/json      (reverse Geocoding: latlng)
+    GET  /youtube/v3/search          (YouTube search.list: q, maxResults)
+    POST /api/token                  (Spotify client-credentials token)
+    GET  /v1/search                  (Spotify search: q, type=track, limit)
+
+Every request waits a latency drawn from the configured distribution, then
+may fail with an injected error (HTTP 503) or a per-service rate limit,
+reported the way each real API reports it: OVER_QUERY_LIMIT for Google Maps,
+403 quotaExceeded for YouTube, 429 with Retry-After for Spotify.
+"""
+
+import gzip
+import json
+import math
+import random
+import secrets
+import socket
+import threading
+import time
+import urllib.parse
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Set, Tuple
+
+from src.rate_limiter import TokenBucket
+from src.stub_server.synthetic import (
+    synthetic_directions,
+    synthetic_geocode,
+    synthetic_spotify_search,
+    synthetic_youtube_search,
+)
+
+
+# Latency distributions
+LATENCY_FIXED = "fixed"
+LATENCY_UNIFORM = "uniform"
+LATENCY_NORMAL = "normal"
+LATENCY_LOGNORMAL = "lognormal"
+LATENCY_EXPONENTIAL = "exponential"
+LATENCY_DISTRIBUTIONS = (
+    LATENCY_FIXED, LATENCY_UNIFORM, LATENCY_NORMAL, LATENCY_LOGNORMAL, LATENCY_EXPONENTIAL
+)
+
+# Services (each has its own rate limit bucket)
+SERVICE_MAPS = "maps"
+SERVICE_YOUTUBE = "youtube"
+SERVICE_SPOTIFY = "spotify"
+
+
+@dataclass
+class LatencyModel:
+    """
+    Response latency distribution
+    mean_ms is the mean; spread_ms is the half-width (uniform) or standard
+    deviation (normal, lognormal) and is ignored by fixed and exponential
+    """
+    distribution: str = LATENCY_FIXED
+    mean_ms: float = 0.0
+    spread_ms: float = 0.0
+
+    def sample(self, rng: random.Random) -> float:
+        """Draw one latency in seconds (never negative)"""
+        mean, spread = self.mean_ms, self.spread_ms
+        if mean <= 0:
+            return 0.0
+        if self.distribution == LATENCY_UNIFORM:
+            value = rng.uniform(mean - spread, mean + spread)
+        elif self.distribution == LATENCY_NORMAL:
+            value = rng.gauss(mean, spread)
+        elif self.distribution == LATENCY_LOGNORMAL:
+            # Parameters chosen so the samples have the given mean and deviation
+            sigma = math.sqrt(math.log(1 + (spread / mean) ** 2))
+            value = rng.lognormvariate(math.log(mean) - sigma ** 2 / 2, sigma)
+        elif self.distribution == LATENCY_EXPONENTIAL:
+            value = rng.expovariate(1 / mean)
+        else:
+            value = mean
+        return max(0.0, value) / 1000
+
+
+@dataclass
+class StubServerConfig:
+    """Behaviour of a StubServer"""
+    host: str = "127.0.0.1"
+    port: int = 0  # 0 = any free port
+    route_steps: int = 20  # Steps per synthetic route
+    step_meters: int = 500  # Mean step length
+    points_per_step: int = 10  # Polyline points per step
+    latency: LatencyModel = field(default_factory=LatencyModel)
+    error_rate: float = 0.0  # Fraction of requests failing with HTTP 503
+    rate_per_second: float = 0.0  # Per-service request rate (0 = unlimited)
+    burst: int = 10
+    handshake_ms: float = 0.0  # Delay per new connection (simulated TLS handshake)
+    seed: Optional[int] = None  # Seeds latency and error sampling
+    require_credentials: bool = True  # Reject requests without key / token
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    stub: "StubServer"
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: _StubHTTPServer
+
+    def setup(self):
+        super().setup()
+        # Headers and body are separate writes; avoid Nagle/delayed-ACK stalls
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        stub = self.server.stub
+        stub._count("connections")
+        if stub.config.handshake_ms > 0:
+            time.sleep(stub.config.handshake_ms / 1000)
+
+    def do_GET(self):
+        self._dispatch("GET")
+
+    def do_POST(self):
+        self._dispatch("POST")
+
+    def _dispatch(self, method: str) -> None:
+        stub = self.server.stub
+        parts = urllib.parse.urlsplit(self.path)
+        params = dict(urllib.parse.parse_qsl(parts.query))
+        if method == "POST":
+            length = int(self.headers.get("Content-Length", 0))
+            params.update(urllib.parse.parse_qsl(self.rfile.read(length).decode("utf-8")))
+
+        status, body, headers = stub.handle(method, parts.path, params, dict(self.headers.items()))
+        payload = json.dumps(body).encode("utf-8")
+        if "gzip" in self.headers.get("Accept-Encoding", ""):
+            payload = gzip.compress(payload)
+            headers["Content-Encoding"] = "gzip"
+
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=UTF-8")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StubServer:
+    """
+    Threaded stub server for the upstream APIs
+
+    Usage:
+        with StubServer(StubServerConfig(route_steps=200)) as stub:
+            config.google_maps_base_url = stub.url
+            ...
+        print(stub.stats())
+    """
+
+    def __init__(self, config: Optional[StubServerConfig] = None):
+        self.config = config or StubServerConfig()
+        self._rng = random.Random(self.config.seed)
+        self._rng_lock = threading.Lock()
+        self._stats: Dict[str, int] = {}
+        self._stats_lock = threading.Lock()
+        self._tokens: Set[str] = set()
+        self._limiters = {
+            service: TokenBucket(self.config.rate_per_second, self.config.burst, name=service)
+            for service in (SERVICE_MAPS, SERVICE_YOUTUBE, SERVICE_SPOTIFY)
+        }
+        self._server: Optional[_StubHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to use for every service, e.g. http://127.0.0.1:8765"""
+        if self._server is None:
+            raise RuntimeError("Stub server is not running")
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        """Start serving on a background thread"""
+        self._server = _StubHTTPServer((self.config.host, self.config.port), _StubHandler)
+        self._server.stub = self
+        self._thread = threading.Thread(target=self._server.serve_forever, name="stub-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Counters: connections, requests, per-endpoint requests,
+        injected_errors, rate_limited, unauthorized
+        """
+        with self._stats_lock:
+            return dict(self._stats)
+
+    def _count(self, name: str) -> None:
+        with self._stats_lock:
+            self._stats[name] = self._stats.get(name, 0) + 1
+
+    def _draw(self) -> Tuple[float, bool]:
+        """Latency (seconds) and whether to inject an error for one request"""
+        with self._rng_lock:
+            return self.config.latency.sample(self._rng), self._rng.random() < self.config.error_rate
+
+    def handle(
+        self,
+        method: str,
+        path: str,
+        params: Dict[str, str],
+        headers: Dict[str, str]
+    ) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+        """
+        Answer one request
+
+        Args:
+            method: "GET" or "POST"
+            path: URL path
+            params: Query (and form body) parameters
+            headers: Request headers
+
+        Returns:
+            (HTTP status, JSON body, extra response headers)
+        """
+        self._count("requests")
+        route = _ROUTES.get((method, path))
+        if route is None:
+            return 404, {"error": {"code": 404, "message": f"No stub for {method} {path}"}}, {}
+        service, handler = route
+        self._count(path)
+
+        latency, fail = self._draw()
+        if latency > 0:
+            time.sleep(latency)
+        if fail:
+            self._count("injected_errors")
+            return 503, {"error": {"code": 503, "message": "Injected backend error"}}, {}
+        if self._limiters[service].reserve(max_wait=0) is None:
+            self._count("rate_limited")
+            return _rate_limited(service)
+
+        headers = {name.lower(): value for name, value in headers.items()}
+        return handler(self, params, headers)
+
+    def _directions(self, params, headers):
+        if self.config.require_credentials and not params.get("key"):
+            self._count("unauthorized")
+            return 200, {"status": "REQUEST_DENIED", "error_message": "The provided API key is invalid.",
+                         "routes": []}, {}
+        if not params.get("origin") or not params.get("destination"):
+            return 200, {"status": "INVALID_REQUEST", "routes": []}, {}
+        stops = [stop for stop in params.get("waypoints", "").split("|") if stop]
+        body = synthetic_directions(
+            params["origin"],
+            params["destination"],
+            step_count=self.config.route_steps,
+            step_meters=self.config.step_meters,
+            stops=stops,
+            alternatives=params.get("alternatives") == "true",
+            points_per_step=self.config.points_per_step
+        )
+        return 200, body, {}
+
+    def _geocode(self, params, headers):
+        if self.config.require_credentials and not params.get("key"):
+            self._count("unauthorized")
+            return 200, {"status": "REQUEST_DENIED", "results": []}, {}
+        try:
+            lat, lng = (float(value) for value in params.get("latlng", "").split(","))
+        except ValueError:
+            return 200, {"status": "INVALID_REQUEST", "results": []}, {}
+        return 200, synthetic_geocode(lat, lng), {}
+
+    def _youtube_search(self, params, headers):
+        if self.config.require_credentials and not params.get("key"):
+            self._count("unauthorized")
+            return 403, {"error": {"code": 403, "message": "API key not valid",
+                                   "errors": [{"reason": "keyInvalid"}]}}, {}
+        try:
+            max_results = min(50, int(params.get("maxResults", 5)))
+        except ValueError:
+            return 400, {"error": {"code": 400, "message": "Invalid value for maxResults",
+                                   "errors": [{"reason": "invalidParameter"}]}}, {}
+        return 200, synthetic_youtube_search(params.get("q", ""), max_results), {}
+
+    def _spotify_token(self, params, headers):
+        if self.config.require_credentials and not headers.get("authorization", "").startswith("Basic "):
+            self._count("unauthorized")
+            return 400, {"error": "invalid_client"}, {}
+        if params.get("grant_type") != "client_credentials":
+            return 400, {"error": "unsupported_grant_type"}, {}
+        token = secrets.token_hex(16)
+        with self._stats_lock:
+            self._tokens.add(token)
+        return 200, {"access_token": token, "token_type": "Bearer", "expires_in": 3600}, {}
+
+    def _spotify_search(self, params, headers):
+        token = headers.get("authorization", "").removeprefix("Bearer ")
+        with self._stats_lock:
+            known = token in self._tokens
+        if self.config.require_credentials and not known:
+            self._count("unauthorized")
+            return 401, {"error": {"status": 401, "message": "Invalid access token"}}, {}
+        try:
+            limit = min(50, int(params.get("limit", 20)))
+        except ValueError:
+            return 400, {"error": {"status": 400, "message": "Invalid limit"}}, {}
+        return 200, synthetic_spotify_search(params.get("q", ""), limit), {}
+
+
+def _rate_limited(service: str) -> Tuple[int, Dict[str, Any], Dict[str, str]]:
+    if service == SERVICE_MAPS:
+        return 200, {"status": "OVER_QUERY_LIMIT", "error_message": "You have exceeded your rate-limit.",
+                     "routes": [], "results": []}, {}
+    if service == SERVICE_YOUTUBE:
+        return 403, {"error": {"code": 403, "message": "Quota exceeded",
+                               "errors": [{"reason": "quotaExceeded"}]}}, {}
+    return 429, {"error": {"status": 429, "message": "API rate limit exceeded"}}, {"Retry-After": "1"}
+
+
+_ROUTES = {
+    ("GET", "/maps/api/directions/json"): (SERVICE_MAPS, StubServer._directions),
+    ("GET", "/maps/api/geocode/json"): (SERVICE_MAPS, StubServer._geocode),
+    ("GET", "/youtube/v3/search"): (SERVICE_YOUTUBE, StubServer._youtube_search),
+    ("POST", "/api/token"): (SERVICE_SPOTIFY, StubServer._spotify_token),
+    ("GET", "/v1/search"): (SERVICE_SPOTIFY, StubServer._spotify_search),
+}
@@ -0,0 +1,202 @@
+"""
+Synthetic Upstream Payloads
+Deterministic Directions, Geocoding, YouTube and Spotify responses
+
+Payloads follow the subset of each API's response format that the project
+reads. The same request always produces the same payload (content is
+seeded from the request parameters), so load-test runs are comparable.
+"""
+
+import math
+import random
+import zlib
+from typing import Any, Dict, List, Sequence
+
+from src.google_maps.directions import format_distance, format_duration
+from src.google_maps.polyline import encode_polyline
+from src.geo import METERS_PER_DEGREE
+
+
+# Degrees of latitude per metre (mean Earth radius)
+DEGREES_PER_METER = 1 / METERS_PER_DEGREE
+
+STREET_NAMES = (
+    "Main St", "Broadway", "Park Ave", "Oak St", "Elm St", "Maple Ave",
+    "Washington Blvd", "Lincoln Way", "Lake Shore Dr", "Market St",
+    "River Rd", "Highland Ave", "Sunset Blvd", "Church St", "Mill Rd"
+)
+HIGHWAYS = ("I-95 N", "I-80 W", "US-1 S", "NJ-3 E", "I-278 E")
+LANDMARKS = (
+    "Central Park", "City Hall", "the Public Library", "Union Station",
+    "the Art Museum", "Memorial Bridge", "the Old Courthouse"
+)
+MANEUVERS = (
+    ("turn-right", "Turn <b>right</b> onto <b>{street}</b>"),
+    ("turn-left", "Turn <b>left</b> onto <b>{street}</b>"),
+    ("straight", "Continue onto <b>{street}</b>"),
+    ("ramp-right", "Take the ramp onto <b>{street}</b>"),
+    ("merge", "Merge onto <b>{street}</b>"),
+    ("keep-left", "Keep <b>left</b> to stay on <b>{street}</b>")
+)
+
+
+def _rng(*parts: Any) -> random.Random:
+    """Random generator seeded from request parameters (stable across processes)"""
+    return random.Random(zlib.crc32("|".join(str(part) for part in parts).encode("utf-8")))
+
+
+def _start_point(place: str) -> Sequence[float]:
+    rng = _rng("place", place)
+    return (40.5 + rng.uniform(0, 0.5), -74.2 + rng.uniform(0, 0.5))
+
+
+def _step(rng: random.Random, lat: float, lng: float, heading: float, meters: int, speed: float,
+          points_per_step: int) -> Dict[str, Any]:
+    end_lat = lat + math.cos(heading) * meters * DEGREES_PER_METER
+    end_lng = lng + math.sin(heading) * meters * DEGREES_PER_METER / math.cos(math.radians(lat))
+    count = max(2, points_per_step)
+    line = [
+        (lat + (end_lat - lat) * i / (count - 1), lng + (end_lng - lng) * i / (count - 1))
+        for i in range(count)
+    ]
+
+    maneuver, template = rng.choice(MANEUVERS)
+    street = rng.choice(HIGHWAYS if meters > 3000 else STREET_NAMES)
+    instruction = template.format(street=street)
+    if rng.random() < 0.3:
+        side = rng.choice(("left", "right"))
+        instruction += (
+            f"<div style=\"font-size:0.9em\">Pass by {rng.choice(LANDMARKS)} (on the {side})</div>"
+        )
+
+    seconds = max(1, int(meters / speed))
+    return {
+        "start_location": {"lat": lat, "lng": lng},
+        "end_location": {"lat": end_lat, "lng": end_lng},
+        "html_instructions": instruction,
+        "distance": {"text": format_distance(meters), "value": meters},
+        "duration": {"text": format_duration(seconds), "value": seconds},
+        "polyline": {"points": encode_polyline(line)},
+        "travel_mode": "DRIVING",
+        "maneuver": maneuver
+    }
+
+
+def synthetic_directions(
+    origin: str,
+    destination: str,
+    step_count: int,
+    step_meters: int,
+    stops: Sequence[str] = (),
+    alternatives: bool = False,
+    points_per_step: int = 10
+) -> Dict[str, Any]:
+    """
+    Build a Directions API response
+
+    Args:
+        origin: Origin as sent by the client (seeds the start point)
+        destination: Destination (seeds the route content)
+        step_count: Steps per route, spread over one leg per stop + 1
+        step_meters: Mean step length; steps vary between 0.5x and 1.5x
+        stops: Intermediate stopovers ("waypoints" parameter)
+        alternatives: Return three alternative routes instead of one
+        points_per_step: Polyline points per step
+
+    Returns:
+        Parsed JSON body with status "OK"
+    """
+    routes = []
+    for index in range(3 if alternatives else 1):
+        rng = _rng("route", origin, destination, "|".join(stops), index)
+        lat, lng = _start_point(origin)
+        heading = rng.uniform(0, 2 * math.pi)
+        speed = rng.uniform(8, 25)  # metres per second
+        # Alternatives are a little longer than the recommended route
+        route_steps = max(1, int(step_count * (1 + 0.1 * index)))
+
+        leg_count = len(stops) + 1
+        legs = []
+        for leg_index in range(leg_count):
+            count = route_steps // leg_count + (1 if leg_index < route_steps % leg_count else 0)
+            steps = []
+            for _ in range(max(1, count)):
+                heading += rng.uniform(-0.6, 0.6)
+                meters = int(step_meters * rng.uniform(0.5, 1.5)) or 1
+                step = _step(rng, lat, lng, heading, meters, speed, points_per_step)
+                steps.append(step)
+                lat, lng = step["end_location"]["lat"], step["end_location"]["lng"]
+            distance = sum(step["distance"]["value"] for step in steps)
+            duration = sum(step["duration"]["value"] for step in steps)
+            legs.append({
+                "start_address": origin if leg_index == 0 else stops[leg_index - 1],
+                "end_address": destination if leg_index == leg_count - 1 else stops[leg_index],
+                "distance": {"text": format_distance(distance), "value": distance},
+                "duration": {"text": format_duration(duration), "value": duration},
+                "steps": steps
+            })
+
+        overview = [(leg["steps"][0]["start_location"]["lat"], leg["steps"][0]["start_location"]["lng"])
+                    for leg in legs]
+        overview.append((lat, lng))
+        routes.append({
+            "summary": rng.choice(HIGHWAYS),
+            "legs": legs,
+            "overview_polyline": {"points": encode_polyline(overview)},
+            "warnings": []
+        })
+
+    return {"status": "OK", "geocoded_waypoints": [], "routes": routes}
+
+
+def synthetic_geocode(lat: float, lng: float) -> Dict[str, Any]:
+    """Build a reverse Geocoding API response"""
+    rng = _rng("geocode", round(lat, 5), round(lng, 5))
+    return {
+        "status": "OK",
+        "results": [{
+            "formatted_address": f"{rng.randint(1, 999)} {rng.choice(STREET_NAMES)}, Stub City, NY",
+            "geometry": {"location": {"lat": lat, "lng": lng}}
+        }]
+    }
+
+
+def synthetic_youtube_search(query: str, max_results: int) -> Dict[str, Any]:
+    """Build a YouTube Data API search.list response"""
+    rng = _rng("youtube", query)
+    items: List[Dict[str, Any]] = []
+    for i in range(max(0, max_results)):
+        video_id = f"stub{zlib.crc32(f'{query}|{i}'.encode('utf-8')):08x}"[:11]
+        items.append({
+            "kind": "youtube#searchResult",
+            "id": {"kind": "youtube#video", "videoId": video_id},
+            "snippet": {
+                "title": f"{query.title()} - part {i + 1}",
+                "description": f"Synthetic video about {query}",
+                "channelTitle": f"Stub Channel {rng.randint(1, 50)}",
+                "publishedAt": f"20{rng.randint(10, 25)}-0{rng.randint(1, 9)}-1{rng.randint(0, 9)}T12:00:00Z"
+            }
+        })
+    return {
+        "kind": "youtube#searchListResponse",
+        "pageInfo": {"totalResults": len(items), "resultsPerPage": len(items)},
+        "items": items
+    }
+
+
+def synthetic_spotify_search(query: str, limit: int) -> Dict[str, Any]:
+    """Build a Spotify Web API search response (type=track)"""
+    rng = _rng("spotify", query)
+    items = []
+    for i in range(max(0, limit)):
+        track_id = f"{zlib.crc32(f'{query}|{i}'.encode('utf-8')):08x}"
+        items.append({
+            "id": track_id,
+            "name": f"{query.title()} Song {i + 1}",
+            "artists": [{"name": f"Stub Artist {rng.randint(1, 200)}"}],
+            "album": {"name": f"{rng.choice(STREET_NAMES)} Sessions"},
+            "popularity": rng.randint(0, 100),
+            "external_urls": {"spotify": f"https://open.spotify.com/track/{track_id}"},
+            "preview_url": None
+        })
+    return {"tracks": {"href": "", "items": items, "limit": limit, "total": len(items)}}
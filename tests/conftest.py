@@ -27,6 +27,37 @@ from src.models import (
     create_transaction_id
 )
 from src.config import SystemConfig, set_config
+from src.cache import reset_caches
+from src.google_maps import reset_cassettes, reset_maps_client, reset_http_pool
+from src.rate_limiter import reset_rate_limiters
+
+
+@pytest.fixture(autouse=True)
+def isolated_caches():
+    """
+    Drops process-wide caches around every test so cached routes
+    and agent results never leak between tests
+    """
+    reset_caches()
+    yield
+    reset_caches()
+
+
+@pytest.fixture(autouse=True)
+def isolated_maps_client():
+    """
+    Drops the shared Google Maps client, connection pool, rate limiters and cassettes
+    around every test so patched clients and per-test configuration take effect
+    """
+    reset_maps_client()
+    reset_http_pool()
+    reset_rate_limiters()
+    reset_cassettes()
+    yield
+    reset_maps_client()
+    reset_http_pool()
+    reset_rate_limiters()
+    reset_cassettes()
 
 
 @pytest.fixture
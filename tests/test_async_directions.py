@@ -0,0 +1,222 @@
+"""
+Unit tests for GoogleMapsClient.get_directions_async
+Tests parsing, timeouts and connection reuse against a local asyncio stub server
+"""
+
+import asyncio
+import gzip
+import json
+
+import pytest
+
+from src.google_maps import GoogleMapsClient, GoogleMapsError, AsyncHTTPConnectionPool
+
+
+def _directions_body(status: str = "OK") -> bytes:
+    return json.dumps({
+        "status": status,
+        "routes": [{
+            "legs": [{
+                "distance": {"text": "1.2 km"},
+                "duration": {"text": "4 mins"},
+                "steps": [{
+                    "start_location": {"lat": 40.0, "lng": -74.0},
+                    "end_location": {"lat": 40.01, "lng": -74.0},
+                    "html_instructions": "Head north on <b>Main St</b>",
+                    "distance": {"value": 1200}
+                }]
+            }]
+        }] if status == "OK" else []
+    }).encode()
+
+
+class StubDirectionsServer:
+    """
+    asyncio HTTP/1.1 stub for the Directions API
+    Destination "slow" never answers; "chunked" uses chunked encoding;
+    "truncated" closes between chunks; "badchunk" sends a malformed chunk
+    size; "nowhere" returns ZERO_RESULTS
+    """
+
+    def __init__(self):
+        self.connection_count = 0
+        self.request_count = 0
+        self._server = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        port = self._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/maps/api/directions/json"
+
+    async def stop(self) -> None:
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        self.connection_count += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    return
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b""):
+                        break
+                    name, _, value = line.decode().partition(":")
+                    headers[name.strip().lower()] = value.strip()
+
+                self.request_count += 1
+                path = request_line.decode().split(" ")[1]
+
+                if "destination=slow" in path:
+                    await asyncio.sleep(10)
+                    return
+
+                body = _directions_body("ZERO_RESULTS" if "destination=nowhere" in path else "OK")
+                extra = ""
+                if "gzip" in headers.get("accept-encoding", ""):
+                    body = gzip.compress(body)
+                    extra = "Content-Encoding: gzip\r\n"
+
+                if "destination=truncated" in path or "destination=badchunk" in path:
+                    # A complete first chunk, then EOF instead of the next size line
+                    half = body[:len(body) // 2]
+                    size = b"zz" if "destination=badchunk" in path else f"{len(half):x}".encode()
+                    writer.write(
+                        f"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n{extra}\r\n".encode()
+                        + size + b"\r\n" + half + b"\r\n"
+                    )
+                    await writer.drain()
+                    return
+                if "destination=chunked" in path:
+                    half = len(body) // 2
+                    payload = b"".join(
+                        f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n"
+                        for chunk in (body[:half], body[half:])
+                    ) + b"0\r\n\r\n"
+                    writer.write(
+                        f"HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n{extra}\r\n".encode() + payload
+                    )
+                else:
+                    writer.write(
+                        f"HTTP/1.1 200 OK\r\nContent-Length: {len(body)}\r\n{extra}\r\n".encode() + body
+                    )
+                await writer.drain()
+        finally:
+            writer.close()
+
+
+async def _with_stub(test):
+    server = StubDirectionsServer()
+    url = await server.start()
+    client = GoogleMapsClient(async_http_pool=AsyncHTTPConnectionPool())
+    client.directions_url = url
+    try:
+        return await test(server, client)
+    finally:
+        await client.aclose()
+        await server.stop()
+
+
+@pytest.mark.unit
+class TestAsyncDirections:
+    """Test the async Directions client"""
+
+    def test_parses_route_like_sync_client(self, mock_config):
+        """Test the async path returns the same RouteData as get_directions"""
+        mock_config.raw_steps_retention = "full"
+
+        async def test(server, client):
+            return await client.get_directions_async("A", "B")
+
+        route = asyncio.run(_with_stub(test))
+
+        assert route.distance == "1.2 km"
+        assert route.waypoints[0].location_name == "Main St"
+        assert route.steps[0]["distance"]["value"] == 1200
+
+    def test_sequential_requests_reuse_connection(self, mock_config):
+        """Test keep-alive: sequential lookups share one connection"""
+        async def test(server, client):
+            for _ in range(5):
+                await client.get_directions_async("A", "B")
+            return server
+
+        server = asyncio.run(_with_stub(test))
+
+        assert server.request_count == 5
+        assert server.connection_count == 1
+
+    def test_concurrent_requests_in_flight_together(self, mock_config):
+        """Test many lookups run concurrently on one loop and connections are then reused"""
+        async def test(server, client):
+            first = await asyncio.gather(*(client.get_directions_async("A", f"B{i}") for i in range(10)))
+            second = await asyncio.gather(*(client.get_directions_async("A", f"B{i}") for i in range(10)))
+            return server, first + second
+
+        server, routes = asyncio.run(_with_stub(test))
+
+        assert len(routes) == 20
+        assert server.connection_count == 10
+
+    def test_chunked_response(self, mock_config):
+        """Test chunked transfer encoding is decoded"""
+        async def test(server, client):
+            return await client.get_directions_async("A", "chunked")
+
+        assert asyncio.run(_with_stub(test)).distance == "1.2 km"
+
+    @pytest.mark.parametrize("destination", ["truncated", "badchunk"])
+    def test_broken_chunked_body_raises_maps_error(self, destination, mock_config):
+        """Test a dropped or malformed chunked body is an error, not a short response"""
+        async def test(server, client):
+            with pytest.raises(GoogleMapsError) as exc_info:
+                await client.get_directions_async("A", destination)
+            return exc_info.value
+
+        assert "Network error" in str(asyncio.run(_with_stub(test)))
+
+    def test_failure_on_reused_connection_retried_once(self, mock_config):
+        """Test a failed reused connection gets a single retry on a fresh connection"""
+        async def test(server, client):
+            await client.get_directions_async("A", "B")
+            with pytest.raises(GoogleMapsError):
+                await client.get_directions_async("A", "truncated")
+            return server
+
+        server = asyncio.run(_with_stub(test))
+
+        assert server.request_count == 3
+        assert server.connection_count == 2
+
+    def test_timeout_raises_maps_error(self, mock_config):
+        """Test the route retrieval timeout bounds the request"""
+        mock_config.route_retrieval_timeout_ms = 200
+
+        async def test(server, client):
+            with pytest.raises(GoogleMapsError) as exc_info:
+                await client.get_directions_async("A", "slow")
+            return exc_info.value
+
+        error = asyncio.run(_with_stub(test))
+
+        assert "timed out" in str(error)
+
+    def test_api_status_error(self, mock_config):
+        """Test non-OK API statuses raise with the status attached"""
+        async def test(server, client):
+            with pytest.raises(GoogleMapsError) as exc_info:
+                await client.get_directions_async("A", "nowhere")
+            return exc_info.value
+
+        assert asyncio.run(_with_stub(test)).status == "ZERO_RESULTS"
+
+    def test_connection_refused_raises_maps_error(self, mock_config):
+        """Test network failures are wrapped in GoogleMapsError"""
+        client = GoogleMapsClient(async_http_pool=AsyncHTTPConnectionPool())
+        client.directions_url = "http://127.0.0.1:1/maps/api/directions/json"
+
+        with pytest.raises(GoogleMapsError, match="Network error"):
+            asyncio.run(client.get_directions_async("A", "B"))
@@ -0,0 +1,177 @@
+"""
+Unit tests for src/modules/bulk_route_retrieval.py
+Tests streaming, deduplication, failure reporting and checkpoint resume
+"""
+
+import gc
+import json
+import threading
+import weakref
+from unittest.mock import patch
+
+import pytest
+
+from src.models import RouteData
+from src.modules import retrieve_routes_bulk, RouteRetrievalError
+
+
+def _fake_retrieve(calls, fail=None):
+    """retrieve_route stand-in recording (origin, destination) per call"""
+    lock = threading.Lock()
+
+    def retrieve(context):
+        with lock:
+            calls.append((context.origin, context.destination))
+        if fail and context.destination in fail:
+            raise RouteRetrievalError("No route", status=fail[context.destination])
+        return RouteData(distance="1 km", duration="1 min", waypoints=[])
+
+    return retrieve
+
+
+@pytest.mark.unit
+class TestBulkRouteRetrieval:
+    """Test bulk route retrieval"""
+
+    def test_returns_result_per_pair(self, mock_config):
+        """Test every pair yields a route in mock mode"""
+        pairs = [("Times Square", f"Destination {i}") for i in range(10)]
+
+        results = list(retrieve_routes_bulk(pairs, concurrency=4, rate_per_second=0))
+
+        assert len(results) == 10
+        assert all(r.succeeded for r in results)
+        assert {r.destination for r in results} == {f"Destination {i}" for i in range(10)}
+
+    def test_duplicates_looked_up_once(self, mock_config):
+        """Test identical (normalized) pairs share one lookup"""
+        calls = []
+        pairs = [("A", "B"), ("a", " b "), ("A", "C"), ("A", "B")]
+
+        with patch('src.modules.bulk_route_retrieval.retrieve_route', side_effect=_fake_retrieve(calls)):
+            results = list(retrieve_routes_bulk(pairs, concurrency=2, rate_per_second=0))
+
+        assert len(results) == 4
+        assert sorted(calls) == [("A", "B"), ("A", "C")]
+        assert sum(r.duplicate for r in results) == 2
+        duplicates_of_b = [r for r in results if r.destination.strip().lower() == "b"]
+        assert len({id(r.route_data) for r in duplicates_of_b}) == 1
+
+    def test_finished_routes_are_not_retained(self, mock_config):
+        """Test a late duplicate re-reads the route cache instead of a kept RouteData"""
+        mock_config.enable_caching = True
+        pairs = [("A", "B")] + [("A", f"D{i}") for i in range(5)] + [("A", "B"), ("A", "b")]
+
+        with patch('src.modules.route_retrieval._fetch_route',
+                   side_effect=lambda context: RouteData(distance="1 km", duration="1 min", waypoints=[])) as fetch:
+            results = retrieve_routes_bulk(pairs, concurrency=1, rate_per_second=0)
+            first = next(results)
+            first_route = weakref.ref(first.route_data)
+            del first
+            rest = list(results)
+            gc.collect()
+
+            assert first_route() is None
+            assert fetch.call_count == 6
+
+        duplicates = [r for r in rest if r.duplicate]
+        assert [r.destination for r in duplicates] == ["B", "b"]
+        assert all(r.succeeded for r in duplicates)
+        assert duplicates[0].route_data is not duplicates[1].route_data
+
+    def test_late_duplicate_of_failure_keeps_status(self, mock_config):
+        """Test a repeat of a finished failure is answered from its kept status"""
+        calls = []
+        fake = _fake_retrieve(calls, fail={"Nowhere": "ZERO_RESULTS"})
+        pairs = [("A", "Nowhere"), ("A", "B"), ("A", "C"), ("A", "Nowhere")]
+
+        with patch('src.modules.bulk_route_retrieval.retrieve_route', side_effect=fake):
+            results = list(retrieve_routes_bulk(pairs, concurrency=1, rate_per_second=0))
+
+        assert calls.count(("A", "Nowhere")) == 1
+        repeat = [r for r in results if r.duplicate]
+        assert len(repeat) == 1
+        assert repeat[0].status == "ZERO_RESULTS"
+        assert not repeat[0].succeeded
+
+    def test_failures_streamed_as_results(self, mock_config):
+        """Test retrieval and validation errors are reported per pair, not raised"""
+        calls = []
+        fake = _fake_retrieve(calls, fail={"Nowhere": "ZERO_RESULTS"})
+
+        with patch('src.modules.bulk_route_retrieval.retrieve_route', side_effect=fake):
+            results = {
+                r.destination: r
+                for r in retrieve_routes_bulk([("A", "Nowhere"), ("A", ""), ("A", "B")], rate_per_second=0)
+            }
+
+        assert results["Nowhere"].status == "ZERO_RESULTS"
+        assert results[""].status == "INVALID_REQUEST"
+        assert results["B"].succeeded
+
+    def test_lazy_input_is_read_ahead_boundedly(self, mock_config):
+        """Test a long generator is consumed incrementally"""
+        consumed = []
+
+        def pairs():
+            for i in range(100):
+                consumed.append(i)
+                yield ("A", f"D{i}")
+
+        with patch('src.modules.bulk_route_retrieval.retrieve_route', side_effect=_fake_retrieve([])):
+            results = retrieve_routes_bulk(pairs(), concurrency=2, rate_per_second=0)
+            next(results)
+            assert len(consumed) <= 6
+            results.close()
+
+    def test_checkpoint_resume_skips_finished_pairs(self, mock_config, tmp_path):
+        """Test an interrupted job resumes without repeating finished or final pairs"""
+        checkpoint = tmp_path / "bulk.jsonl"
+        fail = {"Nowhere": "ZERO_RESULTS", "Flaky": "OVER_QUERY_LIMIT"}
+        pairs = [("A", "B"), ("A", "Nowhere"), ("A", "Flaky"), ("A", "C")]
+
+        first_calls = []
+        with patch('src.modules.bulk_route_retrieval.retrieve_route',
+                   side_effect=_fake_retrieve(first_calls, fail)):
+            results = retrieve_routes_bulk(pairs[:3], concurrency=1, rate_per_second=0,
+                                           checkpoint_path=str(checkpoint))
+            list(results)
+
+        # Simulate a torn final write from a crash
+        with checkpoint.open("a") as f:
+            f.write('{"key": "a|tor')
+
+        second_calls = []
+        with patch('src.modules.bulk_route_retrieval.retrieve_route',
+                   side_effect=_fake_retrieve(second_calls, fail)):
+            resumed = list(retrieve_routes_bulk(pairs, concurrency=1, rate_per_second=0,
+                                                checkpoint_path=str(checkpoint)))
+
+        assert sorted(second_calls) == [("A", "C"), ("A", "Flaky")]
+        assert {r.destination for r in resumed} == {"C", "Flaky"}
+        recorded = []
+        for line in checkpoint.read_text().splitlines():
+            try:
+                recorded.append(json.loads(line)["destination"])
+            except ValueError:
+                assert line == '{"key": "a|tor'
+        assert sorted(recorded) == ["B", "C", "Nowhere"]
+
+    @patch('src.google_maps.client.GoogleMapsClient')
+    def test_cached_unroutable_pair_is_checkpointed(self, mock_client_class, mock_config, tmp_path):
+        """Test a negatively cached ZERO_RESULTS keeps its status and is not retried on resume"""
+        from src.google_maps import GoogleMapsError
+        mock_config.mock_mode = False
+        mock_config.enable_caching = True
+        mock_client_class.return_value.get_directions.side_effect = GoogleMapsError(
+            "No route could be calculated", status="ZERO_RESULTS"
+        )
+        checkpoint = tmp_path / "bulk.jsonl"
+
+        list(retrieve_routes_bulk([("A", "Nowhere")], rate_per_second=0))
+        results = list(retrieve_routes_bulk([("A", "Nowhere")], rate_per_second=0,
+                                            checkpoint_path=str(checkpoint)))
+
+        assert results[0].status == "ZERO_RESULTS"
+        assert mock_client_class.return_value.get_directions.call_count == 1
+        assert json.loads(checkpoint.read_text())["status"] == "ZERO_RESULTS"
@@ -0,0 +1,362 @@
+"""
+Unit tests for src/cache
+Tests TTL expiry, negative entries, byte budgets, statistics and cache keys
+"""
+
+import threading
+
+import pytest
+
+from src.cache import TTLCache, CacheStatsReporter, make_route_key, make_agent_key
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def cache(clock):
+    return TTLCache(
+        namespace="test",
+        ttl_seconds=60,
+        negative_ttl_seconds=10,
+        max_entries=3,
+        clock=clock
+    )
+
+
+@pytest.mark.unit
+class TestTTLCache:
+    """Test TTLCache behaviour"""
+
+    def test_set_and_get(self, cache):
+        """Test stored values are returned as positive entries"""
+        cache.set("a", 1)
+        entry = cache.get("a")
+
+        assert entry.value == 1
+        assert entry.negative is False
+
+    def test_missing_key(self, cache):
+        """Test missing keys return None"""
+        assert cache.get("missing") is None
+
+    def test_positive_entry_expires(self, cache, clock):
+        """Test positive entries expire after the regular TTL"""
+        cache.set("a", 1)
+        clock.now += 59
+        assert cache.get("a") is not None
+        clock.now += 1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_negative_entry_uses_shorter_ttl(self, cache, clock):
+        """Test negative entries expire after the negative TTL"""
+        cache.set_negative("bad", "No route")
+        entry = cache.get("bad")
+        assert entry.negative is True
+        assert entry.value == "No route"
+
+        clock.now += 10
+        assert cache.get("bad") is None
+
+    def test_negative_caching_disabled_with_zero_ttl(self, clock):
+        """Test a zero negative TTL disables negative caching"""
+        cache = TTLCache("test", ttl_seconds=60, negative_ttl_seconds=0, clock=clock)
+        cache.set_negative("bad", "No route")
+        assert cache.get("bad") is None
+
+    def test_lru_eviction(self, cache):
+        """Test least recently used entry is evicted beyond max_entries"""
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+        cache.get("a")  # "b" is now least recently used
+        cache.set("d", 4)
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert len(cache) == 3
+
+    def test_hit_and_miss_counters(self, cache, clock):
+        """Test lookups are counted, including expired entries as misses"""
+        assert cache.hit_rate == 0.0
+        cache.set("a", 1)
+        cache.get("a")
+        cache.get("b")
+        clock.now += 60
+        cache.get("a")
+
+        assert cache.hits == 1
+        assert cache.misses == 2
+        assert cache.hit_rate == pytest.approx(1 / 3)
+
+    def test_invalidate_and_clear(self, cache):
+        """Test explicit removal"""
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        cache.clear()
+        assert len(cache) == 0
+
+
+@pytest.mark.unit
+class TestStaleWhileRevalidate:
+    """Test stale serving and single-flight background refresh"""
+
+    @pytest.fixture
+    def swr_cache(self, clock):
+        cache = TTLCache(
+            namespace="test",
+            ttl_seconds=60,
+            negative_ttl_seconds=10,
+            stale_grace_seconds=30,
+            clock=clock
+        )
+        yield cache
+        cache.close()
+
+    def test_expired_entry_served_within_grace(self, swr_cache, clock):
+        """Test expired entries remain servable and are flagged stale"""
+        swr_cache.set("a", 1)
+        clock.now += 70
+
+        entry = swr_cache.get("a")
+        assert entry.value == 1
+        assert swr_cache.is_stale(entry)
+
+    def test_entry_dropped_after_grace(self, swr_cache, clock):
+        """Test entries are gone once the grace window ends"""
+        swr_cache.set("a", 1)
+        clock.now += 90
+        assert swr_cache.get("a") is None
+
+    def test_negative_entries_not_served_stale(self, swr_cache, clock):
+        """Test negative entries expire without a grace window"""
+        swr_cache.set_negative("bad", "No route")
+        clock.now += 11
+        assert swr_cache.get("bad") is None
+
+    def test_single_refresh_in_flight_per_key(self, swr_cache):
+        """Test concurrent stale hits schedule only one refresh"""
+        release = threading.Event()
+        done = threading.Event()
+        calls = []
+
+        def refresh():
+            calls.append(1)
+            release.wait(timeout=5)
+            swr_cache.set("a", 2)
+            done.set()
+
+        assert swr_cache.refresh_async("a", refresh) is True
+        assert swr_cache.refresh_async("a", refresh) is False
+        assert swr_cache.refresh_async("a", refresh) is False
+
+        release.set()
+        assert done.wait(timeout=5)
+        assert len(calls) == 1
+        assert swr_cache.get("a").value == 2
+
+    def test_failed_refresh_keeps_stale_entry(self, swr_cache, clock):
+        """Test a failing refresh leaves the stale value servable and can be retried"""
+        swr_cache.set("a", 1)
+        clock.now += 70
+        finished = threading.Event()
+
+        def refresh():
+            try:
+                raise RuntimeError("upstream down")
+            finally:
+                finished.set()
+
+        swr_cache.refresh_async("a", refresh)
+        assert finished.wait(timeout=5)
+        swr_cache.close(wait=True)
+
+        assert swr_cache.get("a").value == 1
+        assert swr_cache.refresh_async("a", lambda: None) is True
+
+
+@pytest.mark.unit
+class TestCacheKeys:
+    """Test cache key construction"""
+
+    def test_route_key_normalizes_case_and_whitespace(self):
+        """Test equivalent origin/destination spellings share a key"""
+        assert make_route_key("New  York ", "Boston") == make_route_key("new york", "BOSTON")
+
+    def test_route_key_includes_mode(self):
+        """Test travel mode is part of the key"""
+        assert make_route_key("A", "B", "driving") != make_route_key("A", "B", "walking")
+
+    def test_agent_key_separates_agents(self):
+        """Test the same query for different agents uses different keys"""
+        assert make_agent_key("youtube", "Central Park") != make_agent_key("spotify", "Central Park")
+
+
+@pytest.mark.unit
+class TestCacheStats:
+    """Test cache statistics and reporting"""
+
+    def test_stats_track_counters_and_bytes(self, cache, clock):
+        """Test evictions, expirations, entry count, size and age"""
+        cache.set("a", "x" * 1000)
+        clock.now += 10
+        cache.set("b", 1)
+        cache.set("c", 2)
+        cache.set("d", 3)  # Evicts "a"
+        clock.now += 55
+        cache.get("b")  # 55s old: hit
+        clock.now += 5
+        cache.get("b")  # 60s old: expired
+
+        stats = cache.stats()
+        assert stats.evictions == 1
+        assert stats.expirations == 1
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.entry_count == 2
+        assert 0 < stats.bytes_held < 1000
+        assert stats.average_entry_age_seconds == pytest.approx(60)
+
+    def test_bytes_follow_replacement_and_removal(self, cache):
+        """Test bytes held is adjusted when entries are replaced or removed"""
+        cache.set("a", "x" * 1000)
+        large = cache.stats().bytes_held
+        cache.set("a", "y")
+        assert cache.stats().bytes_held < large
+        cache.invalidate("a")
+        assert cache.stats().bytes_held == 0
+
+    def test_get_cache_stats_per_namespace(self, mock_config):
+        """Test registry-wide stats are keyed by namespace"""
+        from src.cache import ROUTE_CACHE, AGENT_RESULT_CACHE, get_cache, get_cache_stats
+        get_cache(ROUTE_CACHE).set("route", {"distance": "1 km"})
+        get_cache(AGENT_RESULT_CACHE).get("missing")
+
+        stats = get_cache_stats()
+
+        assert stats[ROUTE_CACHE].entry_count == 1
+        assert stats[ROUTE_CACHE].bytes_held > 0
+        assert stats[AGENT_RESULT_CACHE].misses == 1
+        assert stats[AGENT_RESULT_CACHE].to_dict()["hit_rate"] == 0.0
+
+    def test_reporter_logs_each_namespace(self, cache):
+        """Test the reporter writes one structured record per namespace"""
+        from unittest.mock import patch
+        cache.set("a", 1)
+        reporter = CacheStatsReporter(60, lambda: {"test": cache.stats()})
+
+        with patch('src.cache.stats_reporter.get_logger') as mock_get_logger:
+            reporter.report_once()
+
+        mock_get_logger.return_value.info.assert_called_once()
+        _, fields = mock_get_logger.return_value.info.call_args
+        assert fields["namespace"] == "test"
+        assert fields["entry_count"] == 1
+
+    def test_reporter_runs_at_interval(self, cache):
+        """Test the background thread reports periodically until stopped"""
+        reported = threading.Event()
+        reporter = CacheStatsReporter(0.01, lambda: {"test": cache.stats()})
+        reporter.report_once = reported.set
+
+        reporter.start()
+        assert reported.wait(timeout=5)
+        reporter.stop()
+
+
+@pytest.mark.unit
+class TestByteBudget:
+    """Test eviction by estimated entry size"""
+
+    @pytest.fixture
+    def bounded_cache(self, clock):
+        return TTLCache(
+            namespace="bounded",
+            ttl_seconds=60,
+            negative_ttl_seconds=10,
+            max_entries=100,
+            max_bytes=5000,
+            clock=clock
+        )
+
+    def test_evicts_least_recently_used_until_within_budget(self, bounded_cache):
+        """Test large entries push out older entries regardless of entry count"""
+        bounded_cache.set("a", "x" * 2000)
+        bounded_cache.set("b", "x" * 2000)
+        bounded_cache.get("a")  # "b" is now least recently used
+        bounded_cache.set("c", "x" * 2000)
+
+        assert bounded_cache.get("a") is not None
+        assert bounded_cache.get("b") is None
+        assert bounded_cache.get("c") is not None
+        stats = bounded_cache.stats()
+        assert stats.evictions == 1
+        assert stats.bytes_held <= stats.max_bytes
+
+    def test_entry_larger_than_budget_is_rejected(self, bounded_cache):
+        """Test an oversized value neither gets stored nor flushes the namespace"""
+        bounded_cache.set("small", "x" * 100)
+        bounded_cache.set("huge", "x" * 10000)
+
+        assert bounded_cache.get("huge") is None
+        assert bounded_cache.get("small") is not None
+        assert bounded_cache.stats().rejections == 1
+
+    def test_oversized_replacement_drops_previous_value(self, bounded_cache):
+        """Test a rejected update does not leave the old value behind"""
+        bounded_cache.set("a", "x" * 100)
+        bounded_cache.set("a", "x" * 10000)
+
+        assert bounded_cache.get("a") is None
+        assert bounded_cache.stats().bytes_held == 0
+
+    def test_zero_budget_is_unbounded(self, cache):
+        """Test max_bytes=0 only applies the entry-count limit"""
+        cache.set("a", "x" * 100000)
+        assert cache.get("a") is not None
+        assert cache.stats().rejections == 0
+
+    def test_entry_sizes_reported_largest_first(self, bounded_cache):
+        """Test per-entry sizes match the estimator and sort by size"""
+        from src.cache import estimate_size
+        bounded_cache.set("small", "x" * 10)
+        bounded_cache.set("large", "x" * 1000)
+
+        sizes = bounded_cache.entry_sizes()
+
+        assert [key for key, _ in sizes] == ["large", "small"]
+        assert dict(sizes)["large"] == estimate_size("x" * 1000)
+        assert bounded_cache.entry_sizes(limit=1) == sizes[:1]
+
+    def test_route_data_size_grows_with_steps(self):
+        """Test long routes with raw steps are estimated as larger"""
+        from src.cache import estimate_size
+        from src.models import RouteData
+
+        def make_route(step_count):
+            steps = [{"html_instructions": f"Turn onto Road {i}", "distance": {"value": 100}}
+                     for i in range(step_count)]
+            return RouteData(distance="1 km", duration="1 min", waypoints=[], steps=steps)
+
+        assert estimate_size(make_route(1000)) > 100 * estimate_size(make_route(1))
+
+    def test_registry_uses_route_budget(self, mock_config):
+        """Test the route namespace gets its own byte budget"""
+        from src.cache import ROUTE_CACHE, AGENT_RESULT_CACHE, get_cache
+        assert get_cache(ROUTE_CACHE).max_bytes == mock_config.route_cache_max_size_mb * 1024 * 1024
+        assert get_cache(AGENT_RESULT_CACHE).max_bytes == mock_config.cache_max_size_mb * 1024 * 1024
@@ -0,0 +1,372 @@
+"""
+Unit tests for src/cache backends
+Tests serialization, the in-memory and Redis-protocol backends, and
+caches sharing entries through a backend
+"""
+
+import math
+from unittest.mock import patch
+
+import pytest
+
+from src.cache import (
+    TTLCache,
+    InMemoryBackend,
+    RedisBackend,
+    CacheBackendError,
+    serialize,
+    deserialize,
+    PayloadSignatureError,
+    SCHEMA_VERSION,
+)
+from src.cache.fake_redis import FakeRedisServer
+from src.models import Coordinates, Waypoint, AgentContext, create_no_results_result
+
+
+SECRET = b"test-secret-" + b"x" * 20
+KEY = f"tour-guide:v{SCHEMA_VERSION}:test:route"
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _CountingSocket:
+    """Socket proxy counting sendall() calls"""
+
+    def __init__(self, sock):
+        self._sock = sock
+        self.sends = 0
+
+    def sendall(self, data: bytes) -> None:
+        self.sends += 1
+        self._sock.sendall(data)
+
+    def __getattr__(self, name):
+        return getattr(self._sock, name)
+
+
+@pytest.fixture
+def fake_redis():
+    server = FakeRedisServer().start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def redis_backend(fake_redis):
+    backend = RedisBackend(fake_redis.url)
+    yield backend
+    backend.close()
+
+
+def _make_cache(backend, clock=None, **kwargs) -> TTLCache:
+    return TTLCache(
+        namespace="test",
+        ttl_seconds=60,
+        negative_ttl_seconds=10,
+        backend=backend,
+        secret=SECRET,
+        **({"clock": clock} if clock else {}),
+        **kwargs
+    )
+
+
+@pytest.mark.unit
+class TestSerialization:
+    """Test compact payload encoding"""
+
+    def test_round_trip_small_value(self):
+        """Test small values are stored uncompressed"""
+        payload = serialize({"distance": "1 km"}, SECRET, KEY)
+        assert payload[:1] == b"\x00"
+        assert deserialize(payload, SECRET, KEY) == {"distance": "1 km"}
+
+    def test_large_value_is_compressed(self):
+        """Test repetitive large values (e.g. raw steps) are compressed"""
+        steps = [{"html_instructions": "Continue on Main St"} for _ in range(500)]
+        payload = serialize(steps, SECRET, KEY)
+        assert payload[:1] == b"\x01"
+        assert len(payload) < len(repr(steps)) / 10
+        assert deserialize(payload, SECRET, KEY) == steps
+
+    def test_dataclasses_round_trip(self):
+        """Test model objects keep their type and enums"""
+        result = create_no_results_result("youtube", "TXID", 1, "query")
+        restored = deserialize(serialize(result, SECRET, KEY), SECRET, KEY)
+        assert restored == result
+        assert restored.status is result.status
+
+    def test_unknown_header_rejected(self):
+        """Test payloads from another encoder are refused"""
+        with pytest.raises(ValueError):
+            deserialize(b"\x7fdata", SECRET, KEY)
+
+    def test_unsigned_or_tampered_payload_never_unpickled(self):
+        """Test payloads are verified before pickle.loads runs"""
+        payload = serialize({"distance": "1 km"}, SECRET, KEY)
+        tampered = payload[:-1] + bytes([payload[-1] ^ 1])
+
+        with patch("src.cache.serialization.pickle.loads") as loads:
+            for bad, secret in [(payload, b"other-secret"), (tampered, SECRET), (b"\x00" + payload[33:], SECRET)]:
+                with pytest.raises(PayloadSignatureError):
+                    deserialize(bad, secret, KEY)
+        loads.assert_not_called()
+
+
+@pytest.mark.unit
+class TestInMemoryBackend:
+    """Test the reference backend"""
+
+    def test_get_many_returns_remaining_ttl(self):
+        """Test found keys carry payload and remaining TTL; expired keys are omitted"""
+        clock = FakeClock()
+        backend = InMemoryBackend(clock=clock)
+        backend.set("a", b"1", 30)
+        backend.set("b", b"2", 5)
+        backend.set("c", b"3", math.inf)
+        clock.now += 10
+
+        found = backend.get_many(["a", "b", "c", "missing"])
+
+        assert found == {"a": (b"1", 20), "c": (b"3", math.inf)}
+
+
+@pytest.mark.unit
+class TestRedisBackend:
+    """Test the RESP client against the in-process fake server"""
+
+    def test_set_and_get_many(self, redis_backend):
+        """Test payloads and TTLs survive the round trip"""
+        redis_backend.set("a", b"\x00binary\r\npayload", 30)
+        redis_backend.set("b", b"forever", math.inf)
+
+        found = redis_backend.get_many(["a", "b", "missing"])
+
+        assert found["a"][0] == b"\x00binary\r\npayload"
+        assert 29 < found["a"][1] <= 30
+        assert found["b"] == (b"forever", math.inf)
+        assert "missing" not in found
+
+    def test_delete(self, redis_backend):
+        """Test deleted keys are no longer returned"""
+        redis_backend.set("a", b"1", 30)
+        redis_backend.delete("a")
+        assert redis_backend.get_many(["a"]) == {}
+
+    def test_multi_get_is_pipelined(self, redis_backend, fake_redis):
+        """Test a batched lookup is written to the socket in one send"""
+        for i in range(20):
+            redis_backend.set(f"k{i}", b"v", 30)
+        redis_backend.get_many(["warm-up"])  # Establish the connection
+
+        counting = _CountingSocket(redis_backend._sock)
+        redis_backend._sock = counting
+        found = redis_backend.get_many([f"k{i}" for i in range(20)])
+
+        assert len(found) == 20
+        assert counting.sends == 1
+
+    def test_url_selects_database(self, fake_redis):
+        """Test a non-zero database in the URL issues SELECT on connect"""
+        backend = RedisBackend(fake_redis.url.rsplit("/", 1)[0] + "/2")
+        backend.set("a", b"1", 30)
+        backend.close()
+        assert backend.db == 2
+        assert fake_redis.command_count == 2  # SELECT + SET
+
+    def test_unreachable_server_raises_backend_error(self, fake_redis):
+        """Test connection failures surface as CacheBackendError"""
+        url = fake_redis.url
+        fake_redis.stop()
+        backend = RedisBackend(url, timeout_seconds=0.5)
+
+        with pytest.raises(CacheBackendError):
+            backend.get_many(["a"])
+
+    def test_error_reply_raises_backend_error(self, redis_backend):
+        """Test server error replies surface as CacheBackendError"""
+        with pytest.raises(CacheBackendError):
+            redis_backend.pipeline([("NOSUCHCOMMAND",)])
+        # Connection stays usable after an error reply
+        redis_backend.set("a", b"1", 30)
+        assert "a" in redis_backend.get_many(["a"])
+
+    def test_rejects_non_redis_url(self):
+        """Test unsupported URL schemes are refused up front"""
+        with pytest.raises(ValueError):
+            RedisBackend("http://localhost:6379")
+
+
+@pytest.mark.unit
+class TestSharedCache:
+    """Test TTLCache instances sharing entries through a backend"""
+
+    def test_entry_written_by_one_worker_served_to_another(self, redis_backend, fake_redis):
+        """Test write-through and fallback on local miss"""
+        worker_a = _make_cache(redis_backend)
+        worker_b = _make_cache(RedisBackend(fake_redis.url))
+
+        worker_a.set("route", {"distance": "1 km"})
+        entry = worker_b.get("route")
+
+        assert entry.value == {"distance": "1 km"}
+        assert worker_b.stats().remote_hits == 1
+        # Second lookup is served locally
+        worker_b.get("route")
+        assert worker_b.stats().remote_hits == 1
+        worker_b.backend.close()
+
+    def test_negative_entries_shared_with_negative_ttl(self):
+        """Test the negative flag and shorter TTL carry across workers"""
+        clock = FakeClock()
+        backend = InMemoryBackend(clock=clock)
+        worker_a = _make_cache(backend, clock)
+        worker_b = _make_cache(backend, clock)
+
+        worker_a.set_negative("unroutable", "ZERO_RESULTS")
+        entry = worker_b.get("unroutable")
+
+        assert entry.negative
+        assert entry.expires_at == pytest.approx(clock.now + 10)
+
+    def test_remote_ttl_includes_stale_grace(self):
+        """Test other workers can serve an expired entry during the grace window"""
+        clock = FakeClock()
+        backend = InMemoryBackend(clock=clock)
+        worker_a = _make_cache(backend, clock, stale_grace_seconds=30)
+        worker_b = _make_cache(backend, clock, stale_grace_seconds=30)
+
+        worker_a.set("route", "value")
+        clock.now += 70
+        entry = worker_b.get("route")
+
+        assert entry is not None
+        assert worker_b.is_stale(entry)
+
+    def test_prefetch_loads_batch(self):
+        """Test prefetch pulls only locally missing keys"""
+        backend = InMemoryBackend()
+        writer = _make_cache(backend)
+        for i in range(5):
+            writer.set(f"k{i}", i)
+
+        reader = _make_cache(backend)
+        reader.set("k0", 0)
+
+        with patch.object(backend, "get_many", wraps=backend.get_many) as get_many:
+            loaded = reader.prefetch([f"k{i}" for i in range(5)] + ["absent"])
+
+        assert loaded == 4
+        get_many.assert_called_once()
+        assert reader.stats().hits == 0  # Prefetch does not count as lookups
+        assert reader.get("k3").value == 3
+
+    def test_invalidate_propagates(self):
+        """Test invalidation removes the shared entry too"""
+        backend = InMemoryBackend()
+        worker_a = _make_cache(backend)
+        worker_b = _make_cache(backend)
+
+        worker_a.set("key", "value")
+        worker_a.invalidate("key")
+
+        assert worker_b.get("key") is None
+
+    def test_entries_signed_with_another_secret_ignored(self):
+        """Test a worker never loads payloads it cannot verify"""
+        backend = InMemoryBackend()
+        writer = _make_cache(backend)
+        reader = TTLCache("test", ttl_seconds=60, negative_ttl_seconds=10,
+                          backend=backend, secret=b"another-secret")
+
+        writer.set("route", {"distance": "1 km"})
+
+        assert reader.get("route") is None
+        with pytest.raises(ValueError):
+            TTLCache("test", ttl_seconds=60, negative_ttl_seconds=10, backend=backend)
+
+    def test_payload_copied_to_another_key_ignored(self):
+        """Test a validly signed payload only verifies under the key it was written to"""
+        backend = InMemoryBackend()
+        writer = _make_cache(backend)
+        writer.set("a|b", {"distance": "1 km"})
+        payload, _ = backend.get_many([writer._backend_key("a|b")])[writer._backend_key("a|b")]
+
+        backend.set(writer._backend_key("a|c"), payload, 60)
+
+        assert _make_cache(backend).get("a|c") is None
+        with pytest.raises(PayloadSignatureError):
+            deserialize(payload, SECRET, writer._backend_key("a|c"))
+
+    def test_backend_keys_carry_schema_version(self):
+        """Test entries written under an older schema version are not read"""
+        backend = InMemoryBackend()
+        cache = _make_cache(backend)
+        cache.set("route", "value")
+        assert backend.get_many([f"tour-guide:v{SCHEMA_VERSION}:test:route"])
+
+        with patch("src.cache.ttl_cache.SCHEMA_VERSION", SCHEMA_VERSION + 1):
+            assert _make_cache(backend).get("route") is None
+
+    def test_backend_failure_degrades_to_local(self, fake_redis):
+        """Test an unavailable backend never fails cache operations"""
+        url = fake_redis.url
+        fake_redis.stop()
+        cache = _make_cache(RedisBackend(url, timeout_seconds=0.5))
+
+        cache.set("key", "value")
+        assert cache.get("key").value == "value"
+        assert cache.get("missing") is None
+        assert cache.prefetch(["other"]) == 0
+
+    def test_unpicklable_value_kept_locally(self):
+        """Test values that cannot be serialized still cache in-process"""
+        cache = _make_cache(InMemoryBackend())
+        cache.set("key", lambda: None)
+        assert cache.get("key") is not None
+
+    def test_orchestrator_shares_agent_results_across_workers(self, mock_config, fake_redis):
+        """Test agent results computed by one worker are reused by another"""
+        from src.cache import reset_caches
+        from src.modules.orchestrator import Orchestrator
+        from src.models import TransactionContext
+
+        mock_config.enable_caching = True
+        mock_config.cache_backend = "redis"
+        mock_config.cache_backend_url = fake_redis.url
+        mock_config.cache_backend_secret = SECRET.decode()
+
+        def make_waypoint():
+            return Waypoint(
+                id=1,
+                location_name="Central Park",
+                coordinates=Coordinates(lat=40.78, lng=-73.97),
+                instruction="Continue",
+                agent_context=AgentContext(
+                    youtube_query="central park guide",
+                    spotify_query="central park music",
+                    history_query="central park history"
+                )
+            )
+
+        from src.modules.mock_agents import run_mock_youtube_agent
+
+        with patch('src.modules.orchestrator.run_mock_youtube_agent',
+                   side_effect=run_mock_youtube_agent) as youtube:
+            for worker in range(2):
+                orchestrator = Orchestrator()
+                context = TransactionContext(
+                    transaction_id=f"TXID-{worker}", origin="A", destination="B"
+                )
+                orchestrator.enrich_route(context, [make_waypoint()])
+                orchestrator.shutdown()
+                reset_caches()  # Next worker starts with empty local caches
+
+        assert youtube.call_count == 1
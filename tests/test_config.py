@@ -85,6 +85,16 @@ class TestSystemConfig:
         # Should not have API key errors in mock mode
         assert not any("API_KEY" in error for error in errors)
 
+    def test_config_validation_redis_requires_signing_secret(self):
+        """Test the shared cache backend needs a strong payload signing secret"""
+        for secret in ["", "short"]:
+            errors = SystemConfig(cache_backend="redis", cache_backend_secret=secret).validate()
+            assert any("cache_backend_secret" in error for error in errors)
+
+        errors = SystemConfig(cache_backend="redis", cache_backend_secret="s" * 32).validate()
+        assert not any("cache_backend_secret" in error for error in errors)
+        assert SystemConfig(cache_backend="memory").validate() == []
+
     def test_ensure_log_directory(self, tmp_path):
         """Test log directory creation"""
         log_file = tmp_path / "logs" / "test.log"
@@ -0,0 +1,152 @@
+"""
+Unit tests for src/google_maps/directions.py
+Tests lazy parsing of alternative routes and continuous multi-leg waypoints
+"""
+
+import json
+import urllib.parse
+from unittest.mock import patch
+
+import pytest
+
+from src.google_maps import GoogleMapsClient, GoogleMapsError
+from src.google_maps.directions import format_distance, format_duration, summarize_route
+from src.google_maps.http_pool import PooledResponse
+
+
+def _step(lat: float, street: str, meters: int) -> dict:
+    return {
+        "start_location": {"lat": lat, "lng": -74.0},
+        "end_location": {"lat": lat + 0.001, "lng": -74.0},
+        "html_instructions": f"Turn right onto <b>{street}</b>",
+        "distance": {"value": meters},
+        "duration": {"value": meters // 10}
+    }
+
+
+def _leg(lat: float, streets, meters: int = 500) -> dict:
+    return {
+        "distance": {"text": format_distance(meters * len(streets)), "value": meters * len(streets)},
+        "duration": {"text": format_duration(meters * len(streets) / 10), "value": meters * len(streets) // 10},
+        "steps": [_step(lat + i * 0.001, street, meters) for i, street in enumerate(streets)]
+    }
+
+
+def _response() -> dict:
+    return {
+        "status": "OK",
+        "routes": [
+            {
+                "summary": "Main St",
+                "legs": [
+                    _leg(40.0, ["Main St", "Oak St"]),
+                    _leg(40.01, ["Elm St", "Pine St", "Birch St"])
+                ]
+            },
+            {
+                "summary": "I-95 N",
+                "legs": [_leg(40.0, ["I-95 N"], meters=4000)]
+            }
+        ]
+    }
+
+
+class RecordingPool:
+    """Stands in for HTTPConnectionPool; records request URLs"""
+
+    def __init__(self, body: dict):
+        self.body = json.dumps(body).encode()
+        self.urls = []
+
+    def request(self, url, timeout_seconds, headers=None):
+        self.urls.append(url)
+        return PooledResponse(status=200, body=self.body, headers={})
+
+
+@pytest.mark.unit
+class TestDirectionsResult:
+    """Test DirectionsResult and multi-leg parsing"""
+
+    def test_summaries_without_waypoint_extraction(self, mock_config):
+        """Test alternatives are summarized while no route is parsed yet"""
+        result = GoogleMapsClient()._parse_directions_response(_response())
+
+        assert len(result) == 2
+        assert result.parsed_count() == 0
+        first, second = result.alternatives
+        assert (first.summary, first.leg_count, first.distance_meters) == ("Main St", 2, 2500)
+        assert first.distance == "2.5 km"
+        assert first.duration == "4 mins"
+        assert (second.summary, second.distance, second.duration_seconds) == ("I-95 N", "4.0 km", 400)
+
+    def test_only_picked_route_is_parsed(self, mock_config):
+        """Test waypoints are extracted once, for the requested alternative only"""
+        result = GoogleMapsClient()._parse_directions_response(_response())
+
+        route = result.route(1)
+
+        assert result.parsed_count() == 1
+        assert result.route(1) is route
+        assert [wp.location_name for wp in route.waypoints] == ["I-95 N"]
+        with pytest.raises(IndexError):
+            result.route(2)
+
+    def test_each_route_summarized_once(self, mock_config):
+        """Test building an alternative reuses its summary instead of re-parsing the route"""
+        with patch('src.google_maps.directions.summarize_route', wraps=summarize_route) as summarize:
+            result = GoogleMapsClient()._parse_directions_response(_response())
+            route = result.route(1)
+            result.route(0)
+
+        assert [call.args[0] for call in summarize.call_args_list] == [0, 1]
+        assert (route.distance, route.duration) == (result.alternatives[1].distance, result.alternatives[1].duration)
+
+    def test_multi_leg_numbering_and_distance_continue(self, mock_config):
+        """Test ids, step_index and distance_from_start run on across legs"""
+        route = GoogleMapsClient()._parse_directions_response(_response()).route(0)
+
+        assert [wp.location_name for wp in route.waypoints] == [
+            "Main St", "Oak St", "Elm St", "Pine St", "Birch St"
+        ]
+        assert [wp.id for wp in route.waypoints] == [1, 2, 3, 4, 5]
+        assert [wp.step_index for wp in route.waypoints] == [0, 1, 2, 3, 4]
+        assert [wp.distance_from_start for wp in route.waypoints] == [0, 500, 1000, 1500, 2000]
+        assert len(route.steps) == 5
+        assert route.distance == "2.5 km"
+
+    def test_malformed_route_raises_maps_error(self, mock_config):
+        """Test structural problems surface as GoogleMapsError"""
+        with pytest.raises(GoogleMapsError):
+            GoogleMapsClient()._parse_directions_response({"routes": []})
+        with pytest.raises(GoogleMapsError):
+            GoogleMapsClient()._parse_directions_response({"routes": [{"legs": []}]})
+
+    def test_stops_and_alternatives_in_request(self, mock_config):
+        """Test stopovers and the alternatives flag are sent in one request"""
+        pool = RecordingPool(_response())
+        client = GoogleMapsClient(http_pool=pool)
+
+        result = client.get_directions_result("A", "C", stops=["B1", "B2"], alternatives=True)
+
+        query = urllib.parse.parse_qs(urllib.parse.urlsplit(pool.urls[0]).query)
+        assert query["waypoints"] == ["B1|B2"]
+        assert query["alternatives"] == ["true"]
+        assert len(result.alternatives) == 2
+        assert len(pool.urls) == 1
+
+    def test_get_directions_returns_first_route(self, mock_config):
+        """Test get_directions keeps returning the recommended route"""
+        pool = RecordingPool(_response())
+
+        route = GoogleMapsClient(http_pool=pool).get_directions("A", "C")
+
+        assert route.waypoint_count() == 5
+        assert "alternatives" not in pool.urls[0]
+
+    def test_format_helpers(self):
+        """Test summed totals are formatted like API text"""
+        assert format_distance(850) == "850 m"
+        assert format_distance(45230) == "45.2 km"
+        assert format_duration(60) == "1 min"
+        assert format_duration(3900) == "1 hour 5 mins"
+        assert format_duration(7200) == "2 hours"
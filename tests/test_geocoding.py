@@ -0,0 +1,133 @@
+"""
+Unit tests for src/google_maps/geocoding.py
+Tests coordinate quantization, deduplication, caching and concurrency
+"""
+
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from src.cache import GEOCODE_CACHE, get_cache
+from src.google_maps import ReverseGeocoder, GoogleMapsError
+from src.google_maps.client import reverse_geocode
+from src.models import Coordinates, Waypoint
+
+
+class FakeGeocodingAPI:
+    """Records lookups and returns deterministic addresses"""
+
+    def __init__(self, latency_seconds: float = 0.0, failing=()):
+        self.latency_seconds = latency_seconds
+        self.failing = set(failing)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def __call__(self, lat: float, lng: float):
+        with self._lock:
+            self.calls.append((lat, lng))
+        time.sleep(self.latency_seconds)
+        if (lat, lng) in self.failing:
+            raise GoogleMapsError("Network error: timed out")
+        if lat == 0.0:
+            return None  # Ocean: no address
+        return f"Address {lat}, {lng}"
+
+
+@pytest.fixture
+def geocoding_config(mock_config):
+    mock_config.enable_caching = True
+    return mock_config
+
+
+@pytest.mark.unit
+class TestReverseGeocoder:
+    """Test ReverseGeocoder"""
+
+    def test_quantize_rounds_to_precision(self, geocoding_config):
+        """Test coordinates are rounded to the configured decimal places"""
+        geocoder = ReverseGeocoder(precision=3, fetch=FakeGeocodingAPI())
+        assert geocoder.quantize(40.748817, -73.985428) == (40.749, -73.985)
+
+    def test_nearby_points_share_one_lookup(self, geocoding_config):
+        """Test points quantizing to the same cell are fetched once"""
+        api = FakeGeocodingAPI()
+        geocoder = ReverseGeocoder(precision=3, rate_per_second=0, fetch=api)
+
+        addresses = geocoder.resolve_many([
+            Coordinates(lat=40.74881, lng=-73.98542),
+            Coordinates(lat=40.74879, lng=-73.98539),
+            Coordinates(lat=40.76000, lng=-73.97000),
+        ])
+
+        assert len(api.calls) == 2
+        assert addresses[0] == addresses[1] == "Address 40.749, -73.985"
+        assert addresses[2] == "Address 40.76, -73.97"
+
+    def test_results_are_cached(self, geocoding_config):
+        """Test repeated lookups are served from the cache"""
+        api = FakeGeocodingAPI()
+        geocoder = ReverseGeocoder(rate_per_second=0, fetch=api)
+
+        geocoder.resolve(40.7, -73.9)
+        geocoder.resolve(0.0, 10.0)
+        assert geocoder.resolve(40.7, -73.9) == "Address 40.7, -73.9"
+        assert geocoder.resolve(0.0, 10.0) is None
+
+        assert len(api.calls) == 2
+
+    def test_expired_addresses_are_refetched(self, geocoding_config):
+        """Test the geocode cache serves no stale entries, as nothing would refresh them"""
+        geocoding_config.cache_stale_grace_seconds = 300
+        api = FakeGeocodingAPI()
+        geocoder = ReverseGeocoder(rate_per_second=0, fetch=api)
+        get_cache(GEOCODE_CACHE).set((40.7, -73.9), "Old address", ttl_seconds=-1)
+
+        assert geocoder.resolve_many([Coordinates(lat=40.7, lng=-73.9)]) == ["Address 40.7, -73.9"]
+        assert get_cache(GEOCODE_CACHE).stale_grace_seconds == 0
+
+    def test_failures_are_not_cached(self, geocoding_config):
+        """Test failed lookups return None and are retried next time"""
+        api = FakeGeocodingAPI(failing={(40.7, -73.9)})
+        geocoder = ReverseGeocoder(rate_per_second=0, fetch=api)
+
+        assert geocoder.resolve(40.7, -73.9) is None
+        assert geocoder.resolve(40.7, -73.9) is None
+        assert len(api.calls) == 2
+
+    def test_route_resolves_in_about_one_round_trip(self, geocoding_config):
+        """Test distinct lookups run concurrently"""
+        api = FakeGeocodingAPI(latency_seconds=0.2)
+        geocoder = ReverseGeocoder(max_concurrency=8, rate_per_second=0, fetch=api)
+
+        start = time.time()
+        geocoder.resolve_many([Coordinates(lat=40 + i, lng=-73.0) for i in range(8)])
+        elapsed = time.time() - start
+
+        assert len(api.calls) == 8
+        assert elapsed < 0.2 * 3
+
+    def test_resolve_waypoint_names_only_renames_fallbacks(self, geocoding_config):
+        """Test only coordinate-named waypoints are renamed"""
+        api = FakeGeocodingAPI()
+        geocoder = ReverseGeocoder(rate_per_second=0, fetch=api)
+        waypoints = [
+            Waypoint(id=1, location_name="Main St",
+                     coordinates=Coordinates(lat=40.1, lng=-73.1), instruction="Head north"),
+            Waypoint(id=2, location_name="40.2000, -73.2000",
+                     coordinates=Coordinates(lat=40.2, lng=-73.2), instruction="Turn left"),
+        ]
+
+        renamed = geocoder.resolve_waypoint_names(waypoints)
+
+        assert renamed == 1
+        assert waypoints[0].location_name == "Main St"
+        assert waypoints[1].location_name == "Address 40.2, -73.2"
+        assert api.calls == [(40.2, -73.2)]
+
+    @pytest.mark.parametrize("error", [KeyError("formatted_address"), IndexError("list index out of range")])
+    def test_legacy_reverse_geocode_returns_none_on_malformed_payload(self, geocoding_config, error):
+        """Test the legacy helper keeps returning None rather than raising"""
+        with patch('src.google_maps.client.fetch_reverse_geocode', side_effect=error):
+            assert reverse_geocode(40.7, -73.9, "key") is None
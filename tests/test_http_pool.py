@@ -0,0 +1,234 @@
+"""
+Unit tests for src/google_maps/http_pool.py
+Tests keep-alive reuse, idle expiry, gzip decoding and the shared Maps client
+against a local stub server
+"""
+
+import gzip
+import http.client
+import json
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from src.google_maps import (
+    GoogleMapsClient,
+    HTTPConnectionPool,
+    get_maps_client,
+)
+
+
+DIRECTIONS_RESPONSE = {
+    "status": "OK",
+    "routes": [{
+        "legs": [{
+            "distance": {"text": "1.2 km"},
+            "duration": {"text": "4 mins"},
+            "steps": [{
+                "start_location": {"lat": 40.0, "lng": -74.0},
+                "end_location": {"lat": 40.01, "lng": -74.0},
+                "html_instructions": "Head north on <b>Main St</b>",
+                "distance": {"value": 1200}
+            }]
+        }]
+    }]
+}
+
+
+class FakeClock:
+    """Manually advanced monotonic clock"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class _DroppedConnection:
+    """Connection whose server has already closed it"""
+
+    def __init__(self, host="127.0.0.1", port=80, timeout=None):
+        self.timeout = timeout
+        self.sock = None
+        self.closed = False
+
+    def request(self, method, path, headers=None):
+        pass
+
+    def getresponse(self):
+        raise http.client.RemoteDisconnected("Remote end closed connection without response")
+
+    def close(self):
+        self.closed = True
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        with self.server.lock:
+            self.server.connection_count += 1
+
+    def do_GET(self):
+        body = json.dumps(DIRECTIONS_RESPONSE).encode()
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        if gzipped:
+            body = gzip.compress(body)
+
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.end_headers()
+        self.wfile.write(body)
+
+        # Simulates a server closing an idle keep-alive connection
+        if "drop" in self.path:
+            self.close_connection = True
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.connection_count = 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+class TestHTTPConnectionPool:
+    """Test connection reuse and lifecycle"""
+
+    def test_requests_reuse_one_connection(self, stub_server):
+        """Test sequential requests share a single keep-alive connection"""
+        pool = HTTPConnectionPool()
+
+        for _ in range(5):
+            response = pool.request(f"{stub_server.url}/json?origin=a", timeout_seconds=5)
+            assert response.status == 200
+
+        assert stub_server.connection_count == 1
+        assert pool.connections_created == 1
+        assert pool.requests_sent == 5
+        pool.close()
+
+    def test_gzip_body_is_decompressed(self, stub_server):
+        """Test gzip responses are requested and transparently decoded"""
+        pool = HTTPConnectionPool()
+
+        response = pool.request(f"{stub_server.url}/json", timeout_seconds=5)
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert json.loads(response.body)["status"] == "OK"
+        pool.close()
+
+    def test_idle_connection_expires(self, stub_server):
+        """Test connections idle past the timeout are replaced"""
+        clock = FakeClock()
+        pool = HTTPConnectionPool(idle_timeout_seconds=30, clock=clock)
+
+        pool.request(f"{stub_server.url}/json", timeout_seconds=5)
+        clock.now += 31
+        pool.request(f"{stub_server.url}/json", timeout_seconds=5)
+
+        assert pool.connections_created == 2
+        assert pool.idle_count() == 1
+        pool.close()
+
+    def test_server_closed_connection_is_retried(self, stub_server):
+        """Test a keep-alive connection closed by the server is replaced transparently"""
+        pool = HTTPConnectionPool()
+
+        pool.request(f"{stub_server.url}/drop", timeout_seconds=5)
+        response = pool.request(f"{stub_server.url}/json", timeout_seconds=5)
+
+        assert response.status == 200
+        assert pool.connections_created == 2
+
+    def test_stale_connection_retried_once_within_deadline(self):
+        """Test only one fresh retry follows a stale reused connection, with the remaining timeout"""
+        pool = HTTPConnectionPool()
+        origin = ("http", "127.0.0.1", 80)
+        for _ in range(3):
+            pool._release(origin, _DroppedConnection())
+        fresh = []
+
+        def connect(origin, timeout_seconds):
+            fresh.append(_DroppedConnection(timeout=timeout_seconds))
+            return fresh[-1]
+
+        with patch.object(pool, "_connect", side_effect=connect):
+            with pytest.raises(http.client.RemoteDisconnected):
+                pool.request("http://127.0.0.1:80/json", timeout_seconds=5)
+
+        assert len(fresh) == 1
+        assert 0 < fresh[0].timeout <= 5
+        assert pool.idle_count() == 2
+
+    def test_idle_connections_capped_per_host(self, stub_server):
+        """Test concurrent bursts keep at most max_idle_per_host connections"""
+        pool = HTTPConnectionPool(max_idle_per_host=2)
+        barrier = threading.Barrier(4)
+
+        def fetch():
+            barrier.wait()
+            pool.request(f"{stub_server.url}/json", timeout_seconds=5)
+
+        threads = [threading.Thread(target=fetch) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert pool.requests_sent == 4
+        assert pool.idle_count() <= 2
+        pool.close()
+        assert pool.idle_count() == 0
+
+    def test_connection_refused_raises_os_error(self):
+        """Test connection failures surface as OSError"""
+        pool = HTTPConnectionPool()
+        with pytest.raises(OSError):
+            pool.request("http://127.0.0.1:1/json", timeout_seconds=1)
+
+
+@pytest.mark.unit
+class TestPooledMapsClient:
+    """Test GoogleMapsClient over the connection pool"""
+
+    def test_directions_over_keep_alive(self, stub_server, mock_config):
+        """Test repeated directions calls parse routes and reuse one connection"""
+        pool = HTTPConnectionPool()
+        client = GoogleMapsClient(http_pool=pool)
+        client.directions_url = f"{stub_server.url}/maps/api/directions/json"
+
+        for _ in range(3):
+            route = client.get_directions("A", "B")
+
+        assert route.distance == "1.2 km"
+        assert route.waypoints[0].location_name == "Main St"
+        assert stub_server.connection_count == 1
+        pool.close()
+
+    def test_shared_client_is_long_lived(self, mock_config):
+        """Test get_maps_client returns one instance using the shared pool"""
+        from src.google_maps import get_http_pool
+        client = get_maps_client()
+        assert get_maps_client() is client
+        assert client.http_pool is get_http_pool()
@@ -0,0 +1,87 @@
+"""
+Unit tests for src/google_maps/instructions.py
+Tests tag stripping, entity decoding and street name extraction, with golden
+parity against the previous per-call regex implementation
+"""
+
+import re
+
+import pytest
+
+from src.google_maps import GoogleMapsClient
+from src.google_maps.instructions import (
+    clean_instruction,
+    extract_location_name,
+    parse_instruction,
+)
+from src.stub_server import synthetic_directions
+
+
+def _previous_location_name(instruction: str):
+    """Reference: GoogleMapsClient._extract_location_name before the compiled parser"""
+    for pattern in (r'onto\s+([^,\.]+)', r'on\s+([^,\.]+)', r'toward\s+([^,\.]+)', r'at\s+([^,\.]+)'):
+        match = re.search(pattern, instruction, re.IGNORECASE)
+        if match:
+            name = re.sub(r'\s*\(.*?\)', '', match.group(1).strip())
+            if len(name) > 3:
+                return name
+    return None
+
+
+GOLDEN = [
+    ("Turn <b>right</b> onto <b>Main St</b>", "Turn right onto Main St", "Main St"),
+    ("Head <b>north</b> on <b>Station Rd</b> toward <b>Elm St</b>",
+     "Head north on Station Rd toward Elm St", "Station Rd toward Elm St"),
+    ("Turn left at Washington Ave", "Turn left at Washington Ave", "Washington Ave"),
+    ("Continue onto (toward Boston)", "Continue onto (toward Boston)", "Boston)"),
+    ("Keep left at the fork to continue on I-9", "Keep left at the fork to continue on I-9",
+     "the fork to continue on I-9"),
+    ("Merge onto <b>I-95 N</b> via the ramp to <b>Trenton</b>",
+     "Merge onto I-95 N via the ramp to Trenton", "I-95 N via the ramp to Trenton"),
+    ("Turn RIGHT ONTO main st, then", "Turn RIGHT ONTO main st, then", "main st"),
+    ("Turn onto <b>Elm St</b><div style=\"font-size:0.9em\">Pass by City Hall (on the left)</div>",
+     "Turn onto Elm StPass by City Hall (on the left)", "Elm StPass by City Hall"),
+    ("Slight right", "Slight right", None),
+    ("", "", None),
+]
+
+
+@pytest.mark.unit
+class TestInstructionParser:
+    """Test the compiled instruction parser"""
+
+    @pytest.mark.parametrize("html_instruction, instruction, location_name", GOLDEN)
+    def test_golden(self, html_instruction, instruction, location_name):
+        """Test known instructions parse to the expected text and name"""
+        assert parse_instruction(html_instruction) == (instruction, location_name)
+        assert _previous_location_name(instruction) == location_name
+
+    def test_parity_on_synthetic_routes(self):
+        """Test thousands of real-shaped instructions match the previous implementation"""
+        for i in range(150):
+            route = synthetic_directions(f"O{i}", f"D{i}", step_count=20, step_meters=800)
+            for step in route["routes"][0]["legs"][0]["steps"]:
+                html_instruction = step["html_instructions"]
+                instruction, name = parse_instruction(html_instruction)
+
+                assert instruction == re.sub('<[^<]+?>', '', html_instruction).strip()
+                assert name == _previous_location_name(instruction)
+
+    def test_entities_are_decoded(self):
+        """Test HTML entities in instructions become plain characters"""
+        assert clean_instruction("Turn onto <b>Lewis &amp; Clark Rd</b>&nbsp;") == "Turn onto Lewis & Clark Rd"
+        assert extract_location_name("Turn onto Lewis & Clark Rd") == "Lewis & Clark Rd"
+
+    def test_coordinate_fallback_in_waypoints(self, mock_config):
+        """Test unnamed steps still get a coordinate location name"""
+        steps = [{
+            "start_location": {"lat": 40.123456, "lng": -74.0},
+            "end_location": {"lat": 40.2, "lng": -74.0},
+            "html_instructions": "Slight <b>right</b>",
+            "distance": {"value": 100}
+        }]
+
+        waypoint = GoogleMapsClient()._extract_waypoints_from_steps(steps)[0]
+
+        assert waypoint.instruction == "Slight right"
+        assert waypoint.location_name == "40.1235, -74.0000"
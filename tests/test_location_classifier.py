@@ -0,0 +1,184 @@
+"""
+Unit tests for src/modules/location_classifier.py
+Tests the Aho-Corasick automaton, gazetteer loading and classification
+parity with the previous keyword-list classifier
+"""
+
+import random
+
+import pytest
+
+from src.config import SystemConfig
+from src.google_maps.instructions import parse_instruction
+from src.models import LocationType
+from src.modules.location_classifier import (
+    KeywordAutomaton,
+    LocationClassifier,
+    get_location_classifier,
+    load_gazetteers,
+    reset_location_classifier,
+)
+from src.stub_server import synthetic_directions
+
+
+def _previous_location_type(location_name):
+    """Reference: waypoint_preprocessor._classify_location_type before the gazetteers"""
+    name_lower = location_name.lower()
+    if any(keyword in name_lower for keyword in [
+        "park", "building", "tower", "statue", "museum", "library",
+        "cathedral", "church", "bridge", "square", "plaza", "center"
+    ]):
+        return LocationType.LANDMARK
+    if any(term in name_lower for term in ["highway", "interstate", "i-", "route"]):
+        return LocationType.HIGHWAY
+    if "&" in name_lower or " and " in name_lower or " at " in name_lower:
+        return LocationType.INTERSECTION
+    if any(keyword in name_lower for keyword in [
+        "district", "quarter", "neighborhood", "heights", "village", "town"
+    ]):
+        return LocationType.NEIGHBORHOOD
+    return LocationType.INTERSECTION
+
+
+NAMES = [
+    "Central Park West",
+    "Brooklyn Bridge",
+    "I-95 N",
+    "Hi-Line Rd",
+    "Route 66",
+    "Main St & 5th Ave",
+    "Elm St and Oak St",
+    "Theater District",
+    "Georgetown",
+    "Parkway Heights & Elm",
+    "TIMES SQUARE",
+    "40.7128, -74.0060",
+    "Oak Ave",
+    "",
+]
+
+
+@pytest.mark.unit
+class TestKeywordAutomaton:
+    """Test the multi-pattern matcher"""
+
+    def test_overlapping_and_nested_matches(self):
+        """Test every occurrence is reported, including keywords inside keywords"""
+        automaton = KeywordAutomaton([("he", 1), ("she", 2), ("his", 3), ("hers", 4)])
+
+        assert sorted(automaton.iter_matches("ushers")) == [(1, 4, 2), (2, 4, 1), (2, 6, 4)]
+
+    def test_matches_brute_force_search(self):
+        """Test random keywords and texts against a naive substring scan"""
+        rng = random.Random(7)
+        for _ in range(50):
+            keywords = {"".join(rng.choice("abc") for _ in range(rng.randint(1, 4))) for _ in range(8)}
+            text = "".join(rng.choice("abcd") for _ in range(40))
+            automaton = KeywordAutomaton((keyword, keyword) for keyword in keywords)
+
+            expected = sorted(
+                (start, start + len(keyword), keyword)
+                for keyword in keywords
+                for start in range(len(text))
+                if text.startswith(keyword, start)
+            )
+            assert sorted(automaton.iter_matches(text)) == expected
+
+    def test_empty_keywords_are_ignored(self):
+        """Test empty keywords do not match everywhere"""
+        automaton = KeywordAutomaton([("", 1), ("a", 2)])
+
+        assert automaton.size == 1
+        assert list(automaton.iter_matches("bab")) == [(1, 2, 2)]
+
+
+@pytest.mark.unit
+class TestLocationClassifier:
+    """Test gazetteer-backed classification"""
+
+    @pytest.mark.parametrize("location_name", NAMES)
+    def test_bundled_gazetteers_match_previous_classifier(self, location_name):
+        """Test the bundled term lists classify exactly like the old keyword lists"""
+        classifier = LocationClassifier(load_gazetteers())
+
+        assert classifier.classify(location_name).location_type == _previous_location_type(location_name)
+
+    def test_synthetic_route_names_match_previous_classifier(self):
+        """Test real-shaped location names classify like the old keyword lists"""
+        classifier = LocationClassifier(load_gazetteers())
+        for i in range(60):
+            route = synthetic_directions(f"O{i}", f"D{i}", step_count=20, step_meters=800)
+            for step in route["routes"][0]["legs"][0]["steps"]:
+                _, name = parse_instruction(step["html_instructions"])
+                if name:
+                    assert classifier.classify(name).location_type == _previous_location_type(name)
+
+    def test_landmarks_are_extracted_as_written(self):
+        """Test matched landmark terms keep the name's casing, longest first"""
+        classifier = LocationClassifier({LocationType.LANDMARK: ["Central Park", "park", "Museum"]})
+
+        classification = classifier.classify("Central Park Museum near Park Ave")
+
+        assert classification.location_type == LocationType.LANDMARK
+        assert classification.landmarks == ("Central Park", "Museum", "Park")
+
+    def test_landmarks_in_names_whose_lowercase_changes_length(self):
+        """Test landmark text is sliced correctly when lower() adds characters"""
+        classifier = LocationClassifier({LocationType.LANDMARK: ["tower", "İstanbul"]})
+
+        assert len("İstanbul Tower".lower()) == 15
+        assert classifier.classify("İstanbul Tower").landmarks == ("İstanbul", "Tower")
+        assert classifier.classify("Galata İİ Tower").landmarks == ("Tower",)
+
+    def test_non_landmarks_extract_nothing(self):
+        """Test names without landmark terms have no landmarks"""
+        classification = LocationClassifier(load_gazetteers()).classify("I-95 N")
+
+        assert classification.location_type == LocationType.HIGHWAY
+        assert classification.landmarks == ()
+
+    def test_large_gazetteer(self):
+        """Test thousands of terms classify correctly"""
+        terms = [f"landmark number {i}" for i in range(5000)]
+        classifier = LocationClassifier({
+            LocationType.LANDMARK: terms,
+            LocationType.NEIGHBORHOOD: ["soho"],
+        })
+
+        assert classifier.classify("Landmark Number 4321 Plaza").landmarks == ("Landmark Number 4321",)
+        assert classifier.classify("SoHo").location_type == LocationType.NEIGHBORHOOD
+        assert classifier.classify("Landmark Numbers").location_type == LocationType.INTERSECTION
+
+
+@pytest.mark.unit
+class TestGazetteers:
+    """Test gazetteer files and configuration"""
+
+    def test_directory_files_replace_bundled_lists(self, tmp_path):
+        """Test a gazetteer directory overrides only the files it contains"""
+        (tmp_path / "landmark.txt").write_text("# Custom list\n\nSpace Needle\n  Pike Place  \n", encoding="utf-8")
+
+        gazetteers = load_gazetteers(str(tmp_path))
+
+        assert gazetteers[LocationType.LANDMARK] == ["Space Needle", "Pike Place"]
+        assert "highway" in gazetteers[LocationType.HIGHWAY]
+
+    def test_shared_classifier_uses_configured_directory(self, mock_config, tmp_path):
+        """Test the shared classifier is built from GAZETTEER_DIR and rebuilt on reset"""
+        (tmp_path / "neighborhood.txt").write_text("soho\n", encoding="utf-8")
+        mock_config.gazetteer_dir = str(tmp_path)
+        reset_location_classifier()
+        try:
+            classifier = get_location_classifier()
+
+            assert get_location_classifier() is classifier
+            assert classifier.classify("SoHo").location_type == LocationType.NEIGHBORHOOD
+            assert classifier.classify("Theater District").location_type == LocationType.INTERSECTION
+        finally:
+            reset_location_classifier()
+
+    def test_missing_directory_fails_validation(self):
+        """Test a gazetteer directory that does not exist is a config error"""
+        errors = SystemConfig(gazetteer_dir="/nonexistent/gazetteers").validate()
+
+        assert "gazetteer_dir must be an existing directory" in errors
@@ -427,6 +427,52 @@ class TestOrchestrator:
             # Cleanup
             orchestrator.shutdown()
 
+    @patch('src.modules.orchestrator.Orchestrator._enrich_single_waypoint')
+    def test_enrich_route_streams_iterators(
+        self,
+        mock_enrich,
+        transaction_context,
+        sample_waypoints,
+        mock_config
+    ):
+        """Test an iterator is enriched as it yields, in order, within the concurrency limit"""
+        import threading
+        import time
+
+        active = []
+        peak = []
+        lock = threading.Lock()
+
+        def enrich(ctx, wp):
+            with lock:
+                active.append(wp.id)
+                peak.append(len(active))
+            time.sleep(0.01)
+            with lock:
+                active.remove(wp.id)
+            return wp
+
+        mock_enrich.side_effect = enrich
+        mock_config.max_concurrent_waypoints = 2
+        submitted_before_end = []
+
+        def produce():
+            for waypoint in sample_waypoints:
+                yield waypoint
+                submitted_before_end.append(mock_enrich.call_count)
+
+        with patch('src.modules.orchestrator.get_config', return_value=mock_config):
+            orchestrator = Orchestrator()
+            result = orchestrator.enrich_route(transaction_context, produce())
+
+            assert result == sample_waypoints
+            assert max(peak) <= 2
+            # The first waypoint was submitted before the producer finished
+            assert submitted_before_end[0] >= 1
+
+            # Cleanup
+            orchestrator.shutdown()
+
     def test_shutdown(self, mock_config):
         """Test orchestrator shutdown"""
         with patch('src.modules.orchestrator.get_config', return_value=mock_config):
@@ -437,3 +483,131 @@ class TestOrchestrator:
 
             # Thread pool should be shut down
             assert orchestrator.thread_pool._shutdown
+
+
+@pytest.mark.unit
+class TestAgentResultCaching:
+    """Test agent result caching in the orchestrator"""
+
+    @staticmethod
+    def _waypoint(waypoint_id: int) -> Waypoint:
+        from src.models import AgentContext
+        return Waypoint(
+            id=waypoint_id,
+            location_name="Nowhere Lane",
+            coordinates=Coordinates(lat=40.0, lng=-74.0),
+            instruction="Continue",
+            agent_context=AgentContext(
+                youtube_query="nowhere lane travel guide",
+                spotify_query="nowhere lane city urban",
+                history_query="nowhere lane history"
+            )
+        )
+
+    @patch('src.modules.orchestrator.run_mock_youtube_agent')
+    def test_no_results_is_negatively_cached(self, mock_youtube, mock_config):
+        """Test empty searches are served from the negative cache on repeat"""
+        from src.models import create_no_results_result
+        mock_config.enable_caching = True
+        mock_youtube.side_effect = lambda txid, wp: create_no_results_result(
+            "youtube", txid, wp.id, wp.agent_context.youtube_query
+        )
+
+        with patch('src.modules.orchestrator.get_config', return_value=mock_config):
+            orchestrator = Orchestrator()
+            first = orchestrator._run_agent("youtube", "TXID-1", self._waypoint(1))
+            second = orchestrator._run_agent("youtube", "TXID-2", self._waypoint(2))
+            orchestrator.shutdown()
+
+        assert mock_youtube.call_count == 1
+        assert first.status == AgentStatus.NO_RESULTS
+        assert second.status == AgentStatus.NO_RESULTS
+        assert second.transaction_id == "TXID-2"
+        assert second.waypoint_id == 2
+
+    @patch('src.modules.orchestrator.run_mock_youtube_agent')
+    def test_mutating_a_result_does_not_corrupt_the_cache(self, mock_youtube, mock_config):
+        """Test the caller's result and every hit are independent copies of the cached one"""
+        from src.models import ContentItem, ContentType
+        mock_config.enable_caching = True
+        mock_youtube.side_effect = lambda txid, wp: AgentResult(
+            agent_name="youtube",
+            transaction_id=txid,
+            waypoint_id=wp.id,
+            status=AgentStatus.SUCCESS,
+            content=ContentItem(
+                content_type=ContentType.VIDEO,
+                title="Nowhere Lane walk",
+                description="A walk",
+                relevance_score=0.8,
+                metadata={"tags": ["walk"]}
+            )
+        )
+
+        with patch('src.modules.orchestrator.get_config', return_value=mock_config):
+            orchestrator = Orchestrator()
+            first = orchestrator._run_agent("youtube", "TXID-1", self._waypoint(1))
+            first.content.title = "Changed by caller"
+            first.content.metadata["tags"].append("first")
+            second = orchestrator._run_agent("youtube", "TXID-2", self._waypoint(2))
+            second.content.metadata["tags"].append("second")
+            third = orchestrator._run_agent("youtube", "TXID-3", self._waypoint(3))
+            orchestrator.shutdown()
+
+        assert mock_youtube.call_count == 1
+        assert third.content.title == "Nowhere Lane walk"
+        assert third.content.metadata["tags"] == ["walk"]
+
+    @patch('src.modules.orchestrator.run_mock_youtube_agent')
+    def test_errors_and_timeouts_are_not_cached(self, mock_youtube, mock_config):
+        """Test transient agent failures always re-run the agent"""
+        mock_config.enable_caching = True
+        mock_youtube.side_effect = [
+            create_error_result("youtube", "TXID-1", 1, Exception("network down")),
+            create_timeout_result("youtube", "TXID-2", 2, 5000),
+            create_error_result("youtube", "TXID-3", 3, Exception("network down")),
+        ]
+
+        with patch('src.modules.orchestrator.get_config', return_value=mock_config):
+            orchestrator = Orchestrator()
+            for waypoint_id in (1, 2, 3):
+                orchestrator._run_agent("youtube", f"TXID-{waypoint_id}", self._waypoint(waypoint_id))
+            orchestrator.shutdown()
+
+        assert mock_youtube.call_count == 3
+
+    def test_unnamed_waypoints_use_negative_cache_through_enrich_route(self, mock_config, transaction_context):
+        """Test mock agents' empty searches for unnamed waypoints are not repeated"""
+        from src.models import AgentContext
+        from src.modules import mock_agents
+        mock_config.enable_caching = True
+
+        def unnamed_waypoint(waypoint_id):
+            return Waypoint(
+                id=waypoint_id,
+                location_name="40.7500, -73.9800",
+                coordinates=Coordinates(lat=40.75, lng=-73.98),
+                instruction="Continue",
+                agent_context=AgentContext(
+                    youtube_query="40.7500 -73.9800 travel guide",
+                    spotify_query="40.7500 -73.9800 city urban",
+                    history_query="40.7500 -73.9800 history"
+                )
+            )
+
+        with patch('src.modules.mock_agents.time.sleep'), \
+                patch('src.modules.orchestrator.run_mock_youtube_agent',
+                      wraps=mock_agents.run_mock_youtube_agent) as youtube, \
+                patch('src.modules.orchestrator.run_mock_spotify_agent',
+                      wraps=mock_agents.run_mock_spotify_agent) as spotify, \
+                patch('src.modules.orchestrator.get_config', return_value=mock_config):
+            orchestrator = Orchestrator()
+            first = orchestrator.enrich_route(transaction_context, [unnamed_waypoint(1)])
+            second = orchestrator.enrich_route(transaction_context, [unnamed_waypoint(2)])
+            orchestrator.shutdown()
+
+        assert youtube.call_count == 1
+        assert spotify.call_count == 1
+        for waypoint in first + second:
+            assert waypoint.enrichment.all_agent_results["youtube"].status == AgentStatus.NO_RESULTS
+            assert waypoint.enrichment.judge_decision.winner == "fallback"
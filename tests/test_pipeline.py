@@ -3,11 +3,13 @@ Unit tests for src/pipeline.py
 Tests end-to-end pipeline execution
 """
 
+import threading
+
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 
 from src.pipeline import execute_pipeline, execute_pipeline_safe, PipelineError
-from src.modules import ValidationError, RouteRetrievalError
+from src.modules import ValidationError, RouteRetrievalError, WaypointClusterer
 
 
 @pytest.mark.integration
@@ -136,3 +138,311 @@ class TestErrorResponse:
         assert result["error"]["code"] == "TEST_ERROR"
         assert result["error"]["message"] == "Test error message"
         assert "timestamp" in result
+
+
+@pytest.mark.unit
+class TestIdempotentPipeline:
+    """Test response replay for idempotency keys and duplicate requests"""
+
+    @staticmethod
+    def _response(transaction_id="TXID-first"):
+        return {"transaction_id": transaction_id, "route": {"waypoints": []}}
+
+    @patch('src.pipeline.execute_pipeline')
+    def test_repeated_idempotency_key_replays_response(self, mock_execute, mock_config):
+        """Test retries with the same key do not re-run the pipeline"""
+        mock_execute.return_value = self._response()
+
+        first = execute_pipeline_safe("New York", "Boston", idempotency_key="abc")
+        first["route"]["waypoints"].append("mutated")
+        second = execute_pipeline_safe("New York", "Boston", idempotency_key="abc")
+
+        assert mock_execute.call_count == 1
+        assert second["transaction_id"] == "TXID-first"
+        assert second["route"]["waypoints"] == []
+
+    @patch('src.pipeline.execute_pipeline')
+    def test_different_keys_run_separately(self, mock_execute, mock_config):
+        """Test distinct idempotency keys each execute the pipeline"""
+        mock_execute.return_value = self._response()
+
+        execute_pipeline_safe("New York", "Boston", idempotency_key="a")
+        execute_pipeline_safe("New York", "Boston", idempotency_key="b")
+        execute_pipeline_safe("New York", "Boston")
+
+        assert mock_execute.call_count == 3
+
+    @patch('src.pipeline.execute_pipeline')
+    def test_error_responses_are_not_replayed(self, mock_execute, mock_config):
+        """Test a failed attempt does not pin the error for later retries"""
+        mock_execute.side_effect = [RouteRetrievalError("timeout"), self._response()]
+
+        first = execute_pipeline_safe("New York", "Boston", idempotency_key="abc")
+        second = execute_pipeline_safe("New York", "Boston", idempotency_key="abc")
+
+        assert first["error"]["code"] == "ROUTE_NOT_FOUND"
+        assert second["transaction_id"] == "TXID-first"
+
+    @patch('src.pipeline.execute_pipeline')
+    def test_concurrent_duplicates_wait_for_first(self, mock_execute, mock_config):
+        """Test concurrent requests with one key share a single execution"""
+        import threading
+        import time
+
+        def slow_execute(*args, **kwargs):
+            time.sleep(0.2)
+            return self._response()
+
+        mock_execute.side_effect = slow_execute
+        results = []
+
+        threads = [
+            threading.Thread(
+                target=lambda: results.append(
+                    execute_pipeline_safe("New York", "Boston", idempotency_key="abc")
+                )
+            )
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert mock_execute.call_count == 1
+        assert len(results) == 5
+        assert all(result["transaction_id"] == "TXID-first" for result in results)
+
+    @patch('src.pipeline.execute_pipeline')
+    def test_reused_key_for_different_request_is_rejected(self, mock_execute, mock_config):
+        """Test a key is only replayed for the request that stored it"""
+        mock_execute.return_value = self._response()
+
+        execute_pipeline_safe("New York", "Boston", {"content_type": "video"}, idempotency_key="abc")
+        same = execute_pipeline_safe(" new york", "BOSTON", {"content_type": "video"}, idempotency_key="abc")
+        other = execute_pipeline_safe("New York", "Chicago", {"content_type": "video"}, idempotency_key="abc")
+
+        assert mock_execute.call_count == 1
+        assert same["transaction_id"] == "TXID-first"
+        assert other["error"]["code"] == "IDEMPOTENCY_KEY_REUSED"
+
+    def test_cache_lookups_do_not_block_other_keys(self, mock_config):
+        """Test a slow response cache lookup only delays its own key"""
+        import threading
+        from src.cache import execute_idempotent
+
+        release = threading.Event()
+        slow_cache = Mock()
+        slow_cache.get.side_effect = lambda key: release.wait(5) and None if key == "slow" else None
+
+        with patch('src.cache.response_cache.get_cache', return_value=slow_cache):
+            blocked = threading.Thread(
+                target=execute_idempotent, args=("slow", 30, self._response)
+            )
+            blocked.start()
+            try:
+                result = execute_idempotent("fast", 30, lambda: self._response("TXID-fast"))
+                assert blocked.is_alive()
+            finally:
+                release.set()
+                blocked.join()
+
+        assert result["transaction_id"] == "TXID-fast"
+
+    @patch('src.pipeline.execute_pipeline')
+    def test_dedup_window_replays_identical_requests(self, mock_execute, mock_config):
+        """Test identical request tuples are replayed when deduplication is on"""
+        mock_config.response_dedup_window_seconds = 30
+        mock_execute.return_value = self._response()
+
+        execute_pipeline_safe("New York", "Boston", {"content_type": "video"})
+        execute_pipeline_safe(" new york ", "BOSTON", {"content_type": "video"})
+        execute_pipeline_safe("New York", "Boston", {"content_type": "music"})
+
+        assert mock_execute.call_count == 2
+
+
+@pytest.mark.unit
+class TestOverlappedStages:
+    """Test preprocessing and orchestration connected through the stage queue"""
+
+    class RecordingOrchestrator:
+        """Consumes waypoints like the orchestrator, recording when each arrives"""
+
+        def __init__(self):
+            self.arrivals = []
+
+        def enrich_route(self, context, waypoints):
+            import time
+            received = []
+            for waypoint in waypoints:
+                self.arrivals.append(time.monotonic())
+                received.append(waypoint)
+            return received
+
+    @staticmethod
+    def _slow_preprocessing(monkeypatch, delay_seconds=0.005):
+        import time
+        from src.modules import waypoint_preprocessor
+        analyze = waypoint_preprocessor._analyze_location
+        finished = []
+
+        def slow_analyze(waypoint):
+            time.sleep(delay_seconds)
+            finished.append(time.monotonic())
+            return analyze(waypoint)
+
+        monkeypatch.setattr(waypoint_preprocessor, "_analyze_location", slow_analyze)
+        return finished
+
+    @staticmethod
+    def _route(count):
+        from src.models import RouteData, Waypoint, Coordinates
+        return RouteData(
+            distance="10 km",
+            duration="20 mins",
+            waypoints=[
+                Waypoint(
+                    id=i + 1,
+                    location_name=f"Street {i}",
+                    coordinates=Coordinates(lat=40.0, lng=-74.0),
+                    instruction=f"Turn left onto Street {i}"
+                )
+                for i in range(count)
+            ]
+        )
+
+    def test_first_waypoint_reaches_agents_before_preprocessing_ends(
+        self, transaction_context, mock_config, monkeypatch
+    ):
+        """Test orchestration starts on early waypoints while later ones are preprocessed"""
+        from src.pipeline import _run_overlapped_stages
+        finished = self._slow_preprocessing(monkeypatch)
+        orchestrator = self.RecordingOrchestrator()
+        route = self._route(40)
+
+        enriched = _run_overlapped_stages(
+            transaction_context, route, orchestrator, queue_size=4, clusterer=WaypointClusterer(0)
+        )
+
+        assert enriched == route.waypoints
+        assert all(waypoint.agent_context is not None for waypoint in enriched)
+        assert orchestrator.arrivals[0] < finished[-1]
+
+    def test_preprocessing_error_is_raised_in_caller(self, transaction_context, mock_config, monkeypatch):
+        """Test a failure in the preprocessing thread surfaces from the pipeline stage"""
+        from src.modules import waypoint_preprocessor
+        from src.pipeline import _run_overlapped_stages
+
+        def failing_analyze(waypoint):
+            raise ValueError("bad waypoint")
+
+        monkeypatch.setattr(waypoint_preprocessor, "_analyze_location", failing_analyze)
+
+        with pytest.raises(ValueError, match="bad waypoint"):
+            _run_overlapped_stages(
+                transaction_context, self._route(3), self.RecordingOrchestrator(),
+                queue_size=2, clusterer=WaypointClusterer(0)
+            )
+
+    def test_base_exception_in_preprocessing_does_not_hang(self, transaction_context, mock_config, monkeypatch):
+        """Test KeyboardInterrupt-style exceptions still end the stream and reach the caller"""
+        from src.modules import waypoint_preprocessor
+        from src.pipeline import _run_overlapped_stages
+
+        class Abort(BaseException):
+            pass
+
+        analyze = waypoint_preprocessor._analyze_location
+
+        def aborting_analyze(waypoint):
+            if waypoint.id == 3:
+                raise Abort()
+            return analyze(waypoint)
+
+        monkeypatch.setattr(waypoint_preprocessor, "_analyze_location", aborting_analyze)
+        outcome = []
+
+        def run():
+            try:
+                _run_overlapped_stages(
+                    transaction_context, self._route(5), self.RecordingOrchestrator(),
+                    queue_size=2, clusterer=WaypointClusterer(0)
+                )
+            except Abort:
+                outcome.append("raised")
+
+        caller = threading.Thread(target=run, daemon=True)
+        caller.start()
+        caller.join(timeout=5)
+
+        assert not caller.is_alive()
+        assert outcome == ["raised"]
+
+    def test_dead_producer_without_sentinel_raises(self, transaction_context, mock_config, monkeypatch):
+        """Test the consumer notices a producer thread that exited without ending the stream"""
+        from src.pipeline import PipelineError, _run_overlapped_stages
+        monkeypatch.setattr("src.pipeline.queue.Queue.put", lambda self, item, timeout=None: None)
+
+        with pytest.raises(PipelineError, match="stopped without finishing"):
+            _run_overlapped_stages(
+                transaction_context, self._route(3), self.RecordingOrchestrator(),
+                queue_size=2, clusterer=WaypointClusterer(0)
+            )
+
+    def test_preprocessing_thread_does_not_change_current_stage(
+        self, transaction_context, mock_config, monkeypatch
+    ):
+        """Test the producer's stage transitions stay on its own sub-stage context"""
+        from src.pipeline import _run_overlapped_stages
+        self._slow_preprocessing(monkeypatch, delay_seconds=0.002)
+        stages = []
+
+        class StageRecordingOrchestrator(self.RecordingOrchestrator):
+            def enrich_route(self, context, waypoints):
+                context.log_stage_entry("orchestration")
+                received = []
+                for waypoint in waypoints:
+                    stages.append(context.current_stage)
+                    received.append(waypoint)
+                return received
+
+        _run_overlapped_stages(
+            transaction_context, self._route(20), StageRecordingOrchestrator(),
+            queue_size=2, clusterer=WaypointClusterer(0)
+        )
+
+        assert stages == ["orchestration"] * 20
+        assert transaction_context.current_stage == "orchestration"
+
+    def test_orchestration_failure_stops_preprocessing(self, transaction_context, mock_config, monkeypatch):
+        """Test preprocessing blocked on a full queue exits when orchestration fails"""
+        from src.pipeline import _run_overlapped_stages
+        self._slow_preprocessing(monkeypatch, delay_seconds=0)
+
+        class FailingOrchestrator:
+            def enrich_route(self, context, waypoints):
+                next(iter(waypoints))
+                raise RuntimeError("agents down")
+
+        with pytest.raises(RuntimeError, match="agents down"):
+            _run_overlapped_stages(
+                transaction_context, self._route(50), FailingOrchestrator(),
+                queue_size=1, clusterer=WaypointClusterer(0)
+            )
+
+    def test_sequential_stages_when_queue_disabled(
+        self, transaction_context, sample_route_data, sample_waypoints, mock_config
+    ):
+        """Test STAGE_QUEUE_SIZE=0 hands orchestration the fully preprocessed list"""
+        mock_config.stage_queue_size = 0
+        with patch('src.pipeline.validate_request', return_value=transaction_context), \
+                patch('src.pipeline.retrieve_route', return_value=sample_route_data), \
+                patch('src.pipeline.Orchestrator') as mock_orchestrator_class:
+            mock_orchestrator_class.return_value.enrich_route.return_value = sample_waypoints
+
+            execute_pipeline("New York", "Boston")
+
+            waypoints = mock_orchestrator_class.return_value.enrich_route.call_args[0][1]
+            assert isinstance(waypoints, list)
+            assert all(waypoint.metadata is not None for waypoint in waypoints)
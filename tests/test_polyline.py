@@ -0,0 +1,231 @@
+"""
+Unit tests for src/google_maps/polyline.py
+Tests polyline decoding, haversine lengths and densification with both the
+NumPy and pure-Python implementations, and densified waypoint extraction
+"""
+
+import random
+
+import pytest
+
+from src.geo import METERS_PER_DEGREE
+from src.google_maps import GoogleMapsClient
+from src.google_maps import polyline
+from src.google_maps.polyline import (
+    cumulative_distances,
+    decode_polyline,
+    densify,
+    encode_polyline,
+)
+
+
+# Example from the Encoded Polyline Algorithm Format documentation
+GOOGLE_EXAMPLE = "_p~iF~ps|U_ulLnnqC_mqNvxq`@"
+GOOGLE_EXAMPLE_POINTS = [(38.5, -120.2), (40.7, -120.95), (43.252, -126.453)]
+
+ONE_DEGREE_LAT_METERS = METERS_PER_DEGREE
+
+
+@pytest.fixture(params=["numpy", "python"])
+def backend(request, monkeypatch):
+    """Runs a test against each implementation"""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(polyline, "np", None)
+    return request.param
+
+
+def _straight_line(length_degrees: float, count: int):
+    return [(40.0 + length_degrees * i / (count - 1), -74.0) for i in range(count)]
+
+
+@pytest.mark.unit
+class TestPolyline:
+    """Test polyline decoding, length and densification"""
+
+    def test_decode_reference_example(self, backend):
+        """Test the documented example decodes exactly"""
+        assert decode_polyline(GOOGLE_EXAMPLE) == pytest.approx(GOOGLE_EXAMPLE_POINTS)
+
+    def test_encode_reference_example(self):
+        """Test encoding reproduces the documented string"""
+        assert encode_polyline(GOOGLE_EXAMPLE_POINTS) == GOOGLE_EXAMPLE
+
+    def test_round_trip_large_polyline(self, backend):
+        """Test tens of thousands of points survive an encode/decode round trip"""
+        rng = random.Random(7)
+        lat, lng = 40.0, -74.0
+        points = []
+        for _ in range(30000):
+            lat += rng.uniform(-0.01, 0.01)
+            lng += rng.uniform(-0.01, 0.01)
+            points.append((round(lat, 5), round(lng, 5)))
+
+        decoded = decode_polyline(encode_polyline(points))
+
+        assert len(decoded) == len(points)
+        assert decoded[-1] == pytest.approx(points[-1])
+        assert decoded[12345] == pytest.approx(points[12345])
+
+    def test_truncated_polyline_keeps_complete_points(self, backend):
+        """Test a cut-off string decodes up to its last complete point"""
+        assert decode_polyline(GOOGLE_EXAMPLE[:-3]) == pytest.approx(GOOGLE_EXAMPLE_POINTS[:2])
+        assert decode_polyline("") == []
+
+    def test_cumulative_distances(self, backend):
+        """Test haversine distances accumulate along the line"""
+        distances = cumulative_distances([(40.0, -74.0), (40.5, -74.0), (41.0, -74.0)])
+
+        assert distances[0] == 0.0
+        assert distances[1] == pytest.approx(ONE_DEGREE_LAT_METERS / 2, rel=1e-4)
+        assert distances[2] == pytest.approx(ONE_DEGREE_LAT_METERS, rel=1e-4)
+
+    def test_densify_spacing_excludes_endpoints(self, backend):
+        """Test points are emitted every interval and never at the line's ends"""
+        samples = densify(_straight_line(1.0, 11), 10000)
+
+        offsets = [meters for _, _, meters in samples]
+        assert offsets == pytest.approx([10000.0 * i for i in range(1, 11)])
+        assert samples[0][0] == pytest.approx(40.0 + 10000 / ONE_DEGREE_LAT_METERS, rel=1e-6)
+        assert all(lng == pytest.approx(-74.0) for _, lng, _ in samples)
+
+    def test_densify_scales_to_known_length(self, backend):
+        """Test offsets follow the reported length rather than the haversine length"""
+        samples = densify(_straight_line(1.0, 3), 50000, length_meters=100000)
+
+        assert [meters for _, _, meters in samples] == pytest.approx([50000.0])
+        assert samples[0][0] == pytest.approx(40.5)
+
+    def test_densify_short_line(self, backend):
+        """Test lines shorter than 1.5 intervals yield nothing"""
+        assert densify(_straight_line(0.01, 5), 1000) == []
+        assert densify([(40.0, -74.0)], 1000) == []
+
+
+def _random_walk(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    lat, lng = 40.0, -74.0
+    points = []
+    for _ in range(count):
+        lat += rng.uniform(-0.01, 0.01)
+        lng += rng.uniform(-0.01, 0.01)
+        points.append((round(lat, 5), round(lng, 5)))
+    return points
+
+
+@pytest.mark.unit
+class TestNumpyParity:
+    """Test the NumPy path returns what the pure-Python path returns"""
+
+    @pytest.fixture(autouse=True)
+    def _require_numpy(self):
+        pytest.importorskip("numpy")
+
+    def _both(self, monkeypatch, function, *args, **kwargs):
+        vectorized = function(*args, **kwargs)
+        monkeypatch.setattr(polyline, "np", None)
+        scalar = function(*args, **kwargs)
+        monkeypatch.undo()
+        return vectorized, scalar
+
+    def test_decode_matches(self, monkeypatch):
+        """Test both decoders agree on a long random polyline"""
+        vectorized, scalar = self._both(monkeypatch, decode_polyline, encode_polyline(_random_walk(2000)))
+
+        assert vectorized == pytest.approx(scalar)
+
+    def test_cumulative_distances_match(self, monkeypatch):
+        """Test vectorized haversine sums match the scalar helper"""
+        vectorized, scalar = self._both(monkeypatch, cumulative_distances, _random_walk(2000))
+
+        assert vectorized == pytest.approx(scalar, rel=1e-9)
+
+    def test_densify_matches(self, monkeypatch):
+        """Test both densifiers place the same samples"""
+        points = _random_walk(500)
+
+        vectorized, scalar = self._both(monkeypatch, densify, points, 750)
+        assert len(vectorized) == len(scalar) > 0
+        assert [list(sample) for sample in vectorized] == [pytest.approx(list(sample)) for sample in scalar]
+
+        vectorized, scalar = self._both(monkeypatch, densify, points, 750, length_meters=123456)
+        assert [list(sample) for sample in vectorized] == [pytest.approx(list(sample)) for sample in scalar]
+
+
+def _highway_steps(step_meters: int = 40000, step_seconds: int = 1800):
+    degrees = step_meters / ONE_DEGREE_LAT_METERS
+    highway = _straight_line(degrees, 200)
+    return [
+        {
+            "start_location": {"lat": 40.0, "lng": -74.0},
+            "end_location": {"lat": highway[-1][0], "lng": -74.0},
+            "html_instructions": "Merge onto <b>I-95 N</b>",
+            "distance": {"value": step_meters},
+            "duration": {"value": step_seconds},
+            "polyline": {"points": encode_polyline(highway)}
+        },
+        {
+            "start_location": {"lat": highway[-1][0], "lng": -74.0},
+            "end_location": {"lat": highway[-1][0], "lng": -74.001},
+            "html_instructions": "Turn right onto <b>Main St</b>",
+            "distance": {"value": 85},
+            "duration": {"value": 20}
+        }
+    ]
+
+
+@pytest.mark.unit
+class TestDensifiedWaypoints:
+    """Test waypoint extraction along long steps"""
+
+    def test_long_step_gets_intermediate_waypoints(self, mock_config, backend):
+        """Test a 40 km step yields a waypoint every 2 km between maneuvers"""
+        mock_config.densify_interval_meters = 2000
+        waypoints = GoogleMapsClient()._extract_waypoints_from_steps(_highway_steps())
+
+        assert len(waypoints) == 2 + 19
+        assert [wp.id for wp in waypoints] == list(range(1, 22))
+        assert waypoints[0].distance_from_start == 0.0
+        assert waypoints[1].distance_from_start == pytest.approx(2000)
+        assert waypoints[-2].distance_from_start == pytest.approx(38000)
+        assert waypoints[-1].distance_from_start == 40000
+        assert waypoints[-1].location_name == "Main St"
+        assert all(wp.step_index == 0 for wp in waypoints[:-1])
+        assert waypoints[5].instruction == "Merge onto I-95 N"
+
+    def test_time_interval_wins_when_shorter(self, mock_config, backend):
+        """Test densify_interval_seconds spaces waypoints by travel time"""
+        mock_config.densify_interval_meters = 0
+        mock_config.densify_interval_seconds = 300  # 40 km in 30 min: every 6.67 km
+
+        waypoints = GoogleMapsClient()._extract_waypoints_from_steps(_highway_steps())
+
+        assert len(waypoints) == 2 + 5
+        assert waypoints[1].distance_from_start == pytest.approx(40000 / 6)
+
+    def test_disabled_keeps_one_waypoint_per_maneuver(self, mock_config):
+        """Test both intervals at 0 turn densification off"""
+        mock_config.densify_interval_meters = 0
+        mock_config.densify_interval_seconds = 0
+
+        waypoints = GoogleMapsClient()._extract_waypoints_from_steps(_highway_steps())
+
+        assert len(waypoints) == 2
+
+    def test_overview_polyline_is_kept(self, mock_config):
+        """Test the encoded overview polyline is carried on RouteData"""
+        data = {
+            "routes": [{
+                "overview_polyline": {"points": GOOGLE_EXAMPLE},
+                "legs": [{
+                    "distance": {"text": "40 km"},
+                    "duration": {"text": "30 mins"},
+                    "steps": _highway_steps()
+                }]
+            }]
+        }
+
+        route = GoogleMapsClient()._parse_directions_response(data).route(0)
+
+        assert decode_polyline(route.overview_polyline) == pytest.approx(GOOGLE_EXAMPLE_POINTS)
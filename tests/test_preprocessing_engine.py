@@ -0,0 +1,136 @@
+"""
+Unit tests for src/modules/preprocessing_engine.py
+Golden parity tests against the per-pattern extraction functions the engine
+replaced, over synthetic routes and hand-picked edge cases
+"""
+
+import re
+
+import pytest
+
+from src.google_maps.instructions import parse_instruction
+from src.modules.preprocessing_engine import (
+    LocationFeatures,
+    build_search_keywords,
+    extract_landmarks,
+    extract_location_features,
+    extract_neighborhood,
+)
+from src.stub_server import synthetic_directions
+
+
+# Reference implementations: the waypoint_preprocessor functions before the engine
+
+def _previous_landmarks(instruction, location_name):
+    landmarks = []
+    combined_text = f"{instruction} {location_name}"
+    for pattern in (r"near ([\w\s]+)", r"past ([\w\s]+)", r"toward ([\w\s]+)", r"at ([\w\s]+)"):
+        landmarks.extend(re.findall(pattern, combined_text, re.IGNORECASE))
+    cleaned_landmarks = []
+    for landmark in landmarks:
+        cleaned = landmark.strip()
+        if cleaned and len(cleaned) > 3 and cleaned not in cleaned_landmarks:
+            cleaned_landmarks.append(cleaned)
+    return cleaned_landmarks[:3]
+
+
+def _previous_neighborhood(location_name):
+    for pattern in (r"(\w+\s+(?:District|Quarter|Heights|Village|Town))",
+                    r"((?:Upper|Lower|East|West|North|South)\s+\w+)"):
+        match = re.search(pattern, location_name, re.IGNORECASE)
+        if match:
+            return match.group(1).strip()
+    if "," in location_name:
+        parts = location_name.split(",")
+        if len(parts) > 1:
+            potential_neighborhood = parts[-1].strip()
+            if potential_neighborhood and len(potential_neighborhood) > 2:
+                return potential_neighborhood
+    return None
+
+
+def _previous_keywords(location_name, landmarks, neighborhood):
+    keywords = []
+    for part in re.split(r'[&,\-]', location_name):
+        cleaned = part.strip()
+        if cleaned and len(cleaned) > 2:
+            keywords.append(cleaned)
+    keywords.extend(landmarks)
+    if neighborhood:
+        keywords.append(neighborhood)
+    seen = set()
+    unique_keywords = []
+    for keyword in keywords:
+        if keyword.lower() not in seen:
+            seen.add(keyword.lower())
+            unique_keywords.append(keyword)
+    return unique_keywords[:5]
+
+
+def _previous_features(instruction, location_name):
+    landmarks = _previous_landmarks(instruction, location_name)
+    neighborhood = _previous_neighborhood(location_name)
+    return LocationFeatures(
+        landmarks=tuple(landmarks),
+        neighborhood=neighborhood,
+        search_keywords=tuple(_previous_keywords(location_name, landmarks, neighborhood))
+    )
+
+
+EDGE_CASES = [
+    ("Turn left at Great Neck Rd toward Lake at Main", "Great Neck Rd"),
+    ("Continue toward Times Square at 42nd St near Bryant Park past the Library", "Times Square & 42nd St"),
+    ("Head NEAR the pier, then PAST Pier 17", "Upper West Side, Manhattan"),
+    ("Turn right onto Broadway", "Broadway - Theater District, Midtown"),
+    ("Keep left at the fork", "Brooklyn Heights"),
+    ("Arrive at destination", "5th Ave, NY"),
+    ("Pass near near near the park", "Park & Park & park"),
+    ("Continue past Café Réunion toward Ärzte Platz", "Ärzte Platz, Neukölln"),
+    ("Merge", "40.7128, -74.0060"),
+    ("", ""),
+    ("Turn at A at B at C at D at E", "A, B, C, D, E, F, G"),
+]
+
+
+def _synthetic_corpus(route_count: int = 120):
+    corpus = []
+    for i in range(route_count):
+        route = synthetic_directions(f"Origin {i}", f"Destination {i}", step_count=20, step_meters=800)
+        for step in route["routes"][0]["legs"][0]["steps"]:
+            instruction, name = parse_instruction(step["html_instructions"])
+            corpus.append((instruction, name or "40.7128, -74.0060"))
+    return corpus
+
+
+@pytest.mark.unit
+class TestPreprocessingEngine:
+    """Test the single-pass preprocessing engine"""
+
+    @pytest.mark.parametrize("instruction, location_name", EDGE_CASES)
+    def test_golden_edge_cases(self, instruction, location_name):
+        """Test hand-picked inputs match the previous functions exactly"""
+        assert extract_location_features(instruction, location_name) == \
+            _previous_features(instruction, location_name)
+
+    def test_golden_synthetic_routes(self):
+        """Test thousands of real-shaped waypoints match the previous functions"""
+        for instruction, location_name in _synthetic_corpus():
+            assert extract_location_features(instruction, location_name) == \
+                _previous_features(instruction, location_name)
+
+    def test_overlapping_landmarks_follow_pattern_order(self):
+        """Test each keyword sees the whole text, with matches ordered by keyword"""
+        assert extract_landmarks("Continue toward Lake at Main past Elm", "Oak St") == [
+            "Elm Oak St", "Lake at Main past Elm Oak St", "Main past Elm Oak St"
+        ]
+
+    def test_neighborhood_priority(self):
+        """Test suffix patterns beat directional prefixes and the comma fallback"""
+        assert extract_neighborhood("Upper East Village, Queens") == "East Village"
+        assert extract_neighborhood("Upper Manhattan, NY") == "Upper Manhattan"
+        assert extract_neighborhood("5th Ave, Manhattan") == "Manhattan"
+        assert extract_neighborhood("Main St") is None
+
+    def test_keywords_are_case_insensitively_unique(self):
+        """Test duplicate keywords differing only in case are dropped"""
+        assert build_search_keywords("Park & park - PARK", ["Park Ave"], "Park") == ["Park", "Park Ave"]
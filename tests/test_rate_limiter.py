@@ -0,0 +1,304 @@
+"""
+Unit tests for src/rate_limiter.py and src/google_maps/throttling.py
+Tests token bucket bursts and refill, deadline-aware reservations and
+OVER_QUERY_LIMIT backoff for Maps calls
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.google_maps import (
+    BackoffPolicy,
+    GoogleMapsClient,
+    GoogleMapsError,
+    OVER_QUERY_LIMIT,
+    ReverseGeocoder,
+    call_with_quota_backoff,
+    call_with_quota_backoff_async,
+)
+from src.google_maps.http_pool import PooledResponse
+from src.models import Coordinates
+from src.rate_limiter import (
+    DIRECTIONS_LIMITER,
+    GEOCODING_LIMITER,
+    RateLimiter,
+    TokenBucket,
+    get_rate_limiter,
+    get_rate_limiter_stats,
+)
+
+
+class FakeClock:
+    """Monotonic clock advanced by the fake sleep"""
+
+    def __init__(self):
+        self.now = 1000.0
+        self.sleeps = []
+
+    def __call__(self) -> float:
+        return self.now
+
+    def sleep(self, seconds: float) -> None:
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class FlakyCall:
+    """Raises OVER_QUERY_LIMIT for the first `failures` calls, then returns "ok" """
+
+    def __init__(self, failures: int, status: str = OVER_QUERY_LIMIT):
+        self.failures = failures
+        self.status = status
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise GoogleMapsError("Google Maps API error: quota", status=self.status)
+        return "ok"
+
+
+def _directions_body(status: str) -> bytes:
+    return json.dumps({
+        "status": status,
+        "routes": [{
+            "legs": [{
+                "distance": {"text": "1.2 km"},
+                "duration": {"text": "4 mins"},
+                "steps": [{
+                    "start_location": {"lat": 40.0, "lng": -74.0},
+                    "end_location": {"lat": 40.01, "lng": -74.0},
+                    "html_instructions": "Head north on <b>Main St</b>"
+                }]
+            }]
+        }] if status == "OK" else []
+    }).encode()
+
+
+class ScriptedPool:
+    """Stands in for HTTPConnectionPool, answering with a fixed status sequence"""
+
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.timeouts = []
+
+    def request(self, url, timeout_seconds, headers=None):
+        self.timeouts.append(timeout_seconds)
+        return PooledResponse(status=200, body=_directions_body(self.statuses.pop(0)), headers={})
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Test TokenBucket"""
+
+    def test_burst_then_sustained_rate(self):
+        """Test a full bucket serves burst calls at once, then one per 1/rate"""
+        clock = FakeClock()
+        bucket = TokenBucket(10, burst=3, clock=clock, sleep=clock.sleep)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(0.1)
+        assert waits[4] == pytest.approx(0.2)
+
+    def test_tokens_refill_over_time(self):
+        """Test idle time refills the bucket up to the burst size only"""
+        clock = FakeClock()
+        bucket = TokenBucket(10, burst=3, clock=clock)
+        for _ in range(3):
+            bucket.reserve()
+
+        clock.now += 10
+        assert bucket.stats().tokens_available == 3
+
+    def test_reserve_beyond_max_wait_is_rejected(self):
+        """Test a reservation that would wait too long takes no token"""
+        clock = FakeClock()
+        bucket = TokenBucket(1, burst=1, clock=clock)
+        bucket.reserve()
+
+        assert bucket.reserve(max_wait=0.5) is None
+        assert bucket.reserve(max_wait=1.0) == pytest.approx(1.0)
+        stats = bucket.stats()
+        assert stats.rejected == 1
+        assert stats.acquired == 2
+        assert stats.throttled == 1
+
+    def test_acquire_sleeps_for_reserved_wait(self):
+        """Test acquire blocks through the injected sleep"""
+        clock = FakeClock()
+        bucket = TokenBucket(4, burst=1, clock=clock, sleep=clock.sleep)
+
+        assert bucket.acquire()
+        assert bucket.acquire()
+        assert clock.sleeps == [pytest.approx(0.25)]
+        assert bucket.acquire(timeout=0.1) is False
+
+    def test_non_positive_rate_disables_limiting(self):
+        """Test rate 0 never waits"""
+        bucket = TokenBucket(0)
+        assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+    def test_rate_limiter_keeps_single_token_spacing(self):
+        """Test RateLimiter still spaces every call 1/rate apart"""
+        clock = FakeClock()
+        limiter = RateLimiter(5)
+        limiter._clock = clock
+        limiter._updated = clock()
+
+        assert limiter.reserve() == 0.0
+        assert limiter.reserve() == pytest.approx(0.2)
+
+    def test_shared_limiters_use_config(self, mock_config):
+        """Test named limiters are built once from configuration"""
+        mock_config.directions_rate_per_second = 25.0
+        mock_config.directions_burst = 4
+
+        limiter = get_rate_limiter(DIRECTIONS_LIMITER)
+
+        assert get_rate_limiter(DIRECTIONS_LIMITER) is limiter
+        assert limiter.rate_per_second == 25.0
+        assert limiter.burst == 4
+        assert set(get_rate_limiter_stats()) == {DIRECTIONS_LIMITER}
+        with pytest.raises(ValueError):
+            get_rate_limiter("unknown")
+
+
+@pytest.mark.unit
+class TestQuotaBackoff:
+    """Test call_with_quota_backoff"""
+
+    def _call(self, call, clock, deadline=1010.0, max_retries=4, limiter=None):
+        return call_with_quota_backoff(
+            call,
+            limiter or TokenBucket(0, clock=clock),
+            deadline,
+            BackoffPolicy(max_retries=max_retries, base_delay_seconds=0.25, max_delay_seconds=1.0),
+            sleep=clock.sleep,
+            clock=clock,
+            rand=lambda: 1.0
+        )
+
+    def test_retries_over_query_limit_until_success(self):
+        """Test quota rejections are retried with capped exponential backoff"""
+        clock = FakeClock()
+        limiter = TokenBucket(0, name="test", clock=clock)
+        call = FlakyCall(failures=3)
+
+        assert self._call(call, clock, limiter=limiter) == "ok"
+        assert call.calls == 4
+        assert clock.sleeps == [0.25, 0.5, 1.0]
+        assert limiter.stats().over_query_limit == 3
+
+    def test_gives_up_after_max_retries(self):
+        """Test the last OVER_QUERY_LIMIT error surfaces once retries run out"""
+        clock = FakeClock()
+        call = FlakyCall(failures=10)
+
+        with pytest.raises(GoogleMapsError) as exc_info:
+            self._call(call, clock, max_retries=2)
+
+        assert exc_info.value.status == OVER_QUERY_LIMIT
+        assert call.calls == 3
+
+    def test_backoff_never_crosses_deadline(self):
+        """Test no retry is scheduled if it would start after the deadline"""
+        clock = FakeClock()
+        call = FlakyCall(failures=10)
+
+        with pytest.raises(GoogleMapsError):
+            self._call(call, clock, deadline=1000.6)
+
+        assert call.calls == 2
+        assert clock.now < 1000.6
+
+    def test_other_errors_are_not_retried(self):
+        """Test deterministic failures raise immediately"""
+        clock = FakeClock()
+        call = FlakyCall(failures=1, status="ZERO_RESULTS")
+
+        with pytest.raises(GoogleMapsError):
+            self._call(call, clock)
+
+        assert call.calls == 1
+        assert clock.sleeps == []
+
+    def test_rate_limit_wait_past_deadline_fails_fast(self):
+        """Test a token that would only arrive after the deadline is not awaited"""
+        clock = FakeClock()
+        limiter = TokenBucket(1, burst=1, clock=clock)
+        limiter.reserve()
+        call = FlakyCall(failures=0)
+
+        with pytest.raises(GoogleMapsError) as exc_info:
+            self._call(call, clock, deadline=1000.5, limiter=limiter)
+
+        assert exc_info.value.status == OVER_QUERY_LIMIT
+        assert call.calls == 0
+        assert limiter.stats().rejected == 1
+
+    def test_async_variant_retries(self):
+        """Test the async helper retries like the sync one"""
+        failing = FlakyCall(failures=1)
+
+        async def call():
+            return failing()
+
+        result = asyncio.run(call_with_quota_backoff_async(
+            call,
+            TokenBucket(0),
+            deadline=float("inf"),
+            policy=BackoffPolicy(max_retries=2, base_delay_seconds=0.001, max_delay_seconds=0.001)
+        ))
+
+        assert result == "ok"
+        assert failing.calls == 2
+
+
+@pytest.mark.unit
+class TestThrottledMapsCalls:
+    """Test the rate limiter and backoff wired into Maps lookups"""
+
+    def test_directions_retry_over_query_limit(self, mock_config):
+        """Test get_directions backs off and succeeds after a quota rejection"""
+        mock_config.quota_backoff_base_ms = 1
+        mock_config.quota_backoff_max_ms = 1
+        pool = ScriptedPool([OVER_QUERY_LIMIT, "OK"])
+        client = GoogleMapsClient(http_pool=pool)
+
+        route = client.get_directions("A", "B")
+
+        assert route.distance == "1.2 km"
+        assert len(pool.timeouts) == 2
+        assert get_rate_limiter_stats()[DIRECTIONS_LIMITER].over_query_limit == 1
+
+    def test_directions_timeout_shrinks_to_deadline(self, mock_config):
+        """Test each attempt's socket timeout is bounded by the remaining deadline"""
+        mock_config.route_retrieval_timeout_ms = 2000
+        pool = ScriptedPool(["OK"])
+        client = GoogleMapsClient(http_pool=pool)
+
+        client.get_directions("A", "B")
+
+        assert 0 < pool.timeouts[0] <= 2.0
+
+    def test_geocoder_retries_over_query_limit(self, mock_config):
+        """Test reverse geocoding retries quota rejections instead of failing"""
+        mock_config.quota_backoff_base_ms = 1
+        mock_config.quota_backoff_max_ms = 1
+        attempts = []
+
+        def fetch(lat, lng):
+            attempts.append((lat, lng))
+            if len(attempts) == 1:
+                raise GoogleMapsError("Google Maps API error: quota", status=OVER_QUERY_LIMIT)
+            return "1 Main St"
+
+        geocoder = ReverseGeocoder(fetch=fetch)
+
+        assert geocoder.resolve_many([Coordinates(lat=40.0, lng=-74.0)]) == ["1 Main St"]
+        assert len(attempts) == 2
+        assert geocoder.limiter is get_rate_limiter(GEOCODING_LIMITER)
@@ -0,0 +1,116 @@
+"""
+Unit tests for raw step retention on RouteData
+Tests the retention modes and measures their memory cost with tracemalloc
+"""
+
+import gc
+import json
+import tracemalloc
+
+import pytest
+
+from src.google_maps import GoogleMapsClient
+from src.google_maps.polyline import encode_polyline
+
+
+def _large_response(step_count: int = 1500, points_per_step: int = 60) -> str:
+    """Synthetic Directions response shaped like a long real route"""
+    steps = []
+    for i in range(step_count):
+        lat = 40.0 + i * 0.001
+        polyline = [(lat + j * 0.00001, -74.0 + j * 0.00001) for j in range(points_per_step)]
+        steps.append({
+            "start_location": {"lat": lat, "lng": -74.0},
+            "end_location": {"lat": lat + 0.001, "lng": -74.0},
+            "html_instructions": (
+                f"Turn <b>right</b> onto <b>Street {i}</b>"
+                f"<div style=\"font-size:0.9em\">Pass by Landmark {i} (on the left)</div>"
+            ),
+            "distance": {"text": "0.1 km", "value": 111},
+            "duration": {"text": "1 min", "value": 30},
+            "polyline": {"points": encode_polyline(polyline)},
+            "travel_mode": "DRIVING",
+            "maneuver": "turn-right"
+        })
+    return json.dumps({
+        "status": "OK",
+        "routes": [{
+            "summary": "Synthetic",
+            "legs": [{
+                "distance": {"text": "166 km", "value": 111 * step_count},
+                "duration": {"text": "12 hours", "value": 30 * step_count},
+                "steps": steps
+            }]
+        }]
+    })
+
+
+def _retained_bytes(body: str) -> int:
+    """Bytes still allocated for a parsed route once the raw response is dropped"""
+    client = GoogleMapsClient()
+    gc.collect()
+    tracemalloc.start()
+    try:
+        baseline = tracemalloc.get_traced_memory()[0]
+        route = client._parse_directions_response(json.loads(body)).route(0)
+        gc.collect()
+        retained = tracemalloc.get_traced_memory()[0] - baseline
+    finally:
+        tracemalloc.stop()
+    assert route.waypoint_count() == 1500
+    return retained
+
+
+@pytest.mark.unit
+class TestRawStepsRetention:
+    """Test RAW_STEPS_RETENTION modes"""
+
+    def test_default_keeps_no_steps(self, mock_config):
+        """Test raw steps are dropped outside debug mode"""
+        mock_config.log_level = "INFO"
+        route = GoogleMapsClient()._parse_directions_response(json.loads(_large_response(5))).route(0)
+
+        assert route.steps == []
+        assert route.waypoint_count() == 5
+
+    def test_auto_keeps_compact_steps_in_debug(self, mock_config):
+        """Test debug mode keeps plain-text steps without HTML or polylines"""
+        mock_config.log_level = "DEBUG"
+        route = GoogleMapsClient()._parse_directions_response(json.loads(_large_response(2))).route(0)
+
+        step = route.steps[0]
+        assert step["instruction"].startswith("Turn right onto Street 0")
+        assert step["distance"] == 111
+        assert step["duration"] == 30
+        assert "polyline" not in step
+        assert "html_instructions" not in step
+
+    def test_full_keeps_api_payload(self, mock_config):
+        """Test full retention keeps the raw steps unchanged"""
+        mock_config.raw_steps_retention = "full"
+        route = GoogleMapsClient()._parse_directions_response(json.loads(_large_response(2))).route(0)
+
+        assert "polyline" in route.steps[0]
+        assert route.steps[0]["distance"]["value"] == 111
+
+    def test_waypoint_durations_do_not_need_steps(self, mock_config):
+        """Test travel time per waypoint survives dropping the raw steps"""
+        mock_config.raw_steps_retention = "none"
+        route = GoogleMapsClient()._parse_directions_response(json.loads(_large_response(3))).route(0)
+
+        assert [wp.duration_from_start for wp in route.waypoints] == [0, 30, 60]
+
+    def test_dropping_steps_cuts_resident_memory(self, mock_config):
+        """Test (tracemalloc) a long route retains far less memory without raw steps"""
+        mock_config.densify_interval_meters = 0
+        body = _large_response()
+
+        mock_config.raw_steps_retention = "full"
+        full = _retained_bytes(body)
+        mock_config.raw_steps_retention = "compact"
+        compact = _retained_bytes(body)
+        mock_config.raw_steps_retention = "none"
+        none = _retained_bytes(body)
+
+        assert none < compact < full
+        assert none < full * 0.5
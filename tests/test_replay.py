@@ -0,0 +1,230 @@
+"""
+Unit tests for src/google_maps/replay.py
+Tests recording, credential redaction, latency scaling and offline replay
+through the Google Maps client
+"""
+
+import asyncio
+import json
+
+import pytest
+
+from src.google_maps import (
+    AsyncReplayTransport,
+    Cassette,
+    GoogleMapsClient,
+    GoogleMapsError,
+    RecordingTransport,
+    ReplayMissError,
+    ReplayTransport,
+    get_http_pool,
+    get_maps_client,
+    reset_http_pool,
+)
+from src.google_maps.http_pool import PooledResponse
+from src.google_maps.replay import RecordedExchange, normalize_url
+
+
+DIRECTIONS_URL = "https://maps.googleapis.com/maps/api/directions/json"
+
+
+def _directions_body() -> bytes:
+    return json.dumps({
+        "status": "OK",
+        "routes": [{
+            "legs": [{
+                "distance": {"text": "1.2 km", "value": 1200},
+                "duration": {"text": "4 mins", "value": 240},
+                "steps": [{
+                    "start_location": {"lat": 40.0, "lng": -74.0},
+                    "end_location": {"lat": 40.01, "lng": -74.0},
+                    "html_instructions": "Head north on <b>Main St</b>",
+                    "distance": {"value": 1200}
+                }]
+            }]
+        }]
+    }).encode()
+
+
+class FakeClock:
+    """Advances by a fixed step on every reading"""
+
+    def __init__(self, step: float):
+        self.now = 0.0
+        self.step = step
+
+    def __call__(self) -> float:
+        self.now += self.step
+        return self.now
+
+
+class LivePool:
+    """Stands in for HTTPConnectionPool; answers every URL with a fixed body"""
+
+    def __init__(self, body: bytes):
+        self.body = body
+        self.urls = []
+        self.closed = False
+
+    def request(self, url, timeout_seconds, headers=None):
+        self.urls.append(url)
+        return PooledResponse(
+            status=200,
+            body=self.body,
+            headers={"Content-Type": "application/json", "Set-Cookie": "session=secret"}
+        )
+
+    def close(self):
+        self.closed = True
+
+
+def _cassette(latency_seconds: float = 0.2) -> Cassette:
+    return Cassette(exchanges=[RecordedExchange(
+        method="GET",
+        url=normalize_url(f"{DIRECTIONS_URL}?origin=A&destination=B&mode=driving&key=x"),
+        status=200,
+        body=_directions_body(),
+        latency_seconds=latency_seconds
+    )])
+
+
+@pytest.mark.unit
+class TestRecordReplay:
+    """Test cassette recording and replay"""
+
+    def test_record_then_replay_round_trip(self, tmp_path):
+        """Test recorded responses are saved and served back identically"""
+        path = tmp_path / "cassette.json"
+        live = LivePool(_directions_body())
+        recorder = RecordingTransport(live, Cassette(str(path)), clock=FakeClock(0.25))
+
+        recorder.request(f"{DIRECTIONS_URL}?origin=A&destination=B&key=secret", timeout_seconds=5)
+        recorder.close()
+
+        assert live.closed
+        replay = ReplayTransport(Cassette.load(str(path)), latency_scale=0, sleep=lambda _: None)
+        response = replay.request(f"{DIRECTIONS_URL}?destination=B&key=other&origin=A", timeout_seconds=5)
+        assert response.status == 200
+        assert response.body == _directions_body()
+        assert response.headers == {"Content-Type": "application/json"}
+        assert replay.requests_served == 1
+
+    def test_credentials_are_not_written(self, tmp_path):
+        """Test API keys and cookies never reach the cassette file"""
+        path = tmp_path / "cassette.json"
+        recorder = RecordingTransport(LivePool(b"{}"), Cassette(str(path)))
+
+        recorder.request(f"{DIRECTIONS_URL}?origin=A&key=AIzaSECRET", timeout_seconds=5)
+        recorder.close()
+
+        saved = path.read_text()
+        assert "AIzaSECRET" not in saved
+        assert "session=secret" not in saved
+        assert "key=REDACTED" in saved
+
+    def test_binary_bodies_survive_saving(self, tmp_path):
+        """Test non-UTF-8 bodies are stored as base64"""
+        path = tmp_path / "cassette.json"
+        recorder = RecordingTransport(LivePool(b"\x1f\x8b\xff\x00"), Cassette(str(path)))
+
+        recorder.request(f"{DIRECTIONS_URL}?origin=A", timeout_seconds=5)
+        recorder.close()
+
+        assert Cassette.load(str(path)).exchanges[0].body == b"\x1f\x8b\xff\x00"
+
+    @pytest.mark.parametrize("scale, expected", [(1.0, 0.2), (0.5, 0.1), (0.0, None)])
+    def test_latency_scale(self, scale, expected):
+        """Test replayed latency is the recorded latency times the scale"""
+        sleeps = []
+        replay = ReplayTransport(_cassette(0.2), latency_scale=scale, sleep=sleeps.append)
+
+        replay.request(f"{DIRECTIONS_URL}?origin=A&destination=B&mode=driving&key=x", timeout_seconds=5)
+
+        assert sleeps == ([] if expected is None else [pytest.approx(expected)])
+
+    def test_slow_recording_times_out(self):
+        """Test a recorded latency beyond the timeout waits the timeout and fails"""
+        sleeps = []
+        replay = ReplayTransport(_cassette(3.0), sleep=sleeps.append)
+
+        with pytest.raises(TimeoutError):
+            replay.request(f"{DIRECTIONS_URL}?origin=A&destination=B&mode=driving&key=x", timeout_seconds=1.5)
+        assert sleeps == [1.5]
+        assert replay.requests_served == 0
+
+    def test_repeated_requests_follow_recording_order(self):
+        """Test repeated URLs get their recordings in order, then the last one again"""
+        url = f"{DIRECTIONS_URL}?origin=A"
+        cassette = Cassette(exchanges=[
+            RecordedExchange("GET", normalize_url(url), 500, b"first"),
+            RecordedExchange("GET", normalize_url(url), 200, b"second")
+        ])
+        replay = ReplayTransport(cassette, latency_scale=0)
+
+        bodies = [replay.request(url, timeout_seconds=1).body for _ in range(3)]
+
+        assert bodies == [b"first", b"second", b"second"]
+
+    def test_unrecorded_request_is_network_error(self, mock_config):
+        """Test a replay miss surfaces through the client as a network error"""
+        replay = ReplayTransport(_cassette(), latency_scale=0)
+        client = GoogleMapsClient(http_pool=replay)
+
+        with pytest.raises(ReplayMissError):
+            replay.request(f"{DIRECTIONS_URL}?origin=Z", timeout_seconds=1)
+        with pytest.raises(GoogleMapsError, match="Network error"):
+            client.get_directions("Nowhere", "Else")
+
+    def test_async_replay(self, mock_config):
+        """Test the async transport serves the same recordings"""
+        mock_config.google_maps_api_key = "x"
+        replay = AsyncReplayTransport(_cassette(0.01), latency_scale=0.5)
+        client = GoogleMapsClient(async_http_pool=replay)
+
+        route = asyncio.run(client.get_directions_async("A", "B"))
+
+        assert route.waypoints[0].location_name == "Main St"
+        assert replay.requests_served == 1
+
+
+@pytest.mark.unit
+class TestTransportConfiguration:
+    """Test HTTP_TRANSPORT switching the shared pools"""
+
+    def test_live_by_default(self, mock_config):
+        """Test the shared pool is the real pool in live mode"""
+        assert not isinstance(get_http_pool(), (RecordingTransport, ReplayTransport))
+
+    def test_replay_mode_runs_offline(self, mock_config, tmp_path):
+        """Test HTTP_TRANSPORT=replay drives the shared client from a cassette"""
+        path = tmp_path / "maps.json"
+        Cassette(str(path), _cassette(0.0).exchanges).save()
+        mock_config.google_maps_api_key = "x"
+        mock_config.http_transport = "replay"
+        mock_config.http_cassette_path = str(path)
+        mock_config.http_replay_latency_scale = 0
+
+        route = get_maps_client().get_directions("A", "B")
+
+        assert isinstance(get_http_pool(), ReplayTransport)
+        assert route.distance == "1.2 km"
+        assert get_http_pool().requests_served == 1
+
+    def test_record_mode_saves_on_close(self, mock_config, tmp_path):
+        """Test closing the shared recording pool writes the cassette"""
+        path = tmp_path / "recorded.json"
+        mock_config.http_transport = "record"
+        mock_config.http_cassette_path = str(path)
+
+        pool = get_http_pool()
+        pool.inner = LivePool(_directions_body())
+        pool.request(f"{DIRECTIONS_URL}?origin=A&destination=B&key=secret", timeout_seconds=5)
+        reset_http_pool()
+
+        assert len(Cassette.load(str(path)).exchanges) == 1
+
+    def test_invalid_transport_rejected(self, mock_config):
+        """Test validate() rejects unknown transport modes"""
+        mock_config.http_transport = "mock"
+
+        assert any("http_transport" in error for error in mock_config.validate())
@@ -91,3 +91,100 @@ class TestRouteRetrieval:
 
         # Stage should have been updated at some point
         assert transaction_context.current_stage is not None
+
+
+@pytest.mark.unit
+class TestRouteNegativeCaching:
+    """Test route cache behaviour for successful and failed lookups"""
+
+    @patch('src.google_maps.client.GoogleMapsClient')
+    def test_zero_results_is_negatively_cached(
+        self,
+        mock_client_class,
+        transaction_context,
+        mock_config
+    ):
+        """Test unroutable pairs fail fast on repeat without an API call"""
+        from src.google_maps import GoogleMapsError
+        mock_config.mock_mode = False
+        mock_config.enable_caching = True
+
+        mock_client = Mock()
+        mock_client.get_directions.side_effect = GoogleMapsError(
+            "No route could be calculated", status="ZERO_RESULTS"
+        )
+        mock_client_class.return_value = mock_client
+
+        for _ in range(3):
+            with pytest.raises(RouteRetrievalError) as exc_info:
+                retrieve_route(transaction_context)
+            assert "No route could be calculated" in str(exc_info.value)
+            assert exc_info.value.status == "ZERO_RESULTS"
+
+        assert mock_client.get_directions.call_count == 1
+
+    @pytest.mark.parametrize("status", ["OVER_QUERY_LIMIT", "UNKNOWN_ERROR", None])
+    @patch('src.google_maps.client.GoogleMapsClient')
+    def test_transient_failures_are_not_cached(
+        self,
+        mock_client_class,
+        status,
+        transaction_context,
+        mock_config
+    ):
+        """Test quota, unknown and network errors always retry upstream"""
+        from src.google_maps import GoogleMapsError
+        mock_config.mock_mode = False
+        mock_config.enable_caching = True
+
+        mock_client = Mock()
+        mock_client.get_directions.side_effect = GoogleMapsError("failure", status=status)
+        mock_client_class.return_value = mock_client
+
+        for _ in range(2):
+            with pytest.raises(RouteRetrievalError):
+                retrieve_route(transaction_context)
+
+        assert mock_client.get_directions.call_count == 2
+
+    def test_successful_route_is_cached_as_copy(self, transaction_context, mock_config):
+        """Test cache hits return independent copies of the route"""
+        from src.modules import route_retrieval
+        mock_config.enable_caching = True
+
+        with patch.object(
+            route_retrieval,
+            '_retrieve_route_mock',
+            wraps=route_retrieval._retrieve_route_mock
+        ) as mock_retrieve:
+            first = retrieve_route(transaction_context)
+            first.waypoints[0].location_name = "mutated"
+            second = retrieve_route(transaction_context)
+
+        assert mock_retrieve.call_count == 1
+        assert second.waypoints[0].location_name == "5th Avenue & E 34th St"
+
+    def test_stale_route_served_while_refreshing(self, transaction_context, mock_config):
+        """Test an expired route within grace is returned and refreshed once"""
+        from src.modules import route_retrieval
+        from src.cache import ROUTE_CACHE, get_cache, make_route_key
+        mock_config.enable_caching = True
+        mock_config.cache_stale_grace_seconds = 300
+
+        with patch.object(
+            route_retrieval,
+            '_retrieve_route_mock',
+            wraps=route_retrieval._retrieve_route_mock
+        ) as mock_retrieve:
+            retrieve_route(transaction_context)
+
+            cache = get_cache(ROUTE_CACHE)
+            key = make_route_key(transaction_context.origin, transaction_context.destination)
+            cache.get(key).expires_at -= mock_config.cache_ttl_seconds  # Force expiry
+
+            stale = retrieve_route(transaction_context)
+            cache.close(wait=True)
+
+            assert stale.distance == "3.5 km"
+            assert mock_retrieve.call_count == 2
+            assert not cache.is_stale(cache.get(key))
@@ -0,0 +1,191 @@
+"""
+Unit tests for src/stub_server
+Tests synthetic payloads, injected latency/errors/rate limits and the real
+route retrieval path pointed at the stub through GOOGLE_MAPS_BASE_URL
+"""
+
+import base64
+import json
+import random
+import statistics
+import urllib.error
+import urllib.parse
+import urllib.request
+
+import pytest
+
+from src.google_maps import GoogleMapsClient, GoogleMapsError, get_maps_client
+from src.google_maps.client import fetch_reverse_geocode
+from src.models import TransactionContext
+from src.modules.route_retrieval import RouteRetrievalError, retrieve_route
+from src.stub_server import LatencyModel, StubServer, StubServerConfig, synthetic_directions
+
+
+@pytest.fixture
+def stub():
+    """Stub server with default behaviour; tests adjust stub.config before requests"""
+    server = StubServer(StubServerConfig(seed=1)).start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def stub_maps_config(mock_config, stub):
+    """Real (non-mock) code paths pointed at the stub"""
+    mock_config.mock_mode = False
+    mock_config.google_maps_base_url = stub.url
+    mock_config.quota_retry_max_attempts = 0
+    return mock_config
+
+
+def _get(url: str, headers=None):
+    request = urllib.request.Request(url, headers=headers or {})
+    try:
+        with urllib.request.urlopen(request, timeout=5) as response:
+            return response.status, json.loads(response.read()), dict(response.headers)
+    except urllib.error.HTTPError as e:
+        return e.code, json.loads(e.read()), dict(e.headers)
+
+
+@pytest.mark.unit
+class TestSyntheticRoutes:
+    """Test synthetic Directions payloads"""
+
+    def test_route_length_and_legs(self):
+        """Test step count is spread over one leg per stop + 1"""
+        body = synthetic_directions("A", "B", step_count=100, step_meters=400, stops=["S1", "S2"])
+
+        legs = body["routes"][0]["legs"]
+        assert len(legs) == 3
+        assert sum(len(leg["steps"]) for leg in legs) == 100
+        assert [leg["end_address"] for leg in legs] == ["S1", "S2", "B"]
+        assert legs[0]["distance"]["value"] == sum(s["distance"]["value"] for s in legs[0]["steps"])
+
+    def test_deterministic_per_request(self):
+        """Test the same request always yields the same route"""
+        first = synthetic_directions("A", "B", step_count=10, step_meters=500)
+        assert synthetic_directions("A", "B", step_count=10, step_meters=500) == first
+        assert synthetic_directions("A", "C", step_count=10, step_meters=500) != first
+
+    def test_alternatives(self):
+        """Test alternatives=true returns three routes"""
+        body = synthetic_directions("A", "B", step_count=10, step_meters=500, alternatives=True)
+
+        assert len(body["routes"]) == 3
+
+    @pytest.mark.parametrize("distribution", ["fixed", "uniform", "normal", "lognormal", "exponential"])
+    def test_latency_distribution_mean(self, distribution):
+        """Test every latency distribution is centred on mean_ms"""
+        model = LatencyModel(distribution, mean_ms=100, spread_ms=30)
+        rng = random.Random(3)
+
+        samples = [model.sample(rng) for _ in range(4000)]
+
+        assert statistics.mean(samples) == pytest.approx(0.1, rel=0.1)
+        assert min(samples) >= 0
+
+
+@pytest.mark.unit
+class TestStubServer:
+    """Test the stub endpoints and the real code paths against them"""
+
+    def test_route_retrieval_real_path(self, stub, stub_maps_config):
+        """Test the non-mock route retrieval parses a long synthetic route"""
+        stub.config.route_steps = 150
+        stub_maps_config.densify_interval_meters = 0
+
+        route = retrieve_route(TransactionContext("t1", "Times Square", "Brooklyn Bridge"))
+
+        assert route.waypoint_count() == 150
+        assert stub.stats()["/maps/api/directions/json"] == 1
+
+    def test_stops_and_alternatives(self, stub, stub_maps_config):
+        """Test stopovers and alternatives reach the stub"""
+        result = GoogleMapsClient().get_directions_result("A", "C", stops=["B"], alternatives=True)
+
+        assert len(result) == 3
+        assert result.alternatives[0].leg_count == 2
+
+    def test_reverse_geocode(self, stub, stub_maps_config):
+        """Test reverse geocoding uses the configured base URL"""
+        address = fetch_reverse_geocode(40.7, -74.0, "stub")
+
+        assert address.endswith("Stub City, NY")
+
+    def test_injected_errors(self, stub, stub_maps_config):
+        """Test error_rate=1 fails every request with a network error"""
+        stub.config.error_rate = 1.0
+
+        with pytest.raises(GoogleMapsError, match="Network error: HTTP 503"):
+            get_maps_client().get_directions("A", "B")
+        assert stub.stats()["injected_errors"] == 1
+
+    def test_rate_limit_reports_over_query_limit(self, mock_config):
+        """Test requests beyond the stub's rate limit get OVER_QUERY_LIMIT"""
+        mock_config.mock_mode = False
+        mock_config.quota_retry_max_attempts = 0
+        with StubServer(StubServerConfig(rate_per_second=0.001, burst=1)) as stub:
+            mock_config.google_maps_base_url = stub.url
+
+            with pytest.raises(RouteRetrievalError) as raised:
+                for i in range(2):
+                    retrieve_route(TransactionContext(f"t{i}", "A", f"B{i}"))
+
+            assert raised.value.status == "OVER_QUERY_LIMIT"
+            assert stub.stats()["rate_limited"] == 1
+
+    def test_missing_key_is_denied(self, stub):
+        """Test requests without an API key get REQUEST_DENIED"""
+        status, body, _ = _get(f"{stub.url}/maps/api/directions/json?origin=A&destination=B")
+
+        assert status == 200
+        assert body["status"] == "REQUEST_DENIED"
+
+    def test_youtube_search(self, stub):
+        """Test the YouTube search.list stand-in"""
+        status, body, _ = _get(f"{stub.url}/youtube/v3/search?q=central+park&maxResults=3&key=stub")
+
+        assert status == 200
+        assert len(body["items"]) == 3
+        assert body["items"][0]["id"]["kind"] == "youtube#video"
+
+    def test_non_numeric_page_size_is_a_bad_request(self):
+        """Test invalid maxResults/limit values get a 400 instead of a dropped connection"""
+        with StubServer(StubServerConfig(require_credentials=False)) as stub:
+            youtube_status, youtube_body, _ = _get(f"{stub.url}/youtube/v3/search?q=a&maxResults=lots")
+            spotify_status, spotify_body, _ = _get(f"{stub.url}/v1/search?q=a&limit=ten")
+
+        assert youtube_status == 400
+        assert youtube_body["error"]["errors"][0]["reason"] == "invalidParameter"
+        assert spotify_status == 400
+        assert spotify_body["error"]["status"] == 400
+
+    def test_spotify_token_and_search(self, stub):
+        """Test the client-credentials token unlocks Spotify search"""
+        request = urllib.request.Request(
+            f"{stub.url}/api/token",
+            data=urllib.parse.urlencode({"grant_type": "client_credentials"}).encode(),
+            headers={"Authorization": "Basic " + base64.b64encode(b"id:secret").decode()}
+        )
+        with urllib.request.urlopen(request, timeout=5) as response:
+            token = json.loads(response.read())["access_token"]
+
+        status, body, _ = _get(
+            f"{stub.url}/v1/search?q=new+york&type=track&limit=5",
+            headers={"Authorization": f"Bearer {token}"}
+        )
+        assert status == 200
+        assert len(body["tracks"]["items"]) == 5
+
+        status, _, _ = _get(f"{stub.url}/v1/search?q=x", headers={"Authorization": "Bearer nope"})
+        assert status == 401
+
+    def test_spotify_rate_limit_sets_retry_after(self):
+        """Test Spotify rate limiting answers 429 with Retry-After"""
+        config = StubServerConfig(rate_per_second=0.001, burst=1, require_credentials=False)
+        with StubServer(config) as stub:
+            _get(f"{stub.url}/v1/search?q=a")
+            status, _, headers = _get(f"{stub.url}/v1/search?q=a")
+
+        assert status == 429
+        assert headers["Retry-After"] == "1"
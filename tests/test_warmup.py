@@ -0,0 +1,181 @@
+"""
+Unit tests for src/cache/warmup.py
+Tests pair loading and offline cache warm-up in mock mode
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from src.cache import ROUTE_CACHE, AGENT_RESULT_CACHE, get_cache, make_route_key, reset_caches
+from src.cache.fake_redis import FakeRedisServer
+from src.cache.warmup import WarmupPair, load_pairs, warm_caches, main
+from src.config import get_config, set_config
+from src.modules import mock_agents
+
+
+TEST_SECRET = "warmup-test-secret-0123456789abcdef"
+
+
+@pytest.fixture
+def warmup_config(mock_config):
+    """Mock-mode configuration with caching enabled"""
+    mock_config.enable_caching = True
+    return mock_config
+
+
+@pytest.fixture
+def cli_env(mock_config, monkeypatch, tmp_path):
+    """Environment for main(): production mode without API keys, shared Redis cache"""
+    server = FakeRedisServer().start()
+    monkeypatch.setenv("MOCK_MODE", "false")
+    monkeypatch.setenv("GOOGLE_MAPS_API_KEY", "")
+    monkeypatch.setenv("YOUTUBE_API_KEY", "")
+    monkeypatch.setenv("ENABLE_CACHING", "true")
+    monkeypatch.setenv("CACHE_BACKEND", "redis")
+    monkeypatch.setenv("CACHE_BACKEND_URL", server.url)
+    monkeypatch.setenv("CACHE_BACKEND_SECRET", TEST_SECRET)
+    monkeypatch.setenv("LOG_FILE_PATH", str(tmp_path / "logs" / "warmup.log"))
+    yield monkeypatch
+    # main() installs its own config; restore the test one
+    reset_caches()
+    set_config(mock_config)
+    server.stop()
+
+
+@pytest.mark.unit
+class TestLoadPairs:
+    """Test JSONL and CSV pair loading"""
+
+    def test_load_jsonl(self, tmp_path):
+        """Test JSONL records with and without preferences"""
+        path = tmp_path / "pairs.jsonl"
+        path.write_text(
+            '{"origin": "A", "destination": "B", "preferences": {"content_type": "music"}}\n'
+            '\n'
+            '{"origin": "C", "destination": "D"}\n'
+        )
+
+        pairs = load_pairs(str(path))
+
+        assert pairs == [
+            WarmupPair("A", "B", {"content_type": "music"}),
+            WarmupPair("C", "D", {}),
+        ]
+
+    def test_load_csv(self, tmp_path):
+        """Test CSV rows with an optional JSON preferences column"""
+        path = tmp_path / "pairs.csv"
+        path.write_text(
+            'origin,destination,preferences\n'
+            'A,B,"{""content_type"": ""video""}"\n'
+            'C,D,\n'
+        )
+
+        pairs = load_pairs(str(path))
+
+        assert pairs[0].preferences == {"content_type": "video"}
+        assert pairs[1] == WarmupPair("C", "D", {})
+
+    def test_missing_destination_rejected(self, tmp_path):
+        """Test malformed records report their line number"""
+        path = tmp_path / "pairs.jsonl"
+        path.write_text('{"origin": "A"}\n')
+
+        with pytest.raises(ValueError, match="Line 1"):
+            load_pairs(str(path))
+
+    def test_unsupported_format_rejected(self, tmp_path):
+        """Test unknown file extensions are rejected"""
+        path = tmp_path / "pairs.txt"
+        path.write_text("A,B\n")
+
+        with pytest.raises(ValueError):
+            load_pairs(str(path))
+
+
+@pytest.mark.integration
+class TestWarmCaches:
+    """Test warm-up against the mock pipeline"""
+
+    def test_warm_fills_caches_and_reports_failures(self, warmup_config):
+        """Test valid pairs fill both caches and invalid pairs are counted"""
+        pairs = [
+            WarmupPair("Empire State Building", "Central Park"),
+            WarmupPair("", "Central Park"),
+        ]
+
+        report = warm_caches(pairs, concurrency=2, rate_per_second=0)
+
+        assert report.total == 2
+        assert report.warmed == 1
+        assert report.failed == 1
+        assert report.failures[0]["origin"] == ""
+        assert len(get_cache(ROUTE_CACHE)) == 1
+        assert len(get_cache(AGENT_RESULT_CACHE)) > 0
+        assert report.agent_cache_entries == len(get_cache(AGENT_RESULT_CACHE))
+
+    def test_warm_runs_agents_only_for_cluster_representatives(self, warmup_config):
+        """Test warm-up follows the pipeline's stages, clustering included"""
+        warmup_config.cluster_radius_meters = 800
+
+        with patch('src.modules.mock_agents.time.sleep'), \
+                patch('src.modules.orchestrator.run_mock_youtube_agent',
+                      wraps=mock_agents.run_mock_youtube_agent) as youtube:
+            report = warm_caches([WarmupPair("Empire State Building", "Central Park")], rate_per_second=0)
+
+        assert report.warmed == 1
+        # The mock route's 8 waypoints form 6 clusters
+        assert youtube.call_count == 6
+
+    def test_main_fills_shared_cache(self, cli_env, tmp_path, capsys):
+        """Test --mock skips API key validation and entries reach the shared backend"""
+        path = tmp_path / "pairs.jsonl"
+        path.write_text('{"origin": "Empire State Building", "destination": "Central Park"}\n')
+
+        exit_code = main([str(path), "--mock", "--rate", "0"])
+
+        report = json.loads(capsys.readouterr().out)
+        assert exit_code == 0
+        assert report["warmed"] == 1
+        assert report["failed"] == 0
+        assert get_config().mock_mode
+
+        # A fresh process-local cache sees the warmed route through the backend
+        reset_caches()
+        assert get_cache(ROUTE_CACHE).get(make_route_key("Empire State Building", "Central Park")) is not None
+
+    def test_main_rejects_process_local_cache(self, cli_env, tmp_path, capsys):
+        """Test warm-up refuses to fill caches no serving worker can read"""
+        cli_env.setenv("CACHE_BACKEND", "memory")
+        path = tmp_path / "pairs.jsonl"
+        path.write_text('{"origin": "A", "destination": "B"}\n')
+
+        assert main([str(path), "--mock"]) == 2
+        assert "CACHE_BACKEND=redis" in capsys.readouterr().err
+
+    def test_main_requires_signing_secret(self, cli_env, tmp_path, capsys):
+        """Test warm-up refuses to run when backend payloads cannot be signed"""
+        cli_env.setenv("CACHE_BACKEND_SECRET", "")
+        path = tmp_path / "pairs.jsonl"
+        path.write_text('{"origin": "A", "destination": "B"}\n')
+
+        assert main([str(path), "--mock"]) == 2
+        assert "CACHE_BACKEND_SECRET" in capsys.readouterr().err
+
+    def test_main_reports_configuration_errors(self, cli_env, tmp_path, capsys):
+        """Test a production run without API keys fails validation cleanly"""
+        path = tmp_path / "pairs.jsonl"
+        path.write_text('{"origin": "A", "destination": "B"}\n')
+
+        assert main([str(path)]) == 2
+        assert "GOOGLE_MAPS_API_KEY" in capsys.readouterr().err
+
+    def test_main_rejects_disabled_caching(self, cli_env, tmp_path):
+        """Test warm-up refuses to run when caching is off"""
+        cli_env.setenv("ENABLE_CACHING", "false")
+        path = tmp_path / "pairs.jsonl"
+        path.write_text('{"origin": "A", "destination": "B"}\n')
+
+        assert main([str(path), "--mock"]) == 2
@@ -0,0 +1,216 @@
+"""
+Unit tests for src/modules/waypoint_clustering.py
+Tests clustering of nearby waypoints and sharing of enrichment within clusters
+"""
+
+import dataclasses
+
+import pytest
+
+from src.models import (
+    Waypoint,
+    Coordinates,
+    WaypointMetadata,
+    WaypointEnrichment,
+    LocationType,
+    ContentItem,
+    ContentType,
+    JudgeDecision,
+    FinalRoute,
+)
+from src.modules.waypoint_clustering import (
+    WaypointClusterer,
+    cluster_waypoints,
+    default_member_enrichment,
+    get_member_enrichment_hook,
+    set_member_enrichment_hook,
+    share_cluster_enrichment,
+)
+from src.modules.result_aggregator import aggregate_results
+from src.modules.response_formatter import format_response
+
+
+# Roughly 111 m per 0.001 degree of latitude
+def make_waypoint(waypoint_id, lat, location_type=LocationType.INTERSECTION):
+    return Waypoint(
+        id=waypoint_id,
+        location_name=f"5th Avenue & E {waypoint_id}th St",
+        coordinates=Coordinates(lat=lat, lng=-73.98),
+        instruction="Continue on 5th Ave",
+        metadata=WaypointMetadata(location_type=location_type)
+    )
+
+
+def make_enrichment(title="5th Avenue walking tour"):
+    content = ContentItem(
+        content_type=ContentType.VIDEO,
+        title=title,
+        description="Video about 5th Avenue",
+        relevance_score=0.9,
+        metadata={"channel": "NYC Walks"}
+    )
+    return WaypointEnrichment(
+        selected_content=content,
+        all_agent_results={},
+        judge_decision=JudgeDecision(
+            winner="youtube",
+            reasoning="Most relevant",
+            confidence_score=0.9,
+            individual_scores={"youtube": 0.9},
+            selected_content=content
+        ),
+        processing_time_ms=1200
+    )
+
+
+@pytest.mark.unit
+class TestWaypointClusterer:
+    """Test grouping of nearby waypoints"""
+
+    def test_nearby_waypoints_of_same_type_cluster(self):
+        """Test consecutive waypoints within the radius of the representative join it"""
+        waypoints = [make_waypoint(1, 40.750), make_waypoint(2, 40.754), make_waypoint(3, 40.758)]
+
+        clusters = cluster_waypoints(waypoints, radius_meters=500)
+
+        assert [cluster.waypoint_ids for cluster in clusters] == [[1, 2], [3]]
+
+    def test_incompatible_types_and_landmarks_do_not_cluster(self):
+        """Test a type change starts a new cluster and landmarks never share"""
+        waypoints = [
+            make_waypoint(1, 40.7500),
+            make_waypoint(2, 40.7501, LocationType.HIGHWAY),
+            make_waypoint(3, 40.7502, LocationType.LANDMARK),
+            make_waypoint(4, 40.7503, LocationType.LANDMARK),
+        ]
+
+        clusters = cluster_waypoints(waypoints, radius_meters=500)
+
+        assert [cluster.waypoint_ids for cluster in clusters] == [[1], [2], [3], [4]]
+
+    def test_zero_radius_disables_clustering(self):
+        """Test every waypoint is its own representative with radius 0"""
+        waypoints = [make_waypoint(1, 40.75), make_waypoint(2, 40.75)]
+
+        assert len(cluster_waypoints(waypoints, radius_meters=0)) == 2
+
+    def test_representatives_are_yielded_as_they_arrive(self):
+        """Test a representative is yielded before later waypoints are consumed"""
+        clusterer = WaypointClusterer(radius_meters=500)
+        consumed = []
+
+        def stream():
+            for waypoint in [make_waypoint(1, 40.750), make_waypoint(2, 40.751), make_waypoint(3, 40.760)]:
+                consumed.append(waypoint.id)
+                yield waypoint
+
+        representatives = clusterer.representatives(stream())
+
+        assert next(representatives).id == 1
+        assert consumed == [1]
+        assert [waypoint.id for waypoint in representatives] == [3]
+
+
+@pytest.mark.unit
+class TestShareClusterEnrichment:
+    """Test enrichment sharing within clusters"""
+
+    def test_members_share_representative_enrichment(self, transaction_context):
+        """Test every member gets a marked copy and route order is restored"""
+        waypoints = [make_waypoint(1, 40.750), make_waypoint(2, 40.751), make_waypoint(3, 40.760)]
+        clusterer = WaypointClusterer(radius_meters=500)
+        representatives = list(clusterer.representatives(waypoints))
+        for waypoint in representatives:
+            waypoint.enrichment = make_enrichment()
+
+        result = share_cluster_enrichment(transaction_context, representatives, clusterer.clusters)
+
+        assert [waypoint.id for waypoint in result] == [1, 2, 3]
+        first, second, third = result
+        assert first.enrichment.shared_with == (1, 2)
+        assert first.enrichment.shared_from is None
+        assert second.enrichment.shared_from == 1
+        assert second.enrichment.processing_time_ms == 0
+        assert second.enrichment.selected_content.title == first.enrichment.selected_content.title
+        assert second.enrichment.selected_content is not first.enrichment.selected_content
+        assert second.enrichment.selected_content.metadata == {"channel": "NYC Walks", "shared_from_step": 1}
+        assert "shared_from_step" not in first.enrichment.selected_content.metadata
+        assert not third.enrichment.is_shared()
+        assert transaction_context.metadata["waypoint_clustering"]["shared_enrichments"] == 1
+
+    def test_member_title_never_names_another_waypoint(self, transaction_context):
+        """Test location-bound text in a member's copy names the member, not the representative"""
+        waypoints = [make_waypoint(34, 40.750), make_waypoint(35, 40.751), make_waypoint(36, 40.752)]
+        clusterer = WaypointClusterer(radius_meters=500)
+        representatives = list(clusterer.representatives(waypoints))
+        representative = representatives[0]
+        representative.enrichment = make_enrichment(title=f"Song for {representative.location_name}")
+        representative.enrichment.selected_content.description = f"Music near {representative.location_name}"
+
+        result = share_cluster_enrichment(transaction_context, representatives, clusterer.clusters)
+
+        for member in result[1:]:
+            content = member.enrichment.selected_content
+            others = [waypoint.location_name for waypoint in result if waypoint is not member]
+            assert content.title == f"Song for {member.location_name}"
+            assert content.description == f"Music near {member.location_name}"
+            assert not any(name in content.title or name in content.description for name in others)
+        assert result[0].enrichment.selected_content.title == "Song for 5th Avenue & E 34th St"
+
+    def test_clustering_is_opt_in(self):
+        """Test the default configuration enriches every waypoint itself"""
+        from src.config import SystemConfig
+        assert SystemConfig().cluster_radius_meters == 0
+
+    def test_member_enrichment_hook(self, transaction_context):
+        """Test the hook adapts each member's copy"""
+        def personalize(representative, member, enrichment):
+            enrichment = default_member_enrichment(representative, member, enrichment)
+            content = dataclasses.replace(enrichment.selected_content, title=f"Near {member.location_name}")
+            return dataclasses.replace(enrichment, selected_content=content)
+
+        waypoints = [make_waypoint(1, 40.750), make_waypoint(2, 40.751)]
+        clusterer = WaypointClusterer(radius_meters=500)
+        representatives = list(clusterer.representatives(waypoints))
+        representatives[0].enrichment = make_enrichment()
+
+        set_member_enrichment_hook(personalize)
+        try:
+            assert get_member_enrichment_hook() is personalize
+            result = share_cluster_enrichment(transaction_context, representatives, clusterer.clusters)
+        finally:
+            set_member_enrichment_hook(None)
+
+        assert result[1].enrichment.selected_content.title == "Near 5th Avenue & E 2th St"
+        assert result[1].enrichment.shared_from == 1
+        assert get_member_enrichment_hook() is default_member_enrichment
+
+    def test_failed_representative_leaves_members_unenriched(self, transaction_context):
+        """Test members of a representative without enrichment stay unenriched"""
+        waypoints = [make_waypoint(1, 40.750), make_waypoint(2, 40.751)]
+        clusterer = WaypointClusterer(radius_meters=500)
+        representatives = list(clusterer.representatives(waypoints))
+
+        result = share_cluster_enrichment(transaction_context, representatives, clusterer.clusters)
+
+        assert len(result) == 2
+        assert not any(waypoint.is_enriched() for waypoint in result)
+
+    def test_response_marks_shared_waypoints(self, transaction_context):
+        """Test the response lists the steps sharing an enrichment and ignores copies in timing"""
+        waypoints = [make_waypoint(1, 40.750), make_waypoint(2, 40.751), make_waypoint(3, 40.760)]
+        clusterer = WaypointClusterer(radius_meters=500)
+        representatives = list(clusterer.representatives(waypoints))
+        for waypoint in representatives:
+            waypoint.enrichment = make_enrichment()
+        shared = share_cluster_enrichment(transaction_context, representatives, clusterer.clusters)
+
+        final_route: FinalRoute = aggregate_results(transaction_context, shared, {"distance": "1 km"})
+        response = format_response(final_route)
+
+        formatted = response["route"]["waypoints"]
+        assert formatted[0]["shared_enrichment"] == {"representative_step": 1, "steps": [1, 2]}
+        assert formatted[1]["shared_enrichment"] == {"representative_step": 1, "steps": [1, 2]}
+        assert "shared_enrichment" not in formatted[2]
+        assert final_route.statistics.enriched_waypoints == 3
+        assert final_route.statistics.average_processing_time_ms == 1200
@@ -3,6 +3,8 @@ Unit tests for src/modules/waypoint_preprocessor.py
 Tests waypoint metadata enrichment and query generation
 """
 
+from unittest.mock import MagicMock
+
 import pytest
 from src.modules.waypoint_preprocessor import preprocess_waypoints
 from src.models import LocationType
@@ -80,3 +82,203 @@ class TestWaypointPreprocessor:
             if waypoint.metadata:
                 # Location type should be classified
                 assert isinstance(waypoint.metadata.location_type, LocationType)
+
+
+@pytest.mark.unit
+class TestPreprocessingMemoization:
+    """Test per-location memoization of preprocessing results"""
+
+    @staticmethod
+    def _route(names):
+        from src.models import RouteData, Waypoint, Coordinates
+        return RouteData(
+            distance="1 km",
+            duration="5 mins",
+            waypoints=[
+                Waypoint(
+                    id=i + 1,
+                    location_name=name,
+                    coordinates=Coordinates(lat=40.0, lng=-74.0),
+                    instruction="Turn left near Union Square"
+                )
+                for i, name in enumerate(names)
+            ]
+        )
+
+    def test_repeated_locations_hit_cache(self, transaction_context, mock_config):
+        """Test recurring locations are served from the memo cache"""
+        from src.cache import PREPROCESSING_CACHE, get_cache
+        mock_config.enable_caching = True
+
+        preprocess_waypoints(transaction_context, self._route(["Broadway & W 4th St"]))
+        preprocess_waypoints(
+            transaction_context,
+            self._route(["Broadway & W 4th St", "Broadway & W 4th St"])
+        )
+
+        cache = get_cache(PREPROCESSING_CACHE)
+        assert cache.misses == 1
+        assert cache.hits == 2
+        assert cache.hit_rate == pytest.approx(2 / 3)
+
+    def test_memoized_output_matches_uncached(self, transaction_context, mock_config):
+        """Test cached and uncached preprocessing produce identical results"""
+        names = ["Central Park South & 6th Ave", "I-95 Highway", "Greenwich Village"]
+
+        mock_config.enable_caching = False
+        uncached = preprocess_waypoints(transaction_context, self._route(names))
+
+        mock_config.enable_caching = True
+        preprocess_waypoints(transaction_context, self._route(names))
+        cached = preprocess_waypoints(transaction_context, self._route(names))
+
+        for expected, actual in zip(uncached, cached):
+            assert actual.metadata == expected.metadata
+            assert actual.agent_context == expected.agent_context
+
+    def test_cached_results_are_not_shared(self, transaction_context, mock_config):
+        """Test each waypoint gets its own metadata objects"""
+        mock_config.enable_caching = True
+
+        first, second = preprocess_waypoints(
+            transaction_context,
+            self._route(["Broadway & W 4th St", "Broadway & W 4th St"])
+        )
+        first.metadata.search_keywords.append("mutated")
+
+        assert first.metadata is not second.metadata
+        assert "mutated" not in second.metadata.search_keywords
+
+
+@pytest.mark.unit
+class TestParallelPreprocessing:
+    """Test process pool preprocessing of long routes"""
+
+    @pytest.fixture(autouse=True)
+    def shared_pool(self):
+        from src.modules.waypoint_preprocessor import reset_preprocessing_pool
+        yield
+        reset_preprocessing_pool()
+
+    @staticmethod
+    def _route(count):
+        from src.models import RouteData, Waypoint, Coordinates
+        names = ["Central Park South & 6th Ave", "I-95 Highway", "Greenwich Village", "Oak St"]
+        return RouteData(
+            distance="100 km",
+            duration="2 hours",
+            waypoints=[
+                Waypoint(
+                    id=i + 1,
+                    location_name=f"{names[i % 4]} {i % 13}",
+                    coordinates=Coordinates(lat=40.0, lng=-74.0),
+                    instruction=f"Turn left near Union Square {i % 5}"
+                )
+                for i in range(count)
+            ]
+        )
+
+    @staticmethod
+    def _parallel(config, workers=2):
+        config.preprocessing_parallel_threshold = 10
+        config.preprocessing_workers = workers
+        config.preprocessing_chunk_size = 7
+
+    def test_default_config_uses_pool_for_long_retrieved_routes(
+        self, transaction_context, mock_config, monkeypatch
+    ):
+        """Test the default threshold is checked before the waypoint cap, so the pool really runs"""
+        from src.config import SystemConfig
+        from src.models import RouteData, Waypoint, Coordinates
+        from src.modules import Orchestrator, waypoint_preprocessor
+        from src.pipeline import run_enrichment_stages
+
+        defaults = SystemConfig()
+        for name in ("preprocessing_parallel_threshold", "preprocessing_workers", "max_waypoints_per_route"):
+            setattr(mock_config, name, getattr(defaults, name))
+        monkeypatch.setattr(waypoint_preprocessor.os, "cpu_count", lambda: 2)
+        monkeypatch.setattr("src.modules.mock_agents.time.sleep", lambda seconds: None)
+        map_chunks = MagicMock(wraps=waypoint_preprocessor._map_chunks)
+        monkeypatch.setattr(waypoint_preprocessor, "_map_chunks", map_chunks)
+
+        # 1200 waypoints ~1 km apart, one of them a landmark
+        route = RouteData(distance="1200 km", duration="12 hours", waypoints=[
+            Waypoint(
+                id=i + 1,
+                location_name="Empire State Building" if i == 600 else f"Oak St & {i}th Ave",
+                coordinates=Coordinates(lat=30.0 + i * 0.009, lng=-90.0),
+                instruction="Continue",
+                distance_from_start=i * 1000.0
+            )
+            for i in range(1200)
+        ])
+
+        orchestrator = Orchestrator()
+        try:
+            enriched = run_enrichment_stages(transaction_context, route, orchestrator)
+        finally:
+            orchestrator.shutdown()
+
+        map_chunks.assert_called_once()
+        assert map_chunks.call_args.args[1] == 2  # Workers: one per (patched) CPU
+        assert len(enriched) == defaults.max_waypoints_per_route
+        assert "Empire State Building" in [waypoint.location_name for waypoint in enriched]
+        assert all(waypoint.metadata and waypoint.agent_context for waypoint in enriched)
+
+    def test_parallel_matches_serial(self, transaction_context, mock_config):
+        """Test the pool returns the same waypoints, in order, with identical results"""
+        serial = preprocess_waypoints(transaction_context, self._route(60))
+
+        self._parallel(mock_config)
+        route = self._route(60)
+        parallel = preprocess_waypoints(transaction_context, route)
+
+        assert [waypoint.id for waypoint in parallel] == list(range(1, 61))
+        assert all(a is b for a, b in zip(parallel, route.waypoints))
+        for expected, actual in zip(serial, parallel):
+            assert actual.metadata == expected.metadata
+            assert actual.agent_context == expected.agent_context
+
+    def test_parallel_uses_and_fills_cache(self, transaction_context, mock_config):
+        """Test cached locations skip the pool and new results are memoized"""
+        from src.cache import PREPROCESSING_CACHE, get_cache
+        mock_config.enable_caching = True
+        preprocess_waypoints(transaction_context, self._route(5))
+
+        self._parallel(mock_config)
+        preprocess_waypoints(transaction_context, self._route(60))
+
+        cache = get_cache(PREPROCESSING_CACHE)
+        assert cache.misses == 5 + 60 - 5
+        assert len(cache) == 60
+
+    def test_small_routes_stay_serial(self, mock_config):
+        """Test short routes, a disabled threshold and a single worker skip the pool"""
+        from src.modules.waypoint_preprocessor import _parallel_workers
+        self._parallel(mock_config)
+
+        assert _parallel_workers(10, mock_config) == 0
+        assert _parallel_workers(11, mock_config) == 2
+
+        mock_config.preprocessing_workers = 1
+        assert _parallel_workers(1000, mock_config) == 0
+
+        mock_config.preprocessing_workers = 2
+        mock_config.preprocessing_parallel_threshold = 0
+        assert _parallel_workers(1000, mock_config) == 0
+
+    def test_broken_pool_falls_back_to_serial(self, transaction_context, mock_config, monkeypatch):
+        """Test a pool that cannot run still yields fully preprocessed waypoints"""
+        from concurrent.futures.process import BrokenProcessPool
+        from src.modules import waypoint_preprocessor
+
+        class BrokenPool:
+            def map(self, *args):
+                raise BrokenProcessPool("worker died")
+
+        monkeypatch.setattr(waypoint_preprocessor, "_get_preprocessing_pool", lambda workers: BrokenPool())
+        self._parallel(mock_config)
+
+        processed = preprocess_waypoints(transaction_context, self._route(30))
+
+        assert all(waypoint.metadata and waypoint.agent_context for waypoint in processed)
@@ -0,0 +1,136 @@
+"""
+Unit tests for src/modules/waypoint_simplifier.py
+Tests merging, Douglas-Peucker, the waypoint budget and landmark retention
+"""
+
+import pytest
+
+from src.geo import METERS_PER_DEGREE
+from src.models import Coordinates, RouteData, Waypoint
+from src.modules.waypoint_simplifier import (
+    apply_waypoint_budget,
+    douglas_peucker,
+    merge_close_waypoints,
+    simplify_waypoints,
+)
+
+
+def _waypoint(index: int, meters: float, name: str = None, lng_offset_m: float = 0.0) -> Waypoint:
+    return Waypoint(
+        id=index + 1,
+        location_name=name or f"Street {index}",
+        coordinates=Coordinates(
+            lat=40.0 + meters / METERS_PER_DEGREE,
+            lng=-74.0 + lng_offset_m / (METERS_PER_DEGREE * 0.766)
+        ),
+        instruction=f"Turn onto Street {index}",
+        distance_from_start=meters,
+        step_index=index
+    )
+
+
+def _city_route(count: int = 150, spacing: float = 40.0):
+    """Stop-and-go route: a turn every `spacing` metres"""
+    return [_waypoint(i, i * spacing) for i in range(count)]
+
+
+@pytest.mark.unit
+class TestWaypointSimplifier:
+    """Test waypoint simplification"""
+
+    def test_merge_drops_close_waypoints(self):
+        """Test waypoints within the minimum distance of the last kept one merge"""
+        kept = merge_close_waypoints(_city_route(11, 40.0), min_distance_meters=100)
+
+        assert [wp.distance_from_start for wp in kept] == [0, 120, 240, 360, 400]
+
+    def test_merge_keeps_landmarks(self):
+        """Test landmarks survive even when close to a kept waypoint"""
+        waypoints = _city_route(5, 10.0)
+        waypoints[2] = _waypoint(2, 20.0, name="Washington Square Park")
+
+        kept = merge_close_waypoints(waypoints, min_distance_meters=100)
+
+        assert [wp.location_name for wp in kept] == ["Street 0", "Washington Square Park", "Street 4"]
+
+    def test_merge_by_travel_time(self):
+        """Test the time criterion merges waypoints passed within min_seconds"""
+        waypoints = _city_route(5, 500.0)
+        seconds = [0, 10, 100, 110, 200]
+
+        kept = merge_close_waypoints(waypoints, 0, min_seconds=60, seconds_at=seconds)
+
+        assert [wp.step_index for wp in kept] == [0, 2, 4]
+
+    def test_douglas_peucker_drops_collinear_points(self):
+        """Test points on a straight line are dropped, corners are kept"""
+        straight = [_waypoint(i, i * 100.0) for i in range(10)]
+        corner = _waypoint(10, 900.0, lng_offset_m=800.0)
+
+        kept = douglas_peucker(straight + [corner], tolerance_meters=20)
+
+        assert [wp.step_index for wp in kept] == [0, 9, 10]
+
+    def test_douglas_peucker_keeps_landmarks(self):
+        """Test landmarks are anchors that are never dropped"""
+        waypoints = [_waypoint(i, i * 100.0) for i in range(10)]
+        waypoints[4] = _waypoint(4, 400.0, name="Brooklyn Bridge")
+
+        kept = douglas_peucker(waypoints, tolerance_meters=20)
+
+        assert [wp.step_index for wp in kept] == [0, 4, 9]
+
+    def test_budget_caps_and_spreads(self):
+        """Test the budget keeps endpoints and spreads the rest along the route"""
+        waypoints = _city_route(100, 100.0)
+
+        kept = apply_waypoint_budget(waypoints, 10)
+
+        assert len(kept) == 10
+        assert kept[0] is waypoints[0]
+        assert kept[-1] is waypoints[-1]
+        gaps = [b.distance_from_start - a.distance_from_start for a, b in zip(kept, kept[1:])]
+        assert max(gaps) < 2 * 9900 / 9
+
+    def test_budget_prefers_landmarks(self):
+        """Test landmarks take budget slots before other waypoints"""
+        waypoints = _city_route(50, 100.0)
+        for index in (10, 20, 30):
+            waypoints[index] = _waypoint(index, index * 100.0, name=f"Museum {index}")
+
+        kept = apply_waypoint_budget(waypoints, 5)
+
+        assert [wp.step_index for wp in kept] == [0, 10, 20, 30, 49]
+
+    def test_stage_bounds_agent_fan_out(self, mock_config, transaction_context):
+        """Test a 150-step city route is cut to the budget and renumbered"""
+        mock_config.waypoint_simplification = "merge"
+        mock_config.simplify_min_distance_meters = 100
+        mock_config.max_waypoints_per_route = 20
+        route = RouteData(distance="6 km", duration="30 mins", waypoints=_city_route(150, 40.0))
+
+        simplified = simplify_waypoints(transaction_context, route)
+
+        assert len(simplified.waypoints) == 20
+        assert [wp.id for wp in simplified.waypoints] == list(range(1, 21))
+        assert simplified.distance == "6 km"
+        assert transaction_context.metadata["waypoint_simplification"] == {
+            "input_waypoints": 150,
+            "after_simplification": 51,
+            "output_waypoints": 20
+        }
+
+    def test_stage_off_keeps_mock_route(self, mock_config, transaction_context):
+        """Test mode off with no budget leaves the route unchanged"""
+        mock_config.waypoint_simplification = "off"
+        mock_config.max_waypoints_per_route = 0
+        route = RouteData(distance="1 km", duration="5 mins", waypoints=_city_route(30, 10.0))
+
+        simplified = simplify_waypoints(transaction_context, route)
+
+        assert len(simplified.waypoints) == 30
+
+    def test_invalid_mode_fails_validation(self, mock_config):
+        """Test unknown simplification modes are rejected by config validation"""
+        mock_config.waypoint_simplification = "random"
+        assert any("waypoint_simplification" in error for error in mock_config.validate())